@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+How many times the vendored urllib3 copies each byte of a response body.
+
+A server process sends a large body, and each way of reading it is timed and
+then run again under tracemalloc to count the bytes it allocates for every
+byte received: each of those is a copy of the body on top of the one out of
+the socket. Run it against the vendored urllib3:
+
+    PYTHONPATH=src python benchmarks/download_copy_benchmark.py --size 64
+"""
+import os
+import socket
+import time
+import argparse
+import threading
+import tracemalloc
+import multiprocessing
+from typing import Callable, Tuple
+
+import urllib3
+
+CHUNK = 2 ** 16
+
+
+def serve(listener: socket.socket, size: int) -> None:
+    """
+    Answer every request with a body of the given size.
+
+    Runs in its own process so that sending doesn't count towards the CPU
+    time of the client.
+
+    Args:
+        listener: Listening socket
+        size: Body size in bytes
+    """
+    block = b"x" * 2 ** 20
+
+    def handle(conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as f:
+            while f.readline():
+                while f.readline() not in (b"\r\n", b""):
+                    pass
+                conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % size)
+                for _ in range(size // len(block)):
+                    conn.sendall(block)
+                conn.sendall(block[:size % len(block)])
+
+    while True:
+        conn, _ = listener.accept()
+        threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+
+class AllocationSink:
+    """
+    Discards what is written to it while counting the memory allocated
+    between writes.
+
+    A read method that hands out a chunk of the body in a new object has
+    copied it there, so this counts the copies on top of the one into the
+    chunk that is written. Buffers that are reused are only allocated once.
+    """
+
+    def __init__(self):
+        self.allocated = 0
+        self._base = 0
+
+    def start(self) -> None:
+        tracemalloc.start()
+        self._base = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> None:
+        self.write(b"")
+        tracemalloc.stop()
+
+    def write(self, data) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        self.allocated += peak - self._base
+        tracemalloc.reset_peak()
+        # What's still alive at the next write, like this chunk, isn't new then
+        self._base = current
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def read_amt(pool: urllib3.HTTPConnectionPool, sink) -> int:
+    response = pool.request("GET", "/", preload_content=False)
+    received = 0
+    while data := response.read(CHUNK):
+        sink.write(data)
+        received += len(data)
+    return received
+
+
+def stream(pool: urllib3.HTTPConnectionPool, sink) -> int:
+    response = pool.request("GET", "/", preload_content=False)
+    received = 0
+    for data in response.stream(CHUNK):
+        sink.write(data)
+        received += len(data)
+    return received
+
+
+def readinto(pool: urllib3.HTTPConnectionPool, sink) -> int:
+    response = pool.request("GET", "/", preload_content=False)
+    buf = bytearray(CHUNK)
+    view = memoryview(buf)
+    received = 0
+    while n := response.readinto(buf):
+        sink.write(view[:n])
+        received += n
+    return received
+
+
+def stream_into(pool: urllib3.HTTPConnectionPool, sink) -> int:
+    response = pool.request("GET", "/", preload_content=False)
+    return response.stream_into(sink, buffer_size=CHUNK)
+
+
+METHODS = (("read", read_amt), ("stream", stream), ("readinto", readinto), ("stream_into", stream_into))
+
+
+def measure(method: Callable, pool: urllib3.HTTPConnectionPool, sink, repeat: int) -> Tuple[float, float]:
+    """
+    Best wall-clock and CPU time per byte of a read method.
+
+    Args:
+        method: Function reading one response, returning the bytes received
+        pool: Pool connected to the benchmark server
+        sink: File the body is written to
+        repeat: Number of runs to take the best of
+
+    Returns:
+        Wall-clock seconds per byte and CPU seconds per byte
+    """
+    best = None
+    for _ in range(repeat):
+        start, cpu_start = time.perf_counter(), time.process_time()
+        received = method(pool, sink)
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+        best = min(best or (elapsed / received, cpu / received), (elapsed / received, cpu / received))
+    return best
+
+
+def count_copies(method: Callable, pool: urllib3.HTTPConnectionPool) -> float:
+    """
+    Bytes a read method allocates per byte received.
+
+    Args:
+        method: Function reading one response, returning the bytes received
+        pool: Pool connected to the benchmark server
+
+    Returns:
+        Allocated bytes per received byte
+    """
+    sink = AllocationSink()
+    sink.start()
+    try:
+        received = method(pool, sink)
+    finally:
+        sink.stop()
+    return sink.allocated / received
+
+
+def main():
+    """
+    Time each read method and print the copies it makes per byte received.
+    """
+    parser = argparse.ArgumentParser(description="Count the copies urllib3 makes of a response body")
+    parser.add_argument("--size", type=int, default=256, help="Body size in MiB")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per method, the best one counts")
+    args = parser.parse_args()
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    server = multiprocessing.Process(target=serve, args=(listener, args.size * 2 ** 20), daemon=True)
+    server.start()
+    pool = urllib3.HTTPConnectionPool("127.0.0.1", listener.getsockname()[1])
+
+    mib = 2 ** 20
+    print(f"{'method':<14} {'MiB/s':>8} {'CPU ms/MiB':>11} {'copies/byte':>12}")
+    with open(os.devnull, "wb") as sink:
+        for name, method in METHODS:
+            elapsed, cpu = measure(method, pool, sink, args.repeat)
+            copies = count_copies(method, pool)
+            print(f"{name:<14} {1 / elapsed / mib:8.0f} {cpu * mib * 1000:11.3f} {copies:12.2f}")
+
+    server.terminate()
+    listener.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,10 @@ Test script to demonstrate the usage of both the CLI and CrewAI integration
 for the image generation tool.
 """
 import os
-import sys
 import subprocess
-from pathlib import Path
 import json
 from dotenv import load_dotenv
 
-# Add parent directory to sys.path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # Load environment variables
 load_dotenv()
 
@@ -25,7 +20,7 @@ TEST_PROMPT = "A beautiful mountain landscape with a crystal clear lake at sunse
 def test_core_api():
     """Test the core image generation API directly."""
     print("\n=== Testing Core API ===")
-    from src.core.image_generation.generator import generate_image
+    from jarvis.core.image_generation.generator import generate_image
     
     result = generate_image(
         prompt=TEST_PROMPT,
@@ -49,16 +44,13 @@ def test_core_api():
 def test_cli():
     """Test the command-line interface."""
     print("\n=== Testing CLI ===")
-    cli_path = Path(__file__).parent.parent / "src" / "cli" / "generate_image.py"
-    
     # Ensure the directory exists
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     # Run the CLI tool
     cmd = [
-        "python", 
-        str(cli_path), 
-        TEST_PROMPT, 
+        "jarvis-generate-image",
+        TEST_PROMPT,
         "--output-dir", OUTPUT_DIR,
         "--prefix", "cli_test",
         "--format", "json"
@@ -87,7 +79,7 @@ def test_crewai():
     print("\n=== Testing CrewAI Integration ===")
     try:
         from crewai import Agent, Task, Crew
-        from src.integrations.crewai.tools.image_tool import ImageGenerationTool
+        from jarvis.integrations.crewai.tools.image_tool import ImageGenerationTool
         
         # Create the image generation tool
         image_tool = ImageGenerationTool(output_dir=OUTPUT_DIR)
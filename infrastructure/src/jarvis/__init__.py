@@ -0,0 +1,12 @@
+"""
+Jarvis: an AI development partner with voice, image generation and a
+cognitive memory system.
+
+Subpackages:
+    core: Voice and image generation, memory and conversation logging
+    integrations: Tools for agent frameworks (CrewAI)
+    services: Multi-agent services built on those tools
+    cli: Command-line entry points
+"""
+
+__version__ = "0.1.0"
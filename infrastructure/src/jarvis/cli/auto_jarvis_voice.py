@@ -16,11 +16,8 @@ import time
 import subprocess
 from pathlib import Path
 
-# Add the project root to sys.path to enable imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from infrastructure.src.core.voice_generation.generator import generate_voice
+from jarvis.core.jobs.worker import run_job
+from jarvis.core.voice_generation.generator import generate_voice
 
 def play_audio(audio_path: str):
     """
@@ -65,8 +62,12 @@ def main():
                         help="Don't automatically play the audio")
     parser.add_argument("--api-key", 
                         help="OpenAI API key (overrides environment variable)")
+    parser.add_argument("--queue", action="store_true",
+                        help="Run through the job queue at interactive priority")
     
     args = parser.parse_args()
+    if args.queue and args.api_key:
+        parser.error("--api-key cannot be used with --queue; queue workers read OPENAI_API_KEY")
     
     # Create output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
@@ -80,17 +81,20 @@ def main():
     words = ''.join(c if c.isalnum() or c == '_' else '' for c in words)
     filename = f"jarvis_response_{timestamp}_{words}"
     
-    # Generate the audio using the core generator
-    result = generate_voice(
-        text=args.text,
-        voice=args.voice,
-        model=args.model,
-        output_dir=args.output_dir,
-        api_key=args.api_key,
-        response_format=args.format,
-        speed=args.speed,
-        filename_prefix="jarvis_response"
-    )
+    # Generate the audio using the core generator, directly or through the queue
+    params = {
+        "text": args.text,
+        "voice": args.voice,
+        "model": args.model,
+        "output_dir": os.path.abspath(args.output_dir),
+        "response_format": args.format,
+        "speed": args.speed,
+        "filename_prefix": "jarvis_response"
+    }
+    if args.queue:
+        result = run_job("voice", params, priority="interactive", source="voice")
+    else:
+        result = generate_voice(api_key=args.api_key, **params)
     
     if result["success"]:
         print(f"Audio generated successfully at: {result['saved_path']}")
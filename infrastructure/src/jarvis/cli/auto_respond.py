@@ -17,11 +17,8 @@ from typing import Optional, Dict, Any
 import re
 import hashlib
 
-# Add the project root to sys.path to enable imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from tools.src.core.voice_generation.generator import generate_voice
+from jarvis.core.jobs.worker import run_job
+from jarvis.core.voice_generation.generator import generate_voice
 
 class ResponseWatcher:
     """Class to watch for and process Jarvis responses."""
@@ -39,7 +36,8 @@ class ResponseWatcher:
         max_length: int = 1000,
         summary_only: bool = False,
         api_key: Optional[str] = None,
-        polling_interval: float = 1.0
+        polling_interval: float = 1.0,
+        use_queue: bool = False
     ):
         """
         Initialize the response watcher.
@@ -57,6 +55,7 @@ class ResponseWatcher:
             summary_only: Whether to only use summary sections
             api_key: OpenAI API key
             polling_interval: How often to check for changes (seconds)
+            use_queue: Whether to generate speech through the job queue
         """
         if not watch_file and not watch_dir:
             raise ValueError("Either watch_file or watch_dir must be provided")
@@ -75,6 +74,7 @@ class ResponseWatcher:
         self.summary_only = summary_only
         self.api_key = api_key
         self.polling_interval = polling_interval
+        self.use_queue = use_queue
         
         # Store file hashes to detect changes
         self.file_hashes = {}
@@ -152,18 +152,18 @@ class ResponseWatcher:
         # Create a filename based on the source
         source_basename = Path(source_file).stem
         
-        result = generate_voice(
-            text=text,
-            voice=self.voice,
-            model=self.model,
-            response_format=self.response_format,
-            speed=self.speed,
-            output_dir=str(self.output_dir),
-            api_key=self.api_key,
-            filename_prefix=f"jarvis_{source_basename}"
-        )
-        
-        return result
+        params = {
+            "text": text,
+            "voice": self.voice,
+            "model": self.model,
+            "response_format": self.response_format,
+            "speed": self.speed,
+            "output_dir": str(self.output_dir.resolve()),
+            "filename_prefix": f"jarvis_{source_basename}"
+        }
+        if self.use_queue:
+            return run_job("voice", params, priority="interactive", source="watcher")
+        return generate_voice(api_key=self.api_key, **params)
     
     def _play_audio(self, audio_path: str):
         """Play the audio file."""
@@ -251,11 +251,15 @@ def main():
                         help="Try to extract and convert only the summary section")
     parser.add_argument("--max-length", type=int, default=1000,
                         help="Maximum text length before summarization")
+    parser.add_argument("--queue", action="store_true",
+                        help="Generate speech through the job queue, sharing its workers")
     
     args = parser.parse_args()
     
     if not args.watch_file and not args.watch_dir:
         parser.error("Either --watch-file or --watch-dir must be provided")
+    if args.queue and args.api_key:
+        parser.error("--api-key cannot be used with --queue; queue workers read OPENAI_API_KEY")
     
     watcher = ResponseWatcher(
         watch_file=args.watch_file,
@@ -269,7 +273,8 @@ def main():
         max_length=args.max_length,
         summary_only=args.summary_only,
         api_key=args.api_key,
-        polling_interval=args.polling_interval
+        polling_interval=args.polling_interval,
+        use_queue=args.queue
     )
     
     watcher.watch()
@@ -5,15 +5,10 @@ CLI tool for generating images using OpenAI DALL-E models.
 This script provides a command-line interface to the core image generation functionality.
 """
 import os
-import sys
 import json
 import argparse
-from pathlib import Path
 
-# Add the parent directory to sys.path to enable imports from core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.core.image_generation.generator import generate_image
+from jarvis.core.image_generation.generator import generate_image
 
 def main():
     """
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CLI tool for producing newsletters for several topics at once.
+
+This script provides a command-line interface to the CrewAI batch newsletter runner.
+"""
+import sys
+import json
+import argparse
+
+from jarvis.services.crewai.batch import run_newsletters
+from jarvis.services.crewai.checkpoint import DEFAULT_CHECKPOINT_DIR
+
+def main():
+    """
+    Main entry point for the batch newsletter CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Produce newsletters for several topics concurrently")
+    parser.add_argument("topics", nargs="*", help="Newsletter topics")
+    parser.add_argument("--topics-file", help="File with one topic per line")
+    parser.add_argument("--output-dir", help="Directory to save the newsletters",
+                        default="workspace/newsletters")
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument("--calls-per-minute", type=float,
+                        help="Global limit on LLM and tool calls across all workers")
+    parser.add_argument("--resume", action="store_true",
+                        help="Checkpoint task outputs and skip tasks completed by an earlier run")
+    parser.add_argument("--format", choices=["json", "text"], default="text",
+                        help="Output format (json or text)")
+
+    args = parser.parse_args()
+
+    topics = list(args.topics)
+    if args.topics_file:
+        with open(args.topics_file, 'r') as f:
+            topics.extend(line.strip() for line in f if line.strip())
+
+    if not topics:
+        parser.error("Provide topics as arguments or with --topics-file")
+
+    summary = run_newsletters(
+        topics,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        calls_per_minute=args.calls_per_minute,
+        checkpoint_dir=DEFAULT_CHECKPOINT_DIR if args.resume else None
+    )
+
+    # Format and output the result
+    if args.format == "json":
+        print(json.dumps(summary, indent=2))
+    else:
+        for result in summary["results"]:
+            if result["success"]:
+                print(f"✅ {result['topic']}: {result['seconds']:.1f}s -> {result['output_dir']}")
+            else:
+                print(f"❌ {result['topic']}: {result['error']}")
+        print(f"\n{summary['succeeded']}/{summary['topics']} newsletters in {summary['seconds']:.1f}s "
+              f"with {summary['workers']} workers")
+
+    return 0 if summary["succeeded"] == summary["topics"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,16 +5,10 @@ CLI tool for generating voice audio using OpenAI TTS models.
 This script provides a command-line interface to the core voice generation functionality.
 """
 import os
-import sys
 import json
 import argparse
-from pathlib import Path
 
-# Add the project root to sys.path to enable imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from tools.src.core.voice_generation.generator import generate_voice
+from jarvis.core.voice_generation.generator import generate_voice
 
 def main():
     """
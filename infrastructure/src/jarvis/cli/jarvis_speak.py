@@ -16,11 +16,7 @@ import tempfile
 import subprocess
 from typing import Optional
 
-# Add the project root to sys.path to enable imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from tools.src.core.voice_generation.generator import generate_voice
+from jarvis.core.voice_generation.generator import generate_voice
 
 def summarize_text(text: str, max_length: int = 1000) -> str:
     """
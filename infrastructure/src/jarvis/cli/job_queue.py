@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+CLI tool for the voice and image job queue.
+
+This script provides a command-line interface to the durable job queue: submit
+jobs, poll their status, and run the worker pool that processes them. Jobs stay
+queued across restarts, and identical jobs that are already queued or running
+are merged.
+"""
+import sys
+import json
+import signal
+import argparse
+
+from jarvis.core.jobs.queue import JobQueue, PRIORITIES
+from jarvis.core.jobs.worker import HANDLERS, WorkerPool
+
+def format_job(job):
+    """
+    Format a job as one line of text.
+    """
+    summary = job["params"].get("text") or job["params"].get("prompt") or ""
+    if len(summary) > 50:
+        summary = summary[:47] + "..."
+    line = f"{job['id']:>6}  {job['kind']:<6} {job['status']:<8} p{job['priority']:<3} {job['source']:<10} {summary}"
+    if job["status"] == "done" and job["result"] and job["result"].get("saved_path"):
+        line += f"\n        -> {job['result']['saved_path']}"
+    elif job["status"] == "failed" and job["error"]:
+        line += f"\n        !! {job['error'].splitlines()[0]}"
+    return line
+
+def main():
+    """
+    Main entry point for the job queue CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Queue and run Jarvis voice and image jobs")
+    parser.add_argument("--queue", help="Path of the queue database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = subparsers.add_parser("submit", help="Queue a job")
+    submit_parser.add_argument("kind", choices=sorted(HANDLERS), help="Job type")
+    submit_parser.add_argument("text", help="Text to speak or image prompt")
+    submit_parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                               help="Extra generator argument (e.g., voice=echo, size=1792x1024)")
+    submit_parser.add_argument("--output-dir", help="Directory to save the output")
+    submit_parser.add_argument("--priority", default="normal",
+                               help=f"Priority name ({', '.join(PRIORITIES)}) or number")
+    submit_parser.add_argument("--source", default="cli", help="Who is submitting the job")
+    submit_parser.add_argument("--no-dedupe", action="store_true",
+                               help="Queue the job even if an identical one is in flight")
+    submit_parser.add_argument("--wait", action="store_true", help="Wait for the job to finish")
+
+    status_parser = subparsers.add_parser("status", help="Show a job")
+    status_parser.add_argument("job_id", type=int, help="Job id")
+    status_parser.add_argument("--wait", action="store_true", help="Wait for the job to finish")
+    status_parser.add_argument("--timeout", type=float, help="Seconds to wait at most")
+
+    list_parser = subparsers.add_parser("list", help="List recent jobs")
+    list_parser.add_argument("--status", choices=["queued", "running", "done", "failed"], help="Only jobs with this status")
+    list_parser.add_argument("--kind", help="Only jobs of this type")
+    list_parser.add_argument("--limit", type=int, default=20, help="Maximum number of jobs")
+
+    subparsers.add_parser("stats", help="Count jobs by status and type")
+
+    cancel_parser = subparsers.add_parser("cancel", help="Cancel a queued job")
+    cancel_parser.add_argument("job_id", type=int, help="Job id")
+
+    work_parser = subparsers.add_parser("work", help="Run the worker pool until interrupted")
+    work_parser.add_argument("--workers", type=int, default=2, help="Number of worker processes (default: 2)")
+    work_parser.add_argument("--kind", action="append", dest="kinds", choices=sorted(HANDLERS),
+                             help="Only run jobs of this type")
+
+    purge_parser = subparsers.add_parser("purge", help="Delete old finished jobs")
+    purge_parser.add_argument("--days", type=float, default=7, help="Age in days (default: 7)")
+
+    for sub in (submit_parser, status_parser, list_parser, subparsers.choices["stats"]):
+        sub.add_argument("--format", choices=["json", "text"], default="text",
+                         help="Output format (json or text)")
+
+    args = parser.parse_args()
+    queue = JobQueue(args.queue)
+
+    try:
+        if args.command == "submit":
+            params = {"text" if args.kind == "voice" else "prompt": args.text}
+            for item in args.param:
+                key, sep, value = item.partition("=")
+                if not sep:
+                    raise ValueError(f"Invalid parameter: {item}. Must be KEY=VALUE")
+                params[key] = float(value) if key == "speed" else value
+            if args.output_dir:
+                params["output_dir"] = args.output_dir
+            priority = int(args.priority) if args.priority.lstrip("-").isdigit() else args.priority
+            job_id = queue.submit(args.kind, params, priority, args.source, dedupe=not args.no_dedupe)
+            job = queue.wait(job_id) if args.wait else queue.get(job_id)
+        elif args.command == "status":
+            job = queue.wait(args.job_id, args.timeout) if args.wait else queue.get(args.job_id)
+            if job is None:
+                raise ValueError(f"No job with id {args.job_id}")
+        elif args.command == "list":
+            jobs = queue.list(args.status, args.kind, args.limit)
+            if args.format == "json":
+                print(json.dumps(jobs, indent=2))
+            else:
+                for job in jobs:
+                    print(format_job(job))
+                print(f"\n{len(jobs)} jobs")
+            return
+        elif args.command == "stats":
+            stats = queue.stats()
+            if args.format == "json":
+                print(json.dumps(stats, indent=2))
+            else:
+                print("  ".join(f"{status}: {count}" for status, count in stats["status"].items()))
+                print(f"Workers: {len(stats['workers'])}")
+            return
+        elif args.command == "cancel":
+            if not queue.cancel(args.job_id):
+                raise ValueError(f"Job {args.job_id} is not queued")
+            print(f"Cancelled job {args.job_id}")
+            return
+        elif args.command == "work":
+            pool = WorkerPool(args.workers, queue, args.kinds)
+            # Stop cleanly on SIGTERM as well as Ctrl-C
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+            print(f"Running {args.workers} workers on {queue.path} (Ctrl-C to stop)")
+            pool.serve()
+            return
+        elif args.command == "purge":
+            print(f"Deleted {queue.purge(args.days * 86400)} finished jobs")
+            return
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps(job, indent=2))
+    else:
+        print(format_job(job))
+    if job["status"] == "failed":
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
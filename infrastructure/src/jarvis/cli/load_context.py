@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CLI tool for building Jarvis's session start context.
+
+This script provides a command-line interface to the context loader. It prints
+(or writes) a prioritized, size-budgeted markdown bundle of identity,
+capabilities, guidelines, the active project and recent memories, rebuilding
+only the sections whose source files changed since the last session.
+"""
+import json
+import time
+import argparse
+from pathlib import Path
+
+from jarvis.core.memory.context import DEFAULT_BUDGET, load_context
+
+def main():
+    """
+    Main entry point for the context loader CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Build the Jarvis session start context bundle")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET,
+                        help="Maximum size of the bundle in characters")
+    parser.add_argument("--project", default="jarvis",
+                        help="Active project in structured memory (use '' for none)")
+    parser.add_argument("--query", help="Topic of the session, to recall related episodic memories")
+    parser.add_argument("--knowledge-dir", help="Root of the knowledge tree")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild every section")
+    parser.add_argument("--output", help="Write the bundle to this file instead of printing it")
+    parser.add_argument("--format", choices=["json", "text"], default="text",
+                        help="Output format (json or text)")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = load_context(
+        budget=args.budget,
+        project=args.project or None,
+        query=args.query,
+        knowledge_dir=args.knowledge_dir,
+        use_cache=not args.no_cache
+    )
+    result["milliseconds"] = round((time.perf_counter() - start) * 1000, 2)
+
+    summary = (f"Context bundle: {len(result['text'])} characters, sections: {', '.join(result['sections'])}"
+               f"{' (cached)' if result['cached'] else ''}")
+    if result["omitted"]:
+        summary += f"; omitted: {', '.join(result['omitted'])}"
+
+    # Format and output the result
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(result["text"], encoding="utf-8")
+        if args.format == "json":
+            print(json.dumps({k: v for k, v in result.items() if k != "text"}, indent=2))
+        else:
+            print(f"{summary}\nWritten to {args.output} in {result['milliseconds']:.1f} ms")
+    elif args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(result["text"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+CLI tool for logging conversation messages to the Jarvis web app.
+
+This script provides a command-line interface to the conversation logging
+client. The message is written to the local spool first and then sent, together
+with anything spooled earlier, in one NDJSON request. If the app is not running
+the message stays spooled and the command still succeeds.
+"""
+import json
+import argparse
+
+from jarvis.core.conversation_log.client import DEFAULT_ENDPOINT, ConversationLogger
+
+def main():
+    """
+    Main entry point for the conversation logging CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Log a conversation message to the Jarvis web app")
+    parser.add_argument("message", nargs="?", help="Message text")
+    parser.add_argument("source", nargs="?", default="jarvis", choices=["user", "jarvis"],
+                        help="Who said it (default: jarvis)")
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT, help="URL of the conversations API")
+    parser.add_argument("--spool-dir", help="Directory holding the spool")
+    parser.add_argument("--no-send", action="store_true",
+                        help="Only spool the message; it is sent with the next flush")
+    parser.add_argument("--flush", action="store_true",
+                        help="Send spooled messages (no message needed)")
+    parser.add_argument("--format", choices=["json", "text"], default="text",
+                        help="Output format (json or text)")
+
+    args = parser.parse_args()
+
+    if not args.message and not args.flush:
+        parser.error("A message is required unless --flush is given")
+
+    logger = ConversationLogger(endpoint=args.endpoint, spool_dir=args.spool_dir)
+    if args.message:
+        logger.log(args.message, args.source)
+
+    result = {"success": True, "sent": 0, "skipped": False}
+    if not args.no_send:
+        result = logger.flush()
+    result["pending"] = logger.pending()
+
+    # Format and output the result; an unreachable app is not an error
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    elif result["success"] and not result["pending"]:
+        print("Response logged successfully")
+    else:
+        print(f"Response spooled ({result['pending']} messages waiting for the app)")
+
+if __name__ == "__main__":
+    main()
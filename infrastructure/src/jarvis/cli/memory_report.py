@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+CLI tool for generating the Jarvis memory status report.
+
+This script provides a command-line interface to the memory report engine and
+prints the JSON report consumed by the web app's memory status page.
+"""
+import json
+import argparse
+
+from jarvis.core.memory.report import DEFAULT_MAX_AGE, generate_memory_report
+
+def main():
+    """
+    Main entry point for the memory report CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Generate a status report of Jarvis's memory systems")
+    parser.add_argument("--knowledge-dir", help="Root of the knowledge tree")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always scan the knowledge tree instead of reusing a cached scan")
+    parser.add_argument("--max-age", type=float, default=DEFAULT_MAX_AGE,
+                        help="Seconds after which a cached scan is refreshed")
+
+    args = parser.parse_args()
+
+    report = generate_memory_report(
+        knowledge_dir=args.knowledge_dir,
+        use_cache=not args.no_cache,
+        max_age=args.max_age
+    )
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+CLI tool for recording and querying project activities.
+
+This script provides a command-line interface to the structured-memory activity
+store. Activities are appended to a log instead of rewriting project JSON files,
+and queries by project, date range and type read only the matching records.
+"""
+import sys
+import json
+import argparse
+
+from jarvis.core.memory.activity import ActivityStore
+
+def main():
+    """
+    Main entry point for the project activity CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Record and query Jarvis project activities")
+    parser.add_argument("--store-dir", help="Directory holding the activity store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="Record an activity")
+    add_parser.add_argument("project", help="Project name (e.g., jarvis)")
+    add_parser.add_argument("description", help="What happened")
+    add_parser.add_argument("--type", default="note", dest="activity_type",
+                            help="Kind of activity (e.g., implementation, design, bugfix)")
+    add_parser.add_argument("--date", help="When it happened (ISO 8601, defaults to now)")
+
+    query_parser = subparsers.add_parser("query", help="List activities")
+    query_parser.add_argument("--project", help="Only activities of this project")
+    query_parser.add_argument("--since", help="Only activities at or after this date (ISO 8601)")
+    query_parser.add_argument("--until", help="Only activities at or before this date (ISO 8601)")
+    query_parser.add_argument("--type", action="append", dest="types", help="Only activities of this type")
+    query_parser.add_argument("--limit", type=int, help="Maximum number of activities")
+    query_parser.add_argument("--format", choices=["json", "text"], default="text",
+                              help="Output format (json or text)")
+
+    subparsers.add_parser("compact", help="Merge the log into a new snapshot")
+    seed_parser = subparsers.add_parser("seed", help="Import recent_activity from the project JSON files")
+    seed_parser.add_argument("--projects-dir", help="Directory of project JSON files")
+
+    args = parser.parse_args()
+    store = ActivityStore(args.store_dir)
+
+    try:
+        if args.command == "add":
+            activity = store.append(args.project, args.description, args.activity_type, args.date)
+            print(f"Recorded {activity['type']} for {activity['project']} at {activity['date']}")
+        elif args.command == "query":
+            activities = store.query(args.project, args.since, args.until, args.types, args.limit)
+            if args.format == "json":
+                print(json.dumps(activities, indent=2))
+            else:
+                for activity in activities:
+                    print(f"{activity['date']}  {activity['project']:<12} {activity['type']:<15} {activity['description']}")
+                print(f"\n{len(activities)} activities")
+        elif args.command == "compact":
+            result = store.compact()
+            print(f"Snapshot holds {result['records']} activities ({result['merged']} merged from the log)")
+        elif args.command == "seed":
+            print(f"Imported {store.seed_from_projects(args.projects_dir)} activities")
+    except ValueError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
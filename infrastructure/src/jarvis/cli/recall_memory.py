@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CLI tool for semantic recall over Jarvis's episodic memory.
+
+This script provides a command-line interface to the local vector store. New
+and changed conversations and sessions are embedded before every query, and
+only the best matching chunks are printed instead of whole memory files.
+"""
+import json
+import time
+import argparse
+
+from jarvis.core.memory.recall import DEFAULT_MEMORY_DIRS, MemoryRecall
+
+def main():
+    """
+    Main entry point for the memory recall CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Recall the memories most similar to a query")
+    parser.add_argument("query", nargs="?", help="What to recall")
+    parser.add_argument("-k", type=int, default=5, help="Number of chunks to return")
+    parser.add_argument("--memory-dir", action="append", dest="memory_dirs",
+                        help=f"Directory of the knowledge tree to index (default: {', '.join(DEFAULT_MEMORY_DIRS)})")
+    parser.add_argument("--knowledge-dir", help="Root of the knowledge tree")
+    parser.add_argument("--store-dir", help="Directory holding the vector store")
+    parser.add_argument("--update-only", action="store_true",
+                        help="Only update the vector store and print what changed")
+    parser.add_argument("--format", choices=["json", "text"], default="text",
+                        help="Output format (json or text)")
+
+    args = parser.parse_args()
+
+    if not args.query and not args.update_only:
+        parser.error("A query is required unless --update-only is given")
+
+    start = time.perf_counter()
+    recall = MemoryRecall(
+        knowledge_dir=args.knowledge_dir,
+        store_dir=args.store_dir,
+        memory_dirs=tuple(args.memory_dirs or DEFAULT_MEMORY_DIRS)
+    )
+    changes = recall.update()
+    results = [] if args.update_only else recall.search(args.query, args.k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Format and output the result
+    if args.format == "json":
+        print(json.dumps({"store": changes, "results": results, "milliseconds": round(elapsed_ms, 2)}, indent=2))
+    elif args.update_only:
+        print(f"Vector store updated in {elapsed_ms:.1f} ms: {changes['added']} added, "
+              f"{changes['updated']} updated, {changes['removed']} removed, "
+              f"{changes['unchanged']} unchanged ({changes['chunks']} chunks embedded)")
+    else:
+        if not results:
+            print(f"No memories found for: {args.query}")
+        for rank, result in enumerate(results, start=1):
+            print(f"{rank}. {result['heading'] or result['path']} ({result['score']:.2f})")
+            print(f"   {result['path']}")
+            print("   " + result["text"].replace("\n", "\n   "))
+            print()
+        print(f"{len(results)} results in {elapsed_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
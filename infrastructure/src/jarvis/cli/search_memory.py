@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+CLI tool for searching the Jarvis knowledge tree.
+
+This script provides a command-line interface to the incremental memory index.
+The index is brought up to date before every search, which only re-reads files
+that changed since the previous run.
+"""
+import json
+import time
+import argparse
+
+from jarvis.core.memory.index import MemoryIndex
+from jarvis.core.memory.paths import MEMORY_TYPES
+
+def main():
+    """
+    Main entry point for the memory search CLI tool.
+    """
+    parser = argparse.ArgumentParser(description="Search Jarvis's memory with BM25 ranking")
+    parser.add_argument("query", nargs="?", help="Words to search for")
+    parser.add_argument("--type", choices=MEMORY_TYPES, dest="memory_type",
+                        help="Only search one memory type")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of results")
+    parser.add_argument("--knowledge-dir", help="Root of the knowledge tree")
+    parser.add_argument("--index-path", help="SQLite file holding the index")
+    parser.add_argument("--update-only", action="store_true",
+                        help="Only update the index and print what changed")
+    parser.add_argument("--format", choices=["json", "text"], default="text",
+                        help="Output format (json or text)")
+
+    args = parser.parse_args()
+
+    if not args.query and not args.update_only:
+        parser.error("A query is required unless --update-only is given")
+
+    start = time.perf_counter()
+    with MemoryIndex(args.knowledge_dir, args.index_path) as index:
+        changes = index.update()
+        results = [] if args.update_only else index.search(args.query, args.limit, args.memory_type)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Format and output the result
+    if args.format == "json":
+        print(json.dumps({"index": changes, "results": results, "milliseconds": round(elapsed_ms, 2)}, indent=2))
+    elif args.update_only:
+        print(f"Index updated in {elapsed_ms:.1f} ms: {changes['added']} added, "
+              f"{changes['updated']} updated, {changes['removed']} removed, {changes['unchanged']} unchanged")
+    else:
+        if not results:
+            print(f"No memories found for: {args.query}")
+        for rank, result in enumerate(results, start=1):
+            print(f"{rank}. [{result['memory_type'] or 'other'}] {result['title']} ({result['score']:.2f})")
+            print(f"   {result['path']}")
+            print(f"   {result['snippet']}")
+        print(f"\n{len(results)} results in {elapsed_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
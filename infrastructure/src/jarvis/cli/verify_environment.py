@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Environment verification script for Jarvis.
+
+This script checks for all required components, API keys, and configurations
+to ensure Jarvis is properly set up and ready to use. Checks run concurrently,
+each with its own timeout, and passing results are cached for a short time in
+a state file so that repeated verifications at session start are instant.
+"""
+import os
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import platform
+import threading
+from pathlib import Path
+import json
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from jarvis.paths import DEFAULT_CACHE_DIR, PROJECT_ROOT
+
+# The jarvis package directory and the .env file holding the API key
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+ENV_FILE = PROJECT_ROOT / "infrastructure" / "config" / ".env"
+
+try:
+    import openai
+    from dotenv import load_dotenv
+    REQUIRED_PACKAGES_INSTALLED = True
+except ImportError:
+    REQUIRED_PACKAGES_INSTALLED = False
+
+# Passing check results are cached here between runs
+STATE_FILE = DEFAULT_CACHE_DIR / "verify_environment.json"
+
+# --fast reuses a passing network check for this long instead of its normal TTL
+FAST_TTL = 86400
+
+# Seconds a check may take before it is reported as failed, unless CHECKS sets its own
+CHECK_TIMEOUT = 10
+
+class VerificationCheck:
+    """
+    Represents a verification check with a name, result, and optional details.
+    """
+    def __init__(self, name: str, success: bool, message: str, details: Any = None):
+        self.name = name
+        self.success = success
+        self.message = message
+        self.details = details
+        self.cached = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the check to a JSON-serializable dictionary.
+        """
+        return {"name": self.name, "success": self.success, "message": self.message, "details": self.details}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VerificationCheck":
+        """
+        Create a check from a dictionary produced by to_dict().
+        """
+        return cls(data["name"], data["success"], data["message"], data.get("details"))
+
+def check_project_structure() -> VerificationCheck:
+    """
+    Verify the Jarvis project structure exists and is properly organized.
+    """
+    required_dirs = [
+        PROJECT_ROOT / "infrastructure",
+        PROJECT_ROOT / "infrastructure" / "config",
+        PACKAGE_DIR,
+        PACKAGE_DIR / "cli",
+        PACKAGE_DIR / "core",
+        PROJECT_ROOT / "workspace",
+        PROJECT_ROOT / "workspace" / "generated_audio",
+        PROJECT_ROOT / "workspace" / "generated_images",
+        PROJECT_ROOT / "instructions"
+    ]
+    
+    missing_dirs = [str(d) for d in required_dirs if not d.exists() or not d.is_dir()]
+    
+    if missing_dirs:
+        return VerificationCheck(
+            "Project Structure", 
+            False,
+            f"Missing {len(missing_dirs)} required directories",
+            missing_dirs
+        )
+    
+    return VerificationCheck(
+        "Project Structure",
+        True,
+        "All required directories are present"
+    )
+
+def check_openai_api_key() -> VerificationCheck:
+    """
+    Verify the OpenAI API key is set and valid.
+    """
+    # Check if .env file exists
+    env_file = ENV_FILE
+    if not env_file.exists():
+        return VerificationCheck(
+            "OpenAI API Key",
+            False,
+            ".env file not found in infrastructure/config/",
+            {"path": str(env_file)}
+        )
+    
+    # Load environment variables
+    load_dotenv(dotenv_path=env_file)
+    
+    # Check if OPENAI_API_KEY is set
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return VerificationCheck(
+            "OpenAI API Key",
+            False,
+            "OPENAI_API_KEY not found in .env file",
+            {"env_file": str(env_file)}
+        )
+    
+    # Check if API key has the right format (basic check)
+    if not api_key.startswith(("sk-", "proj-")):
+        return VerificationCheck(
+            "OpenAI API Key",
+            False,
+            "API key doesn't have the expected format",
+            {"key_prefix": api_key[:5]}
+        )
+    
+    # Try a simple API call to validate
+    try:
+        client = openai.OpenAI(api_key=api_key, timeout=CHECK_TIMEOUT, max_retries=0)
+        # Get list of models or a simple API call to validate
+        models = client.models.list()
+        return VerificationCheck(
+            "OpenAI API Key",
+            True,
+            "OpenAI API key is valid and working",
+            {"key_prefix": f"{api_key[:5]}...{api_key[-4:]}"}
+        )
+    except Exception as e:
+        return VerificationCheck(
+            "OpenAI API Key",
+            False,
+            "OpenAI API key validation failed",
+            {"error": str(e)}
+        )
+
+def check_voice_tools() -> VerificationCheck:
+    """
+    Verify the voice tools are available and executable.
+    """
+    required_files = [
+        PACKAGE_DIR / "core" / "voice_generation" / "generator.py",
+        PACKAGE_DIR / "cli" / "auto_jarvis_voice.py",
+        PACKAGE_DIR / "cli" / "jarvis_speak.py",
+        PACKAGE_DIR / "cli" / "generate_voice.py",
+        PROJECT_ROOT / "workspace" / "tools" / "jarvis_voice.sh",
+        PROJECT_ROOT / "workspace" / "tools" / "claude_voice_integration.py"
+    ]
+    
+    missing_files = [str(f) for f in required_files if not f.exists()]
+    
+    if missing_files:
+        return VerificationCheck(
+            "Voice Tools",
+            False,
+            f"Missing {len(missing_files)} voice tool files",
+            missing_files
+        )
+    
+    # Check if shell scripts are executable
+    shell_script = PROJECT_ROOT / "workspace" / "tools" / "jarvis_voice.sh"
+    if not os.access(shell_script, os.X_OK):
+        return VerificationCheck(
+            "Voice Tools",
+            False,
+            "jarvis_voice.sh is not executable",
+            {"path": str(shell_script)}
+        )
+    
+    return VerificationCheck(
+        "Voice Tools",
+        True,
+        "All voice tools are available and executable"
+    )
+
+def check_python_environment() -> VerificationCheck:
+    """
+    Verify the Python environment has all required packages.
+    """
+    required_packages = ["openai", "python-dotenv", "requests"]
+    
+    if not REQUIRED_PACKAGES_INSTALLED:
+        return VerificationCheck(
+            "Python Environment",
+            False,
+            "Required packages are missing",
+            {"required": required_packages}
+        )
+    
+    # Check Python version
+    python_version = sys.version_info
+    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 8):
+        return VerificationCheck(
+            "Python Environment",
+            False,
+            f"Python version {python_version.major}.{python_version.minor} is below required 3.8",
+            {"current": f"{python_version.major}.{python_version.minor}", "required": "3.8+"}
+        )
+    
+    return VerificationCheck(
+        "Python Environment",
+        True,
+        f"Python {python_version.major}.{python_version.minor} with all required packages"
+    )
+
+def check_audio_playback() -> VerificationCheck:
+    """
+    Verify the system can play audio files.
+    """
+    system = platform.system()
+    
+    # Look the players up on PATH without spawning a process
+    if system == "Darwin":  # macOS
+        if shutil.which("afplay"):
+            return VerificationCheck(
+                "Audio Playback",
+                True,
+                "macOS audio playback (afplay) is available"
+            )
+        return VerificationCheck(
+            "Audio Playback",
+            False,
+            "macOS audio playback (afplay) not found",
+            {"system": system}
+        )
+    elif system == "Linux":
+        if shutil.which("xdg-open"):
+            return VerificationCheck(
+                "Audio Playback",
+                True,
+                "Linux audio playback (xdg-open) is available"
+            )
+        return VerificationCheck(
+            "Audio Playback",
+            False,
+            "Linux audio playback (xdg-open) not found",
+            {"system": system}
+        )
+    elif system == "Windows":
+        # Windows uses os.startfile which is built into Python
+        return VerificationCheck(
+            "Audio Playback",
+            True,
+            "Windows audio playback is available"
+        )
+    else:
+        return VerificationCheck(
+            "Audio Playback",
+            False,
+            f"Unsupported system: {system}",
+            {"system": system}
+        )
+
+def api_key_fingerprint() -> str:
+    """
+    Identify the configured API key without storing it, so that a cached
+    validation is not reused after the key changes.
+    """
+    env_file = ENV_FILE
+    try:
+        content = env_file.read_bytes()
+    except OSError:
+        content = b""
+    key = os.getenv("OPENAI_API_KEY", "").encode()
+    return hashlib.sha256(content + b"\0" + key).hexdigest()
+
+# (key, function, seconds a passing result stays cached, whether it uses the network,
+#  seconds the check may take or None for the default timeout)
+CHECKS = [
+    ("project_structure", check_project_structure, 60, False, None),
+    ("python_environment", check_python_environment, 600, False, None),
+    ("openai_api_key", check_openai_api_key, 900, True, 20),
+    ("voice_tools", check_voice_tools, 60, False, None),
+    ("audio_playback", check_audio_playback, 3600, False, None),
+]
+
+def load_state() -> Dict[str, Any]:
+    """
+    Load cached check results from the state file.
+    """
+    try:
+        with open(STATE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state: Dict[str, Any]) -> None:
+    """
+    Write cached check results to the state file.
+    """
+    try:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{STATE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, STATE_FILE)
+    except OSError:
+        # Verification works without a cache
+        pass
+
+def cached_result(
+    state: Dict[str, Any],
+    key: str,
+    ttl: float,
+    fingerprint: Optional[str]
+) -> Optional[VerificationCheck]:
+    """
+    Get a passing cached result that is younger than ttl.
+    """
+    entry = state.get(key)
+    if not entry or time.time() - entry.get("checked_at", 0) >= ttl:
+        return None
+    if fingerprint is not None and entry.get("fingerprint") != fingerprint:
+        return None
+    check = VerificationCheck.from_dict(entry["result"])
+    check.cached = True
+    return check
+
+class CheckRunner:
+    """
+    Runs one check on a daemon thread, so that a check that hangs is reported
+    as timed out and can't keep the process from exiting.
+    """
+    def __init__(self, key: str, check: Callable[[], VerificationCheck], timeout: float):
+        self.key = key
+        self.timeout = timeout
+        self._check = check
+        self._result: Optional[VerificationCheck] = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name=f"verify-{key}", daemon=True)
+        self.started = time.monotonic()
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self._result = self._check()
+        except Exception as e:
+            self._error = e
+
+    def result(self) -> VerificationCheck:
+        """
+        Wait for the check until its own timeout has passed since it started.
+        """
+        self._thread.join(max(self.started + self.timeout - time.monotonic(), 0))
+        name = self.key.replace("_", " ").title()
+        if self._thread.is_alive():
+            return VerificationCheck(name, False, f"Check timed out after {self.timeout:g} seconds")
+        if self._error is not None:
+            return VerificationCheck(name, False, "Check raised an error", {"error": str(self._error)})
+        return self._result
+
+def run_all_checks(
+    use_cache: bool = True,
+    fast: bool = False,
+    timeout: float = CHECK_TIMEOUT
+) -> List[VerificationCheck]:
+    """
+    Run all verification checks concurrently.
+
+    Args:
+        use_cache: Whether to reuse passing results that are still fresh
+        fast: Reuse a passing network check for up to FAST_TTL instead of its normal TTL
+        timeout: Seconds each check may take, unless CHECKS sets its own
+
+    Returns:
+        Check results in the order of CHECKS
+    """
+    state = load_state() if use_cache else {}
+    results: Dict[str, VerificationCheck] = {}
+    fingerprints: Dict[str, Optional[str]] = {}
+    pending = []
+
+    for key, check, ttl, uses_network, check_timeout in CHECKS:
+        fingerprints[key] = api_key_fingerprint() if key == "openai_api_key" else None
+        if use_cache:
+            cached = cached_result(state, key, FAST_TTL if fast and uses_network else ttl, fingerprints[key])
+            if cached:
+                results[key] = cached
+                continue
+        pending.append(CheckRunner(key, check, check_timeout or timeout))
+
+    if pending:
+        for runner in pending:
+            results[runner.key] = runner.result()
+
+        now = time.time()
+        for key in (runner.key for runner in pending):
+            if results[key].success:
+                state[key] = {"checked_at": now, "fingerprint": fingerprints[key], "result": results[key].to_dict()}
+            else:
+                state.pop(key, None)
+        save_state(state)
+
+    return [results[key] for key, _, _, _, _ in CHECKS]
+
+def format_check_result(check: VerificationCheck) -> str:
+    """
+    Format a verification check result for display.
+    """
+    status = "✅ PASS" if check.success else "❌ FAIL"
+    result = f"{status} | {check.name}: {check.message}"
+    if check.cached:
+        result += " (cached)"
+    
+    if not check.success and check.details:
+        if isinstance(check.details, list):
+            details = "\n  - " + "\n  - ".join(check.details)
+        elif isinstance(check.details, dict):
+            details = "\n  - " + "\n  - ".join([f"{k}: {v}" for k, v in check.details.items()])
+        else:
+            details = f"\n  - {check.details}"
+        result += details
+    
+    return result
+
+def generate_summary(checks: List[VerificationCheck]) -> str:
+    """
+    Generate a summary of all verification checks.
+    """
+    total = len(checks)
+    passed = sum(1 for check in checks if check.success)
+    
+    if passed == total:
+        return f"✅ All {total} checks passed! Jarvis is properly configured and ready to use."
+    else:
+        return f"⚠️ {passed}/{total} checks passed. Please fix the issues to ensure Jarvis works correctly."
+
+def main():
+    """
+    Main function to run all verification checks and display results.
+    """
+    parser = argparse.ArgumentParser(description="Verify that Jarvis is properly configured")
+    parser.add_argument("--fast", action="store_true",
+                        help="Skip network validation if it passed within the last day")
+    parser.add_argument("--no-cache", action="store_true", help="Run every check, ignoring cached results")
+    parser.add_argument("--timeout", type=float, default=CHECK_TIMEOUT,
+                        help=f"Seconds each check may take (default: {CHECK_TIMEOUT})")
+    args = parser.parse_args()
+
+    print("\n🤖 JARVIS ENVIRONMENT VERIFICATION\n")
+    print("Running checks to verify Jarvis is properly configured...\n")
+    
+    checks = run_all_checks(use_cache=not args.no_cache, fast=args.fast, timeout=args.timeout)
+    
+    # Display results
+    for check in checks:
+        print(format_check_result(check))
+    
+    # Display summary
+    print("\n" + generate_summary(checks) + "\n")
+    
+    # Return the exit status for script usage
+    return 0 if all(check.success for check in checks) else 1
+
+if __name__ == "__main__":
+    sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+"""
+
+from .single_flight import SingleFlight, request_key
+
+__all__ = ["SingleFlight", "request_key"]
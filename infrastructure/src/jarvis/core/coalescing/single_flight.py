@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Single-flight coalescing of identical in-flight calls.
+
+The first caller for a key runs the call; callers that arrive with the same key
+while it runs wait for that call instead of making their own, and all of them
+receive its result or its exception. Once the call finishes the key is free
+again, so this merges concurrent work without caching results.
+
+Threads and asyncio tasks share the same groups: every call is tracked as a
+concurrent.futures.Future, which threads wait on directly and coroutines await
+through asyncio.wrap_future. Blocking functions called from a coroutine run in
+the event loop's default executor.
+"""
+import copy
+import json
+import asyncio
+import hashlib
+import threading
+import concurrent.futures
+from typing import Dict, Any, Callable, Optional
+
+
+def request_key(kind: str, **fields: Any) -> str:
+    """
+    Build a coalescing key from the fields that determine a request's output.
+
+    Args:
+        kind: Request type (e.g., "voice")
+        **fields: JSON-serializable request fields
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = json.dumps({"kind": kind, **fields}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Group of in-flight calls keyed by request.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty group.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[str, concurrent.futures.Future] = {}
+        self._stats = {"calls": 0, "shared": 0}
+
+    def _join(self, key: str):
+        """
+        Join the call for a key, or register a new one.
+
+        Returns:
+            Tuple of (future of the call, whether the caller has to run it)
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["shared"] += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: concurrent.futures.Future, result: Any = None,
+                error: Optional[BaseException] = None):
+        """
+        Release the key and hand the outcome to every waiting caller.
+        """
+        # Callers arriving from now on start a new call
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _share(result: Any) -> Any:
+        """
+        Copy a result for a caller that joined, so callers cannot change each other's dicts.
+        """
+        return copy.copy(result) if isinstance(result, (dict, list)) else result
+
+    def do(self, key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call func, or wait for the identical call already running.
+
+        Args:
+            key: Coalescing key (see request_key)
+            func: Function to call
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return self._share(future.result())
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def do_async(self, key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Await func, or the identical call already running in any thread or task.
+
+        Args:
+            key: Coalescing key (see request_key)
+            func: Coroutine function, or blocking function to run in the executor
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        future, leader = self._join(key)
+        if not leader:
+            # Shielded so that a cancelled waiter does not cancel the call for the others
+            return self._share(await asyncio.shield(asyncio.wrap_future(future)))
+
+        if asyncio.iscoroutinefunction(func):
+            call = asyncio.ensure_future(func(*args, **kwargs))
+        else:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(None, lambda: func(*args, **kwargs))
+        call.add_done_callback(lambda done: self._finish(
+            key, future,
+            None if done.cancelled() or done.exception() else done.result(),
+            asyncio.CancelledError() if done.cancelled() else done.exception()
+        ))
+        return await asyncio.shield(call)
+
+    def in_flight(self) -> int:
+        """
+        Number of calls currently running.
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count calls made through the group and how many joined a running call.
+        """
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
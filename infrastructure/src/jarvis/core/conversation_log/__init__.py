@@ -0,0 +1,7 @@
+"""
+Conversation logging client that spools messages and sends them in batches.
+"""
+
+from .client import ConversationLogger, log_message
+
+__all__ = ["ConversationLogger", "log_message"]
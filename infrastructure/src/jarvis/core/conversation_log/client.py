@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Conversation logging client for the Jarvis web app.
+
+Messages are appended to a local spool file, which takes microseconds and never
+touches the network, so logging cannot hold up the voice path. Spooled messages
+are sent to the app as newline-delimited JSON in batches over a pooled
+keep-alive connection, either by a background thread or by an explicit flush.
+While the app is down the messages stay in the spool and go out with the next
+successful flush. A batch whose response was lost is sent again; every message
+carries an id, which the app deduplicates on.
+"""
+import os
+import json
+import time
+import uuid
+import fcntl
+import atexit
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import urllib3
+
+from ...paths import DEFAULT_CACHE_DIR
+
+DEFAULT_ENDPOINT = os.getenv("JARVIS_LOG_URL", "http://localhost:3000/api/conversations")
+DEFAULT_SPOOL_DIR = Path(os.getenv("JARVIS_LOG_SPOOL_DIR", DEFAULT_CACHE_DIR / "conversation_spool"))
+
+# Messages per request
+DEFAULT_BATCH_SIZE = 200
+
+# Seconds the background thread waits for more messages before sending
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Failed sends are retried after this many seconds, doubling up to the maximum
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+# Connecting to the local app either works at once or not at all
+CONNECT_TIMEOUT = 0.5
+READ_TIMEOUT = 5.0
+
+_pool: Optional[urllib3.PoolManager] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> urllib3.PoolManager:
+    """
+    Get the shared connection pool, creating it on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = urllib3.PoolManager(
+                num_pools=2,
+                maxsize=1,
+                retries=False,
+                timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT),
+                headers={"Connection": "keep-alive"},
+            )
+        return _pool
+
+
+class ConversationLogger:
+    """
+    Spools conversation messages and sends them to the app in batches.
+
+    The spool directory holds spool.ndjson, which messages are appended to, and
+    batch-*.ndjson files, which a flush moves the spool to before sending it.
+    Several processes can log to the same spool; one of them flushes at a time.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_ENDPOINT,
+        spool_dir: Optional[Path] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        pool: Optional[urllib3.PoolManager] = None
+    ):
+        """
+        Initialize the logger.
+
+        Args:
+            endpoint: URL that accepts POSTed NDJSON messages
+            spool_dir: Directory holding the spool
+            batch_size: Maximum number of messages per request
+            flush_interval: Seconds the background thread collects messages before sending
+            pool: Connection pool to send with (defaults to a shared keep-alive pool)
+        """
+        self.endpoint = endpoint
+        self.spool_dir = Path(spool_dir or DEFAULT_SPOOL_DIR)
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self.spool_path = self.spool_dir / "spool.ndjson"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pool = pool or get_pool()
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+        self._retry_delay = RETRY_DELAY
+
+    def _lock(self, name: str, exclusive: bool, blocking: bool = True):
+        """
+        Open and lock a lock file of the spool.
+
+        Returns:
+            The open lock file, or None if it is locked and blocking is False
+        """
+        handle = open(self.spool_dir / name, "a")
+        flags = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        try:
+            fcntl.flock(handle, flags if blocking else flags | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            return None
+        return handle
+
+    def log(self, message: str, source: str = "jarvis", **fields: Any) -> Dict[str, Any]:
+        """
+        Append a message to the spool.
+
+        Args:
+            message: Message text
+            source: Who said it ("user" or "jarvis")
+            **fields: Additional JSON-serializable fields
+
+        Returns:
+            The spooled record
+        """
+        record = {
+            "id": uuid.uuid4().hex,
+            "message": message,
+            "source": source,
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            **fields,
+        }
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+        # Appends share the lock; a flush takes it exclusively to move the spool away
+        with self._lock("spool.lock", exclusive=False):
+            fd = os.open(self.spool_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+        self._wake.set()
+        return record
+
+    def _send(self, lines: List[bytes]) -> bool:
+        """
+        POST lines as one NDJSON request.
+        """
+        try:
+            response = self.pool.request(
+                "POST",
+                self.endpoint,
+                body=b"".join(lines),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+        except urllib3.exceptions.HTTPError:
+            return False
+        return 200 <= response.status < 300
+
+    def pending(self) -> int:
+        """
+        Count the messages that have not been sent yet.
+        """
+        count = 0
+        for path in [*self.spool_dir.glob("batch-*.ndjson"), self.spool_path]:
+            try:
+                with open(path, "rb") as f:
+                    count += sum(1 for line in f if line.strip())
+            except FileNotFoundError:
+                pass
+        return count
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Send all spooled messages.
+
+        Returns immediately if another process is already flushing the spool.
+
+        Returns:
+            Dictionary with success, the number of messages sent and whether
+            the flush was skipped because another one was running
+        """
+        flush_lock = self._lock("flush.lock", exclusive=True, blocking=False)
+        if flush_lock is None:
+            return {"success": True, "sent": 0, "skipped": True}
+
+        sent = 0
+        try:
+            while True:
+                batches = sorted(self.spool_dir.glob("batch-*.ndjson"))
+                if not batches:
+                    # Only move the spool once earlier batches are sent, so that
+                    # messages spooled while the app is down go out together
+                    if not (self.spool_path.exists() and self.spool_path.stat().st_size):
+                        break
+                    with self._lock("spool.lock", exclusive=True):
+                        batches = [self.spool_path.rename(self.spool_dir / f"batch-{time.time_ns()}.ndjson")]
+
+                batch_path = batches[0]
+                with open(batch_path, "rb") as f:
+                    lines = [line if line.endswith(b"\n") else line + b"\n" for line in f if line.strip()]
+
+                position = 0
+                while position < len(lines):
+                    chunk = lines[position:position + self.batch_size]
+                    if not self._send(chunk):
+                        break
+                    position += len(chunk)
+                    sent += len(chunk)
+
+                if position < len(lines):
+                    # Keep what was not sent, so that it is not sent twice
+                    if position:
+                        tmp_path = batch_path.with_suffix(".tmp")
+                        with open(tmp_path, "wb") as f:
+                            f.writelines(lines[position:])
+                        os.replace(tmp_path, batch_path)
+                    return {"success": False, "sent": sent, "skipped": False,
+                            "error": f"Could not reach {self.endpoint}"}
+
+                batch_path.unlink()
+        finally:
+            flush_lock.close()
+
+        return {"success": True, "sent": sent, "skipped": False}
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait()
+            # Collect messages for a moment so they go out in one request
+            self._stopping.wait(self.flush_interval)
+            self._wake.clear()
+
+            if time.monotonic() < self._retry_at and not self._stopping.is_set():
+                self._wake.set()
+                continue
+
+            if self.flush()["success"]:
+                self._retry_delay = RETRY_DELAY
+                self._retry_at = 0.0
+            else:
+                # The app is down; messages stay spooled until a later attempt
+                self._retry_at = time.monotonic() + self._retry_delay
+                self._retry_delay = min(self._retry_delay * 2, MAX_RETRY_DELAY)
+                self._wake.set()
+
+    def start(self) -> "ConversationLogger":
+        """
+        Start the background thread that sends spooled messages.
+
+        Returns:
+            The logger
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="conversation-log", daemon=True)
+            self._thread.start()
+            if self.spool_path.exists() or any(self.spool_dir.glob("batch-*.ndjson")):
+                # Messages spooled by an earlier run
+                self._wake.set()
+        return self
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            flush: Whether to try sending the remaining messages once more
+        """
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+_default_logger: Optional[ConversationLogger] = None
+_default_logger_lock = threading.Lock()
+
+
+def log_message(message: str, source: str = "jarvis", **fields: Any) -> Dict[str, Any]:
+    """
+    Log a message with a process-wide background logger.
+
+    The logger is started on first use and flushed when the process exits.
+
+    Args:
+        message: Message text
+        source: Who said it ("user" or "jarvis")
+        **fields: Additional JSON-serializable fields
+
+    Returns:
+        The spooled record
+    """
+    global _default_logger
+    with _default_logger_lock:
+        if _default_logger is None:
+            _default_logger = ConversationLogger().start()
+            atexit.register(_default_logger.stop)
+    return _default_logger.log(message, source, **fields)
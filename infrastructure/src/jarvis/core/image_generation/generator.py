@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Core image generation functionality using OpenAI DALL-E models.
+"""
+import os
+import sys
+import asyncio
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional, Literal
+import openai
+from dotenv import load_dotenv
+
+from ..coalescing import SingleFlight, request_key
+
+# Define type aliases for better documentation and type checking
+ImageSize = Literal["256x256", "512x512", "1024x1024", "1792x1024", "1024x1792"]
+ImageQuality = Literal["standard", "hd"]
+ImageStyle = Literal["vivid", "natural"]
+
+# Identical requests made in this process while one is running share its API
+# call, and callers saving the same image share its download. Separate
+# processes (the watcher, the CLIs) make their own; the job queue is what
+# merges their requests.
+_flights = SingleFlight()
+_downloads = SingleFlight()
+
+def _resolve_api_key(api_key: Optional[str]) -> Optional[str]:
+    """
+    Get the API key to use, falling back to OPENAI_API_KEY from the environment or .env.
+    """
+    # Load environment variables if not done already
+    load_dotenv()
+    api_key = (api_key or os.getenv("OPENAI_API_KEY") or "").strip()
+    return api_key or None
+
+def image_request_key(
+    prompt: str,
+    size: str,
+    quality: str,
+    style: str,
+    api_key: Optional[str],
+) -> str:
+    """
+    Key under which identical image requests are coalesced.
+
+    Only what is sent to the API counts, so callers saving the image to
+    different places still share a call. Whitespace differences in the prompt
+    are ignored, and the API key only enters as a fingerprint.
+    """
+    api_key = _resolve_api_key(api_key) or ""
+    return request_key(
+        "image",
+        prompt=" ".join(prompt.split()),
+        size=size,
+        quality=quality,
+        style=style,
+        account=hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+    )
+
+def generate_image(
+    prompt: str,
+    size: ImageSize = "1024x1024",
+    quality: ImageQuality = "standard",
+    style: ImageStyle = "vivid",
+    output_dir: Optional[str] = None,
+    api_key: Optional[str] = None,
+    filename_prefix: str = "",
+) -> Dict[str, Any]:
+    """
+    Generate an image using OpenAI's DALL-E model.
+
+    Concurrent calls for the same image in this process, from any thread or
+    from generate_image_async, share one API call; each caller saves the image
+    to its own file.
+    
+    Args:
+        prompt: Description of the desired image
+        size: Size of the generated image (256x256, 512x512, 1024x1024, 1792x1024, or 1024x1792)
+        quality: Quality of the generated image (standard or hd)
+        style: Style of the generated image (vivid or natural)
+        output_dir: Directory to save the generated image
+        api_key: OpenAI API key (falls back to environment variable)
+        filename_prefix: Optional prefix for the output filename
+        
+    Returns:
+        Dictionary containing image URL and saved file path
+    """
+    key = image_request_key(prompt, size, quality, style, api_key)
+    image = _flights.do(key, _generate_image, prompt, size, quality, style, api_key)
+    return _save_image(image, output_dir, filename_prefix)
+
+async def generate_image_async(
+    prompt: str,
+    size: ImageSize = "1024x1024",
+    quality: ImageQuality = "standard",
+    style: ImageStyle = "vivid",
+    output_dir: Optional[str] = None,
+    api_key: Optional[str] = None,
+    filename_prefix: str = "",
+) -> Dict[str, Any]:
+    """
+    Asyncio version of generate_image; the API call and the download run in the default executor.
+    """
+    key = image_request_key(prompt, size, quality, style, api_key)
+    image = await _flights.do_async(key, _generate_image, prompt, size, quality, style, api_key)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _save_image, image, output_dir, filename_prefix)
+
+def _download(image_url: str) -> bytes:
+    """
+    Download a generated image.
+    """
+    import requests
+
+    response = requests.get(image_url)
+    return response.content
+
+def _save_image(image: Dict[str, Any], output_dir: Optional[str], filename_prefix: str) -> Dict[str, Any]:
+    """
+    Save a successfully generated image, if output_dir is specified.
+    """
+    if not image["success"] or not output_dir:
+        return image
+    try:
+        from PIL import Image
+        from io import BytesIO
+        
+        prompt = image["prompt"]
+
+        # Create output directory if it doesn't exist
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Generate a filename based on the timestamp and a simplified prompt
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        simplified_prompt = "".join(c for c in prompt[:30] if c.isalnum() or c.isspace()).strip().replace(" ", "_")
+        
+        # Use prefix if provided
+        if filename_prefix:
+            filename = f"{filename_prefix}_{timestamp}_{simplified_prompt}.png"
+        else:
+            filename = f"{timestamp}_{simplified_prompt}.png"
+            
+        filepath = output_path / filename
+        
+        # Download and save the image
+        content = _downloads.do(image["image_url"], _download, image["image_url"])
+        img = Image.open(BytesIO(content))
+        img.save(filepath)
+        return {**image, "saved_path": str(filepath)}
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "prompt": image["prompt"]
+        }
+
+def _generate_image(
+    prompt: str,
+    size: str,
+    quality: str,
+    style: str,
+    api_key: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Make the DALL-E call; see generate_image.
+
+    Returns:
+        Dictionary containing status and image URL
+    """
+    try:
+        # Set up OpenAI API key
+        api_key = _resolve_api_key(api_key)
+        if not api_key:
+            return {
+                "success": False,
+                "error": "OpenAI API key not found. Please provide it as a parameter or set OPENAI_API_KEY environment variable.",
+                "prompt": prompt
+            }
+        
+        openai.api_key = api_key
+        
+        # Validate parameters
+        valid_sizes = ["256x256", "512x512", "1024x1024", "1792x1024", "1024x1792"]
+        valid_qualities = ["standard", "hd"]
+        valid_styles = ["vivid", "natural"]
+        
+        if size not in valid_sizes:
+            raise ValueError(f"Invalid size: {size}. Must be one of {valid_sizes}")
+        
+        if quality not in valid_qualities:
+            raise ValueError(f"Invalid quality: {quality}. Must be one of {valid_qualities}")
+            
+        if style not in valid_styles:
+            raise ValueError(f"Invalid style: {style}. Must be one of {valid_styles}")
+        
+        # Generate the image
+        response = openai.images.generate(
+            model="dall-e-3",
+            prompt=prompt,
+            size=size,
+            quality=quality,
+            style=style,
+            n=1
+        )
+        
+        # Extract image URL
+        image_url = response.data[0].url
+        
+        return {
+            "success": True,
+            "image_url": image_url,
+            "saved_path": None,
+            "prompt": prompt,
+            "size": size,
+            "quality": quality,
+            "style": style
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "prompt": prompt
+        } 
\ No newline at end of file
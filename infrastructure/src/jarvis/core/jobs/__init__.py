@@ -0,0 +1,8 @@
+"""
+Durable queue for voice and image generation jobs, with a worker pool.
+"""
+
+from .queue import JobQueue, PRIORITIES
+from .worker import Worker, WorkerPool, register_handler, run_job
+
+__all__ = ["JobQueue", "PRIORITIES", "Worker", "WorkerPool", "register_handler", "run_job"]
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Durable queue for voice and image generation jobs.
+
+Jobs are rows of a SQLite database in WAL mode, so the watcher, CrewAI, the web
+app and the workers can all submit and poll at the same time from separate
+processes, and nothing queued is lost when they stop. Workers claim the next job
+in one write transaction: highest priority first, then the source with the
+fewest jobs running, then the oldest. A claimed job holds a lease that its
+worker renews while the job runs; a job whose worker died is handed out again
+once the lease expires.
+
+Identical jobs (same kind and parameters) that are queued or running are
+merged: submitting one again returns the existing job id, raising its priority
+if the new request is more urgent.
+"""
+import os
+import json
+import time
+import socket
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Union
+
+from ...paths import DEFAULT_CACHE_DIR
+
+DEFAULT_QUEUE_PATH = Path(os.getenv("JARVIS_JOB_QUEUE", DEFAULT_CACHE_DIR / "jobs.sqlite"))
+
+# Named priorities; larger values run first
+PRIORITIES = {"interactive": 20, "normal": 10, "batch": 0}
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+IN_FLIGHT = (QUEUED, RUNNING)
+
+# Seconds a claimed job stays assigned to its worker without a heartbeat
+DEFAULT_LEASE = 60.0
+
+# Times a job is handed out before it is failed for good
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds a connection waits for another process's write transaction
+BUSY_TIMEOUT = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    dedupe_key TEXT,
+    priority INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority DESC, id);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_in_flight ON jobs (dedupe_key)
+    WHERE status IN ('queued', 'running');
+CREATE TABLE IF NOT EXISTS workers (
+    id TEXT PRIMARY KEY,
+    kinds TEXT,
+    heartbeat REAL NOT NULL
+);
+"""
+
+Priority = Union[int, str]
+
+
+def resolve_priority(priority: Priority) -> int:
+    """
+    Convert a priority name (interactive, normal, batch) or number to a number.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if isinstance(priority, int):
+        return priority
+    if priority not in PRIORITIES:
+        raise ValueError(f"Invalid priority: {priority}. Must be a number or one of {list(PRIORITIES)}")
+    return PRIORITIES[priority]
+
+
+def dedupe_key(kind: str, params: Dict[str, Any]) -> str:
+    """
+    Key identifying jobs that would produce the same output.
+    """
+    canonical = json.dumps({"kind": kind, "params": params}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def default_worker_id() -> str:
+    """
+    Identify the calling process as host:pid.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue shared by every process on the machine.
+
+    Each thread gets its own connection, so one JobQueue can be used from
+    several threads.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        lease: float = DEFAULT_LEASE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ):
+        """
+        Initialize the queue, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            lease: Seconds a claimed job stays assigned without a heartbeat
+            max_attempts: Times a job is handed out before it is failed
+        """
+        self.path = Path(path or DEFAULT_QUEUE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit mode; writes that read first use explicit BEGIN IMMEDIATE
+            connection = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self):
+        """
+        Start a write transaction, taking the database write lock at once.
+        """
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        return connection
+
+    def close(self):
+        """
+        Close this thread's connection.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def submit(
+        self,
+        kind: str,
+        params: Dict[str, Any],
+        priority: Priority = "normal",
+        source: str = "cli",
+        dedupe: bool = True
+    ) -> int:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Job type (e.g., "voice" or "image")
+            params: Keyword arguments for the job's handler
+            priority: Priority name or number; larger numbers run first
+            source: Who submitted the job (e.g., "watcher", "crewai", "app");
+                running capacity is shared fairly between sources
+            dedupe: Whether to merge with an identical queued or running job
+
+        Returns:
+            Id of the new job, or of the identical job already in flight
+
+        Raises:
+            ValueError: If the priority is unknown or params hold an API key
+        """
+        if "api_key" in params:
+            raise ValueError("API keys are not stored in the queue; workers read OPENAI_API_KEY")
+        priority = resolve_priority(priority)
+        encoded = json.dumps(params, sort_keys=True)
+        key = dedupe_key(kind, params) if dedupe else None
+
+        connection = self._transaction()
+        try:
+            if key is not None:
+                row = connection.execute(
+                    "SELECT id, priority FROM jobs WHERE dedupe_key = ? AND status IN (?, ?)",
+                    (key, *IN_FLIGHT)
+                ).fetchone()
+                if row is not None:
+                    if priority > row["priority"]:
+                        connection.execute("UPDATE jobs SET priority = ? WHERE id = ?", (priority, row["id"]))
+                    connection.execute("COMMIT")
+                    return row["id"]
+            cursor = connection.execute(
+                "INSERT INTO jobs (kind, params, dedupe_key, priority, source, status, max_attempts, created)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, encoded, key, priority, source, QUEUED, self.max_attempts, time.time())
+            )
+            connection.execute("COMMIT")
+            return cursor.lastrowid
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _expire_leases(self, connection: sqlite3.Connection, now: float):
+        """
+        Requeue running jobs whose worker stopped renewing the lease.
+
+        Jobs that have used up their attempts are failed instead.
+        """
+        connection.execute(
+            "UPDATE jobs SET status = ?, finished = ?, worker = NULL, lease_until = NULL,"
+            " error = 'Worker stopped responding' WHERE status = ? AND lease_until < ? AND attempts >= max_attempts",
+            (FAILED, now, RUNNING, now)
+        )
+        connection.execute(
+            "UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL WHERE status = ? AND lease_until < ?",
+            (QUEUED, RUNNING, now)
+        )
+
+    def claim(
+        self,
+        worker: Optional[str] = None,
+        kinds: Optional[Iterable[str]] = None,
+        job_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Take the next job off the queue and lease it to a worker.
+
+        Args:
+            worker: Worker id (defaults to host:pid of the caller)
+            kinds: Only claim jobs of these types
+            job_id: Claim this specific job if it is queued
+
+        Returns:
+            The claimed job, or None if no matching job is queued
+        """
+        worker = worker or default_worker_id()
+        now = time.time()
+        where = ["status = ?"]
+        args: List[Any] = [QUEUED]
+        if kinds:
+            kinds = list(kinds)
+            where.append(f"kind IN ({', '.join('?' * len(kinds))})")
+            args.extend(kinds)
+        if job_id is not None:
+            where.append("id = ?")
+            args.append(job_id)
+
+        connection = self._transaction()
+        try:
+            self._expire_leases(connection, now)
+            # Within a priority, prefer the source with the fewest jobs running
+            row = connection.execute(
+                "SELECT id FROM jobs AS j WHERE " + " AND ".join(where) +
+                " ORDER BY priority DESC,"
+                " (SELECT COUNT(*) FROM jobs AS r WHERE r.status = 'running' AND r.source = j.source),"
+                " id LIMIT 1",
+                args
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1,"
+                " started = ? WHERE id = ?",
+                (RUNNING, worker, now + self.lease, now, row["id"])
+            )
+            job = connection.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return self._to_dict(job)
+
+    def heartbeat(self, job_id: int, worker: Optional[str] = None) -> bool:
+        """
+        Renew the lease of a running job.
+
+        Returns:
+            False if the job is no longer leased to this worker
+        """
+        cursor = self._connect().execute(
+            "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND worker = ?",
+            (time.time() + self.lease, job_id, RUNNING, worker or default_worker_id())
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, result: Dict[str, Any], worker: Optional[str] = None) -> bool:
+        """
+        Record the result of a job.
+
+        Results with success set to False mark the job failed; the generators
+        report their errors that way.
+
+        Returns:
+            False if the job was no longer leased to this worker
+        """
+        status = DONE if result.get("success", True) else FAILED
+        cursor = self._connect().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?, lease_until = NULL"
+            " WHERE id = ? AND status = ? AND worker = ?",
+            (status, json.dumps(result), result.get("error"), time.time(),
+             job_id, RUNNING, worker or default_worker_id())
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, error: str, worker: Optional[str] = None) -> bool:
+        """
+        Record that a job raised; it is queued again until it runs out of attempts.
+
+        Returns:
+            False if the job was no longer leased to this worker
+        """
+        connection = self._connect()
+        cursor = connection.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,"
+            " finished = CASE WHEN attempts >= max_attempts THEN ? END,"
+            " error = ?, worker = NULL, lease_until = NULL WHERE id = ? AND status = ? AND worker = ?",
+            (FAILED, QUEUED, time.time(), error, job_id, RUNNING, worker or default_worker_id())
+        )
+        return cursor.rowcount == 1
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Returns:
+            True if the job was queued and is now cancelled
+        """
+        cursor = self._connect().execute(
+            "UPDATE jobs SET status = ?, error = 'Cancelled', finished = ? WHERE id = ? AND status = ?",
+            (FAILED, time.time(), job_id, QUEUED)
+        )
+        return cursor.rowcount == 1
+
+    def recover(self) -> int:
+        """
+        Requeue jobs held by workers on this host whose process has exited.
+
+        Jobs of workers on other hosts are left to lease expiry.
+
+        Returns:
+            Number of jobs requeued
+        """
+        host = socket.gethostname()
+        connection = self._transaction()
+        try:
+            dead = []
+            for row in connection.execute("SELECT DISTINCT worker FROM jobs WHERE status = ?", (RUNNING,)):
+                worker_host, _, pid = (row["worker"] or "").rpartition(":")
+                if worker_host == host and pid.isdigit() and not _process_alive(int(pid)):
+                    dead.append(row["worker"])
+            requeued = 0
+            for worker in dead:
+                requeued += connection.execute(
+                    "UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL WHERE status = ? AND worker = ?",
+                    (QUEUED, RUNNING, worker)
+                ).rowcount
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return requeued
+
+    def register_worker(self, worker: Optional[str] = None, kinds: Optional[Iterable[str]] = None):
+        """
+        Record that a worker is alive; workers call this while they poll.
+        """
+        self._connect().execute(
+            "INSERT INTO workers (id, kinds, heartbeat) VALUES (?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET kinds = excluded.kinds, heartbeat = excluded.heartbeat",
+            (worker or default_worker_id(), json.dumps(list(kinds) if kinds else None), time.time())
+        )
+
+    def unregister_worker(self, worker: Optional[str] = None):
+        """
+        Remove a worker that is shutting down.
+        """
+        self._connect().execute("DELETE FROM workers WHERE id = ?", (worker or default_worker_id(),))
+
+    def live_workers(self, kind: Optional[str] = None) -> List[str]:
+        """
+        Ids of workers that reported in within the lease period.
+
+        Args:
+            kind: Only workers that take jobs of this type
+        """
+        rows = self._connect().execute(
+            "SELECT id, kinds FROM workers WHERE heartbeat >= ?", (time.time() - self.lease,)
+        ).fetchall()
+        return [
+            row["id"] for row in rows
+            if kind is None or row["kinds"] in (None, "null") or kind in json.loads(row["kinds"])
+        ]
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a job and its current status.
+
+        Returns:
+            The job, or None if there is no job with this id
+        """
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def wait(
+        self,
+        job_id: int,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.1
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Poll a job until it is done or failed.
+
+        Args:
+            job_id: Job to wait for
+            timeout: Seconds to wait at most (None waits forever)
+            poll_interval: Seconds between polls
+
+        Returns:
+            The finished job, or its current state if the timeout passed
+
+        Raises:
+            ValueError: If there is no job with this id
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                raise ValueError(f"No job with id {job_id}")
+            if job["status"] not in IN_FLIGHT:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(poll_interval)
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        List jobs, newest first.
+
+        Args:
+            status: Only jobs with this status
+            kind: Only jobs of this type
+            limit: Maximum number of jobs
+        """
+        where, args = [], []
+        if status:
+            where.append("status = ?")
+            args.append(status)
+        if kind:
+            where.append("kind = ?")
+            args.append(kind)
+        sql = "SELECT * FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = self._connect().execute(sql + " ORDER BY id DESC LIMIT ?", (*args, limit)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Count jobs by status and kind.
+
+        Returns:
+            Dictionary with per-status and per-kind counts and the live workers
+        """
+        connection = self._connect()
+        by_status = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+        for row in connection.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            by_status[row["status"]] = row["n"]
+        by_kind: Dict[str, Dict[str, int]] = {}
+        for row in connection.execute("SELECT kind, status, COUNT(*) AS n FROM jobs GROUP BY kind, status"):
+            by_kind.setdefault(row["kind"], {})[row["status"]] = row["n"]
+        return {"status": by_status, "kinds": by_kind, "workers": self.live_workers()}
+
+    def purge(self, older_than: float = 7 * 86400) -> int:
+        """
+        Delete finished jobs and stale worker records.
+
+        Args:
+            older_than: Seconds since a job finished before it is deleted
+
+        Returns:
+            Number of jobs deleted
+        """
+        now = time.time()
+        connection = self._connect()
+        deleted = connection.execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND finished < ?", (DONE, FAILED, now - older_than)
+        ).rowcount
+        connection.execute("DELETE FROM workers WHERE heartbeat < ?", (now - self.lease,))
+        return deleted
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """
+        Convert a job row to a dictionary with decoded params and result.
+        """
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job.pop("dedupe_key", None)
+        return job
+
+
+def _process_alive(pid: int) -> bool:
+    """
+    Check whether a process with this id exists.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
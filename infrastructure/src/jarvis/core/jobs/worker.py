@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Workers that run queued voice and image jobs.
+
+A worker process polls the queue, runs each claimed job with the handler
+registered for its kind and renews the job's lease from a heartbeat thread
+while the handler runs. A pool keeps N worker processes alive and replaces any
+that exit. Handlers are named by dotted path so that spawned processes can
+import them.
+"""
+import time
+import signal
+import importlib
+import threading
+import traceback
+import multiprocessing
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Iterable
+
+from .queue import JobQueue, Priority, default_worker_id
+
+# Job kind -> "module:function" called with the job's params
+HANDLERS: Dict[str, str] = {
+    "voice": "jarvis.core.voice_generation.generator:generate_voice",
+    "image": "jarvis.core.image_generation.generator:generate_image",
+}
+
+# Idle polling starts at the minimum interval after a job and backs off to the maximum
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+_handler_cache: Dict[str, Callable[..., Dict[str, Any]]] = {}
+
+
+def register_handler(kind: str, target: str):
+    """
+    Register the handler for a job kind.
+
+    Args:
+        kind: Job type
+        target: Handler as "module:function"; it must be importable by the workers
+    """
+    HANDLERS[kind] = target
+    _handler_cache.pop(kind, None)
+
+
+def get_handler(kind: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Import the handler for a job kind.
+
+    Raises:
+        ValueError: If no handler is registered for the kind
+    """
+    if kind not in _handler_cache:
+        if kind not in HANDLERS:
+            raise ValueError(f"No handler for job kind: {kind}. Must be one of {list(HANDLERS)}")
+        module_name, _, function_name = HANDLERS[kind].partition(":")
+        _handler_cache[kind] = getattr(importlib.import_module(module_name), function_name)
+    return _handler_cache[kind]
+
+
+class Worker:
+    """
+    Claims jobs from a queue and runs them one at a time.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[JobQueue] = None,
+        kinds: Optional[Iterable[str]] = None,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: Queue to take jobs from
+            kinds: Only run jobs of these types (defaults to all registered kinds)
+            worker_id: Worker id (defaults to host:pid)
+        """
+        self.queue = queue or JobQueue()
+        self.kinds = list(kinds) if kinds else None
+        self.worker_id = worker_id or default_worker_id()
+
+    def execute(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a claimed job, renewing its lease until the handler returns.
+
+        Returns:
+            The handler's result, or an error result if it raised
+        """
+        stop = threading.Event()
+
+        def heartbeat():
+            # Separate connection per thread, handled by the queue
+            while not stop.wait(self.queue.lease / 3):
+                if not self.queue.heartbeat(job["id"], self.worker_id):
+                    break
+            self.queue.close()
+
+        beat = threading.Thread(target=heartbeat, name=f"job-{job['id']}-heartbeat", daemon=True)
+        beat.start()
+        try:
+            result = get_handler(job["kind"])(**job["params"])
+        except Exception as e:
+            self.queue.fail(job["id"], f"{e}\n{traceback.format_exc()}", self.worker_id)
+            return {"success": False, "error": str(e)}
+        finally:
+            stop.set()
+            beat.join()
+        self.queue.complete(job["id"], result, self.worker_id)
+        return result
+
+    def run_once(self, job_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Claim and run one job.
+
+        Args:
+            job_id: Run this specific job if it is still queued
+
+        Returns:
+            The job with its result, or None if nothing was queued
+        """
+        job = self.queue.claim(self.worker_id, self.kinds, job_id)
+        if job is None:
+            return None
+        job["result"] = self.execute(job)
+        return job
+
+    def run(self, stop: Optional[Any] = None):
+        """
+        Run jobs until the stop event is set.
+
+        Args:
+            stop: threading or multiprocessing Event that ends the loop
+        """
+        stop = stop or threading.Event()
+        interval = MIN_POLL_INTERVAL
+        last_report = 0.0
+        try:
+            while not stop.is_set():
+                now = time.monotonic()
+                if now - last_report >= self.queue.lease / 3:
+                    self.queue.register_worker(self.worker_id, self.kinds)
+                    last_report = now
+                if self.run_once() is not None:
+                    interval = MIN_POLL_INTERVAL
+                    continue
+                stop.wait(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+        finally:
+            self.queue.unregister_worker(self.worker_id)
+
+
+def _worker_main(
+    queue_path: str,
+    lease: float,
+    max_attempts: int,
+    kinds: Optional[List[str]],
+    handlers: Dict[str, str],
+    stop: Any
+):
+    """
+    Entry point of a pool worker process.
+    """
+    # The pool owner handles Ctrl-C and tells the workers through the stop event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    HANDLERS.update(handlers)
+    Worker(JobQueue(Path(queue_path), lease, max_attempts), kinds).run(stop)
+
+
+class WorkerPool:
+    """
+    Keeps a number of worker processes running against one queue.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue: Optional[JobQueue] = None,
+        kinds: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of worker processes
+            queue: Queue the workers take jobs from
+            kinds: Only run jobs of these types
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}. Must be at least 1")
+        self.size = workers
+        self.queue = queue or JobQueue()
+        self.kinds = list(kinds) if kinds else None
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: List[Any] = []
+
+    def _spawn(self):
+        process = self._context.Process(
+            target=_worker_main,
+            args=(str(self.queue.path), self.queue.lease, self.queue.max_attempts,
+                  self.kinds, dict(HANDLERS), self._stop),
+            name="jarvis-job-worker",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def start(self):
+        """
+        Requeue jobs of workers that died before, then start the worker processes.
+        """
+        self.queue.recover()
+        self._processes = [self._spawn() for _ in range(self.size)]
+
+    def stop(self, timeout: float = 30.0):
+        """
+        Ask the workers to finish their current job and exit.
+
+        Args:
+            timeout: Seconds to wait before terminating workers that are still busy
+        """
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes = []
+        self.queue.recover()
+
+    def serve(self, check_interval: float = 1.0):
+        """
+        Start the pool and replace workers that exit until interrupted.
+        """
+        self.start()
+        try:
+            while not self._stop.is_set():
+                for index, process in enumerate(self._processes):
+                    if not process.is_alive():
+                        self.queue.recover()
+                        self._processes[index] = self._spawn()
+                self._stop.wait(check_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def run_job(
+    kind: str,
+    params: Dict[str, Any],
+    priority: Priority = "interactive",
+    source: str = "cli",
+    timeout: Optional[float] = None,
+    queue: Optional[JobQueue] = None
+) -> Dict[str, Any]:
+    """
+    Submit a job and wait for its result.
+
+    When no worker for this kind is running, the calling process claims and
+    runs the job itself, so callers work with or without a worker pool.
+
+    Args:
+        kind: Job type (e.g., "voice" or "image")
+        params: Keyword arguments for the job's handler
+        priority: Priority name or number; larger numbers run first
+        source: Who submitted the job
+        timeout: Seconds to wait for a worker at most (None waits forever)
+        queue: Queue to use
+
+    Returns:
+        The handler's result, with the job id added
+    """
+    queue = queue or JobQueue()
+    job_id = queue.submit(kind, params, priority, source)
+    worker = Worker(queue, [kind])
+    # A job that raised is queued again, so keep going until it runs out of attempts
+    while not queue.live_workers(kind) and worker.run_once(job_id) is not None:
+        pass
+
+    job = queue.wait(job_id, timeout)
+    if job["result"] is not None:
+        return {**job["result"], "job_id": job_id}
+    if job["status"] in ("queued", "running"):
+        return {"success": False, "job_id": job_id,
+                "error": f"Timed out waiting for job {job_id} ({job['status']})"}
+    return {"success": False, "job_id": job_id, "error": job["error"] or "Job failed"}
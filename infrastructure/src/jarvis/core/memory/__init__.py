@@ -0,0 +1,25 @@
+"""
+Memory tools for the Jarvis knowledge tree.
+"""
+
+from .index import MemoryIndex, search_memory
+from .context import ContextLoader, load_context
+from .activity import ActivityStore
+
+__all__ = [
+    "MemoryIndex",
+    "search_memory",
+    "ContextLoader",
+    "load_context",
+    "ActivityStore",
+    "MemoryRecall",
+    "recall_memories",
+]
+
+
+def __getattr__(name):
+    # Vector recall needs numpy, so it is only imported when used
+    if name in ("MemoryRecall", "recall_memories"):
+        from . import recall
+        return getattr(recall, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
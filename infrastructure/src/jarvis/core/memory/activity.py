@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Log-structured store for structured-memory activities.
+
+Project activities are appended as compact binary records to a log, so adding
+one never rewrites a project file. Compaction merges the log into a snapshot
+sorted by project and date, with a footer index of where each project starts
+and a sparse list of dates inside it. Queries by project and date range seek
+straight to the matching records of the snapshot and only scan the small log
+written since the last compaction.
+
+Record layout (little endian): total length and CRC32 of the body, then the
+body of timestamp in milliseconds, four string lengths and the UTF-8 project,
+type, description and JSON-encoded extra fields.
+"""
+import os
+import json
+import mmap
+import zlib
+import fcntl
+import struct
+import bisect
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator, Tuple, Union
+
+from .paths import DEFAULT_KNOWLEDGE_DIR
+
+DEFAULT_ACTIVITY_DIR = DEFAULT_KNOWLEDGE_DIR / "structured_memory" / "activity"
+
+SNAPSHOT_MAGIC = b"JVSNAP1\n"
+LOG_MAGIC = b"JVLOG01\n"
+
+# (length, crc32) before every record body
+FRAME = struct.Struct("<II")
+# (timestamp_ms, project, type, description, extra) lengths at the start of a body
+HEADER = struct.Struct("<qHHII")
+# Footer length at the very end of a snapshot
+FOOTER_LENGTH = struct.Struct("<Q")
+
+# One date in the sparse index per this many records of a project
+SPARSE_INTERVAL = 64
+
+# Compact automatically once the log holds this many bytes
+DEFAULT_COMPACT_BYTES = 1 << 20
+
+# Fields every activity has; extra fields may not use these names
+RESERVED_FIELDS = ("project", "date", "timestamp", "type", "description")
+
+DateLike = Union[str, datetime, int, float, None]
+
+
+def to_timestamp(value: DateLike) -> Optional[int]:
+    """
+    Convert a date to milliseconds since the epoch (UTC).
+
+    Args:
+        value: ISO 8601 string (e.g., "2025-04-25T09:45:22Z" or "2025-04-25"),
+            datetime, or seconds since the epoch
+
+    Returns:
+        Milliseconds since the epoch, or None if value is None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value * 1000)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def format_timestamp(timestamp: int) -> str:
+    """
+    Format milliseconds since the epoch like the dates in the project files.
+    """
+    return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def encode_record(timestamp: int, project: str, activity_type: str, description: str,
+                  extra: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encode one activity as a framed binary record.
+    """
+    fields = [
+        project.encode("utf-8"),
+        activity_type.encode("utf-8"),
+        description.encode("utf-8"),
+        json.dumps(extra, separators=(",", ":")).encode("utf-8") if extra else b"",
+    ]
+    body = HEADER.pack(timestamp, *map(len, fields)) + b"".join(fields)
+    return FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def decode_body(body: bytes) -> Dict[str, Any]:
+    """
+    Decode the body of a record into an activity dictionary.
+    """
+    timestamp, *lengths = HEADER.unpack_from(body)
+    position = HEADER.size
+    values = []
+    for length in lengths:
+        values.append(body[position:position + length].decode("utf-8"))
+        position += length
+    project, activity_type, description, extra = values
+
+    activity = {
+        "project": project,
+        "date": format_timestamp(timestamp),
+        "timestamp": timestamp,
+        "type": activity_type,
+        "description": description,
+    }
+    if extra:
+        activity.update(json.loads(extra))
+    return activity
+
+
+def iter_records(
+    data: Union[bytes, mmap.mmap],
+    start: int = 0,
+    end: Optional[int] = None
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Decode the records in data[start:end] (bytes or a memory map).
+
+    Decoding stops at the first incomplete or corrupt record, which is what a
+    write interrupted by a crash leaves at the end of a log.
+
+    Yields:
+        Tuples of (offset of the record, activity)
+    """
+    end = len(data) if end is None else end
+    position = start
+    while position + FRAME.size <= end:
+        length, crc = FRAME.unpack_from(data, position)
+        body = data[position + FRAME.size:position + FRAME.size + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            return
+        yield position, decode_body(body)
+        position += FRAME.size + length
+
+
+def valid_end(data: Union[bytes, mmap.mmap], start: int = 0) -> int:
+    """
+    Find where the intact records in data[start:] end.
+
+    Returns:
+        Offset just past the last record before the first incomplete or
+        corrupt one
+    """
+    position = start
+    while position + FRAME.size <= len(data):
+        length, crc = FRAME.unpack_from(data, position)
+        body = data[position + FRAME.size:position + FRAME.size + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+        position += FRAME.size + length
+    return position
+
+
+class ActivityStore:
+    """
+    Append-only activity log with compacted, indexed snapshots.
+
+    The store directory holds snapshot.bin (records sorted by project and date,
+    followed by a JSON footer index) and activity-<generation>.log (records
+    appended since the snapshot of that generation was written).
+    """
+
+    def __init__(self, root: Optional[Path] = None, compact_bytes: int = DEFAULT_COMPACT_BYTES):
+        """
+        Open (or create) the store.
+
+        Args:
+            root: Directory holding the store
+            compact_bytes: Log size that triggers compaction on append (0 to disable)
+        """
+        self.root = Path(root or DEFAULT_ACTIVITY_DIR)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compact_bytes = compact_bytes
+        self.snapshot_path = self.root / "snapshot.bin"
+        self.lock_path = self.root / ".lock"
+
+        self._snapshot: Union[bytes, mmap.mmap] = b""
+        self._footer: Dict[str, Any] = {"generation": 0, "projects": {}}
+        self._snapshot_stat: Optional[Tuple[int, int]] = None
+        # (log path, size) as left by our last append, known to end on a whole record
+        self._log_tail: Optional[Tuple[Path, int]] = None
+
+    def _lock(self, shared: bool = False):
+        """
+        Lock the store: exclusively for appends and compaction, shared for queries.
+        """
+        handle = open(self.lock_path, "a")
+        fcntl.flock(handle, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return handle
+
+    def _load_snapshot(self) -> None:
+        """
+        Map the snapshot and read its footer, unless it is unchanged since the last read.
+        """
+        try:
+            stat = self.snapshot_path.stat()
+        except FileNotFoundError:
+            self._snapshot, self._snapshot_stat = b"", None
+            self._footer = {"generation": 0, "projects": {}}
+            return
+        if self._snapshot_stat == (stat.st_mtime_ns, stat.st_size):
+            return
+
+        with open(self.snapshot_path, "rb") as f:
+            # Records are only read where a query needs them
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or len(data) < len(SNAPSHOT_MAGIC) + FOOTER_LENGTH.size:
+            raise ValueError(f"Not an activity snapshot: {self.snapshot_path}")
+        (footer_length,) = FOOTER_LENGTH.unpack_from(data, len(data) - FOOTER_LENGTH.size)
+        footer_start = len(data) - FOOTER_LENGTH.size - footer_length
+        self._footer = json.loads(data[footer_start:footer_start + footer_length])
+        self._snapshot = data
+        self._snapshot_stat = (stat.st_mtime_ns, stat.st_size)
+
+    def _log_path(self, generation: Optional[int] = None) -> Path:
+        if generation is None:
+            self._load_snapshot()
+            generation = self._footer["generation"]
+        return self.root / f"activity-{generation}.log"
+
+    def _read_log(self) -> bytes:
+        try:
+            with open(self._log_path(), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return b""
+        return data if data.startswith(LOG_MAGIC) else b""
+
+    def append(
+        self,
+        project: str,
+        description: str,
+        activity_type: str = "note",
+        date: DateLike = None,
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """
+        Append an activity to the log.
+
+        Args:
+            project: Project name (e.g., "jarvis")
+            description: What happened
+            activity_type: Kind of activity (e.g., "implementation", "design", "bugfix")
+            date: When it happened (defaults to now)
+            **extra: Additional JSON-serializable fields stored with the activity
+
+        Returns:
+            The stored activity
+
+        Raises:
+            ValueError: If the project or type is empty, or an extra field uses a reserved name
+        """
+        if not project or not activity_type:
+            raise ValueError("An activity needs a project and a type")
+        reserved = [key for key in extra if key in RESERVED_FIELDS]
+        if reserved:
+            raise ValueError(f"Reserved activity fields: {', '.join(reserved)}")
+        timestamp = to_timestamp(date) if date is not None else to_timestamp(datetime.now(timezone.utc))
+        record = encode_record(timestamp, project, activity_type, description, extra or None)
+
+        with self._lock():
+            log_path = self._log_path()
+            with open(log_path, "ab") as f:
+                self._repair_log_tail(log_path, f)
+                if f.tell() == 0:
+                    f.write(LOG_MAGIC)
+                f.write(record)
+                size = f.tell()
+            self._log_tail = (log_path, size)
+            if self.compact_bytes and size >= self.compact_bytes:
+                self._compact_locked()
+
+        return decode_body(record[FRAME.size:])
+
+    def _repair_log_tail(self, log_path: Path, f) -> None:
+        """
+        Truncate a torn record off the end of the log before appending after it.
+
+        Readers stop at the first bad record, so anything appended after a
+        write that was interrupted by a crash would never be seen. Must be
+        called with the exclusive lock held.
+        """
+        size = os.fstat(f.fileno()).st_size
+        if self._log_tail == (log_path, size) or size == 0:
+            return
+        with open(log_path, "rb") as reader:
+            data = reader.read()
+        end = valid_end(data, len(LOG_MAGIC)) if data.startswith(LOG_MAGIC) else 0
+        if end != size:
+            f.truncate(end)
+            f.seek(end)
+
+    def _snapshot_records(
+        self,
+        project: Optional[str],
+        since: Optional[int],
+        until: Optional[int]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matching snapshot records, seeking with the footer index.
+        """
+        projects = self._footer["projects"]
+        names = [project] if project else sorted(projects)
+        for name in names:
+            if name not in projects:
+                continue
+            index = projects[name]
+            start = index["start"]
+            if since is not None:
+                # The sparse index holds every SPARSE_INTERVAL-th date and its offset
+                position = bisect.bisect_left(index["dates"], since) - 1
+                if position >= 0:
+                    start = index["offsets"][position]
+            for _, activity in iter_records(self._snapshot, start, index["end"]):
+                if until is not None and activity["timestamp"] > until:
+                    break
+                if since is None or activity["timestamp"] >= since:
+                    yield activity
+
+    def query(
+        self,
+        project: Optional[str] = None,
+        since: DateLike = None,
+        until: DateLike = None,
+        types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Find activities.
+
+        Args:
+            project: Only activities of this project
+            since: Only activities at or after this date
+            until: Only activities at or before this date
+            types: Only activities of these types
+            limit: Maximum number of activities
+            newest_first: Order by date descending instead of ascending
+
+        Returns:
+            List of activities with project, date, timestamp, type, description
+            and any extra fields
+        """
+        since_ts, until_ts = to_timestamp(since), to_timestamp(until)
+        with self._lock(shared=True):
+            self._load_snapshot()
+            log = self._read_log()
+            matches = list(self._snapshot_records(project, since_ts, until_ts))
+
+        for _, activity in iter_records(log, len(LOG_MAGIC)):
+            if project and activity["project"] != project:
+                continue
+            if since_ts is not None and activity["timestamp"] < since_ts:
+                continue
+            if until_ts is not None and activity["timestamp"] > until_ts:
+                continue
+            matches.append(activity)
+
+        if types:
+            matches = [activity for activity in matches if activity["type"] in types]
+        matches.sort(key=lambda activity: activity["timestamp"], reverse=newest_first)
+        return matches[:limit] if limit is not None else matches
+
+    def projects(self) -> List[str]:
+        """
+        Get the names of all projects with activities.
+        """
+        with self._lock(shared=True):
+            self._load_snapshot()
+            names = set(self._footer["projects"])
+            log = self._read_log()
+        names.update(activity["project"] for _, activity in iter_records(log, len(LOG_MAGIC)))
+        return sorted(names)
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Merge the log into a new snapshot and start an empty log.
+
+        Returns:
+            Dictionary with the number of records in the snapshot and merged from the log
+        """
+        with self._lock():
+            return self._compact_locked()
+
+    def _compact_locked(self) -> Dict[str, int]:
+        self._load_snapshot()
+        log = self._read_log()
+        old_generation = self._footer["generation"]
+
+        records = [
+            (activity["project"], activity["timestamp"], self._snapshot[offset:offset + FRAME.size + length])
+            for _, index in self._footer["projects"].items()
+            for offset, activity, length in self._frames(self._snapshot, index["start"], index["end"])
+        ]
+        log_records = [
+            (activity["project"], activity["timestamp"], log[offset:offset + FRAME.size + length])
+            for offset, activity, length in self._frames(log, len(LOG_MAGIC), len(log))
+        ]
+        records.extend(log_records)
+        records.sort(key=lambda record: (record[0], record[1]))
+
+        generation = old_generation + 1
+        projects: Dict[str, Dict[str, Any]] = {}
+        chunks = [SNAPSHOT_MAGIC]
+        position = len(SNAPSHOT_MAGIC)
+        for project, timestamp, record in records:
+            index = projects.setdefault(project, {"start": position, "end": position, "count": 0, "dates": [], "offsets": []})
+            if index["count"] % SPARSE_INTERVAL == 0:
+                index["dates"].append(timestamp)
+                index["offsets"].append(position)
+            chunks.append(record)
+            position += len(record)
+            index["end"] = position
+            index["count"] += 1
+
+        footer = json.dumps({"generation": generation, "projects": projects}, separators=(",", ":")).encode("utf-8")
+        chunks.extend([footer, FOOTER_LENGTH.pack(len(footer))])
+
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+        # The new snapshot points at a new, empty log, so a crash before the
+        # old log is removed cannot apply its records twice
+        os.replace(tmp_path, self.snapshot_path)
+        self._log_path(old_generation).unlink(missing_ok=True)
+        self._snapshot_stat = None
+
+        return {"records": len(records), "merged": len(log_records)}
+
+    @staticmethod
+    def _frames(data: bytes, start: int, end: int) -> Iterator[Tuple[int, Dict[str, Any], int]]:
+        for offset, activity in iter_records(data, start, end):
+            (length, _) = FRAME.unpack_from(data, offset)
+            yield offset, activity, length
+
+    def seed_from_projects(self, projects_dir: Optional[Path] = None) -> int:
+        """
+        Import the recent_activity lists of the project JSON files.
+
+        Activities that are already stored (same project, date, type and
+        description) are skipped, so seeding can be repeated.
+
+        Args:
+            projects_dir: Directory of project files (defaults to structured_memory/projects)
+
+        Returns:
+            Number of activities imported
+        """
+        projects_dir = Path(projects_dir or DEFAULT_KNOWLEDGE_DIR / "structured_memory" / "projects")
+        imported = 0
+        for path in sorted(projects_dir.glob("*.json")):
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, dict):
+                continue
+
+            project = path.stem
+            for item in data.get("recent_activity", []):
+                if not isinstance(item, dict) or "date" not in item:
+                    continue
+                existing = self.query(project, since=item["date"], until=item["date"])
+                if any(activity["type"] == item.get("type", "note")
+                       and activity["description"] == item.get("description", "") for activity in existing):
+                    continue
+                extra = {key: value for key, value in item.items() if key not in ("date", "type", "description")}
+                self.append(project, item.get("description", ""), item.get("type", "note"), item["date"], **extra)
+                imported += 1
+
+        return imported
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Session start context bundle for Jarvis.
+
+Assembles identity, capabilities, operational guidelines, the active project
+and the latest episodic memories into one size-budgeted markdown document, in
+priority order. Every section is cached together with the size, modification
+time and hash of the files it was built from, so a new session only re-reads
+sections whose sources changed and reuses the assembled bundle when nothing did.
+Recent memories are picked by file name from a single directory listing, and
+recalled memories are cached by the query and the state of the vector index, so
+the cost of a session start does not grow with the size of the knowledge tree.
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from .paths import DEFAULT_CACHE_DIR, DEFAULT_KNOWLEDGE_DIR, recall_store_dir
+
+DEFAULT_CONTEXT_CACHE = DEFAULT_CACHE_DIR / "context_bundle.json"
+
+# Total size of the bundle in characters
+DEFAULT_BUDGET = 40000
+
+# Bump when rendering changes to invalidate cached sections
+CONTEXT_VERSION = 1
+
+# Sections in priority order. Each section lists its files, takes the latest
+# files of a directory, where file names start with the date (YYYYMMDD_topic.md),
+# or recalls the episodic memory chunks most similar to a query.
+CONTEXT_SECTIONS: List[Dict[str, Any]] = [
+    {
+        "name": "identity",
+        "title": "Identity",
+        "files": ["semantic_memory/concepts/jarvis_identity.md"],
+    },
+    {
+        "name": "capabilities",
+        "title": "Capabilities",
+        "files": [
+            "semantic_memory/concepts/jarvis_capabilities.md",
+            "semantic_memory/concepts/jarvis_introduction.md",
+        ],
+    },
+    {
+        "name": "guidelines",
+        "title": "Operational Guidelines",
+        "files": ["procedural_memory/workflows/operational_guidelines.md"],
+    },
+    {
+        "name": "project",
+        "title": "Active Project",
+        "files": ["structured_memory/projects/{project}.json"],
+        "max_chars": 4000,
+    },
+    {
+        "name": "relevant_memories",
+        "title": "Relevant Memories",
+        "recall": 5,
+        "max_chars": 6000,
+    },
+    {
+        "name": "recent_sessions",
+        "title": "Recent Sessions",
+        "directory": "episodic_memory/sessions",
+        "latest": 3,
+        "max_chars": 8000,
+    },
+    {
+        "name": "recent_conversations",
+        "title": "Recent Conversations",
+        "directory": "episodic_memory/conversations",
+        "latest": 5,
+        "max_chars": 8000,
+    },
+    {
+        "name": "voice",
+        "title": "Voice Implementation",
+        "files": ["procedural_memory/workflows/voice_implementation.md"],
+    },
+]
+
+
+def truncate(text: str, limit: int) -> str:
+    """
+    Shorten text to at most limit characters, preferring a paragraph boundary.
+
+    Args:
+        text: Text to shorten
+        limit: Maximum number of characters
+
+    Returns:
+        The text, or its beginning followed by a truncation marker
+    """
+    if len(text) <= limit:
+        return text
+    marker = "\n\n[...truncated]\n"
+    cut = max(limit - len(marker), 0)
+    boundary = text.rfind("\n\n", 0, cut)
+    if boundary > cut // 2:
+        cut = boundary
+    return text[:cut].rstrip() + marker
+
+
+class ContextLoader:
+    """
+    Builds the session start context bundle, reusing cached sections.
+    """
+
+    def __init__(
+        self,
+        knowledge_dir: Optional[Path] = None,
+        cache_path: Optional[Path] = DEFAULT_CONTEXT_CACHE,
+        sections: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            knowledge_dir: Root of the knowledge tree
+            cache_path: File to cache sections and the bundle in, or None to disable caching
+            sections: Section definitions in priority order (defaults to CONTEXT_SECTIONS)
+        """
+        self.knowledge_dir = Path(knowledge_dir or DEFAULT_KNOWLEDGE_DIR).resolve()
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.sections = sections or CONTEXT_SECTIONS
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        empty = {"version": CONTEXT_VERSION, "knowledge_dir": str(self.knowledge_dir), "sections": {}, "bundle": None}
+        if self.cache_path is None:
+            return empty
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if cache.get("version") != CONTEXT_VERSION or cache.get("knowledge_dir") != str(self.knowledge_dir):
+            return empty
+        return cache
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # The loader works without a cache
+            pass
+
+    def _section_files(self, section: Dict[str, Any], project: Optional[str]) -> List[str]:
+        """
+        Get the files of a section, relative to the knowledge directory.
+        """
+        if "directory" not in section:
+            files = []
+            for pattern in section["files"]:
+                if "{project}" in pattern:
+                    if not project:
+                        continue
+                    pattern = pattern.format(project=project)
+                files.append(pattern)
+            return files
+
+        directory = self.knowledge_dir / section["directory"]
+        try:
+            with os.scandir(directory) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if entry.is_file() and entry.name.endswith(".md") and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
+            return []
+        # Dated file names sort chronologically
+        names.sort(reverse=True)
+        return [f"{section['directory']}/{name}" for name in names[:section["latest"]]]
+
+    def _fingerprint(self, relative_path: str, cached: Optional[List[Any]]) -> Tuple[Optional[List[Any]], Optional[str]]:
+        """
+        Get [mtime_ns, size, sha256] of a file, only reading it if its stat changed.
+
+        Returns:
+            Tuple of (fingerprint or None if missing, content if it was read)
+        """
+        path = self.knowledge_dir / relative_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None, None
+        if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return cached, None
+        content = path.read_text(encoding="utf-8", errors="replace")
+        sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return [stat.st_mtime_ns, stat.st_size, sha256], content
+
+    def _render(self, section: Dict[str, Any], contents: Dict[str, str]) -> str:
+        """
+        Render a section from the contents of its files.
+        """
+        parts = [f"## {section['title']}\n"]
+        for relative_path, content in contents.items():
+            if relative_path.endswith(".json"):
+                content = f"```json\n{content.strip()}\n```"
+            parts.append(f"_Source: {relative_path}_\n\n{content.strip()}\n")
+        text = "\n".join(parts)
+        if section.get("max_chars"):
+            text = truncate(text, section["max_chars"])
+        return text
+
+    def _index_state(self) -> Optional[List[int]]:
+        """
+        Get [mtime_ns, size] of the vector index manifest, or None if there is no index yet.
+        """
+        try:
+            stat = (recall_store_dir(self.knowledge_dir) / "manifest.json").stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _build_recall_section(self, section: Dict[str, Any], query: Optional[str]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Get a recall section from the cache, or search the vector index if the
+        query or the index changed.
+
+        The index is only built here when there is none yet; keeping it up to
+        date is left to `jarvis-recall --update-only`, which walks the tree.
+
+        Returns:
+            Tuple of (section entry with inputs, key and text, whether it was rebuilt)
+        """
+        if not query:
+            return {"inputs": {}, "key": "", "text": ""}, False
+
+        cached = self.cache["sections"].get(section["name"]) or {}
+        inputs = {"query": query, "index": self._index_state()}
+        if cached.get("key") and cached.get("inputs") == inputs:
+            return cached, False
+
+        # Vector recall needs numpy, so it is only imported when a query is given
+        from .recall import MemoryRecall
+
+        recall = MemoryRecall(self.knowledge_dir)
+        if inputs["index"] is None:
+            recall.update()
+            inputs["index"] = self._index_state()
+        parts = [f"## {section['title']}\n"]
+        for result in recall.search(query, section["recall"]):
+            heading = f" - {result['heading']}" if result["heading"] else ""
+            parts.append(f"_Source: {result['path']}{heading}_\n\n{result['text']}\n")
+        text = truncate("\n".join(parts), section["max_chars"]) if len(parts) > 1 else ""
+        return {"inputs": inputs, "key": hashlib.sha256(text.encode("utf-8")).hexdigest(), "text": text}, True
+
+    def _build_section(
+        self,
+        section: Dict[str, Any],
+        project: Optional[str],
+        query: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Get a section from the cache, or rebuild it if any of its files changed.
+
+        Returns:
+            Tuple of (section entry with inputs, key and text, whether it was rebuilt)
+        """
+        if "recall" in section:
+            return self._build_recall_section(section, query)
+
+        cached = self.cache["sections"].get(section["name"]) or {}
+        cached_inputs = cached.get("inputs", {})
+        files = self._section_files(section, project)
+
+        inputs = {}
+        contents: Dict[str, Optional[str]] = {}
+        for relative_path in files:
+            fingerprint, content = self._fingerprint(relative_path, cached_inputs.get(relative_path))
+            if fingerprint is None:
+                continue
+            inputs[relative_path] = fingerprint
+            contents[relative_path] = content
+
+        key = hashlib.sha256(
+            json.dumps([section, {path: fp[2] for path, fp in inputs.items()}], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        if cached.get("key") == key:
+            # A new dict, so that build() sees refreshed fingerprints and saves them
+            return {**cached, "inputs": inputs}, False
+
+        for relative_path, content in contents.items():
+            if content is None:
+                contents[relative_path] = (self.knowledge_dir / relative_path).read_text(encoding="utf-8", errors="replace")
+        text = self._render(section, contents) if contents else ""
+        return {"inputs": inputs, "key": key, "text": text}, True
+
+    def build(
+        self,
+        budget: int = DEFAULT_BUDGET,
+        project: Optional[str] = "jarvis",
+        query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the context bundle.
+
+        Sections are added in priority order until the budget is used up; the
+        section that crosses the budget is truncated and later ones are omitted.
+
+        Args:
+            budget: Maximum size of the bundle in characters
+            project: Name of the active project in structured_memory/projects, or None
+            query: Topic of the session, used to recall related episodic memories
+
+        Returns:
+            Dictionary with "text", "sections" (included section names),
+            "omitted", "rebuilt" (sections re-read from disk) and "cached"
+            (whether the assembled bundle was reused)
+        """
+        entries = {}
+        rebuilt = []
+        for section in self.sections:
+            entry, changed = self._build_section(section, project, query)
+            entries[section["name"]] = entry
+            if changed and entry["text"]:
+                rebuilt.append(section["name"])
+        # Touched but unmodified files only update their fingerprints
+        dirty = any(self.cache["sections"].get(name) != entry for name, entry in entries.items())
+        self.cache["sections"].update(entries)
+
+        bundle_key = hashlib.sha256(
+            json.dumps([budget, [entries[s["name"]]["key"] for s in self.sections]]).encode("utf-8")
+        ).hexdigest()
+        bundle = self.cache.get("bundle")
+        if bundle and bundle.get("key") == bundle_key:
+            if dirty:
+                self._save_cache()
+            return {**bundle["result"], "rebuilt": rebuilt, "cached": True}
+
+        parts = []
+        included = []
+        omitted = []
+        remaining = budget
+        for section in self.sections:
+            text = entries[section["name"]]["text"]
+            if not text:
+                continue
+            if remaining <= 0:
+                omitted.append(section["name"])
+                continue
+            text = truncate(text, remaining)
+            parts.append(text)
+            included.append(section["name"])
+            remaining -= len(text) + 1
+
+        result = {"text": "\n".join(parts), "sections": included, "omitted": omitted}
+        self.cache["bundle"] = {"key": bundle_key, "result": result}
+        self._save_cache()
+        return {**result, "rebuilt": rebuilt, "cached": False}
+
+
+def load_context(
+    budget: int = DEFAULT_BUDGET,
+    project: Optional[str] = "jarvis",
+    query: Optional[str] = None,
+    knowledge_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Build the session start context bundle.
+
+    Args:
+        budget: Maximum size of the bundle in characters
+        project: Name of the active project, or None
+        query: Topic of the session, used to recall related episodic memories
+        knowledge_dir: Root of the knowledge tree
+        use_cache: Whether to reuse cached sections
+
+    Returns:
+        Result of ContextLoader.build()
+    """
+    loader = ContextLoader(knowledge_dir, DEFAULT_CONTEXT_CACHE if use_cache else None)
+    return loader.build(budget=budget, project=project, query=query)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Incremental full-text index over the Jarvis knowledge tree.
+
+Every memory file (markdown, structured JSON and YAML metadata) is indexed in
+an SQLite FTS5 table and ranked with BM25. Updates only re-read files whose
+modification time or size changed, and only re-index files whose content
+hash changed, so keeping the index current stays cheap as memory grows.
+"""
+import re
+import json
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .paths import DEFAULT_CACHE_DIR, DEFAULT_KNOWLEDGE_DIR, iter_memory_files, memory_type_of
+
+DEFAULT_INDEX_PATH = DEFAULT_CACHE_DIR / "memory_index.sqlite3"
+
+# Bump when the schema or text extraction changes to force a rebuild
+INDEX_VERSION = 1
+
+# BM25 column weights for (path, memory_type, title, body)
+BM25_WEIGHTS = (0.0, 0.0, 5.0, 1.0)
+
+
+def extract_text(relative_path: str, content: str) -> Dict[str, str]:
+    """
+    Extract the searchable title and body of a memory file.
+
+    Args:
+        relative_path: Path relative to the knowledge directory
+        content: File content
+
+    Returns:
+        Dictionary with "title" and "body"
+    """
+    title = Path(relative_path).stem.replace("_", " ")
+    body = content
+
+    if relative_path.endswith(".md"):
+        match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        if match:
+            title = match.group(1).strip()
+    elif relative_path.endswith(".json"):
+        try:
+            data = json.loads(content)
+        except ValueError:
+            data = None
+        if data is not None:
+            strings = []
+
+            def collect(value):
+                if isinstance(value, dict):
+                    for item in value.values():
+                        collect(item)
+                elif isinstance(value, list):
+                    for item in value:
+                        collect(item)
+                elif isinstance(value, str):
+                    strings.append(value)
+
+            collect(data)
+            body = "\n".join(strings)
+            if isinstance(data, dict) and isinstance(data.get("name"), str):
+                title = data["name"]
+
+    return {"title": title, "body": body}
+
+
+def build_match_query(query: str, any_term: bool = False) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word is quoted so that user input can never be parsed as FTS5 syntax.
+
+    Args:
+        query: Free-text query
+        any_term: Match documents containing any word instead of all words
+
+    Returns:
+        MATCH expression, or None if the query has no words
+    """
+    terms = [f'"{term}"' for term in re.findall(r"\w+", query)]
+    if not terms:
+        return None
+    return (" OR " if any_term else " ").join(terms)
+
+
+class MemoryIndex:
+    """
+    BM25 index over all files of the knowledge tree, stored in SQLite FTS5.
+    """
+
+    def __init__(self, knowledge_dir: Optional[Path] = None, index_path: Optional[Path] = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            knowledge_dir: Root of the knowledge tree
+            index_path: SQLite file holding the index
+        """
+        self.knowledge_dir = Path(knowledge_dir or DEFAULT_KNOWLEDGE_DIR)
+        if index_path is None:
+            index_path = DEFAULT_INDEX_PATH
+            if self.knowledge_dir.resolve() != Path(DEFAULT_KNOWLEDGE_DIR).resolve():
+                # Keep separate knowledge trees from overwriting each other's index
+                digest = hashlib.sha256(str(self.knowledge_dir.resolve()).encode()).hexdigest()[:8]
+                index_path = DEFAULT_CACHE_DIR / f"memory_index-{digest}.sqlite3"
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.index_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            self._conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS entries;")
+
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                memory_type TEXT,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                entry_id INTEGER
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+                path UNINDEXED,
+                memory_type UNINDEXED,
+                title,
+                body,
+                tokenize = 'porter unicode61'
+            );
+            """
+        )
+        self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def update(self) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the knowledge tree.
+
+        Returns:
+            Dictionary with the number of added, updated, removed and unchanged
+            files and the time taken
+        """
+        start = time.perf_counter()
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        known = {
+            path: (mtime_ns, size, sha256, entry_id)
+            for path, mtime_ns, size, sha256, entry_id in self._conn.execute(
+                "SELECT path, mtime_ns, size, sha256, entry_id FROM files"
+            )
+        }
+
+        with self._conn:
+            for relative_path, entry in iter_memory_files(self.knowledge_dir):
+                stat = entry.stat()
+                previous = known.pop(relative_path, None)
+                if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+
+                with open(entry.path, "rb") as f:
+                    raw = f.read()
+                sha256 = hashlib.sha256(raw).hexdigest()
+                memory_type = memory_type_of(relative_path)
+
+                if previous and previous[2] == sha256:
+                    # Touched but not modified
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (stat.st_mtime_ns, stat.st_size, relative_path)
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                if previous:
+                    self._conn.execute("DELETE FROM entries WHERE rowid = ?", (previous[3],))
+
+                text = extract_text(relative_path, raw.decode("utf-8", errors="replace"))
+                cursor = self._conn.execute(
+                    "INSERT INTO entries (path, memory_type, title, body) VALUES (?, ?, ?, ?)",
+                    (relative_path, memory_type, text["title"], text["body"])
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, memory_type, mtime_ns, size, sha256, entry_id)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (relative_path, memory_type, stat.st_mtime_ns, stat.st_size, sha256, cursor.lastrowid)
+                )
+                stats["updated" if previous else "added"] += 1
+
+            # Whatever is left was deleted from the knowledge tree
+            for relative_path, (_, _, _, entry_id) in known.items():
+                self._conn.execute("DELETE FROM files WHERE path = ?", (relative_path,))
+                self._conn.execute("DELETE FROM entries WHERE rowid = ?", (entry_id,))
+                stats["removed"] += 1
+
+        stats["seconds"] = round(time.perf_counter() - start, 4)
+        return stats
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the index.
+
+        All words of the query must match; if nothing matches, documents that
+        contain any of the words are returned instead.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            memory_type: Optional memory type to restrict the search to (e.g., "episodic")
+
+        Returns:
+            List of results ordered by relevance, each with path, memory_type,
+            title, score and snippet
+        """
+        results = []
+        for any_term in (False, True):
+            match = build_match_query(query, any_term)
+            if match is None:
+                return []
+
+            sql = (
+                "SELECT path, memory_type, title, bm25(entries, ?, ?, ?, ?) AS score,"
+                " snippet(entries, 3, '[', ']', ' … ', 12)"
+                " FROM entries WHERE entries MATCH ?"
+            )
+            params: List[Any] = [*BM25_WEIGHTS, match]
+            if memory_type:
+                sql += " AND memory_type = ?"
+                params.append(memory_type)
+            sql += " ORDER BY score LIMIT ?"
+            params.append(limit)
+
+            results = [
+                {
+                    "path": path,
+                    "memory_type": memory_type_,
+                    "title": title,
+                    # SQLite returns BM25 as a negative number where lower is better
+                    "score": round(-score, 4),
+                    "snippet": snippet,
+                }
+                for path, memory_type_, title, score, snippet in self._conn.execute(sql, params)
+            ]
+            if results:
+                break
+
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count the indexed files per memory type.
+
+        Returns:
+            Dictionary of memory types to file counts
+        """
+        return {
+            memory_type or "other": count
+            for memory_type, count in self._conn.execute(
+                "SELECT memory_type, COUNT(*) FROM files GROUP BY memory_type"
+            )
+        }
+
+
+def search_memory(
+    query: str,
+    limit: int = 10,
+    memory_type: Optional[str] = None,
+    knowledge_dir: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """
+    Update the default index and search it.
+
+    Args:
+        query: Free-text query
+        limit: Maximum number of results
+        memory_type: Optional memory type to restrict the search to
+        knowledge_dir: Root of the knowledge tree
+
+    Returns:
+        List of results ordered by relevance
+    """
+    with MemoryIndex(knowledge_dir) as index:
+        index.update()
+        return index.search(query, limit=limit, memory_type=memory_type)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Locations and traversal of the Jarvis knowledge tree.
+"""
+import os
+import hashlib
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from ...paths import DEFAULT_CACHE_DIR, PROJECT_ROOT
+
+# Root of the Jarvis memory tree (semantic_memory, episodic_memory, ...)
+DEFAULT_KNOWLEDGE_DIR = Path(os.getenv("JARVIS_KNOWLEDGE_DIR", PROJECT_ROOT / "knowledge" / "jarvis"))
+
+MEMORY_TYPES = ["semantic", "episodic", "procedural", "structured"]
+
+# File types that hold memory content
+MEMORY_EXTENSIONS = (".md", ".json", ".yaml", ".yml")
+
+
+def memory_type_of(relative_path: str) -> Optional[str]:
+    """
+    Get the memory type of a file from its path inside the knowledge tree.
+
+    Args:
+        relative_path: Path relative to the knowledge directory
+            (e.g., "episodic_memory/sessions/20250425_documentation_update.md")
+
+    Returns:
+        Memory type (e.g., "episodic"), or None for files outside a memory directory
+    """
+    top = relative_path.replace(os.sep, "/").split("/", 1)[0]
+    if top.endswith("_memory") and top[:-len("_memory")] in MEMORY_TYPES:
+        return top[:-len("_memory")]
+    return None
+
+
+def recall_store_dir(knowledge_dir: Optional[Path] = None) -> Path:
+    """
+    Get the default vector store directory of a knowledge tree.
+
+    Knowledge trees other than the default one get a store of their own, so
+    that they don't overwrite each other's vectors.
+
+    Args:
+        knowledge_dir: Root of the knowledge tree
+
+    Returns:
+        Directory of the vector store
+    """
+    knowledge_dir = Path(knowledge_dir or DEFAULT_KNOWLEDGE_DIR).resolve()
+    if knowledge_dir == Path(DEFAULT_KNOWLEDGE_DIR).resolve():
+        return DEFAULT_CACHE_DIR / "memory_vectors"
+    digest = hashlib.sha256(str(knowledge_dir).encode()).hexdigest()[:8]
+    return DEFAULT_CACHE_DIR / f"memory_vectors-{digest}"
+
+
+def iter_memory_files(
+    knowledge_dir: Optional[Path] = None,
+    extensions: Tuple[str, ...] = MEMORY_EXTENSIONS
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Walk the knowledge tree once with os.scandir.
+
+    Hidden files and directories are skipped.
+
+    Args:
+        knowledge_dir: Root of the knowledge tree
+        extensions: File extensions to include
+
+    Yields:
+        Tuples of (path relative to knowledge_dir, DirEntry)
+    """
+    root = str(knowledge_dir or DEFAULT_KNOWLEDGE_DIR)
+    stack = [""]
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            entries = os.scandir(os.path.join(root, relative_dir))
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                relative_path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(relative_path)
+                elif entry.name.endswith(extensions):
+                    yield relative_path, entry
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Semantic recall over episodic memory with a local vector index.
+
+Memory files are split into chunks and embedded with hashed character and word
+n-grams, which needs no model download and no API call. Vectors are appended to
+a float16 file that is memory-mapped for search, so new conversations and
+sessions are added incrementally and a query only touches the vectors, never
+the full text of every memory file.
+"""
+import os
+import re
+import json
+import zlib
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+import numpy as np
+
+from .paths import DEFAULT_KNOWLEDGE_DIR, iter_memory_files, recall_store_dir
+
+DEFAULT_STORE_DIR = recall_store_dir()
+
+# Directories of the knowledge tree that are indexed by default
+DEFAULT_MEMORY_DIRS = ("episodic_memory",)
+
+# Chunks are split on headings and then packed paragraph by paragraph up to this size
+MAX_CHUNK_CHARS = 1200
+
+# Rewrite the vector file once this share of rows belongs to deleted chunks
+COMPACT_RATIO = 0.25
+
+# Rows scored per block, to bound the float32 working set during search
+SEARCH_BLOCK_ROWS = 65536
+
+
+class HashedNgramEmbedder:
+    """
+    Embeds text as L2-normalized feature-hashed word and character n-gram counts.
+
+    Similar wording maps to similar vectors, which is enough to find the
+    memories that talk about the same things as a query.
+    """
+
+    def __init__(self, dim: int = 512, char_ngrams: Tuple[int, ...] = (3, 4)):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Number of vector dimensions
+            char_ngrams: Character n-gram lengths to hash
+        """
+        self.dim = dim
+        self.char_ngrams = char_ngrams
+
+    @property
+    def name(self) -> str:
+        """Identifier stored with the index; vectors from other embedders are not comparable."""
+        return f"hashed-ngram-{self.dim}-{'-'.join(map(str, self.char_ngrams))}"
+
+    def _features(self, text: str) -> Iterable[str]:
+        words = re.findall(r"\w+", text.lower())
+        yield from words
+        yield from (f"{a} {b}" for a, b in zip(words, words[1:]))
+        for word in words:
+            padded = f" {word} "
+            for n in self.char_ngrams:
+                yield from (padded[i:i + n] for i in range(len(padded) - n + 1))
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dim) with unit-length rows
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))
+                # The top bit picks the sign so that collisions tend to cancel out
+                vectors[row, digest % self.dim] += 1.0 if digest & 0x80000000 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+def chunk_markdown(content: str) -> List[Dict[str, Any]]:
+    """
+    Split a memory file into chunks along headings and paragraphs.
+
+    Args:
+        content: File content
+
+    Returns:
+        List of chunks with "heading", "start" and "end" character offsets
+    """
+    body_start = 0
+    if content.startswith("---"):
+        # Skip YAML front matter
+        end = content.find("\n---", 3)
+        if end != -1:
+            body_start = end + 4
+
+    sections = []
+    heading = ""
+    section_start = body_start
+    for match in re.finditer(r"^#{1,6}\s+(.+)$", content[body_start:], re.MULTILINE):
+        position = body_start + match.start()
+        if not re.sub(r"^#{1,6}\s+.*$", "", content[section_start:position], flags=re.MULTILINE).strip():
+            # A heading directly followed by another one starts the same chunk
+            heading = heading or match.group(1).strip()
+            continue
+        sections.append((heading, section_start, position))
+        heading = match.group(1).strip()
+        section_start = position
+    sections.append((heading, section_start, len(content)))
+
+    chunks = []
+    for heading, start, end in sections:
+        chunk_start = start
+        for paragraph in re.finditer(r"\n\s*\n", content[start:end]):
+            split = start + paragraph.end()
+            if split - chunk_start >= MAX_CHUNK_CHARS:
+                chunks.append({"heading": heading, "start": chunk_start, "end": split})
+                chunk_start = split
+        if content[chunk_start:end].strip():
+            chunks.append({"heading": heading, "start": chunk_start, "end": end})
+
+    return chunks
+
+
+class MemoryRecall:
+    """
+    Incremental vector index over chunks of memory files.
+
+    The store directory holds vectors.f16 (rows of float16 vectors), chunks.jsonl
+    (one metadata line per row) and manifest.json (indexed files and deleted rows).
+    Only one process should update a store at a time.
+    """
+
+    def __init__(
+        self,
+        knowledge_dir: Optional[Path] = None,
+        store_dir: Optional[Path] = None,
+        embedder: Optional[Any] = None,
+        memory_dirs: Tuple[str, ...] = DEFAULT_MEMORY_DIRS
+    ):
+        """
+        Open (or create) the vector store.
+
+        Args:
+            knowledge_dir: Root of the knowledge tree
+            store_dir: Directory holding the vector store
+            embedder: Object with name, dim and embed(texts) (defaults to HashedNgramEmbedder)
+            memory_dirs: Directories of the knowledge tree to index
+        """
+        self.knowledge_dir = Path(knowledge_dir or DEFAULT_KNOWLEDGE_DIR)
+        if store_dir is None:
+            store_dir = recall_store_dir(self.knowledge_dir)
+        self.store_dir = Path(store_dir)
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.memory_dirs = memory_dirs
+
+        self.vectors_path = self.store_dir / "vectors.f16"
+        self.chunks_path = self.store_dir / "chunks.jsonl"
+        self.manifest_path = self.store_dir / "manifest.json"
+
+        self._chunks: Optional[List[Dict[str, Any]]] = None
+        self.manifest = self._load_manifest()
+
+    def _empty_manifest(self) -> Dict[str, Any]:
+        return {"embedder": self.embedder.name, "dim": self.embedder.dim, "rows": 0, "files": {}, "deleted": []}
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return self._empty_manifest()
+
+        if manifest.get("embedder") != self.embedder.name or manifest.get("dim") != self.embedder.dim:
+            # Vectors from another embedder cannot be compared with new ones
+            return self._empty_manifest()
+        return manifest
+
+    def _save_manifest(self) -> None:
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _load_chunks(self) -> List[Dict[str, Any]]:
+        if self._chunks is None:
+            self._chunks = []
+            if self.chunks_path.exists():
+                with open(self.chunks_path, "r") as f:
+                    self._chunks = [json.loads(line) for line in f]
+        return self._chunks[:self.manifest["rows"]]
+
+    def _truncate_to_manifest(self) -> None:
+        """
+        Cut rows past manifest["rows"] off the vector and chunk files.
+
+        An update that crashed after appending but before saving the manifest
+        leaves such rows behind; new rows must be appended right after the
+        ones the manifest knows about.
+        """
+        rows = self.manifest["rows"]
+        vector_bytes = rows * self.embedder.dim * np.dtype(np.float16).itemsize
+
+        chunk_bytes = 0
+        chunk_rows = 0
+        if rows:
+            try:
+                with open(self.chunks_path, "rb") as f:
+                    for line in f:
+                        if chunk_rows == rows:
+                            break
+                        if not line.endswith(b"\n"):
+                            break
+                        chunk_bytes += len(line)
+                        chunk_rows += 1
+            except OSError:
+                pass
+            vectors_size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+            if chunk_rows < rows or vectors_size < vector_bytes:
+                # Rows the manifest counts on are missing; start over
+                self.manifest = self._empty_manifest()
+                vector_bytes = chunk_bytes = 0
+
+        for path, size in ((self.vectors_path, vector_bytes), (self.chunks_path, chunk_bytes)):
+            if not path.exists() or path.stat().st_size != size:
+                with open(path, "ab") as f:
+                    f.truncate(size)
+                self._chunks = None
+
+    def update(self) -> Dict[str, int]:
+        """
+        Embed new and changed memory files and forget deleted ones.
+
+        Returns:
+            Dictionary with the number of added, updated, removed and unchanged files
+            and the number of chunks embedded
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        # Rows and metadata lines must line up with the manifest before appending
+        self._truncate_to_manifest()
+
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "chunks": 0}
+        files = self.manifest["files"]
+        deleted = set(self.manifest["deleted"])
+        seen = set()
+
+        new_vectors = []
+        new_chunks = []
+        for memory_dir in self.memory_dirs:
+            for relative_path, entry in iter_memory_files(self.knowledge_dir / memory_dir, (".md",)):
+                relative_path = os.path.join(memory_dir, relative_path)
+                seen.add(relative_path)
+
+                stat = entry.stat()
+                previous = files.get(relative_path)
+                if previous and (previous["mtime_ns"], previous["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+
+                with open(entry.path, "r", encoding="utf-8", errors="replace") as f:
+                    content = f.read()
+                sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                if previous and previous["sha256"] == sha256:
+                    previous.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    stats["unchanged"] += 1
+                    continue
+
+                if previous:
+                    deleted.update(previous["rows"])
+
+                chunks = chunk_markdown(content)
+                first_row = self.manifest["rows"] + len(new_chunks)
+                texts = [f"{chunk['heading']}\n{content[chunk['start']:chunk['end']]}" for chunk in chunks]
+                if texts:
+                    new_vectors.append(self.embedder.embed(texts))
+                new_chunks.extend({"path": relative_path, **chunk} for chunk in chunks)
+
+                files[relative_path] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": sha256,
+                    "rows": list(range(first_row, first_row + len(chunks))),
+                }
+                stats["updated" if previous else "added"] += 1
+                stats["chunks"] += len(chunks)
+
+        for relative_path in [path for path in files if path not in seen]:
+            deleted.update(files.pop(relative_path)["rows"])
+            stats["removed"] += 1
+
+        if new_chunks:
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.concatenate(new_vectors).astype(np.float16).tobytes())
+            with open(self.chunks_path, "a") as f:
+                for chunk in new_chunks:
+                    f.write(json.dumps(chunk) + "\n")
+            if self._chunks is not None:
+                self._chunks.extend(new_chunks)
+            self.manifest["rows"] += len(new_chunks)
+
+        self.manifest["deleted"] = sorted(deleted)
+        self._save_manifest()
+
+        if self.manifest["rows"] and len(deleted) / self.manifest["rows"] > COMPACT_RATIO:
+            self.compact()
+
+        return stats
+
+    def _vectors(self) -> Optional[np.ndarray]:
+        rows = self.manifest["rows"]
+        if rows == 0:
+            return None
+        return np.memmap(self.vectors_path, dtype=np.float16, mode="r", shape=(rows, self.embedder.dim))
+
+    def compact(self) -> None:
+        """
+        Rewrite the store without the rows of deleted chunks.
+        """
+        vectors = self._vectors()
+        chunks = self._load_chunks()
+        deleted = set(self.manifest["deleted"])
+        keep = [row for row in range(self.manifest["rows"]) if row not in deleted]
+
+        remap = {old: new for new, old in enumerate(keep)}
+        tmp_vectors = self.vectors_path.with_suffix(".tmp")
+        tmp_chunks = self.chunks_path.with_suffix(".tmp")
+        with open(tmp_vectors, "wb") as f:
+            if keep:
+                f.write(np.asarray(vectors[keep]).tobytes())
+        with open(tmp_chunks, "w") as f:
+            for row in keep:
+                f.write(json.dumps(chunks[row]) + "\n")
+        del vectors
+
+        os.replace(tmp_vectors, self.vectors_path)
+        os.replace(tmp_chunks, self.chunks_path)
+
+        for info in self.manifest["files"].values():
+            info["rows"] = [remap[row] for row in info["rows"]]
+        self.manifest["rows"] = len(keep)
+        self.manifest["deleted"] = []
+        self._chunks = None
+        self._save_manifest()
+
+    def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the memory chunks most similar to a query.
+
+        Args:
+            query: Free-text query
+            k: Number of results
+
+        Returns:
+            List of results ordered by cosine similarity, each with path,
+            heading, score and text
+        """
+        vectors = self._vectors()
+        if vectors is None or k <= 0:
+            return []
+
+        query_vector = self.embedder.embed([query])[0]
+        rows = vectors.shape[0]
+        scores = np.empty(rows, dtype=np.float32)
+        for start in range(0, rows, SEARCH_BLOCK_ROWS):
+            block = vectors[start:start + SEARCH_BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query_vector
+        if self.manifest["deleted"]:
+            scores[self.manifest["deleted"]] = -np.inf
+
+        k = min(k, rows)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        chunks = self._load_chunks()
+        results = []
+        texts: Dict[str, str] = {}
+        for row in top:
+            if not np.isfinite(scores[row]):
+                continue
+            chunk = chunks[row]
+            if chunk["path"] not in texts:
+                with open(self.knowledge_dir / chunk["path"], "r", encoding="utf-8", errors="replace") as f:
+                    texts[chunk["path"]] = f.read()
+            results.append({
+                "path": chunk["path"],
+                "heading": chunk["heading"],
+                "score": round(float(scores[row]), 4),
+                "text": texts[chunk["path"]][chunk["start"]:chunk["end"]].strip(),
+            })
+        return results
+
+
+def recall_memories(query: str, k: int = 5, knowledge_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    Update the default episodic vector store and search it.
+
+    Args:
+        query: Free-text query
+        k: Number of results
+        knowledge_dir: Root of the knowledge tree
+
+    Returns:
+        List of results ordered by similarity
+    """
+    recall = MemoryRecall(knowledge_dir)
+    recall.update()
+    return recall.search(query, k)
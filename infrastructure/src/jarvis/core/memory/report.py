@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Memory status report for the Jarvis knowledge tree.
+
+Produces the same JSON as workspace/tools/generate_memory_report.sh, but walks
+the tree once with os.scandir instead of running find/stat/wc per memory type.
+The collected counts are cached together with the modification times of the
+directories they came from, so repeated reports skip the walk entirely.
+"""
+import os
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from .paths import DEFAULT_CACHE_DIR, DEFAULT_KNOWLEDGE_DIR
+
+DEFAULT_REPORT_CACHE = DEFAULT_CACHE_DIR / "memory_report.json"
+
+# In-place edits do not change directory mtimes, so cached counts are also
+# refreshed after this many seconds
+DEFAULT_MAX_AGE = 60
+
+# Freshness thresholds in seconds: 1 day for fresh, 7 days for normal, beyond is stale
+FRESH_THRESHOLD = 86400
+NORMAL_THRESHOLD = 604800
+
+# (directory, file suffix, files for "complete", files for 100%) per memory type
+MEMORY_SPECS = {
+    "semantic": ("semantic_memory", ".md", 3, 5),
+    "procedural": ("procedural_memory", ".md", 3, 5),
+    "structured": ("structured_memory", ".json", 2, 2),
+}
+EPISODIC_DIR = "episodic_memory"
+
+
+def _scan(knowledge_dir: Path) -> Dict[str, Any]:
+    """
+    Walk the knowledge tree once and collect file counts and modification times.
+    """
+    counts = {name: 0 for name in ["semantic", "procedural", "structured", "conversations", "sessions"]}
+    last_modified = {name: 0.0 for name in ["semantic", "episodic", "procedural", "structured"]}
+    directories: Dict[str, int] = {}
+
+    def walk(path: str, visit) -> None:
+        try:
+            directories[path] = os.stat(path).st_mtime_ns
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path, visit)
+                elif entry.is_file():
+                    visit(path, entry)
+
+    for memory_type, (directory, suffix, _, _) in MEMORY_SPECS.items():
+        def visit(_, entry, memory_type=memory_type, suffix=suffix):
+            if entry.name.endswith(suffix):
+                counts[memory_type] += 1
+                last_modified[memory_type] = max(last_modified[memory_type], entry.stat().st_mtime)
+
+        walk(os.path.join(knowledge_dir, directory), visit)
+
+    episodic_root = os.path.join(knowledge_dir, EPISODIC_DIR)
+
+    def visit_episodic(path, entry):
+        if not entry.name.endswith(".md"):
+            return
+        # Only files below conversations/ and sessions/ count towards those totals
+        relative = os.path.relpath(path, episodic_root).split(os.sep)[0]
+        if relative in ("conversations", "sessions"):
+            counts[relative] += 1
+        last_modified["episodic"] = max(last_modified["episodic"], entry.stat().st_mtime)
+
+    walk(episodic_root, visit_episodic)
+
+    return {"counts": counts, "last_modified": last_modified, "directories": directories}
+
+
+def _directories_unchanged(directories: Dict[str, int]) -> bool:
+    """
+    Check that none of the scanned directories changed since the scan.
+    """
+    for path, mtime_ns in directories.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def collect_memory_stats(
+    knowledge_dir: Optional[Path] = None,
+    cache_path: Optional[Path] = DEFAULT_REPORT_CACHE,
+    max_age: float = DEFAULT_MAX_AGE
+) -> Dict[str, Any]:
+    """
+    Get file counts and modification times for every memory type.
+
+    Args:
+        knowledge_dir: Root of the knowledge tree
+        cache_path: File to cache the scan in, or None to always scan
+        max_age: Seconds after which a cached scan is refreshed even if no
+            directory changed
+
+    Returns:
+        Dictionary with "counts" and "last_modified" per memory type
+    """
+    knowledge_dir = Path(knowledge_dir or DEFAULT_KNOWLEDGE_DIR).resolve()
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if (cached.get("knowledge_dir") == str(knowledge_dir)
+                    and time.time() - cached.get("scanned_at", 0) < max_age
+                    and _directories_unchanged(cached["directories"])):
+                return cached
+        except (OSError, ValueError, KeyError):
+            pass
+
+    stats = _scan(knowledge_dir)
+    stats["knowledge_dir"] = str(knowledge_dir)
+    stats["scanned_at"] = time.time()
+
+    if cache_path is not None:
+        try:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The report works without a cache
+            pass
+
+    return stats
+
+
+def get_freshness(last_modified: float, now: float) -> str:
+    """
+    Classify how recently a memory type was updated.
+    """
+    if not last_modified:
+        return "stale"
+    age = now - last_modified
+    if age < FRESH_THRESHOLD:
+        return "fresh"
+    elif age < NORMAL_THRESHOLD:
+        return "normal"
+    return "stale"
+
+
+def get_completeness_status(count: int, threshold: int) -> str:
+    """
+    Classify how complete a memory type is.
+    """
+    if count >= threshold:
+        return "complete"
+    elif count > 0:
+        return "partial"
+    return "empty"
+
+
+def get_completeness(count: int, target: int) -> int:
+    """
+    Get the completeness percentage of a memory type, capped at 100.
+    """
+    return min(100, count * 100 // target)
+
+
+def format_timestamp(timestamp: float) -> str:
+    """
+    Format a modification time like the shell report did.
+    """
+    if not timestamp:
+        return ""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def build_report(stats: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Build the memory status report from collected stats.
+
+    Args:
+        stats: Result of collect_memory_stats()
+        now: Current time (defaults to time.time())
+
+    Returns:
+        Report dictionary with memory_systems, overall_health and recommendations
+    """
+    now = time.time() if now is None else now
+    counts = stats["counts"]
+    last_modified = stats["last_modified"]
+
+    memory_systems: Dict[str, Dict[str, Any]] = {}
+    for memory_type in ["semantic", "episodic", "procedural", "structured"]:
+        if memory_type == "episodic":
+            memory_systems["episodic"] = {
+                "conversation_count": counts["conversations"],
+                "session_count": counts["sessions"],
+                "last_updated": format_timestamp(last_modified["episodic"]),
+                "freshness": get_freshness(last_modified["episodic"], now),
+                "conversation_status": "active" if counts["conversations"] > 0 else "inactive",
+                "session_status": "active" if counts["sessions"] > 0 else "inactive",
+            }
+            continue
+
+        _, _, threshold, target = MEMORY_SPECS[memory_type]
+        memory_systems[memory_type] = {
+            "files": counts[memory_type],
+            "last_updated": format_timestamp(last_modified[memory_type]),
+            "freshness": get_freshness(last_modified[memory_type], now),
+            "completeness": get_completeness_status(counts[memory_type], threshold),
+            "percentage": get_completeness(counts[memory_type], target),
+        }
+
+    freshness = [system["freshness"] for system in memory_systems.values()]
+    completeness = [memory_systems[t]["completeness"] for t in ["semantic", "procedural", "structured"]]
+    episodic = memory_systems["episodic"]
+
+    critical = freshness.count("stale") + completeness.count("empty")
+    warning = freshness.count("normal") + completeness.count("partial")
+    if episodic["conversation_status"] == "inactive" and episodic["session_status"] == "inactive":
+        warning += 1
+
+    if critical > 0:
+        status = "critical"
+        description = "Critical issues detected in memory systems that require immediate attention."
+    elif warning > 0:
+        status = "warning"
+        description = "Some memory systems require attention due to age or completeness issues."
+    else:
+        status = "healthy"
+        description = "All memory systems are functioning properly with recent updates."
+
+    recommendations: List[str] = []
+    if memory_systems["semantic"]["completeness"] != "complete":
+        recommendations.append("Continue adding semantic memory concepts to enhance knowledge capabilities")
+    if episodic["conversation_count"] < 3:
+        recommendations.append("Consider creating more episodic conversations to build richer interaction history")
+    if memory_systems["procedural"]["completeness"] != "complete":
+        recommendations.append("Add more procedural workflows to enhance operational capabilities")
+    if any(value != "fresh" for value in freshness):
+        recommendations.append("Update outdated memory systems to maintain cognitive relevance")
+    recommendations.append("Schedule regular memory maintenance to ensure continued health")
+
+    return {
+        "timestamp": int(now),
+        "formatted_time": datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"),
+        "memory_systems": memory_systems,
+        "overall_health": {
+            "status": status,
+            "description": description,
+        },
+        "recommendations": recommendations,
+    }
+
+
+def generate_memory_report(
+    knowledge_dir: Optional[Path] = None,
+    use_cache: bool = True,
+    max_age: float = DEFAULT_MAX_AGE
+) -> Dict[str, Any]:
+    """
+    Generate the memory status report.
+
+    Args:
+        knowledge_dir: Root of the knowledge tree
+        use_cache: Whether to reuse a cached scan of unchanged directories
+        max_age: Seconds after which a cached scan is refreshed
+
+    Returns:
+        Report dictionary
+    """
+    cache_path = DEFAULT_REPORT_CACHE if use_cache else None
+    return build_report(collect_memory_stats(knowledge_dir, cache_path, max_age))
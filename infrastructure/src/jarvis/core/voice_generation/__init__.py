@@ -0,0 +1,7 @@
+"""
+Voice generation module for converting text to speech.
+"""
+
+from .generator import generate_voice, generate_voice_async, VoiceType, AudioFormat
+
+__all__ = ["generate_voice", "generate_voice_async", "VoiceType", "AudioFormat"] 
\ No newline at end of file
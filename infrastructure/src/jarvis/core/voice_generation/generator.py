@@ -4,17 +4,62 @@ Core voice generation functionality using OpenAI text-to-speech models.
 """
 import os
 import sys
+import asyncio
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Literal
 import openai
+import hashlib
 import traceback
 from dotenv import load_dotenv
 
+from ..coalescing import SingleFlight, request_key
+
 # Define type aliases for better documentation and type checking
 VoiceType = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
 AudioFormat = Literal["mp3", "opus", "aac", "flac", "wav"]
 
+# Identical requests made in this process while one is running share its API
+# call. Separate processes (the watcher, the CLIs) make their own; the job queue
+# is what merges their requests.
+_flights = SingleFlight()
+
+def _resolve_api_key(api_key: Optional[str]) -> Optional[str]:
+    """
+    Get the API key to use, falling back to OPENAI_API_KEY from the environment or .env.
+    """
+    # Load environment variables if not done already
+    load_dotenv()
+    # IMPORTANT: strip any whitespace
+    api_key = (api_key or os.getenv("OPENAI_API_KEY") or "").strip()
+    return api_key or None
+
+def voice_request_key(
+    text: str,
+    voice: str,
+    model: str,
+    api_key: Optional[str],
+    response_format: str,
+    speed: float,
+) -> str:
+    """
+    Key under which identical voice requests are coalesced.
+
+    Only what is sent to the API counts, so callers saving the audio to
+    different places still share a call. Whitespace differences in the text
+    are ignored, and the API key only enters as a fingerprint.
+    """
+    api_key = _resolve_api_key(api_key) or ""
+    return request_key(
+        "voice",
+        text=" ".join(text.split()),
+        voice=voice,
+        model=model,
+        account=hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+        response_format=response_format,
+        speed=float(speed),
+    )
+
 def generate_voice(
     text: str,
     voice: VoiceType = "nova",
@@ -27,6 +72,10 @@ def generate_voice(
 ) -> Dict[str, Any]:
     """
     Generate audio from text using OpenAI's text-to-speech model.
+
+    Concurrent calls for the same speech in this process, from any thread or
+    from generate_voice_async, share one API call; each caller saves the audio
+    to its own file.
     
     Args:
         text: The text to convert to speech
@@ -41,15 +90,100 @@ def generate_voice(
     Returns:
         Dictionary containing status and file path
     """
+    key = voice_request_key(text, voice, model, api_key, response_format, speed)
+    speech = _flights.do(key, _synthesize, text, voice, model, api_key, response_format, speed)
+    return _save_voice(speech, text, output_dir, filename_prefix)
+
+async def generate_voice_async(
+    text: str,
+    voice: VoiceType = "nova",
+    model: str = "tts-1",
+    output_dir: Optional[str] = None,
+    api_key: Optional[str] = None,
+    response_format: AudioFormat = "mp3",
+    speed: float = 1.0,
+    filename_prefix: str = "",
+) -> Dict[str, Any]:
+    """
+    Asyncio version of generate_voice; the API call and the file write run in the default executor.
+    """
+    key = voice_request_key(text, voice, model, api_key, response_format, speed)
+    speech = await _flights.do_async(key, _synthesize, text, voice, model, api_key, response_format, speed)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _save_voice, speech, text, output_dir, filename_prefix)
+
+def _save_voice(
+    speech: Dict[str, Any],
+    text: str,
+    output_dir: Optional[str],
+    filename_prefix: str,
+) -> Dict[str, Any]:
+    """
+    Save the audio of a successful speech call, if output_dir is specified.
+    """
+    if not speech["success"]:
+        return speech
     try:
-        # Load environment variables if not done already
-        load_dotenv()
-        
-        # Set up OpenAI API key - IMPORTANT: strip any whitespace
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if api_key:
-            api_key = api_key.strip()
+        saved_path = None
+        if output_dir:
+            # Create output directory if it doesn't exist
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            
+            # Generate a filename based on the timestamp and a simplified text
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            simplified_text = "".join(c for c in text[:30] if c.isalnum() or c.isspace()).strip().replace(" ", "_")
+            
+            # Use prefix if provided
+            if filename_prefix:
+                filename = f"{filename_prefix}_{timestamp}_{simplified_text}.{speech['format']}"
+            else:
+                filename = f"{timestamp}_{simplified_text}.{speech['format']}"
+                
+            filepath = output_path / filename
+            
+            # Save the audio
+            with open(filepath, "wb") as f:
+                f.write(speech["audio"])
+            saved_path = str(filepath)
+            
+        return {
+            "success": True,
+            "saved_path": saved_path,
+            "text": text[:100] + "..." if len(text) > 100 else text,
+            "voice": speech["voice"],
+            "model": speech["model"],
+            "format": speech["format"],
+            "speed": speech["speed"]
+        }
         
+    except Exception as e:
+        error_details = f"{str(e)}\n{traceback.format_exc()}"
+        print(f"Error in generate_voice: {error_details}")
+        return {
+            "success": False,
+            "error": str(e),
+            "error_details": error_details,
+            "text": text[:100] + "..." if len(text) > 100 else text
+        }
+
+def _synthesize(
+    text: str,
+    voice: str,
+    model: str,
+    api_key: Optional[str],
+    response_format: str,
+    speed: float,
+) -> Dict[str, Any]:
+    """
+    Make the text-to-speech call; see generate_voice.
+
+    Returns:
+        Dictionary containing status and the audio bytes
+    """
+    try:
+        # Set up OpenAI API key
+        api_key = _resolve_api_key(api_key)
         if not api_key:
             return {
                 "success": False,
@@ -85,34 +219,9 @@ def generate_voice(
             speed=speed
         )
         
-        # Save the audio locally if output_dir is specified
-        saved_path = None
-        if output_dir:
-            # Create output directory if it doesn't exist
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Generate a filename based on the timestamp and a simplified text
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            simplified_text = "".join(c for c in text[:30] if c.isalnum() or c.isspace()).strip().replace(" ", "_")
-            
-            # Use prefix if provided
-            if filename_prefix:
-                filename = f"{filename_prefix}_{timestamp}_{simplified_text}.{response_format}"
-            else:
-                filename = f"{timestamp}_{simplified_text}.{response_format}"
-                
-            filepath = output_path / filename
-            
-            # Save the audio
-            with open(filepath, "wb") as f:
-                f.write(response.read())
-            saved_path = str(filepath)
-            
         return {
             "success": True,
-            "saved_path": saved_path,
-            "text": text[:100] + "..." if len(text) > 100 else text,
+            "audio": response.read(),
             "voice": voice,
             "model": model,
             "format": response_format,
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+CrewAI tools module initialization.
+
+Tools are registered as factories and only constructed the first time they are
+requested. Every agent in the process then shares the same instance, and with
+it the same HTTP connection pool. Search and image results are served from
+the shared tool result cache (see cache.py); only cache misses count against
+the call limiter (see rate_limit.py).
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, List
+
+from .cache import cache_tool
+from .rate_limit import limit_calls
+
+# Factories for the tools that can be used by agents, keyed by tool name
+TOOL_FACTORIES: Dict[str, Callable[[], Any]] = {}
+
+_instances: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def register_tool(tool_name: str, factory: Callable[[], Any]) -> None:
+    """
+    Register a factory that builds a tool on first use.
+
+    Args:
+        tool_name: The name agents use to request the tool
+        factory: Callable without arguments that returns the tool instance
+    """
+    with _lock:
+        TOOL_FACTORIES[tool_name] = factory
+        _instances.pop(tool_name, None)
+
+
+def _image_exists(result):
+    return bool(result.get("image_path")) and os.path.exists(result["image_path"])
+
+
+def _create_image_generation_tool():
+    from .image_tool import ImageGenerationTool
+    return cache_tool(limit_calls(ImageGenerationTool()), "image_generation", validate=_image_exists)
+
+
+def _create_search_tool():
+    from crewai_tools import SerperDevTool
+    return cache_tool(limit_calls(SerperDevTool()), "search")
+
+
+register_tool("image_generation", _create_image_generation_tool)
+register_tool("search", _create_search_tool)
+
+
+def get_tool(tool_name):
+    """
+    Get a tool by name.
+
+    The tool is constructed on the first call and shared afterwards.
+
+    Args:
+        tool_name: The name of the tool to retrieve
+
+    Returns:
+        Tool instance or None if the tool doesn't exist
+    """
+    if tool_name in _instances:
+        return _instances[tool_name]
+
+    with _lock:
+        if tool_name not in _instances:
+            factory = TOOL_FACTORIES.get(tool_name)
+            if factory is None:
+                return None
+            _instances[tool_name] = factory()
+        return _instances[tool_name]
+
+
+def tool_identity(tool: Any) -> Any:
+    """
+    Get the key that identifies a tool to an agent.
+
+    CrewAI agents select tools by name, so two tools with the same name are
+    duplicates even if they are different instances.
+
+    Args:
+        tool: Tool instance
+
+    Returns:
+        The tool name, or the object identity for tools without a name
+    """
+    return getattr(tool, "name", None) or id(tool)
+
+
+def dedupe_tools(tools: List[Any]) -> List[Any]:
+    """
+    Remove duplicate tools, keeping the first occurrence of each.
+
+    Args:
+        tools: List of tool instances
+
+    Returns:
+        List of unique tool instances in their original order
+    """
+    seen = set()
+    unique = []
+    for tool in tools:
+        identity = tool_identity(tool)
+        if identity not in seen:
+            seen.add(identity)
+            unique.append(tool)
+    return unique
+
+
+def get_tools_for_agent(agent_config):
+    """
+    Get a list of tools for an agent based on their configuration.
+
+    Args:
+        agent_config: The agent configuration dictionary
+
+    Returns:
+        List of Tool instances
+    """
+    tools = []
+
+    # Add tools based on agent's allowed_tools configuration
+    if "allowed_tools" in agent_config and agent_config["allowed_tools"]:
+        for tool_name in agent_config["allowed_tools"]:
+            tool = get_tool(tool_name)
+            if tool:
+                tools.append(tool)
+
+    return dedupe_tools(tools)
+
+
+def __getattr__(name):
+    # Keep `from ...tools import ImageGenerationTool` working without
+    # importing the image generation stack when the package is imported
+    if name == "ImageGenerationTool":
+        from .image_tool import ImageGenerationTool
+        return ImageGenerationTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
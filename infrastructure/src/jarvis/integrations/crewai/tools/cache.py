@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Persistent result cache shared by the CrewAI tools of all agents.
+
+Several agents of a crew issue the same searches or ask for near-identical
+images. Results are stored in a small SQLite database keyed by the tool name
+and its normalized arguments, so repeated calls within and across runs are
+answered without calling the external API again.
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Optional, Any, Callable, Tuple
+
+from jarvis.paths import DEFAULT_CACHE_DIR
+
+# Where results are stored, shared by every launch directory
+DEFAULT_CACHE_PATH = os.getenv("JARVIS_TOOL_CACHE_PATH", str(DEFAULT_CACHE_DIR / "tool_results.sqlite3"))
+
+# How long results stay valid, in seconds, per tool name
+DEFAULT_TTLS = {
+    "search": 6 * 60 * 60,
+    "image_generation": 7 * 24 * 60 * 60,
+}
+FALLBACK_TTL = 60 * 60
+
+# Tools whose arguments are matched case-insensitively; search engines ignore
+# case, but an image prompt in capitals may well mean something different
+CASEFOLDED_TOOLS = {"search"}
+
+
+def _normalize(value: Any, casefold: bool = False) -> Any:
+    """
+    Normalize a value so that trivially different arguments share a cache entry.
+    """
+    if isinstance(value, str):
+        value = re.sub(r"\s+", " ", value).strip()
+        return value.casefold() if casefold else value
+    if isinstance(value, dict):
+        return {str(k): _normalize(v, casefold) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, casefold) for v in value]
+    return value
+
+
+def cache_key(args: Tuple[Any, ...], kwargs: Dict[str, Any], casefold: bool = False) -> str:
+    """
+    Build the cache key for a tool call.
+
+    Strings are whitespace-collapsed (and case-folded if casefold is set),
+    keyword arguments are sorted and arguments left at None are ignored.
+
+    Args:
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        casefold: Whether strings differing only in case share an entry
+
+    Returns:
+        Stable JSON encoding of the normalized arguments
+    """
+    return json.dumps({"args": _normalize(list(args), casefold), "kwargs": _normalize(kwargs, casefold)},
+                      sort_keys=True, default=str)
+
+
+def is_successful_result(result: Any) -> bool:
+    """
+    Decide whether a tool result is worth caching.
+
+    Failed image generations and empty results are never cached.
+    """
+    if result is None:
+        return False
+    if isinstance(result, dict):
+        return result.get("status") != "failure" and result.get("success", True) is not False
+    return True
+
+
+class ToolResultCache:
+    """
+    SQLite-backed cache of tool results with per-tool TTLs and hit-rate statistics.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file; parent directories are created
+            ttls: Seconds results stay valid per tool name (defaults to DEFAULT_TTLS)
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results ("
+            " tool TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (tool, key))"
+        )
+        self._conn.commit()
+
+    def _record(self, tool: str, outcome: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(tool, {"hits": 0, "misses": 0})
+            stats[outcome] += 1
+
+    def get(self, tool: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            tool: Tool name
+            key: Cache key from cache_key()
+
+        Returns:
+            Tuple of (found, result)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM tool_results WHERE tool = ? AND key = ? AND expires_at > ?",
+                (tool, key, time.time())
+            ).fetchone()
+            if row is None:
+                return False, None
+            self._conn.execute("UPDATE tool_results SET hits = hits + 1 WHERE tool = ? AND key = ?", (tool, key))
+            self._conn.commit()
+        return True, json.loads(row[0])
+
+    def set(self, tool: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a result.
+
+        Args:
+            tool: Tool name
+            key: Cache key from cache_key()
+            value: JSON-serializable result
+            ttl: Seconds the result stays valid (defaults to the tool's TTL)
+        """
+        now = time.time()
+        ttl = self.ttls.get(tool, FALLBACK_TTL) if ttl is None else ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_results (tool, key, value, created_at, expires_at, hits)"
+                " VALUES (?, ?, ?, ?, ?, 0)",
+                (tool, key, json.dumps(value, default=str), now, now + ttl)
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired results.
+
+        Returns:
+            Number of deleted results
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM tool_results WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def wrap(
+        self,
+        tool: str,
+        func: Callable[..., Any],
+        ttl: Optional[float] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+        casefold: Optional[bool] = None
+    ) -> Callable[..., Any]:
+        """
+        Wrap a tool function so that its results are served from the cache.
+
+        Args:
+            tool: Tool name used to partition the cache and pick the TTL
+            func: The function performing the actual tool call
+            ttl: Seconds results stay valid (defaults to the tool's TTL)
+            validate: Optional check that a cached result is still usable,
+                e.g. that a generated file still exists
+            casefold: Whether arguments differing only in case share a result
+                (defaults to True for the tools in CASEFOLDED_TOOLS)
+
+        Returns:
+            Function with the same signature as func
+        """
+        if casefold is None:
+            casefold = tool in CASEFOLDED_TOOLS
+
+        def cached(*args, **kwargs):
+            key = cache_key(args, kwargs, casefold)
+            found, result = self.get(tool, key)
+            if found and (validate is None or validate(result)):
+                self._record(tool, "hits")
+                return result
+
+            self._record(tool, "misses")
+            result = func(*args, **kwargs)
+            if is_successful_result(result):
+                self.set(tool, key, result, ttl)
+            return result
+
+        cached.__wrapped__ = func
+        return cached
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hit-rate statistics for this process and stored entries per tool.
+
+        Returns:
+            Dictionary of tool names to hits, misses, hit_rate, entries and lifetime_hits
+        """
+        with self._lock:
+            stored = {
+                tool: (entries, lifetime_hits)
+                for tool, entries, lifetime_hits in self._conn.execute(
+                    "SELECT tool, COUNT(*), SUM(hits) FROM tool_results WHERE expires_at > ? GROUP BY tool",
+                    (time.time(),)
+                )
+            }
+
+            session = {tool: dict(stats) for tool, stats in self._stats.items()}
+
+        report = {}
+        for tool in sorted(set(session) | set(stored)):
+            stats = session.get(tool, {"hits": 0, "misses": 0})
+            calls = stats["hits"] + stats["misses"]
+            entries, lifetime_hits = stored.get(tool, (0, 0))
+            report[tool] = {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_rate": stats["hits"] / calls if calls else 0.0,
+                "entries": entries,
+                "lifetime_hits": lifetime_hits or 0,
+            }
+        return report
+
+    def format_report(self) -> str:
+        """
+        Format the hit-rate statistics for display.
+        """
+        lines = ["Tool cache:"]
+        for tool, stats in self.report().items():
+            lines.append(
+                f"  {tool}: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%}), {stats['entries']} cached results"
+            )
+        return "\n".join(lines)
+
+
+def cache_tool(tool: Any, tool_name: str, cache: Optional["ToolResultCache"] = None, **options: Any) -> Any:
+    """
+    Serve a CrewAI tool's results from the cache.
+
+    The tool's _run method is replaced on the instance, so the tool keeps its
+    name, description and argument schema.
+
+    Args:
+        tool: CrewAI tool instance
+        tool_name: Name used to partition the cache and pick the TTL
+        cache: Cache to use (defaults to the shared cache)
+        **options: Passed to ToolResultCache.wrap (ttl, validate, casefold)
+
+    Returns:
+        The same tool instance
+    """
+    cache = cache or get_tool_cache()
+    if cache is None:
+        return tool
+    # Pydantic models reject unknown attributes through setattr
+    object.__setattr__(tool, "_run", cache.wrap(tool_name, tool._run, **options))
+    return tool
+
+
+_cache: Optional[ToolResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> Optional[ToolResultCache]:
+    """
+    Get the process-wide tool result cache.
+
+    Set JARVIS_TOOL_CACHE=0 to disable caching.
+
+    Returns:
+        Shared ToolResultCache, or None if caching is disabled
+    """
+    global _cache
+    if os.getenv("JARVIS_TOOL_CACHE", "1") == "0":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ToolResultCache()
+    return _cache
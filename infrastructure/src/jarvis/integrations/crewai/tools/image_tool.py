@@ -3,15 +3,11 @@
 Image generation tool that integrates with CrewAI.
 """
 import os
-import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-# Add the parent directory to sys.path to enable imports from core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 from crewai import Tool
-from src.core.image_generation.generator import generate_image, ImageSize, ImageQuality, ImageStyle
+from jarvis.core.image_generation.generator import generate_image, ImageSize, ImageQuality, ImageStyle
 
 class ImageGenerationTool(Tool):
     """
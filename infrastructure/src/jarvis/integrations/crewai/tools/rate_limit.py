@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Rate limiting of external API calls made by CrewAI tools and agents.
+"""
+import time
+import multiprocessing
+from typing import Optional, Any, Callable
+
+
+class RateLimiter:
+    """
+    Spaces calls evenly so that at most calls_per_minute calls start per minute.
+
+    The limiter state lives in shared memory, so a limiter created in a parent
+    process and handed to worker processes enforces one global limit.
+    """
+
+    def __init__(self, calls_per_minute: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            calls_per_minute: Maximum number of calls allowed per minute
+        """
+        if calls_per_minute <= 0:
+            raise ValueError(f"Invalid rate: {calls_per_minute}. Must be greater than 0")
+        self.interval = 60.0 / calls_per_minute
+        self._next_slot = multiprocessing.Value("d", 0.0, lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until the caller may make its call.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a function so that every call first acquires the limiter.
+        """
+        def limited(*args, **kwargs):
+            self.acquire()
+            return func(*args, **kwargs)
+
+        limited.__wrapped__ = func
+        return limited
+
+
+_call_limiter: Optional[RateLimiter] = None
+
+
+def set_call_limiter(limiter: Optional[RateLimiter]) -> None:
+    """
+    Set the limiter applied to every tool wrapped with limit_calls().
+
+    Args:
+        limiter: RateLimiter to apply, or None to remove the limit
+    """
+    global _call_limiter
+    _call_limiter = limiter
+
+
+def get_call_limiter() -> Optional[RateLimiter]:
+    """Get the limiter applied to tool calls, if any."""
+    return _call_limiter
+
+
+def limit_calls(tool: Any) -> Any:
+    """
+    Apply the process-wide call limiter to a CrewAI tool.
+
+    The limiter is looked up on every call, so it can be set after the tool
+    was constructed. Without a limiter the call goes straight through.
+
+    Args:
+        tool: CrewAI tool instance
+
+    Returns:
+        The same tool instance
+    """
+    run = tool._run
+
+    def limited_run(*args, **kwargs):
+        if _call_limiter is not None:
+            _call_limiter.acquire()
+        return run(*args, **kwargs)
+
+    # Pydantic models reject unknown attributes through setattr
+    object.__setattr__(tool, "_run", limited_run)
+    return tool
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Locations shared by all Jarvis subsystems.
+"""
+import os
+from pathlib import Path
+
+# Repository root, three levels above infrastructure/src/jarvis; set JARVIS_ROOT
+# when the package is installed outside of the repository
+PROJECT_ROOT = Path(os.getenv("JARVIS_ROOT", Path(__file__).resolve().parents[3]))
+
+# Where derived data such as indexes and caches is kept, outside of the knowledge tree
+DEFAULT_CACHE_DIR = Path(os.getenv("JARVIS_CACHE_DIR", PROJECT_ROOT / "workspace" / ".cache"))
@@ -0,0 +1,3 @@
+"""
+Services built on the Jarvis core and integrations.
+"""
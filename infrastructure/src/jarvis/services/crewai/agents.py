@@ -3,24 +3,27 @@
 Agent definitions and management for CrewAI newsletter team.
 """
 import os
-import sys
-import yaml
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 from crewai import Agent
-from crewai_tools import WebSearchTool, SerperDevTool
 
-# Add the project root to sys.path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from .config_registry import get_config_registry
+from .tools import dedupe_tools, get_tool
 
-from tools.src.integrations.crewai.tools.image_tool import ImageGenerationTool
-from .tools.dropbox_tool import DropboxAccessTool
+# Tools every agent of a role receives in addition to the ones passed in
+ROLE_TOOLS = {
+    "design_ceo": ["search"],
+    "content_manager": ["search"],
+    "designer": ["image_generation"],
+    "creative_manager": ["image_generation"],
+}
 
 
 def load_agent_config(agent_type: str) -> Dict[str, Any]:
     """
     Load agent configuration from YAML file.
     
+    The file is parsed once and cached until it changes on disk.
+    
     Args:
         agent_type: The type of agent to load (e.g., "design_ceo")
         
@@ -30,16 +33,7 @@ def load_agent_config(agent_type: str) -> Dict[str, Any]:
     Raises:
         ValueError: If agent_type is not found in the configuration
     """
-    config_path = os.path.join(os.path.dirname(__file__), 'config', 'agents.yaml')
-    
-    with open(config_path, 'r') as file:
-        configs = yaml.safe_load(file)
-    
-    if agent_type not in configs:
-        valid_types = list(configs.keys())
-        raise ValueError(f"Unknown agent type: '{agent_type}'. Valid types: {', '.join(valid_types)}")
-    
-    return configs[agent_type]
+    return get_config_registry().agent(agent_type)
 
 
 def format_config_values(config: Dict[str, Any], format_args: Dict[str, Any]) -> Dict[str, Any]:
@@ -92,16 +86,14 @@ def create_agent(
         config = format_config_values(config, format_args)
     
     # Determine which tools to give the agent based on its role
-    agent_tools = tools or []
+    agent_tools = list(tools or [])
     
-    # Add role-specific tools
-    if agent_type in ["design_ceo", "content_manager"]:
-        # These roles need search capabilities
-        agent_tools.append(SerperDevTool())
+    # Add role-specific tools, shared with every other agent in the process
+    for tool_name in ROLE_TOOLS.get(agent_type, []):
+        agent_tools.append(get_tool(tool_name))
     
-    if agent_type in ["designer", "creative_manager"]:
-        # These roles need image generation capabilities
-        agent_tools.append(ImageGenerationTool())
+    # Drop tools the caller already passed in
+    agent_tools = dedupe_tools(agent_tools)
     
     # Create and return the agent
     return Agent(
@@ -123,14 +115,15 @@ def create_all_agents(format_args: Optional[Dict[str, Any]] = None) -> Dict[str,
     Returns:
         Dictionary of agent names to Agent instances
     """
-    # Initialize tools
-    search_tool = SerperDevTool()
-    image_tool = ImageGenerationTool()
+    # Shared tool instances, constructed on first use
+    search_tool = get_tool("search")
+    image_tool = get_tool("image_generation")
     
     # Try to create Dropbox tool if environment variable exists
     dropbox_tool = None
     if os.getenv("DROPBOX_ACCESS_TOKEN"):
         try:
+            from .tools.dropbox_tool import DropboxAccessTool
             dropbox_tool = DropboxAccessTool()
         except Exception as e:
             print(f"Warning: Failed to initialize DropboxAccessTool: {e}")
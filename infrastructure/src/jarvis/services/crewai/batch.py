@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Batch production of newsletters for many topics at once.
+
+Topics are distributed over a pool of worker processes. Each worker builds the
+agent team once and reuses it for every topic it handles, while all workers
+share one rate limit on LLM and tool calls.
+"""
+import os
+import json
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any
+
+from crewai import Crew, Process, Agent
+
+from .agents import create_all_agents
+from .checkpoint import CheckpointStore
+from .tasks import build_task_graph, create_task_graph, load_checkpointed_outputs, topic_slug
+from .tools import RateLimiter, get_tool_cache, set_call_limiter
+
+# Agent team of the current worker process, set by _init_worker
+_worker_agents: Optional[Dict[str, Agent]] = None
+
+
+def limit_agent_llm(agent: Agent, limiter: RateLimiter) -> None:
+    """
+    Make every LLM call of an agent acquire the rate limiter first.
+
+    Args:
+        agent: CrewAI agent
+        limiter: Shared rate limiter
+    """
+    llm = getattr(agent, "llm", None)
+    if llm is not None and callable(getattr(llm, "call", None)):
+        # Pydantic-based LLM wrappers reject unknown attributes through setattr
+        object.__setattr__(llm, "call", limiter.wrap(llm.call))
+
+
+def _init_worker(limiter: Optional[RateLimiter], format_args: Optional[Dict[str, Any]]) -> None:
+    """
+    Build the agent team of a worker process and apply the shared rate limit.
+    """
+    global _worker_agents
+    set_call_limiter(limiter)
+    _worker_agents = create_all_agents(format_args)
+    if limiter is not None:
+        for agent in _worker_agents.values():
+            limit_agent_llm(agent, limiter)
+
+
+def _run_topic(topic: str, output_dir: str, checkpoint_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Produce the newsletter for one topic in a worker process.
+
+    Returns:
+        Dictionary describing the outcome and timing of the run
+    """
+    topic_dir = os.path.join(output_dir, topic_slug(topic))
+    os.makedirs(topic_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    result = {
+        "topic": topic,
+        "output_dir": topic_dir,
+        "pid": os.getpid(),
+    }
+
+    try:
+        checkpoints = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
+        tasks = create_task_graph(_worker_agents, topic, topic_dir, checkpoints=checkpoints)
+        result["tasks_run"] = len(tasks)
+
+        if tasks:
+            crew = Crew(
+                agents=list(_worker_agents.values()),
+                tasks=tasks,
+                process=Process.sequential,
+                verbose=False
+            )
+            output = str(crew.kickoff())
+        else:
+            # Every task is checkpointed; the newsletter is the final task's saved output
+            final_task = build_task_graph().order()[-1]
+            output = load_checkpointed_outputs(checkpoints, topic).get(final_task)
+            if output is None:
+                raise RuntimeError(f"No checkpointed output of '{final_task}' to rebuild the newsletter from")
+
+        with open(os.path.join(topic_dir, "newsletter.md"), "w") as f:
+            f.write(output)
+
+        result["success"] = True
+    except Exception as e:
+        result["success"] = False
+        result["error"] = str(e)
+        result["error_details"] = traceback.format_exc()
+
+    result["seconds"] = round(time.perf_counter() - start, 3)
+
+    cache = get_tool_cache()
+    if cache is not None:
+        result["tool_cache"] = cache.report()
+
+    with open(os.path.join(topic_dir, "run.json"), "w") as f:
+        json.dump(result, f, indent=2)
+
+    return result
+
+
+def run_newsletters(
+    topics: List[str],
+    output_dir: str = "workspace/newsletters",
+    max_workers: Optional[int] = None,
+    calls_per_minute: Optional[float] = None,
+    format_args: Optional[Dict[str, Any]] = None,
+    checkpoint_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Produce newsletters for several topics concurrently.
+
+    Each topic is written to its own subdirectory of output_dir with the final
+    newsletter, the article and a run.json with its timing. A summary of the
+    whole batch is written to output_dir/batch_summary.json.
+
+    Args:
+        topics: Newsletter topics
+        output_dir: Directory to save the newsletters
+        max_workers: Number of worker processes (defaults to one per topic, up to the CPU count)
+        calls_per_minute: Global limit on LLM and tool calls across all workers
+        format_args: Optional dictionary for formatting agent properties
+        checkpoint_dir: Optional directory for task checkpoints; topics that failed
+            part-way resume from their completed tasks when run again
+
+    Returns:
+        Dictionary with the per-topic results and total timing
+    """
+    topics = list(dict.fromkeys(topics))
+    if not topics:
+        raise ValueError("At least one topic is required")
+
+    os.makedirs(output_dir, exist_ok=True)
+    if max_workers is None:
+        max_workers = min(len(topics), os.cpu_count() or 1)
+
+    limiter = RateLimiter(calls_per_minute) if calls_per_minute else None
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(limiter, format_args)
+    ) as executor:
+        futures = {executor.submit(_run_topic, topic, output_dir, checkpoint_dir): topic for topic in topics}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # The worker itself failed, e.g. while building the agents
+                results.append({"topic": futures[future], "success": False, "error": str(e)})
+
+    results.sort(key=lambda result: topics.index(result["topic"]))
+    summary = {
+        "topics": len(topics),
+        "succeeded": sum(1 for result in results if result["success"]),
+        "workers": max_workers,
+        "calls_per_minute": calls_per_minute,
+        "seconds": round(time.perf_counter() - start, 3),
+        "results": results,
+    }
+
+    with open(os.path.join(output_dir, "batch_summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
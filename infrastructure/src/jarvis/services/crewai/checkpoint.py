@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+On-disk checkpoints of CrewAI task outputs.
+
+Each completed task output is saved under the newsletter topic and a hash of
+the task configuration and the outputs it consumed. When a pipeline fails part-way, a rerun skips every
+task whose checkpoint exists and only pays for the remaining work.
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from typing import Dict, Optional, Any
+
+# Where checkpoints are stored, relative to the working directory like the other outputs
+DEFAULT_CHECKPOINT_DIR = os.getenv("JARVIS_CHECKPOINT_DIR", "workspace/.cache/crewai_checkpoints")
+
+
+def output_hash(output: str) -> str:
+    """
+    Hash a task output.
+
+    Args:
+        output: Raw task output
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(output.encode("utf-8")).hexdigest()
+
+
+def config_hash(config: Dict[str, Any], input_hashes: Optional[Dict[str, str]] = None) -> str:
+    """
+    Hash a formatted task configuration together with the hashes of its inputs.
+
+    The input hashes are those of the outputs the task consumes (see
+    output_hash()), so a different upstream output also invalidates the
+    checkpoints of every task that consumes it.
+
+    Args:
+        config: Formatted task configuration (and anything else that affects the output)
+        input_hashes: Dictionary of input task types to the hashes of their outputs
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps({"config": config, "inputs": input_hashes or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Stores task outputs as JSON files under <root>/<topic>/<task_type>-<hash>.json.
+    """
+
+    def __init__(self, root: str = DEFAULT_CHECKPOINT_DIR):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            root: Directory to store checkpoints in
+        """
+        self.root = root
+
+    def _topic_dir(self, topic: str) -> str:
+        topic_hash = hashlib.sha256(topic.encode("utf-8")).hexdigest()[:12]
+        safe_topic = "".join(c if c.isalnum() else '_' for c in topic)[:30]
+        return os.path.join(self.root, f"{safe_topic}-{topic_hash}")
+
+    def _path(self, topic: str, task_type: str, task_hash: str) -> str:
+        return os.path.join(self._topic_dir(topic), f"{task_type}-{task_hash[:16]}.json")
+
+    def load(self, topic: str, task_type: str, task_hash: str) -> Optional[str]:
+        """
+        Get the saved output of a task.
+
+        Args:
+            topic: The newsletter topic
+            task_type: Type of the task
+            task_hash: Hash of the task configuration from config_hash()
+
+        Returns:
+            The saved output, or None if there is no checkpoint
+        """
+        try:
+            with open(self._path(topic, task_type, task_hash), "r") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if checkpoint.get("hash") != task_hash:
+            return None
+        return checkpoint.get("output")
+
+    def save(self, topic: str, task_type: str, task_hash: str, output: str) -> str:
+        """
+        Save the output of a completed task.
+
+        The file is written atomically, so a crash never leaves a partial checkpoint.
+
+        Args:
+            topic: The newsletter topic
+            task_type: Type of the task
+            task_hash: Hash of the task configuration from config_hash()
+            output: The task output
+
+        Returns:
+            Path of the checkpoint file
+        """
+        path = self._path(topic, task_type, task_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        checkpoint = {
+            "topic": topic,
+            "task_type": task_type,
+            "hash": task_hash,
+            "saved_at": time.time(),
+            "output": output,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def clear(self, topic: str) -> None:
+        """
+        Delete all checkpoints of a topic.
+
+        Args:
+            topic: The newsletter topic
+        """
+        shutil.rmtree(self._topic_dir(topic), ignore_errors=True)
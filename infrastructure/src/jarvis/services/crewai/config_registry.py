@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Cached, validated access to the CrewAI agent and task configuration files.
+"""
+import os
+import threading
+import yaml
+from typing import Dict, List, Optional, Any, Tuple
+
+# Prefer the libyaml-backed loader, which parses several times faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), 'config')
+
+# Fields every entry must define as non-empty strings
+REQUIRED_AGENT_FIELDS = ["role", "goal", "backstory"]
+REQUIRED_TASK_FIELDS = ["description", "expected_output", "agent"]
+
+
+class ConfigRegistry:
+    """
+    Parses agents.yaml and tasks.yaml once and serves entries from memory.
+
+    Each file is re-read only when its modification time or size changes, so
+    long-running services can rebuild crews without paying for YAML parsing.
+    Both files are validated as a whole when they are (re)loaded.
+    """
+
+    def __init__(self, config_dir: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            config_dir: Directory containing agents.yaml and tasks.yaml
+        """
+        self.config_dir = config_dir or CONFIG_DIR
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._validated: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
+
+    def _load(self, filename: str) -> Tuple[Tuple[int, int], Dict[str, Any]]:
+        """
+        Get the parsed content of a config file, re-parsing it if it changed.
+        """
+        path = os.path.join(self.config_dir, filename)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._files.get(filename)
+        if cached and cached[0] == signature:
+            return cached
+
+        with open(path, 'r') as file:
+            configs = yaml.load(file, Loader=SafeLoader) or {}
+
+        if not isinstance(configs, dict):
+            raise ValueError(f"{path} must contain a mapping of names to configurations")
+
+        self._files[filename] = (signature, configs)
+        return self._files[filename]
+
+    def _load_all(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get the agent and task configurations, validating them if either changed.
+        """
+        with self._lock:
+            agent_signature, agents = self._load('agents.yaml')
+            task_signature, tasks = self._load('tasks.yaml')
+
+            if self._validated != (agent_signature, task_signature):
+                validate_configs(agents, tasks)
+                self._validated = (agent_signature, task_signature)
+
+            return agents, tasks
+
+    def agent_types(self) -> List[str]:
+        """Names of all configured agents."""
+        return list(self._load_all()[0])
+
+    def task_types(self) -> List[str]:
+        """Names of all configured tasks."""
+        return list(self._load_all()[1])
+
+    def agent(self, agent_type: str) -> Dict[str, Any]:
+        """
+        Get the configuration of an agent.
+
+        Args:
+            agent_type: The type of agent (e.g., "design_ceo")
+
+        Returns:
+            Copy of the agent configuration
+
+        Raises:
+            ValueError: If agent_type is not found in the configuration
+        """
+        agents, _ = self._load_all()
+        if agent_type not in agents:
+            raise ValueError(f"Unknown agent type: '{agent_type}'. Valid types: {', '.join(agents)}")
+        return dict(agents[agent_type])
+
+    def task(self, task_type: str) -> Dict[str, Any]:
+        """
+        Get the configuration of a task.
+
+        Args:
+            task_type: The type of task (e.g., "newsletter_planning")
+
+        Returns:
+            Copy of the task configuration
+
+        Raises:
+            ValueError: If task_type is not found in the configuration
+        """
+        _, tasks = self._load_all()
+        if task_type not in tasks:
+            raise ValueError(f"Unknown task type: '{task_type}'. Valid types: {', '.join(tasks)}")
+        return dict(tasks[task_type])
+
+
+def _check_fields(kind: str, name: str, config: Any, required: List[str]) -> None:
+    """
+    Check that a config entry is a mapping defining all required string fields.
+    """
+    if not isinstance(config, dict):
+        raise ValueError(f"{kind} '{name}' must be a mapping")
+
+    missing = [field for field in required if not isinstance(config.get(field), str) or not config[field].strip()]
+    if missing:
+        raise ValueError(f"{kind} '{name}' is missing required fields: {', '.join(missing)}")
+
+
+def validate_configs(agents: Dict[str, Any], tasks: Dict[str, Any]) -> None:
+    """
+    Validate the agent and task configurations against each other.
+
+    Args:
+        agents: Parsed agents.yaml
+        tasks: Parsed tasks.yaml
+
+    Raises:
+        ValueError: If an entry is malformed or references an unknown agent or task
+    """
+    for agent_type, config in agents.items():
+        _check_fields("Agent", agent_type, config, REQUIRED_AGENT_FIELDS)
+
+    for task_type, config in tasks.items():
+        _check_fields("Task", task_type, config, REQUIRED_TASK_FIELDS)
+
+        if config["agent"] not in agents:
+            raise ValueError(f"Task '{task_type}' uses unknown agent '{config['agent']}'")
+
+        context = config.get("context") or []
+        if not isinstance(context, list):
+            raise ValueError(f"Task '{task_type}' context must be a list of task types")
+
+        unknown = [dep for dep in context if dep not in tasks]
+        if unknown:
+            raise ValueError(f"Task '{task_type}' context references unknown tasks: {', '.join(map(str, unknown))}")
+
+
+_registry: Optional[ConfigRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """
+    Get the process-wide registry for the bundled configuration files.
+
+    Returns:
+        Shared ConfigRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ConfigRegistry()
+    return _registry
@@ -3,16 +3,11 @@
 Example demonstrating how to use the ImageGenerationTool with CrewAI.
 """
 import os
-import sys
-from pathlib import Path
 from dotenv import load_dotenv
 from crewai import Agent, Task, Crew
 
-# Add the project root to sys.path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 # Import the tool from the new location
-from tools.src.integrations.crewai.tools.image_tool import ImageGenerationTool
+from jarvis.integrations.crewai.tools.image_tool import ImageGenerationTool
 
 # Load environment variables
 load_dotenv()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Dependency graph scheduling for CrewAI newsletter tasks.
+"""
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Callable
+
+
+class TaskGraph:
+    """
+    A directed acyclic graph of named tasks and the tasks whose output they consume.
+
+    Tasks are kept in insertion order so that scheduling is deterministic and
+    matches the order in which the tasks are declared in the configuration.
+    """
+
+    def __init__(self):
+        self._inputs: Dict[str, List[str]] = {}
+
+    def add(self, name: str, inputs: Optional[List[str]] = None) -> None:
+        """
+        Add a task to the graph.
+
+        Args:
+            name: Unique name of the task (e.g., "content_research")
+            inputs: Names of the tasks whose output this task consumes
+
+        Raises:
+            ValueError: If a task with the same name was already added
+        """
+        if name in self._inputs:
+            raise ValueError(f"Task '{name}' is already part of the graph")
+        self._inputs[name] = list(inputs or [])
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all tasks in insertion order."""
+        return list(self._inputs)
+
+    def inputs(self, name: str) -> List[str]:
+        """
+        Get the names of the tasks a task depends on.
+
+        Args:
+            name: Name of the task
+
+        Returns:
+            List of task names
+        """
+        return list(self._inputs[name])
+
+    def layers(self) -> List[List[str]]:
+        """
+        Group the tasks into layers that can run concurrently.
+
+        Every task only depends on tasks in earlier layers.
+
+        Returns:
+            List of layers, each a list of task names
+
+        Raises:
+            ValueError: If a task depends on an unknown task or the graph has a cycle
+        """
+        for name, inputs in self._inputs.items():
+            unknown = [dep for dep in inputs if dep not in self._inputs]
+            if unknown:
+                raise ValueError(f"Task '{name}' depends on unknown tasks: {', '.join(unknown)}")
+
+        remaining = {name: set(inputs) for name, inputs in self._inputs.items()}
+        layers = []
+        while remaining:
+            ready = [name for name, inputs in remaining.items() if not inputs]
+            if not ready:
+                raise ValueError(f"Task graph has a cycle between: {', '.join(remaining)}")
+            layers.append(ready)
+            for name in ready:
+                del remaining[name]
+            for inputs in remaining.values():
+                inputs.difference_update(ready)
+
+        return layers
+
+    def order(self) -> List[str]:
+        """
+        Get a topological order of all tasks.
+
+        Returns:
+            List of task names in an order that respects all dependencies
+        """
+        return [name for layer in self.layers() for name in layer]
+
+    def run(
+        self,
+        execute: Callable[[str, Dict[str, Any]], Any],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute all tasks, starting each one as soon as its inputs are available.
+
+        Args:
+            execute: Called as execute(name, inputs) where inputs maps each
+                dependency name to its output; returns the task output
+            max_workers: Maximum number of tasks running at the same time
+                (defaults to the width of the widest layer)
+
+        Returns:
+            Dictionary of task names to their outputs
+
+        Raises:
+            Exception: The first exception raised by a task; tasks that have
+                not started yet are cancelled
+        """
+        layers = self.layers()
+        if max_workers is None:
+            max_workers = max((len(layer) for layer in layers), default=1)
+
+        outputs: Dict[str, Any] = {}
+        pending = {name: set(inputs) for name, inputs in self._inputs.items()}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+
+            def submit_ready():
+                for name in [n for n, inputs in pending.items() if not inputs]:
+                    del pending[name]
+                    task_inputs = {dep: outputs[dep] for dep in self._inputs[name]}
+                    running[executor.submit(execute, name, task_inputs)] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        outputs[name] = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+                    for inputs in pending.values():
+                        inputs.discard(name)
+                submit_ready()
+
+        return outputs
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Task definitions and management for CrewAI newsletter team.
+"""
+import os
+import threading
+from typing import Dict, List, Optional, Any, Callable
+from crewai import Task, Agent
+
+from .checkpoint import CheckpointStore, config_hash, output_hash
+from .config_registry import get_config_registry
+from .graph import TaskGraph
+
+# Task types that make up a newsletter, in their sequential order
+NEWSLETTER_TASKS = [
+    "newsletter_planning",
+    "content_research",
+    "creative_concept",
+    "visual_design",
+    "article_writing",
+    "final_review",
+]
+
+
+def load_task_config(task_type: str) -> Dict[str, Any]:
+    """
+    Load task configuration from YAML file.
+    
+    The file is parsed once and cached until it changes on disk.
+    
+    Args:
+        task_type: The type of task to load (e.g., "newsletter_planning")
+        
+    Returns:
+        Dictionary containing the task configuration
+        
+    Raises:
+        ValueError: If task_type is not found in the configuration
+    """
+    return get_config_registry().task(task_type)
+
+
+def format_task_config(config: Dict[str, Any], format_args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format any placeholders in the task config using the provided arguments.
+    
+    Args:
+        config: The task configuration dictionary
+        format_args: Dictionary of values to use for formatting
+        
+    Returns:
+        Dictionary with formatted values
+    """
+    formatted_config = {}
+    
+    for key, value in config.items():
+        if isinstance(value, str):
+            try:
+                formatted_config[key] = value.format(**format_args)
+            except KeyError:
+                # If formatting fails, keep the original value
+                formatted_config[key] = value
+        else:
+            formatted_config[key] = value
+            
+    return formatted_config
+
+
+def create_task(
+    task_type: str,
+    agents: Dict[str, Agent],
+    format_args: Optional[Dict[str, Any]] = None,
+    context: Optional[List[Task]] = None,
+    output_file: Optional[str] = None,
+    async_execution: bool = False,
+    cached_context: Optional[str] = None,
+    callback: Optional[Callable[[Any], Any]] = None
+) -> Task:
+    """
+    Create a CrewAI task based on its type.
+    
+    Args:
+        task_type: Type of task to create (e.g., "newsletter_planning")
+        agents: Dictionary of available agents indexed by name
+        format_args: Optional dictionary for formatting task properties
+        context: Optional list of tasks whose output is passed to this task
+        output_file: Optional file path to save task output
+        async_execution: Whether the task may run concurrently with later tasks
+        cached_context: Optional outputs of completed tasks to include in the description
+        callback: Optional function called with the task output on completion
+        
+    Returns:
+        Configured CrewAI Task
+    """
+    # Load the task configuration
+    config = load_task_config(task_type)
+    
+    # Format any placeholder values in the config
+    if format_args:
+        config = format_task_config(config, format_args)
+    
+    # Get the agent for this task
+    agent_name = config.get("agent")
+    if agent_name not in agents:
+        raise ValueError(f"Agent '{agent_name}' not found for task '{task_type}'")
+    
+    agent = agents[agent_name]
+    
+    description = config.get("description")
+    if cached_context:
+        description = f"{description}\n\nOutput of tasks completed earlier:\n\n{cached_context}"
+    
+    # Create task
+    task = Task(
+        description=description,
+        expected_output=config.get("expected_output"),
+        agent=agent,
+        context=context,
+        output_file=output_file,
+        async_execution=async_execution,
+        callback=callback
+    )
+    
+    return task
+
+
+def topic_slug(topic: str) -> str:
+    """
+    Create a safe filename fragment from a topic.
+    
+    Args:
+        topic: The newsletter topic
+        
+    Returns:
+        Topic with unsafe characters replaced, at most 30 characters long
+    """
+    safe_topic = "".join(c if c.isalnum() or c in [' ', '_'] else '_' for c in topic)
+    return safe_topic.replace(' ', '_')[:30]  # Limit length
+
+
+def article_output_file(topic: str, output_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Get the file path the article for a topic is saved to.
+    
+    Args:
+        topic: The newsletter topic
+        output_dir: Optional directory to save task outputs
+        
+    Returns:
+        File path, or None if no output directory is provided
+    """
+    if not output_dir:
+        return None
+    
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{topic_slug(topic)}_article.md")
+
+
+class TopicCheckpoints:
+    """
+    Checkpoints of the tasks of one topic.
+    
+    A task's checkpoint hash covers its formatted configuration, the
+    configuration of its agent and the hashes of the outputs it consumes, so
+    it is only known once all of its inputs have an output. Outputs are
+    recorded as tasks are loaded or completed.
+    """
+    
+    def __init__(self, store: CheckpointStore, topic: str, dependencies: Dict[str, List[str]]):
+        """
+        Initialize the checkpoints of a topic.
+        
+        Args:
+            store: Checkpoint store
+            topic: The newsletter topic
+            dependencies: Dictionary of task types to the task types they depend on,
+                in execution order
+        """
+        self.store = store
+        self.topic = topic
+        self.dependencies = dependencies
+        self.outputs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        
+        registry = get_config_registry()
+        self.configs: Dict[str, Dict[str, Any]] = {}
+        for task_type in dependencies:
+            config = format_task_config(load_task_config(task_type), {"topic": topic})
+            config["agent_config"] = registry.agent(config["agent"])
+            self.configs[task_type] = config
+    
+    def task_hash(self, task_type: str) -> Optional[str]:
+        """
+        Get the checkpoint hash of a task.
+        
+        Returns:
+            Hex digest, or None while an input of the task has no output yet
+        """
+        with self._lock:
+            inputs = self.dependencies[task_type]
+            if any(dep not in self.outputs for dep in inputs):
+                return None
+            return config_hash(self.configs[task_type], {dep: output_hash(self.outputs[dep]) for dep in inputs})
+    
+    def load(self, task_type: str) -> Optional[str]:
+        """
+        Get the saved output of a task and record it as the task's output.
+        
+        Returns:
+            The saved output, or None if there is no checkpoint for the current inputs
+        """
+        task_hash = self.task_hash(task_type)
+        if task_hash is None:
+            return None
+        output = self.store.load(self.topic, task_type, task_hash)
+        if output is not None:
+            with self._lock:
+                self.outputs[task_type] = output
+        return output
+    
+    def load_all(self) -> Dict[str, str]:
+        """
+        Load the saved output of every task whose inputs are all saved too.
+        
+        Returns:
+            Dictionary of task types to their saved outputs
+        """
+        completed = {}
+        for task_type in self.dependencies:
+            output = self.load(task_type)
+            if output is not None:
+                completed[task_type] = output
+        return completed
+    
+    def save(self, task_type: str, output: str) -> None:
+        """
+        Record the output of a completed task and save it as a checkpoint.
+        """
+        task_hash = self.task_hash(task_type)
+        with self._lock:
+            self.outputs[task_type] = output
+        if task_hash is not None:
+            self.store.save(self.topic, task_type, task_hash, output)
+    
+    def callback(self, task_type: str) -> Callable[[Any], Any]:
+        """
+        Create a task callback that saves the task output as a checkpoint.
+        """
+        def save(output: Any) -> None:
+            self.save(task_type, output.raw)
+        
+        return save
+
+
+def graph_dependencies(graph: Optional[TaskGraph] = None) -> Dict[str, List[str]]:
+    """
+    Get the inputs of every task of the newsletter graph, in execution order.
+    
+    Args:
+        graph: Task graph (defaults to build_task_graph())
+        
+    Returns:
+        Dictionary of task types to the task types they depend on
+    """
+    graph = graph or build_task_graph()
+    return {task_type: graph.inputs(task_type) for task_type in graph.order()}
+
+
+def load_checkpointed_outputs(checkpoints: CheckpointStore, topic: str) -> Dict[str, str]:
+    """
+    Get the saved outputs of the newsletter graph tasks of a topic.
+    
+    Args:
+        checkpoints: Checkpoint store
+        topic: The newsletter topic
+        
+    Returns:
+        Dictionary of task types to their saved outputs
+    """
+    return TopicCheckpoints(checkpoints, topic, graph_dependencies()).load_all()
+
+
+def create_sequential_tasks(
+    agents: Dict[str, Agent],
+    topic: str,
+    output_dir: Optional[str] = None,
+    checkpoints: Optional[CheckpointStore] = None
+) -> List[Task]:
+    """
+    Create a sequence of tasks for newsletter creation.
+    
+    With a checkpoint store, every task saves its output on completion. Leading
+    tasks that already have a checkpoint are left out, and their saved outputs
+    are passed to the first remaining task, so a rerun after a failure resumes
+    where the previous run stopped.
+    
+    Args:
+        agents: Dictionary of available agents
+        topic: The newsletter topic
+        output_dir: Optional directory to save task outputs
+        checkpoints: Optional checkpoint store for resuming
+        
+    Returns:
+        List of tasks in sequential order (empty if every task has a checkpoint)
+    """
+    format_args = {"topic": topic}
+    tasks = []
+    
+    # In a sequential crew every task sees the output of all earlier tasks
+    topic_checkpoints = None
+    if checkpoints is not None:
+        topic_checkpoints = TopicCheckpoints(
+            checkpoints, topic, {t: NEWSLETTER_TASKS[:i] for i, t in enumerate(NEWSLETTER_TASKS)}
+        )
+    completed: Dict[str, str] = {}
+    
+    def add(task_type: str, output_file: Optional[str] = None) -> None:
+        if topic_checkpoints is not None and not tasks:
+            output = topic_checkpoints.load(task_type)
+            if output is not None:
+                completed[task_type] = output
+                return
+        
+        tasks.append(create_task(
+            task_type,
+            agents,
+            format_args,
+            output_file=output_file,
+            cached_context=None if tasks else format_task_context(completed),
+            callback=topic_checkpoints.callback(task_type) if topic_checkpoints else None
+        ))
+    
+    # 1. Planning task (CEO)
+    add("newsletter_planning")
+    
+    # 2. Research task (Content Manager)
+    add("content_research")
+    
+    # 3. Creative concept task (Creative Manager)
+    add("creative_concept")
+    
+    # 4. Visual design task (Designer)
+    add("visual_design")
+    
+    # 5. Article writing task (Writer)
+    # Save to output file if directory is provided
+    add("article_writing", output_file=article_output_file(topic, output_dir))
+    
+    # 6. Final review task (CEO)
+    add("final_review")
+    
+    return tasks
+
+
+def build_task_graph(task_types: Optional[List[str]] = None) -> TaskGraph:
+    """
+    Build the dependency graph of newsletter tasks from their configured context.
+    
+    Each task declares the tasks whose output it consumes under the "context"
+    key in tasks.yaml. Tasks that do not depend on each other can run concurrently.
+    
+    Args:
+        task_types: Task types to include (defaults to all newsletter tasks)
+        
+    Returns:
+        TaskGraph of the task types
+    """
+    graph = TaskGraph()
+    for task_type in task_types or NEWSLETTER_TASKS:
+        graph.add(task_type, load_task_config(task_type).get("context") or [])
+    return graph
+
+
+def create_task_graph(
+    agents: Dict[str, Agent],
+    topic: str,
+    output_dir: Optional[str] = None,
+    checkpoints: Optional[CheckpointStore] = None
+) -> List[Task]:
+    """
+    Create the newsletter tasks wired together by their declared dependencies.
+    
+    Unlike create_sequential_tasks, each task only receives the output of the
+    tasks it depends on, and tasks that share a layer of the graph are marked
+    for asynchronous execution so that CrewAI runs them concurrently.
+    
+    With a checkpoint store, tasks that already have a checkpoint are left out
+    and their saved outputs are passed to the tasks that depend on them.
+    
+    Args:
+        agents: Dictionary of available agents
+        topic: The newsletter topic
+        output_dir: Optional directory to save task outputs
+        checkpoints: Optional checkpoint store for resuming
+        
+    Returns:
+        List of tasks in a valid execution order (empty if every task has a checkpoint)
+    """
+    format_args = {"topic": topic}
+    graph = build_task_graph()
+    
+    topic_checkpoints = None
+    completed: Dict[str, str] = {}
+    if checkpoints is not None:
+        topic_checkpoints = TopicCheckpoints(checkpoints, topic, graph_dependencies(graph))
+        completed = topic_checkpoints.load_all()
+    
+    layers = [[name for name in layer if name not in completed] for layer in graph.layers()]
+    order = [name for layer in layers for name in layer]
+    concurrent = {name for layer in layers if len(layer) > 1 for name in layer}
+    
+    tasks: Dict[str, Task] = {}
+    for task_type in order:
+        inputs = graph.inputs(task_type)
+        output_file = article_output_file(topic, output_dir) if task_type == "article_writing" else None
+        tasks[task_type] = create_task(
+            task_type,
+            agents,
+            format_args,
+            context=[tasks[dep] for dep in inputs if dep in tasks] or None,
+            output_file=output_file,
+            # CrewAI requires the last task of a crew to run synchronously
+            async_execution=task_type in concurrent and task_type != order[-1],
+            cached_context=format_task_context({dep: completed[dep] for dep in inputs if dep in completed}),
+            callback=topic_checkpoints.callback(task_type) if topic_checkpoints else None
+        )
+    
+    return [tasks[task_type] for task_type in order]
+
+
+def format_task_context(outputs: Dict[str, Any]) -> Optional[str]:
+    """
+    Join the outputs of dependency tasks into a context string for a task.
+    
+    Args:
+        outputs: Dictionary of task types to their outputs
+        
+    Returns:
+        Context string, or None if there are no outputs
+    """
+    if not outputs:
+        return None
+    return "\n\n".join(f"## {task_type}\n{output}" for task_type, output in outputs.items())
+
+
+def run_task_graph(
+    agents: Dict[str, Agent],
+    topic: str,
+    output_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoints: Optional[CheckpointStore] = None
+) -> Dict[str, str]:
+    """
+    Run the newsletter tasks on a thread pool, outside of a Crew.
+    
+    Each task starts as soon as the tasks it depends on have finished. With a
+    checkpoint store, completed tasks are saved and tasks with a checkpoint
+    are not run again; their saved output is passed on instead.
+    
+    Args:
+        agents: Dictionary of available agents
+        topic: The newsletter topic
+        output_dir: Optional directory to save task outputs
+        max_workers: Maximum number of tasks running at the same time
+        checkpoints: Optional checkpoint store for resuming
+        
+    Returns:
+        Dictionary of task types to their raw output
+    """
+    format_args = {"topic": topic}
+    graph = build_task_graph()
+    topic_checkpoints = None
+    if checkpoints is not None:
+        topic_checkpoints = TopicCheckpoints(checkpoints, topic, graph_dependencies(graph))
+    
+    def execute(task_type: str, inputs: Dict[str, Any]) -> str:
+        if topic_checkpoints is not None:
+            output = topic_checkpoints.load(task_type)
+            if output is not None:
+                return output
+        
+        output_file = article_output_file(topic, output_dir) if task_type == "article_writing" else None
+        task = create_task(task_type, agents, format_args, output_file=output_file)
+        result = task.execute_sync(context=format_task_context(inputs))
+        
+        if topic_checkpoints is not None:
+            topic_checkpoints.save(task_type, result.raw)
+        return result.raw
+    
+    return graph.run(execute, max_workers=max_workers)
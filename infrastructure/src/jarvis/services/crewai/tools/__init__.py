@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+CrewAI tools module initialization.
+
+The newsletter service shares the lazy tool registry of the CrewAI integration,
+so agents built here and elsewhere in the process use the same tool instances.
+"""
+
+from jarvis.integrations.crewai.tools import (
+    TOOL_FACTORIES,
+    dedupe_tools,
+    get_tool,
+    get_tools_for_agent,
+    register_tool,
+)
+from jarvis.integrations.crewai.tools.cache import get_tool_cache
+from jarvis.integrations.crewai.tools.rate_limit import RateLimiter, set_call_limiter
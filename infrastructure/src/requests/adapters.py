@@ -27,7 +27,7 @@ from urllib3.poolmanager import PoolManager, proxy_from_url
 from urllib3.util import Timeout as TimeoutSauce
 from urllib3.util import parse_url
 from urllib3.util.retry import Retry
-from urllib3.util.ssl_ import create_urllib3_context
+from urllib3.util.ssl_ import cached_ssl_context
 
 from .auth import _basic_auth_str
 from .compat import basestring, urlparse
@@ -77,9 +77,10 @@ DEFAULT_POOL_TIMEOUT = None
 try:
     import ssl  # noqa: F401
 
-    _preloaded_ssl_context = create_urllib3_context()
-    _preloaded_ssl_context.load_verify_locations(
-        extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH)
+    # Shared with urllib3 pools that use the same CA bundle, so that the
+    # bundle is only parsed once per process.
+    _preloaded_ssl_context = cached_ssl_context(
+        ca_certs=extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH)
     )
 except ImportError:
     # Bypass default SSLContext creation when Python
@@ -31,6 +31,7 @@ if typing.TYPE_CHECKING:
     from typing import Protocol
 
     from .response import BaseHTTPResponse
+    from .util.resolver import BaseResolver
 
     class BaseHTTPConnection(Protocol):
         default_port: typing.ClassVar[int]
@@ -44,6 +45,8 @@ if typing.TYPE_CHECKING:
         blocksize: int
         source_address: tuple[str, int] | None
         socket_options: _TYPE_SOCKET_OPTIONS | None
+        happy_eyeballs_delay: float | None
+        resolver: BaseResolver | None
 
         proxy: Url | None
         proxy_config: ProxyConfig | None
@@ -62,6 +65,8 @@ if typing.TYPE_CHECKING:
             socket_options: _TYPE_SOCKET_OPTIONS | None = ...,
             proxy: Url | None = None,
             proxy_config: ProxyConfig | None = None,
+            happy_eyeballs_delay: float | None = ...,
+            resolver: BaseResolver | None = None,
         ) -> None: ...
 
         def set_tunnel(
@@ -148,6 +153,8 @@ if typing.TYPE_CHECKING:
             socket_options: _TYPE_SOCKET_OPTIONS | None = ...,
             proxy: Url | None = None,
             proxy_config: ProxyConfig | None = None,
+            happy_eyeballs_delay: float | None = ...,
+            resolver: BaseResolver | None = None,
             cert_reqs: int | str | None = None,
             assert_hostname: None | str | typing.Literal[False] = None,
             assert_fingerprint: str | None = None,
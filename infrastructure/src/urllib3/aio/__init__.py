@@ -0,0 +1,23 @@
+"""
+asyncio counterparts of urllib3's connection pools.
+
+They reuse urllib3's :class:`~urllib3.util.Retry`, :class:`~urllib3.util.Timeout`,
+header handling and content decoding, and speak HTTP/1.1 over
+:mod:`asyncio` streams.
+"""
+
+from __future__ import annotations
+
+from .connection import AsyncHTTPConnection, AsyncHTTPSConnection
+from .connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from .poolmanager import AsyncPoolManager
+from .response import AsyncHTTPResponse
+
+__all__ = (
+    "AsyncHTTPConnection",
+    "AsyncHTTPSConnection",
+    "AsyncHTTPConnectionPool",
+    "AsyncHTTPSConnectionPool",
+    "AsyncHTTPResponse",
+    "AsyncPoolManager",
+)
@@ -0,0 +1,463 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import io
+import logging
+import socket
+import ssl
+import typing
+
+from .._collections import HTTPHeaderDict
+from ..connection import (
+    _CONTAINS_CONTROL_CHAR_RE,
+    _get_default_user_agent,
+    _match_hostname,
+)
+from ..connection import port_by_scheme as port_by_scheme
+from ..exceptions import (
+    ConnectTimeoutError,
+    NameResolutionError,
+    NewConnectionError,
+    ProtocolError,
+)
+from ..util import connection
+from ..util.request import SKIP_HEADER, SKIPPABLE_HEADERS, body_to_chunks
+from ..util.ssl_ import assert_fingerprint as _assert_fingerprint
+from ..util.ssl_ import (
+    _reconfigure_cached_ssl_context,
+    cached_ssl_context,
+    resolve_cert_reqs,
+)
+from ..util.timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT, Timeout
+from ..util.util import to_str
+
+if typing.TYPE_CHECKING:
+    from .._base_connection import _TYPE_BODY
+
+log = logging.getLogger(__name__)
+
+#: Longest status line and header block accepted from a server.
+_MAX_HEAD_SIZE = 64 * 1024
+
+
+class AsyncHTTPConnection:
+    """
+    HTTP/1.1 connection on top of :mod:`asyncio` streams.
+
+    The asyncio counterpart of :class:`urllib3.connection.HTTPConnection`,
+    used by :class:`~urllib3.aio.AsyncHTTPConnectionPool`. ``timeout`` is the
+    connect timeout; :meth:`getresponse` takes the read timeout. Connections
+    race the host's addresses like the blocking ones do, see
+    ``happy_eyeballs_delay`` there.
+    """
+
+    default_port: typing.ClassVar[int] = port_by_scheme["http"]
+    default_socket_options: typing.ClassVar[connection._TYPE_SOCKET_OPTIONS] = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    ]
+
+    is_verified: bool = False
+    proxy_is_verified: bool | None = None
+    proxy = None
+    has_connected_to_proxy = False
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        *,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        source_address: tuple[str, int] | None = None,
+        blocksize: int = 16384,
+        socket_options: None | (
+            connection._TYPE_SOCKET_OPTIONS
+        ) = default_socket_options,
+        happy_eyeballs_delay: float | None = connection.DEFAULT_HAPPY_EYEBALLS_DELAY,
+    ) -> None:
+        self._dns_host = host
+        self.port = port or self.default_port
+        self.timeout = Timeout.resolve_default_timeout(timeout)
+        self.source_address = source_address
+        self.blocksize = blocksize
+        self.socket_options = socket_options
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._pending_method: str | None = None
+
+    @property
+    def host(self) -> str:
+        return self._dns_host.rstrip(".")
+
+    @property
+    def is_closed(self) -> bool:
+        return self._writer is None
+
+    @property
+    def is_connected(self) -> bool:
+        if self._writer is None or self._reader is None:
+            return False
+        # An idle connection that has data or EOF waiting was dropped by the
+        # server, or is out of sync.
+        return not (
+            self._writer.is_closing()
+            or self._reader.at_eof()
+            or self._reader._buffer  # type: ignore[attr-defined]
+        )
+
+    def _open_connection_kw(self) -> dict[str, typing.Any]:
+        kw: dict[str, typing.Any] = {"limit": max(self.blocksize, _MAX_HEAD_SIZE)}
+        if self.source_address:
+            kw["local_addr"] = self.source_address
+        if self.happy_eyeballs_delay is not None:
+            kw["happy_eyeballs_delay"] = self.happy_eyeballs_delay
+        return kw
+
+    async def connect(self) -> None:
+        """Opens the connection, raising urllib3's connection errors."""
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self._dns_host, self.port, **self._open_connection_kw()
+                ),
+                self.timeout,
+            )
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e  # type: ignore[arg-type]
+        except asyncio.TimeoutError as e:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
+            ) from e
+        except ssl.SSLError:
+            raise
+        except OSError as e:
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {e}"  # type: ignore[arg-type]
+            ) from e
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None and self.socket_options:
+            connection._set_socket_options(sock, self.socket_options)
+
+    def _request_head(
+        self,
+        method: str,
+        url: str,
+        headers: typing.Mapping[str, str],
+        framing: tuple[str, str] | None,
+    ) -> bytes:
+        match = _CONTAINS_CONTROL_CHAR_RE.search(method)
+        if match:
+            raise ValueError(
+                f"Method cannot contain non-token characters {method!r} (found at least {match.group()!r})"
+            )
+        if any(c in url for c in " \r\n"):
+            raise ValueError(f"URL can't contain control characters. {url!r}")
+
+        lines = [f"{method} {url} HTTP/1.1"]
+        header_keys = frozenset(to_str(k.lower()) for k in headers)
+        if "host" not in header_keys:
+            host = self.host
+            if ":" in host:
+                host = f"[{host}]"
+            if self.port != self.default_port:
+                host = f"{host}:{self.port}"
+            lines.append(f"Host: {host}")
+        if "accept-encoding" not in header_keys:
+            lines.append("Accept-Encoding: identity")
+        if framing is not None:
+            lines.append("%s: %s" % framing)
+        if "user-agent" not in header_keys:
+            lines.append(f"User-Agent: {_get_default_user_agent()}")
+        for header, value in headers.items():
+            if isinstance(value, str) and value == SKIP_HEADER:
+                if to_str(header.lower()) not in SKIPPABLE_HEADERS:
+                    skippable_headers = "', '".join(
+                        [str.title(header) for header in sorted(SKIPPABLE_HEADERS)]
+                    )
+                    raise ValueError(
+                        f"urllib3.util.SKIP_HEADER only supports '{skippable_headers}'"
+                    )
+                continue
+            value = str(value)
+            if any(c in header for c in ":\r\n") or "\r" in value or "\n" in value:
+                raise ValueError(f"Invalid header {header!r}: {value!r}")
+            lines.append(f"{header}: {value}")
+        lines.append("\r\n")
+        return "\r\n".join(lines).encode("latin-1")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: _TYPE_BODY | typing.AsyncIterable[bytes] | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        *,
+        chunked: bool = False,
+    ) -> None:
+        """
+        Sends a request. Bodies are framed like
+        :meth:`urllib3.connection.HTTPConnection.request` does; async
+        iterables of bytes are sent chunked.
+        """
+        if self._writer is None:
+            await self.connect()
+        writer = self._writer
+        assert writer is not None
+
+        if headers is None:
+            headers = {}
+        header_keys = frozenset(to_str(k.lower()) for k in headers)
+
+        chunks: typing.Iterable[typing.Any] | typing.AsyncIterable[bytes] | None
+        if hasattr(body, "__aiter__"):
+            chunks, content_length = (
+                typing.cast(typing.AsyncIterable[bytes], body),
+                None,
+            )
+        else:
+            chunks_and_cl = body_to_chunks(
+                body, method=method, blocksize=self.blocksize
+            )
+            chunks, content_length = chunks_and_cl.chunks, chunks_and_cl.content_length
+
+        framing = None
+        if chunked:
+            if "transfer-encoding" not in header_keys:
+                framing = ("Transfer-Encoding", "chunked")
+        elif "content-length" in header_keys:
+            chunked = False
+        elif "transfer-encoding" in header_keys:
+            chunked = True
+        elif content_length is None:
+            if chunks is not None:
+                chunked = True
+                framing = ("Transfer-Encoding", "chunked")
+        else:
+            framing = ("Content-Length", str(content_length))
+
+        self._pending_method = method
+        writer.write(self._request_head(method, url, headers, framing))
+
+        async def send(chunk: bytes | str) -> None:
+            # Sending empty chunks isn't allowed for TE: chunked
+            # as it indicates the end of the body.
+            if not chunk:
+                return
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if chunked:
+                writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+            else:
+                writer.write(chunk)
+            await writer.drain()
+
+        if chunks is not None:
+            if hasattr(chunks, "__aiter__"):
+                async for chunk in chunks:  # type: ignore[union-attr]
+                    await send(chunk)
+            else:
+                for chunk in chunks:  # type: ignore[union-attr]
+                    await send(chunk)
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _read_head(self) -> bytes:
+        assert self._reader is not None
+        try:
+            return await self._reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                raise http.client.RemoteDisconnected(
+                    "Remote end closed connection without response"
+                ) from e
+            raise ProtocolError("Connection broken: incomplete response head", e) from e
+        except asyncio.LimitOverrunError as e:
+            raise ProtocolError("Response head is too long", e) from e
+
+    async def getresponse(
+        self, read_timeout: float | None = None
+    ) -> tuple[int, int, str, str, HTTPHeaderDict]:
+        """
+        Reads the head of the response to the last request and returns its
+        ``(status, version, version_string, reason, headers)``. Informational
+        responses are skipped.
+        """
+        if self._pending_method is None or self._reader is None:
+            raise http.client.ResponseNotReady()
+        self._pending_method = None
+        while True:
+            head = await asyncio.wait_for(self._read_head(), read_timeout)
+            status_line, _, header_block = head.partition(b"\r\n")
+            try:
+                version_string, status_str, *rest = (
+                    status_line.decode("iso-8859-1").rstrip().split(None, 2)
+                )
+                status = int(status_str)
+            except ValueError:
+                raise http.client.BadStatusLine(repr(status_line)) from None
+            if not version_string.startswith("HTTP/") or not 100 <= status <= 999:
+                raise http.client.BadStatusLine(repr(status_line))
+            reason = rest[0] if rest else ""
+            # 101 switches protocols, any other 1xx is followed by the real response.
+            if 100 <= status < 200 and status != 101:
+                continue
+            break
+
+        version = 10 if version_string == "HTTP/1.0" else 11
+        message = http.client.parse_headers(io.BytesIO(header_block))
+        return status, version, version_string, reason, HTTPHeaderDict(message.items())
+
+    @property
+    def reader(self) -> asyncio.StreamReader:
+        if self._reader is None:
+            raise http.client.ResponseNotReady()
+        return self._reader
+
+    def close(self) -> None:
+        writer, self._writer, self._reader = self._writer, None, None
+        self._pending_method = None
+        if writer is not None:
+            writer.close()
+
+
+class AsyncHTTPSConnection(AsyncHTTPConnection):
+    """
+    TLS variant of :class:`AsyncHTTPConnection`, configured like
+    :class:`urllib3.connection.HTTPSConnection`. Without an ``ssl_context``
+    it uses the process-wide context shared with blocking connections.
+    """
+
+    default_port = port_by_scheme["https"]  # type: ignore[misc]
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        *,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        source_address: tuple[str, int] | None = None,
+        blocksize: int = 16384,
+        socket_options: None | (
+            connection._TYPE_SOCKET_OPTIONS
+        ) = AsyncHTTPConnection.default_socket_options,
+        happy_eyeballs_delay: float | None = connection.DEFAULT_HAPPY_EYEBALLS_DELAY,
+        cert_reqs: int | str | None = None,
+        assert_hostname: None | str | typing.Literal[False] = None,
+        assert_fingerprint: str | None = None,
+        server_hostname: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        ca_certs: str | None = None,
+        ca_cert_dir: str | None = None,
+        ca_cert_data: None | str | bytes = None,
+        ssl_minimum_version: int | None = None,
+        ssl_maximum_version: int | None = None,
+        ssl_version: int | str | None = None,
+        cert_file: str | None = None,
+        key_file: str | None = None,
+        key_password: str | None = None,
+    ) -> None:
+        super().__init__(
+            host,
+            port,
+            timeout=timeout,
+            source_address=source_address,
+            blocksize=blocksize,
+            socket_options=socket_options,
+            happy_eyeballs_delay=happy_eyeballs_delay,
+        )
+        if cert_reqs is None:
+            cert_reqs = (
+                ssl_context.verify_mode
+                if ssl_context is not None
+                else resolve_cert_reqs(None)
+            )
+        self.cert_reqs = cert_reqs
+        self.assert_hostname = assert_hostname
+        self.assert_fingerprint = assert_fingerprint
+        self.server_hostname = server_hostname
+        self.ssl_context = ssl_context
+        self.ca_certs = ca_certs
+        self.ca_cert_dir = ca_cert_dir
+        self.ca_cert_data = ca_cert_data
+        self.ssl_minimum_version = ssl_minimum_version
+        self.ssl_maximum_version = ssl_maximum_version
+        self.ssl_version = ssl_version
+        self.cert_file = cert_file
+        self.key_file = key_file
+        self.key_password = key_password
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        cert_reqs = resolve_cert_reqs(self.cert_reqs)
+        # Fingerprints and custom hostnames are checked once connected.
+        check_hostname = (
+            cert_reqs == ssl.CERT_REQUIRED
+            and not self.assert_fingerprint
+            and self.assert_hostname is None
+        )
+        if self.ssl_context is not None:
+            # Shared contexts aren't changed; see _reconfigure_cached_ssl_context().
+            shared = _reconfigure_cached_ssl_context(
+                self.ssl_context,
+                cert_reqs,
+                check_hostname,
+                ca_certs=self.ca_certs,
+                ca_cert_dir=self.ca_cert_dir,
+                ca_cert_data=self.ca_cert_data,
+                cert_file=self.cert_file,
+                key_file=self.key_file,
+                key_password=self.key_password,
+            )
+            if shared is not None:
+                return shared
+            context = self.ssl_context
+            if not check_hostname:
+                context.check_hostname = False
+            context.verify_mode = cert_reqs
+            return context
+        return cached_ssl_context(
+            ssl_version=self.ssl_version,
+            cert_reqs=cert_reqs,
+            ssl_minimum_version=self.ssl_minimum_version,
+            ssl_maximum_version=self.ssl_maximum_version,
+            ca_certs=self.ca_certs,
+            ca_cert_dir=self.ca_cert_dir,
+            ca_cert_data=self.ca_cert_data,
+            cert_file=self.cert_file,
+            key_file=self.key_file,
+            key_password=self.key_password,
+            check_hostname=check_hostname,
+        )
+
+    def _open_connection_kw(self) -> dict[str, typing.Any]:
+        kw = super()._open_connection_kw()
+        kw["ssl"] = self._ssl_context()
+        kw["server_hostname"] = self.server_hostname or self.host
+        kw["ssl_handshake_timeout"] = self.timeout
+        return kw
+
+    async def connect(self) -> None:
+        await super().connect()
+        assert self._writer is not None
+        ssl_object = self._writer.get_extra_info("ssl_object")
+        cert_reqs = resolve_cert_reqs(self.cert_reqs)
+        try:
+            if self.assert_fingerprint:
+                _assert_fingerprint(
+                    ssl_object.getpeercert(binary_form=True), self.assert_fingerprint
+                )
+            elif self.assert_hostname and cert_reqs != ssl.CERT_NONE:
+                _match_hostname(
+                    ssl_object.getpeercert(),
+                    self.assert_hostname,
+                    hostname_checks_common_name=False,
+                )
+        except BaseException:
+            self.close()
+            raise
+        self.is_verified = cert_reqs == ssl.CERT_REQUIRED or bool(
+            self.assert_fingerprint
+        )
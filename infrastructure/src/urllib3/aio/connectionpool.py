@@ -0,0 +1,621 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import logging
+import ssl
+import typing
+import warnings
+
+from .._collections import HTTPHeaderDict
+from .._request_methods import RequestMethods
+from ..connectionpool import ConnectionPool, _normalize_host, _url_from_pool
+from ..exceptions import (
+    ClosedPoolError,
+    EmptyPoolError,
+    FullPoolError,
+    HostChangedError,
+    InsecureRequestWarning,
+    MaxRetryError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+    TimeoutError,
+)
+from ..util.request import _TYPE_BODY_POSITION, set_file_position
+from ..util.retry import Retry
+from ..util.ssl_match_hostname import CertificateError
+from ..util.timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT, Timeout
+from ..util.url import _encode_target, parse_url
+from ..util.util import to_str
+from .connection import AsyncHTTPConnection, AsyncHTTPSConnection, port_by_scheme
+from .response import AsyncHTTPResponse
+
+if typing.TYPE_CHECKING:
+    from .._base_connection import _TYPE_BODY
+
+log = logging.getLogger(__name__)
+
+
+async def _sleep(retries: Retry, response: AsyncHTTPResponse | None = None) -> None:
+    # Same as Retry.sleep() without blocking the event loop.
+    if response is not None and retries.respect_retry_after_header:
+        retry_after = retries.get_retry_after(response)
+        if retry_after:
+            await asyncio.sleep(retry_after)
+            return
+    backoff = retries.get_backoff_time()
+    if backoff > 0:
+        await asyncio.sleep(backoff)
+
+
+async def _sleep_for_retry(retries: Retry, response: AsyncHTTPResponse) -> None:
+    # Same as Retry.sleep_for_retry(), which only honours Retry-After.
+    retry_after = retries.get_retry_after(response)
+    if retry_after:
+        await asyncio.sleep(retry_after)
+
+
+class AsyncHTTPConnectionPool(ConnectionPool, RequestMethods):
+    """
+    Connection pool for one host that makes requests from asyncio
+    coroutines, so that many requests can be in flight on a single thread.
+
+    Takes the same arguments as :class:`urllib3.HTTPConnectionPool` (apart
+    from proxies) and retries, redirects and times out the same way.
+    :meth:`urlopen`, as well as :meth:`request` and the other helpers that
+    call it, return awaitables that resolve to
+    :class:`~urllib3.aio.AsyncHTTPResponse` objects:
+
+    .. code-block:: python
+
+        pool = AsyncHTTPConnectionPool("example.com", maxsize=10)
+        response = await pool.request("GET", "/")
+        print(response.status, response.data)
+
+    With ``block=True`` requests wait for one of the ``maxsize`` connections
+    to be free instead of opening more. Connections are bound to the event
+    loop that opened them, so a pool must only be used from one loop.
+    """
+
+    scheme = "http"
+    ConnectionCls: type[AsyncHTTPConnection] = AsyncHTTPConnection
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        timeout: _TYPE_TIMEOUT | None = _DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        **conn_kw: typing.Any,
+    ):
+        ConnectionPool.__init__(self, host, port)
+        RequestMethods.__init__(self, headers)
+
+        if not isinstance(timeout, Timeout):
+            timeout = Timeout.from_float(timeout)
+
+        if retries is None:
+            retries = Retry.DEFAULT
+
+        self.timeout = timeout
+        self.retries = retries
+        self.maxsize = maxsize
+        self.block = block
+
+        self.pool: asyncio.LifoQueue[AsyncHTTPConnection | None] | None
+        self.pool = asyncio.LifoQueue(maxsize)
+        # Fill the queue up so that doing get() on it will block properly
+        for _ in range(maxsize):
+            self.pool.put_nowait(None)
+
+        # These are mostly for testing and debugging purposes.
+        self.num_connections = 0
+        self.num_requests = 0
+        self.conn_kw = conn_kw
+
+    def _new_conn(self) -> AsyncHTTPConnection:
+        """
+        Return a fresh, not yet connected :class:`AsyncHTTPConnection`.
+        """
+        self.num_connections += 1
+        log.debug(
+            "Starting new %s connection (%d): %s:%s",
+            self.scheme.upper(),
+            self.num_connections,
+            self.host,
+            self.port or port_by_scheme[self.scheme],
+        )
+        return self.ConnectionCls(
+            host=self.host,
+            port=self.port,
+            timeout=self.timeout.connect_timeout,
+            **self.conn_kw,
+        )
+
+    async def _get_conn(self, timeout: float | None = None) -> AsyncHTTPConnection:
+        """
+        Get a connection. Will return a pooled connection if one is available.
+
+        If no connections are available and :prop:`.block` is ``False``, then a
+        fresh connection is returned.
+
+        :param timeout:
+            Seconds to wait before giving up and raising
+            :class:`urllib3.exceptions.EmptyPoolError` if the pool is empty and
+            :prop:`.block` is ``True``.
+        """
+        if self.pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+
+        conn = None
+        try:
+            if self.block:
+                conn = await asyncio.wait_for(self.pool.get(), timeout)
+            else:
+                conn = self.pool.get_nowait()
+        except asyncio.TimeoutError:
+            raise EmptyPoolError(
+                self,
+                "Pool is empty and a new connection can't be opened due to blocking mode.",
+            ) from None
+        except asyncio.QueueEmpty:
+            pass  # Oh well, we'll create a new connection then
+
+        # If this is a persistent connection, check if it got disconnected
+        if conn and not conn.is_closed and not conn.is_connected:
+            log.debug("Resetting dropped connection: %s", self.host)
+            conn.close()
+
+        return conn or self._new_conn()
+
+    def _put_conn(self, conn: AsyncHTTPConnection | None) -> None:
+        """
+        Put a connection back into the pool.
+
+        If the pool is already full or closed, the connection is closed and
+        discarded.
+        """
+        if self.pool is not None:
+            try:
+                self.pool.put_nowait(conn)
+                return  # Everything is dandy, done.
+            except asyncio.QueueFull:
+                if conn:
+                    conn.close()
+
+                if self.block:
+                    # This should never happen if you got the conn from self._get_conn
+                    raise FullPoolError(
+                        self,
+                        "Pool reached maximum size and no more connections are allowed.",
+                    ) from None
+
+                log.warning(
+                    "Connection pool is full, discarding connection: %s. Connection pool size: %s",
+                    self.host,
+                    self.pool.qsize(),
+                )
+
+        # Connection never got put back into the pool, close it.
+        if conn:
+            conn.close()
+
+    async def _validate_conn(self, conn: AsyncHTTPConnection) -> None:
+        """
+        Called right before a request is made.
+        """
+
+    def _get_timeout(self, timeout: _TYPE_TIMEOUT) -> Timeout:
+        """Helper that always returns a :class:`urllib3.util.Timeout`"""
+        if timeout is _DEFAULT_TIMEOUT:
+            return self.timeout.clone()
+
+        if isinstance(timeout, Timeout):
+            return timeout.clone()
+        else:
+            return Timeout.from_float(timeout)
+
+    async def _make_request(
+        self,
+        conn: AsyncHTTPConnection,
+        method: str,
+        url: str,
+        body: _TYPE_BODY | typing.AsyncIterable[bytes] | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | None = None,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        chunked: bool = False,
+        preload_content: bool = True,
+        decode_content: bool = True,
+        enforce_content_length: bool = True,
+    ) -> AsyncHTTPResponse:
+        """
+        Perform a request on a connection taken from our pool. Arguments are
+        the same as for :meth:`urllib3.HTTPConnectionPool._make_request`.
+        """
+        self.num_requests += 1
+
+        timeout_obj = self._get_timeout(timeout)
+        timeout_obj.start_connect()
+        conn.timeout = Timeout.resolve_default_timeout(timeout_obj.connect_timeout)
+
+        try:
+            if conn.is_closed:
+                await conn.connect()
+            await self._validate_conn(conn)
+        except (ssl.SSLError, CertificateError) as e:
+            raise SSLError(e) from e
+
+        try:
+            await conn.request(method, url, body=body, headers=headers, chunked=chunked)
+        # The server may legitimately close the connection after sending a
+        # valid response while we're still sending the body.
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+        read_timeout = timeout_obj.read_timeout
+        if read_timeout == 0:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={read_timeout})"
+            )
+        read_timeout = Timeout.resolve_default_timeout(read_timeout)
+
+        try:
+            status, version, version_string, reason, headers = await conn.getresponse(
+                read_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(
+                self, url, f"Read timed out. (read timeout={read_timeout})"
+            ) from e
+
+        response = AsyncHTTPResponse(
+            headers=headers,
+            status=status,
+            version=version,
+            version_string=version_string,
+            reason=reason,
+            decode_content=decode_content,
+            request_url=_url_from_pool(self, url),  # type: ignore[arg-type]
+            request_method=method,
+            retries=retries,
+            connection=conn,
+            enforce_content_length=enforce_content_length,
+            read_timeout=read_timeout,
+        )
+        response._origin_pool = self
+
+        log.debug(
+            '%s://%s:%s "%s %s %s" %s %s',
+            self.scheme,
+            self.host,
+            self.port,
+            method,
+            url,
+            version_string,
+            status,
+            response.length_remaining,
+        )
+
+        # If reading the body fails the connection is closed, and urlopen()
+        # gives the pool a replacement, so the response only gets to return
+        # the connection to the pool once this went well.
+        if preload_content:
+            await response.read(decode_content=decode_content, cache_content=True)
+        response._pool = self
+        if response._eof:
+            response.release_conn()
+
+        return response
+
+    def close(self) -> None:
+        """
+        Close all pooled connections and disable the pool.
+        """
+        if self.pool is None:
+            return
+        # Disable access to the pool
+        old_pool, self.pool = self.pool, None
+
+        while True:
+            try:
+                conn = old_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if conn:
+                conn.close()
+
+    def is_same_host(self, url: str) -> bool:
+        """
+        Check if the given ``url`` is a member of the same host as this
+        connection pool.
+        """
+        if url.startswith("/"):
+            return True
+
+        scheme, _, host, port, *_ = parse_url(url)
+        scheme = scheme or "http"
+        if host is not None:
+            host = _normalize_host(host, scheme=scheme)
+
+        # Use explicit default port for comparison when none is given
+        if self.port and not port:
+            port = port_by_scheme.get(scheme)
+        elif not self.port and port == port_by_scheme.get(scheme):
+            port = None
+
+        return (scheme, host, port) == (self.scheme, self.host, self.port)
+
+    async def urlopen(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: _TYPE_BODY | typing.AsyncIterable[bytes] | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        redirect: bool = True,
+        assert_same_host: bool = True,
+        timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
+        pool_timeout: int | None = None,
+        release_conn: bool | None = None,
+        chunked: bool = False,
+        body_pos: _TYPE_BODY_POSITION | None = None,
+        preload_content: bool = True,
+        decode_content: bool = True,
+        **response_kw: typing.Any,
+    ) -> AsyncHTTPResponse:
+        """
+        Get a connection from the pool and perform an HTTP request.
+
+        Takes the same arguments as :meth:`urllib3.HTTPConnectionPool.urlopen`.
+        ``body`` may also be an async iterable of bytes, which is sent
+        chunked and can't be rewound for retries. Without ``preload_content``
+        the connection goes back to the pool once the body has been read,
+        or when the response is closed or released.
+        """
+        parsed_url = parse_url(url)
+
+        if headers is None:
+            headers = self.headers
+
+        if not isinstance(retries, Retry):
+            retries = Retry.from_int(retries, redirect=redirect, default=self.retries)
+
+        # Check host
+        if assert_same_host and not self.is_same_host(url):
+            raise HostChangedError(self, url, retries)
+
+        # Ensure that the URL we're connecting to is properly encoded
+        if url.startswith("/"):
+            url = to_str(_encode_target(url))
+        else:
+            url = to_str(parsed_url.url)
+
+        conn = None
+        err = None
+        clean_exit = False
+
+        # Rewind body position, if needed. Record current position
+        # for future rewinds in the event of a redirect/retry.
+        body_pos = set_file_position(body, body_pos)
+
+        try:
+            timeout_obj = self._get_timeout(timeout)
+            conn = await self._get_conn(timeout=pool_timeout)
+
+            response = await self._make_request(
+                conn,
+                method,
+                url,
+                timeout=timeout_obj,
+                body=body,
+                headers=headers,
+                chunked=chunked,
+                retries=retries,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+            clean_exit = True
+
+        except EmptyPoolError:
+            # Didn't get a connection from the pool, no need to clean up
+            clean_exit = True
+            conn = None
+            raise
+
+        except (
+            TimeoutError,
+            http.client.HTTPException,
+            OSError,
+            ProtocolError,
+            ssl.SSLError,
+            SSLError,
+            CertificateError,
+            asyncio.IncompleteReadError,
+        ) as e:
+            clean_exit = False
+            new_e: Exception = e
+            if isinstance(e, (ssl.SSLError, CertificateError)):
+                new_e = SSLError(e)
+            elif isinstance(e, asyncio.IncompleteReadError):
+                new_e = ProtocolError("Connection aborted.", e)
+            elif isinstance(e, (OSError, http.client.HTTPException)):
+                new_e = ProtocolError("Connection aborted.", e)
+
+            retries = retries.increment(
+                method, url, error=new_e, _pool=self, _stacktrace=e.__traceback__
+            )
+            await _sleep(retries)
+
+            # Keep track of the error for the retry warning.
+            err = e
+
+        finally:
+            if not clean_exit:
+                # Throw the connection away and put a placeholder back so the
+                # pool doesn't shrink.
+                if conn:
+                    conn.close()
+                    conn = None
+                self._put_conn(None)
+
+        if not clean_exit:
+            log.warning(
+                "Retrying (%r) after connection broken by '%r': %s", retries, err, url
+            )
+            return await self.urlopen(
+                method,
+                url,
+                body,
+                headers,
+                retries,
+                redirect,
+                assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        # Handle redirect?
+        redirect_location = redirect and response.get_redirect_location()
+        if redirect_location:
+            if response.status == 303:
+                # Change the method according to RFC 9110, Section 15.4.4.
+                method = "GET"
+                # And lose the body not to transfer anything sensitive.
+                body = None
+                headers = HTTPHeaderDict(headers)._prepare_for_method_change()
+
+            try:
+                retries = retries.increment(method, url, response=response, _pool=self)
+            except MaxRetryError:
+                if retries.raise_on_redirect:
+                    await response.drain_conn()
+                    raise
+                return response
+
+            await response.drain_conn()
+            await _sleep_for_retry(retries, response)
+            log.debug("Redirecting %s -> %s", url, redirect_location)
+            return await self.urlopen(
+                method,
+                redirect_location,
+                body,
+                headers,
+                retries=retries,
+                redirect=redirect,
+                assert_same_host=assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        # Check if we should retry the HTTP response.
+        has_retry_after = bool(response.headers.get("Retry-After"))
+        if retries.is_retry(method, response.status, has_retry_after):
+            try:
+                retries = retries.increment(method, url, response=response, _pool=self)
+            except MaxRetryError:
+                if retries.raise_on_status:
+                    await response.drain_conn()
+                    raise
+                return response
+
+            await response.drain_conn()
+            await _sleep(retries, response)
+            log.debug("Retry: %s", url)
+            return await self.urlopen(
+                method,
+                url,
+                body,
+                headers,
+                retries=retries,
+                redirect=redirect,
+                assert_same_host=assert_same_host,
+                timeout=timeout,
+                pool_timeout=pool_timeout,
+                release_conn=release_conn,
+                chunked=chunked,
+                body_pos=body_pos,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                **response_kw,
+            )
+
+        return response
+
+
+class AsyncHTTPSConnectionPool(AsyncHTTPConnectionPool):
+    """
+    Same as :class:`.AsyncHTTPConnectionPool`, but HTTPS. TLS settings are
+    the same as for :class:`urllib3.HTTPSConnectionPool`.
+    """
+
+    scheme = "https"
+    ConnectionCls: type[AsyncHTTPConnection] = AsyncHTTPSConnection
+
+    def __init__(
+        self,
+        host: str,
+        port: int | None = None,
+        timeout: _TYPE_TIMEOUT | None = _DEFAULT_TIMEOUT,
+        maxsize: int = 1,
+        block: bool = False,
+        headers: typing.Mapping[str, str] | None = None,
+        retries: Retry | bool | int | None = None,
+        key_file: str | None = None,
+        cert_file: str | None = None,
+        cert_reqs: int | str | None = None,
+        key_password: str | None = None,
+        ca_certs: str | None = None,
+        ssl_version: int | str | None = None,
+        ssl_minimum_version: ssl.TLSVersion | None = None,
+        ssl_maximum_version: ssl.TLSVersion | None = None,
+        assert_hostname: str | typing.Literal[False] | None = None,
+        assert_fingerprint: str | None = None,
+        ca_cert_dir: str | None = None,
+        **conn_kw: typing.Any,
+    ) -> None:
+        super().__init__(
+            host, port, timeout, maxsize, block, headers, retries, **conn_kw
+        )
+        self.conn_kw.update(
+            key_file=key_file,
+            cert_file=cert_file,
+            cert_reqs=cert_reqs,
+            key_password=key_password,
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ssl_version=ssl_version,
+            ssl_minimum_version=ssl_minimum_version,
+            ssl_maximum_version=ssl_maximum_version,
+            assert_hostname=assert_hostname,
+            assert_fingerprint=assert_fingerprint,
+        )
+
+    async def _validate_conn(self, conn: AsyncHTTPConnection) -> None:
+        if not conn.is_verified:
+            warnings.warn(
+                (
+                    f"Unverified HTTPS request is being made to host '{conn.host}'. "
+                    "Adding certificate verification is strongly advised. See: "
+                    "https://urllib3.readthedocs.io/en/latest/advanced-usage.html"
+                    "#tls-warnings"
+                ),
+                InsecureRequestWarning,
+            )
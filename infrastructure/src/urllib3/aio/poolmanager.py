@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import typing
+import warnings
+from types import TracebackType
+from urllib.parse import urljoin
+
+from .._collections import HTTPHeaderDict
+from ..exceptions import MaxRetryError
+from ..poolmanager import PoolManager
+from ..util.retry import Retry
+from ..util.url import parse_url
+from .connectionpool import AsyncHTTPConnectionPool, AsyncHTTPSConnectionPool
+from .response import AsyncHTTPResponse
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ["AsyncPoolManager"]
+
+
+log = logging.getLogger(__name__)
+
+pool_classes_by_scheme = {
+    "http": AsyncHTTPConnectionPool,
+    "https": AsyncHTTPSConnectionPool,
+}
+
+
+class AsyncPoolManager(PoolManager):
+    """
+    Same as :class:`urllib3.PoolManager`, but with asyncio pools: requests
+    are awaited, and many of them can be in flight at once without a thread
+    each.
+
+    Example:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from urllib3.aio import AsyncPoolManager
+
+        async def main():
+            async with AsyncPoolManager(maxsize=50) as http:
+                responses = await asyncio.gather(
+                    *(http.request("GET", f"https://example.com/{i}") for i in range(500))
+                )
+                print([r.status for r in responses])
+
+        asyncio.run(main())
+
+    Proxies aren't supported.
+    """
+
+    def __init__(
+        self,
+        num_pools: int = 10,
+        headers: typing.Mapping[str, str] | None = None,
+        **connection_pool_kw: typing.Any,
+    ) -> None:
+        super().__init__(num_pools, headers, **connection_pool_kw)
+        self.pool_classes_by_scheme = pool_classes_by_scheme  # type: ignore[assignment]
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> typing.Literal[False]:
+        self.clear()
+        # Return False to re-raise any potential exceptions
+        return False
+
+    async def urlopen(  # type: ignore[override]
+        self, method: str, url: str, redirect: bool = True, **kw: typing.Any
+    ) -> AsyncHTTPResponse:
+        """
+        Same as :meth:`urllib3.PoolManager.urlopen`, awaiting the request on
+        the pool for the URL's host.
+        """
+        u = parse_url(url)
+
+        if u.scheme is None:
+            warnings.warn(
+                "URLs without a scheme (ie 'https://') are deprecated and will raise an error "
+                "in a future version of urllib3. To avoid this DeprecationWarning ensure all URLs "
+                "start with 'https://' or 'http://'. Read more in this issue: "
+                "https://github.com/urllib3/urllib3/issues/2920",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+
+        conn = typing.cast(
+            AsyncHTTPConnectionPool,
+            self.connection_from_host(u.host, port=u.port, scheme=u.scheme),
+        )
+
+        kw["assert_same_host"] = False
+        kw["redirect"] = False
+
+        if "headers" not in kw:
+            kw["headers"] = self.headers
+
+        response = await conn.urlopen(method, u.request_uri, **kw)
+
+        redirect_location = redirect and response.get_redirect_location()
+        if not redirect_location:
+            return response
+
+        # Support relative URLs for redirecting.
+        redirect_location = urljoin(url, redirect_location)
+
+        if response.status == 303:
+            # Change the method according to RFC 9110, Section 15.4.4.
+            method = "GET"
+            # And lose the body not to transfer anything sensitive.
+            kw["body"] = None
+            kw["headers"] = HTTPHeaderDict(kw["headers"])._prepare_for_method_change()
+
+        retries = kw.get("retries")
+        if not isinstance(retries, Retry):
+            retries = Retry.from_int(retries, redirect=redirect)
+
+        # Strip headers marked as unsafe to forward to the redirected location.
+        if retries.remove_headers_on_redirect and not conn.is_same_host(
+            redirect_location
+        ):
+            new_headers = kw["headers"].copy()
+            for header in kw["headers"]:
+                if header.lower() in retries.remove_headers_on_redirect:
+                    new_headers.pop(header, None)
+            kw["headers"] = new_headers
+
+        try:
+            retries = retries.increment(method, url, response=response, _pool=conn)
+        except MaxRetryError:
+            if retries.raise_on_redirect:
+                await response.drain_conn()
+                raise
+            return response
+
+        kw["retries"] = retries
+        kw["redirect"] = redirect
+
+        log.info("Redirecting %s -> %s", url, redirect_location)
+
+        await response.drain_conn()
+        return await self.urlopen(method, redirect_location, **kw)
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import ssl
+import typing
+
+from .._collections import HTTPHeaderDict
+from ..exceptions import (
+    DecodeError,
+    HTTPError,
+    IncompleteRead,
+    InvalidChunkLength,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+from ..response import BaseHTTPResponse, BytesQueueBuffer
+from ..util.retry import Retry
+
+if typing.TYPE_CHECKING:
+    from .connection import AsyncHTTPConnection
+    from .connectionpool import AsyncHTTPConnectionPool
+
+
+class AsyncHTTPResponse(BaseHTTPResponse):
+    """
+    Response to a request made with :class:`~urllib3.aio.AsyncHTTPConnectionPool`.
+
+    The body is read from the connection with the coroutines :meth:`read`,
+    :meth:`readinto`, :meth:`stream` and :meth:`stream_into` and decoded like
+    :class:`urllib3.response.HTTPResponse` does. Once the body has been read
+    completely the connection goes back to the pool. With ``preload_content``
+    the pool reads it before returning the response, so :attr:`data` and
+    :meth:`json` are available right away.
+    """
+
+    def __init__(
+        self,
+        *,
+        headers: HTTPHeaderDict,
+        status: int,
+        version: int,
+        version_string: str,
+        reason: str | None,
+        decode_content: bool = True,
+        request_url: str | None = None,
+        request_method: str | None = None,
+        retries: Retry | None = None,
+        connection: AsyncHTTPConnection | None = None,
+        pool: AsyncHTTPConnectionPool | None = None,
+        enforce_content_length: bool = True,
+        read_timeout: float | None = None,
+    ) -> None:
+        super().__init__(
+            headers=headers,
+            status=status,
+            version=version,
+            version_string=version_string,
+            reason=reason,
+            decode_content=decode_content,
+            request_url=request_url,
+            retries=retries,
+        )
+        self.enforce_content_length = enforce_content_length
+        self.read_timeout = read_timeout
+        self._conn = connection
+        self._pool = pool
+        # Pool the request was made through, named in errors. Unlike _pool it
+        # is known while the pool preloads the body, before the response may
+        # give the connection back.
+        self._origin_pool = pool
+        self._body: bytes | None = None
+        self._fp_bytes_read = 0
+        self._decoded_buffer = BytesQueueBuffer()
+        self.chunk_left: int | None = None
+        self.length_remaining = self._init_length(request_method)
+        self._eof = self.length_remaining == 0 or connection is None
+        self._will_close = self._connection_will_close()
+        if self._eof:
+            self.release_conn()
+
+    def _connection_will_close(self) -> bool:
+        connection_header = self.headers.get("connection", "").lower()
+        if "close" in connection_header:
+            return True
+        if self.version == 10 and "keep-alive" not in connection_header:
+            return True
+        # Without framing the body ends when the server closes the connection.
+        return not self.chunked and self.length_remaining is None
+
+    @property
+    def data(self) -> bytes:
+        if self._body is not None:
+            return self._body
+        if self._eof:
+            return b""
+        raise RuntimeError("The body hasn't been read yet, await response.read() first")
+
+    @property
+    def url(self) -> str | None:
+        return self._request_url
+
+    @url.setter
+    def url(self, url: str | None) -> None:
+        self._request_url = url
+
+    @property
+    def connection(self) -> AsyncHTTPConnection | None:  # type: ignore[override]
+        return self._conn
+
+    def tell(self) -> int:
+        """Number of body bytes received so far, before decoding."""
+        return self._fp_bytes_read
+
+    async def _with_timeout(self, coro: typing.Awaitable[bytes]) -> bytes:
+        try:
+            return await asyncio.wait_for(coro, self.read_timeout)
+        except asyncio.TimeoutError as e:
+            raise ReadTimeoutError(
+                self._origin_pool,  # type: ignore[arg-type]
+                self.url,  # type: ignore[arg-type]
+                f"Read timed out. (read timeout={self.read_timeout})",
+            ) from e
+
+    async def _read_chunk_size(self) -> int | None:
+        assert self._conn is not None
+        line = await self._with_timeout(self._conn.reader.readuntil(b"\r\n"))
+        # Ignore chunk extensions.
+        size = line.split(b";", 1)[0]
+        try:
+            return int(size, 16)
+        except ValueError:
+            raise InvalidChunkLength(self, line) from None  # type: ignore[arg-type]
+
+    async def _raw_read_once(self, amt: int) -> bytes:
+        """Returns up to ``amt`` body bytes, or nothing once the body has ended."""
+        assert self._conn is not None
+        reader = self._conn.reader
+
+        if self.chunked:
+            if self.chunk_left is None:
+                self.chunk_left = await self._read_chunk_size()
+                if self.chunk_left == 0:
+                    # Skip trailers up to the empty line ending the body.
+                    while (
+                        await self._with_timeout(reader.readuntil(b"\r\n"))
+                    ) != b"\r\n":
+                        pass
+                    return b""
+            data = await self._with_timeout(reader.read(min(amt, self.chunk_left)))
+            if not data:
+                raise IncompleteRead(self._fp_bytes_read, self.chunk_left)
+            self.chunk_left -= len(data)
+            if self.chunk_left == 0:
+                await self._with_timeout(reader.readexactly(2))
+                self.chunk_left = None
+            return data
+
+        if self.length_remaining is not None:
+            amt = min(amt, self.length_remaining)
+            if amt == 0:
+                return b""
+        data = await self._with_timeout(reader.read(amt))
+        if (
+            not data
+            and self.enforce_content_length
+            and self.length_remaining is not None
+        ):
+            raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+        return data
+
+    async def _raw_read(self, amt: int) -> bytes:
+        if self._eof:
+            return b""
+        clean_exit = False
+        try:
+            data = await self._raw_read_once(amt)
+            clean_exit = True
+        except (ssl.SSLError, SSLError) as e:
+            raise SSLError(e) from e
+        except IncompleteRead as e:
+            raise ProtocolError(f"Connection broken: {e!r}", e) from e
+        except asyncio.IncompleteReadError as e:
+            raise ProtocolError(
+                f"Connection broken: {IncompleteRead(len(e.partial), e.expected)!r}",
+                e,
+            ) from e
+        except (http.client.HTTPException, OSError) as e:
+            raise ProtocolError(f"Connection broken: {e!r}", e) from e
+        finally:
+            if not clean_exit and self._conn is not None:
+                self._conn.close()
+                self._eof = True
+                self.release_conn()
+
+        if data:
+            self._fp_bytes_read += len(data)
+            if self.length_remaining is not None:
+                self.length_remaining -= len(data)
+        if not data or self.length_remaining == 0:
+            self._eof = True
+            if self._will_close and self._conn is not None:
+                self._conn.close()
+            self.release_conn()
+        return data
+
+    async def read(
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+        cache_content: bool = False,
+    ) -> bytes:
+        """
+        Reads and decodes up to ``amt`` bytes of the body, or all of it.
+        Like :meth:`urllib3.response.HTTPResponse.read` the result is only
+        shorter than ``amt`` at the end of the body.
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        if amt is not None and amt < 0:
+            amt = None
+
+        if amt is None:
+            if self._body is not None and self._eof:
+                return self._body
+            parts = [self._decoded_buffer.get_all()]
+            while not self._eof:
+                raw = await self._raw_read(max(self._conn_blocksize(), 2**16))
+                parts.append(self._decode(raw, decode_content, flush_decoder=False))
+            parts.append(self._flush(decode_content))
+            data = b"".join(parts)
+            if cache_content:
+                self._body = data
+            return data
+
+        if not decode_content:
+            if self._has_decoded_content:
+                raise RuntimeError(
+                    "Calling read(decode_content=False) is not supported after "
+                    "read(decode_content=True) was called."
+                )
+            parts = []
+            remaining = amt
+            while remaining and not self._eof:
+                raw = await self._raw_read(remaining)
+                parts.append(raw)
+                remaining -= len(raw)
+            return b"".join(parts)
+
+        while len(self._decoded_buffer) < amt and not self._eof:
+            raw = await self._raw_read(amt)
+            self._decoded_buffer.put(self._decode(raw, decode_content, False))
+            if self._eof:
+                self._decoded_buffer.put(self._flush(decode_content))
+        return self._decoded_buffer.get(min(amt, len(self._decoded_buffer)))
+
+    def _conn_blocksize(self) -> int:
+        return self._conn.blocksize if self._conn is not None else 2**16
+
+    def _flush(self, decode_content: bool) -> bytes:
+        if not decode_content:
+            return b""
+        try:
+            return self._flush_decoder()
+        except self.DECODER_ERROR_CLASSES as e:
+            content_encoding = self.headers.get("content-encoding", "").lower()
+            raise DecodeError(
+                "Received response with content-encoding: %s, but "
+                "failed to decode it." % content_encoding,
+                e,
+            ) from e
+
+    async def read1(  # type: ignore[override]
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+    ) -> bytes:
+        """
+        Returns whatever decoded data is available with at most one read
+        from the connection, like :meth:`io.BufferedReader.read1`.
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+        if amt is not None and amt < 0:
+            amt = None
+        size = amt if amt is not None else self._conn_blocksize()
+        if len(self._decoded_buffer) == 0:
+            while not self._eof:
+                raw = await self._raw_read(size)
+                decoded = self._decode(raw, decode_content, False)
+                if self._eof:
+                    decoded += self._flush(decode_content)
+                if decoded:
+                    self._decoded_buffer.put(decoded)
+                    break
+        if amt is None:
+            return self._decoded_buffer.get_all()
+        return self._decoded_buffer.get(min(amt, len(self._decoded_buffer)))
+
+    async def stream(  # type: ignore[override]
+        self, amt: int | None = 2**16, decode_content: bool | None = None
+    ) -> typing.AsyncIterator[bytes]:
+        """
+        Yields the decoded body in pieces of about ``amt`` bytes as they
+        arrive.
+        """
+        if self._body is not None and self._eof:
+            if self._body:
+                yield self._body
+            return
+        while not self._eof or len(self._decoded_buffer):
+            data = await self.read1(amt, decode_content)
+            if data:
+                yield data
+
+    async def readinto(  # type: ignore[override]
+        self, b: bytearray | memoryview, decode_content: bool | None = None
+    ) -> int:
+        """
+        Reads up to ``len(b)`` bytes of the body into the writable buffer
+        ``b`` and returns how many, or ``0`` once the body has been read.
+        """
+        view = memoryview(b).cast("B")
+        data = await self.read(len(view), decode_content=decode_content)
+        view[: len(data)] = data
+        return len(data)
+
+    async def stream_into(  # type: ignore[override]
+        self,
+        target: typing.Any,
+        decode_content: bool | None = None,
+        buffer_size: int = 2**16,
+    ) -> int:
+        """
+        Writes the body into ``target`` and returns the number of bytes
+        written, like :meth:`urllib3.response.BaseHTTPResponse.stream_into`.
+
+        :param target:
+            Either a writable buffer, which is filled from the start until
+            it's full or the body ends, or a binary file object, which gets
+            the rest of the body. Its ``write`` isn't awaited.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param buffer_size:
+            Size of the pieces written to a file object.
+        """
+        if hasattr(target, "write"):
+            total = 0
+            async for data in self.stream(buffer_size, decode_content):
+                view = memoryview(data)
+                written = 0
+                while written < len(view):
+                    # Raw files may write less than they were given.
+                    count = target.write(view[written:])
+                    written += len(view) - written if count is None else count
+                total += len(view)
+            return total
+
+        view = memoryview(target).cast("B")
+        filled = 0
+        while filled < len(view):
+            n = await self.readinto(view[filled:], decode_content=decode_content)
+            if not n:
+                break
+            filled += n
+        return filled
+
+    def release_conn(self) -> None:
+        if self._pool is None or self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        if not self._eof:
+            # The rest of the body is still on the wire.
+            conn.close()
+        self._pool._put_conn(conn)
+
+    async def drain_conn(self) -> None:  # type: ignore[override]
+        """
+        Reads and discards the rest of the body so that the connection can
+        be reused.
+        """
+        try:
+            while not self._eof:
+                await self._raw_read(self._conn_blocksize())
+        except (HTTPError, OSError, ssl.SSLError, http.client.HTTPException):
+            pass
+        self.release_conn()
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def closed(self) -> bool:
+        return self._eof and self._conn is None
+
+    def isclosed(self) -> bool:
+        return self.closed
+
+    def shutdown(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+
+    def close(self) -> None:
+        if not self._eof and self._conn is not None:
+            self._conn.close()
+        self._eof = True
+        self.release_conn()
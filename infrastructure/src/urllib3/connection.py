@@ -17,7 +17,9 @@ from socket import timeout as SocketTimeout
 
 if typing.TYPE_CHECKING:
     from .response import HTTPResponse
+    from .util.resolver import BaseResolver
     from .util.ssl_ import _TYPE_PEER_CERT_RET_DICT
+    from .util.ssl_session import TLSSessionCache
     from .util.ssltransport import SSLTransport
 
 from ._collections import HTTPHeaderDict
@@ -102,6 +104,14 @@ class HTTPConnection(_HTTPConnection):
          ]
 
       Or you may want to disable the defaults by passing an empty list (e.g., ``[]``).
+    - ``happy_eyeballs_delay``: When the host resolves to several addresses, start
+      a connection attempt to the next one after this many seconds instead of
+      waiting for the previous attempt to time out, alternating between IPv6 and
+      IPv4 (RFC 8305). ``None`` tries the addresses one after another. Every
+      attempt of the last connect is recorded in ``connect_attempts``.
+    - ``resolver``: A :class:`~urllib3.util.resolver.BaseResolver` to look up the
+      host with, for example a :class:`~urllib3.util.resolver.CachingResolver`
+      shared between connections. Defaults to :func:`socket.getaddrinfo`.
     """
 
     default_port: typing.ClassVar[int] = port_by_scheme["http"]  # type: ignore[misc]
@@ -122,6 +132,9 @@ class HTTPConnection(_HTTPConnection):
     blocksize: int
     source_address: tuple[str, int] | None
     socket_options: connection._TYPE_SOCKET_OPTIONS | None
+    happy_eyeballs_delay: float | None
+    resolver: BaseResolver | None
+    connect_attempts: list[connection.ConnectAttempt]
 
     _has_connected_to_proxy: bool
     _response_options: _ResponseOptions | None
@@ -142,6 +155,8 @@ class HTTPConnection(_HTTPConnection):
         ) = default_socket_options,
         proxy: Url | None = None,
         proxy_config: ProxyConfig | None = None,
+        happy_eyeballs_delay: float | None = connection.DEFAULT_HAPPY_EYEBALLS_DELAY,
+        resolver: BaseResolver | None = None,
     ) -> None:
         super().__init__(
             host=host,
@@ -151,6 +166,9 @@ class HTTPConnection(_HTTPConnection):
             blocksize=blocksize,
         )
         self.socket_options = socket_options
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self.resolver = resolver
+        self.connect_attempts = []
         self.proxy = proxy
         self.proxy_config = proxy_config
 
@@ -194,12 +212,16 @@ class HTTPConnection(_HTTPConnection):
 
         :return: New socket connection.
         """
+        self.connect_attempts = []
         try:
             sock = connection.create_connection(
                 (self._dns_host, self.port),
                 self.timeout,
                 source_address=self.source_address,
                 socket_options=self.socket_options,
+                happy_eyeballs_delay=self.happy_eyeballs_delay,
+                attempts=self.connect_attempts,
+                resolver=self.resolver,
             )
         except socket.gaierror as e:
             raise NameResolutionError(self.host, self, e) from e
@@ -576,6 +598,8 @@ class HTTPSConnection(HTTPConnection):
         ) = HTTPConnection.default_socket_options,
         proxy: Url | None = None,
         proxy_config: ProxyConfig | None = None,
+        happy_eyeballs_delay: float | None = connection.DEFAULT_HAPPY_EYEBALLS_DELAY,
+        resolver: BaseResolver | None = None,
         cert_reqs: int | str | None = None,
         assert_hostname: None | str | typing.Literal[False] = None,
         assert_fingerprint: str | None = None,
@@ -590,6 +614,7 @@ class HTTPSConnection(HTTPConnection):
         cert_file: str | None = None,
         key_file: str | None = None,
         key_password: str | None = None,
+        tls_session_cache: TLSSessionCache | None = None,
     ) -> None:
         super().__init__(
             host,
@@ -600,6 +625,8 @@ class HTTPSConnection(HTTPConnection):
             socket_options=socket_options,
             proxy=proxy,
             proxy_config=proxy_config,
+            happy_eyeballs_delay=happy_eyeballs_delay,
+            resolver=resolver,
         )
 
         self.key_file = key_file
@@ -615,6 +642,10 @@ class HTTPSConnection(HTTPConnection):
         self.ca_certs = ca_certs and os.path.expanduser(ca_certs)
         self.ca_cert_dir = ca_cert_dir and os.path.expanduser(ca_cert_dir)
         self.ca_cert_data = ca_cert_data
+        self.tls_session_cache = tls_session_cache
+        self._tls_session_origin: tuple[str, int | None] | None = None
+        self._tls_context: ssl.SSLContext | None = None
+        self._tls_session_saved = False
 
         # cert_reqs depends on ssl_context so calculate last.
         if cert_reqs is None:
@@ -755,8 +786,14 @@ class HTTPSConnection(HTTPConnection):
                 tls_in_tls=tls_in_tls,
                 assert_hostname=self.assert_hostname,
                 assert_fingerprint=self.assert_fingerprint,
+                tls_session_cache=self.tls_session_cache,
+                tls_session_origin=(server_hostname_rm_dot, probe_http2_port),
             )
             self.sock = sock_and_verified.socket
+            self._tls_session_origin = (server_hostname_rm_dot, probe_http2_port)
+            self._tls_context = sock_and_verified.context
+            self._tls_session_saved = False
+            self._save_tls_session()
 
         # If an error occurs during connection/handshake we may need to release
         # our lock so another connection can probe the origin.
@@ -832,6 +869,35 @@ class HTTPSConnection(HTTPConnection):
         self.proxy_is_verified = sock_and_verified.is_verified
         return sock_and_verified.socket  # type: ignore[return-value]
 
+    def _save_tls_session(self) -> None:
+        """Offers the connection's TLS session to the cache for later connections."""
+        if (
+            self.tls_session_cache is None
+            or self._tls_session_saved
+            or self._tls_context is None
+            or self._tls_session_origin is None
+            or self.sock is None
+        ):
+            return
+        self._tls_session_saved = self.tls_session_cache.put(
+            self._tls_session_origin, self._tls_context, self.sock  # type: ignore[arg-type]
+        )
+
+    def getresponse(  # type: ignore[override]
+        self,
+    ) -> HTTPResponse:
+        response = super().getresponse()
+        # With TLS 1.3 the session ticket only arrives after the handshake, so
+        # the session becomes resumable once the server has sent something.
+        self._save_tls_session()
+        return response
+
+    def close(self) -> None:
+        # A "Connection: close" response closes the connection right after
+        # its headers were read, before getresponse() could offer the session.
+        self._save_tls_session()
+        super().close()
+
 
 class _WrappedAndVerifiedSocket(typing.NamedTuple):
     """
@@ -841,6 +907,7 @@ class _WrappedAndVerifiedSocket(typing.NamedTuple):
 
     socket: ssl.SSLSocket | SSLTransport
     is_verified: bool
+    context: ssl.SSLContext | None = None
 
 
 def _ssl_wrap_socket_and_match_hostname(
@@ -861,28 +928,21 @@ def _ssl_wrap_socket_and_match_hostname(
     server_hostname: str | None,
     ssl_context: ssl.SSLContext | None,
     tls_in_tls: bool = False,
+    tls_session_cache: TLSSessionCache | None = None,
+    tls_session_origin: tuple[str, int | None] | None = None,
 ) -> _WrappedAndVerifiedSocket:
     """Logic for constructing an SSLContext from all TLS parameters, passing
     that down into ssl_wrap_socket, and then doing certificate verification
     either via hostname or fingerprint. This function exists to guarantee
     that both proxies and targets have the same behavior when connecting via TLS.
-    """
-    default_ssl_context = False
-    if ssl_context is None:
-        default_ssl_context = True
-        context = create_urllib3_context(
-            ssl_version=resolve_ssl_version(ssl_version),
-            ssl_minimum_version=ssl_minimum_version,
-            ssl_maximum_version=ssl_maximum_version,
-            cert_reqs=resolve_cert_reqs(cert_reqs),
-        )
-    else:
-        context = ssl_context
-
-    context.verify_mode = resolve_cert_reqs(cert_reqs)
 
+    Connections without an ``ssl_context`` share a fully loaded context per
+    set of TLS settings (see :func:`~urllib3.util.ssl_.cached_ssl_context`).
+    With a ``tls_session_cache``, sessions from earlier connections to
+    ``tls_session_origin`` are resumed.
+    """
     # In some cases, we want to verify hostnames ourselves
-    if (
+    verify_hostname_ourselves = bool(
         # `ssl` can't verify fingerprints or alternate hostnames
         assert_fingerprint
         or assert_hostname
@@ -892,20 +952,67 @@ def _ssl_wrap_socket_and_match_hostname(
         # hostnames easily: https://github.com/pyca/pyopenssl/pull/933
         or ssl_.IS_PYOPENSSL
         or not ssl_.HAS_NEVER_CHECK_COMMON_NAME
-    ):
-        context.check_hostname = False
-
-    # Try to load OS default certs if none are given. We need to do the hasattr() check
-    # for custom pyOpenSSL SSLContext objects because they don't support
-    # load_default_certs().
-    if (
-        not ca_certs
-        and not ca_cert_dir
-        and not ca_cert_data
-        and default_ssl_context
-        and hasattr(context, "load_default_certs")
-    ):
-        context.load_default_certs()
+    )
+
+    def new_default_context() -> ssl.SSLContext:
+        # Loads the OS default certs if none are given.
+        return ssl_.cached_ssl_context(
+            ssl_version=ssl_version,
+            cert_reqs=cert_reqs,
+            ssl_minimum_version=ssl_minimum_version,
+            ssl_maximum_version=ssl_maximum_version,
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ca_cert_data=ca_cert_data,
+            cert_file=cert_file,
+            key_file=key_file,
+            key_password=key_password,
+            check_hostname=not verify_hostname_ourselves,
+        )
+
+    default_ssl_context = False
+    if ssl_context is None:
+        default_ssl_context = True
+        if tls_session_cache is not None:
+            # Sessions can only be resumed with the context that created them,
+            # so the session cache keeps the context alive as long as the pool.
+            settings = (
+                ssl_version,
+                ssl_minimum_version,
+                ssl_maximum_version,
+                cert_reqs,
+                ca_certs,
+                ca_cert_dir,
+                ca_cert_data,
+                cert_file,
+                key_file,
+                key_password,
+                verify_hostname_ourselves,
+            )
+            context = tls_session_cache.default_context(settings, new_default_context)
+        else:
+            context = new_default_context()
+    else:
+        context = ssl_._reconfigure_cached_ssl_context(
+            ssl_context,
+            resolve_cert_reqs(cert_reqs),
+            not verify_hostname_ourselves,
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ca_cert_data=ca_cert_data,
+            cert_file=cert_file,
+            key_file=key_file,
+            key_password=key_password,
+        )
+        if context is not None:
+            # A shared context, e.g. requests' preloaded one: use the shared
+            # context with this connection's settings rather than change it.
+            default_ssl_context = True
+        else:
+            context = ssl_context
+            context.verify_mode = resolve_cert_reqs(cert_reqs)
+            if verify_hostname_ourselves:
+                context.check_hostname = False
 
     # Ensure that IPv6 addresses are in the proper format and don't have a
     # scope ID. Python's SSL module fails to recognize scoped IPv6 addresses
@@ -917,18 +1024,41 @@ def _ssl_wrap_socket_and_match_hostname(
         if is_ipaddress(normalized):
             server_hostname = normalized
 
-    ssl_sock = ssl_wrap_socket(
-        sock=sock,
-        keyfile=key_file,
-        certfile=cert_file,
-        key_password=key_password,
-        ca_certs=ca_certs,
-        ca_cert_dir=ca_cert_dir,
-        ca_cert_data=ca_cert_data,
-        server_hostname=server_hostname,
-        ssl_context=context,
-        tls_in_tls=tls_in_tls,
-    )
+    session = None
+    if tls_session_cache is not None and tls_session_origin and not tls_in_tls:
+        session = tls_session_cache.get(tls_session_origin, context)
+
+    if default_ssl_context:
+        # Certificates were loaded into the shared context when it was made.
+        ssl_sock = ssl_wrap_socket(
+            sock=sock,
+            server_hostname=server_hostname,
+            ssl_context=context,
+            tls_in_tls=tls_in_tls,
+            session=session,
+        )
+    else:
+        ssl_sock = ssl_wrap_socket(
+            sock=sock,
+            keyfile=key_file,
+            certfile=cert_file,
+            key_password=key_password,
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ca_cert_data=ca_cert_data,
+            server_hostname=server_hostname,
+            ssl_context=context,
+            tls_in_tls=tls_in_tls,
+            session=session,
+        )
+
+    if tls_session_cache is not None:
+        resumed = tls_session_cache.record_handshake(ssl_sock)
+        log.debug(
+            "TLS handshake with %s (%s)",
+            server_hostname,
+            "resumed" if resumed else "full",
+        )
 
     try:
         if assert_fingerprint:
@@ -962,6 +1092,7 @@ def _ssl_wrap_socket_and_match_hostname(
             socket=ssl_sock,
             is_verified=context.verify_mode == ssl.CERT_REQUIRED
             or bool(assert_fingerprint),
+            context=context,
         )
     except BaseException:
         ssl_sock.close()
@@ -45,6 +45,7 @@ from .util.proxy import connection_requires_http_tunnel
 from .util.request import _TYPE_BODY_POSITION, set_file_position
 from .util.retry import Retry
 from .util.ssl_match_hostname import CertificateError
+from .util.ssl_session import TLSSessionCache
 from .util.timeout import _DEFAULT_TIMEOUT, _TYPE_DEFAULT, Timeout
 from .util.url import Url, _encode_target
 from .util.url import _normalize_host as normalize_host
@@ -972,6 +973,10 @@ class HTTPSConnectionPool(HTTPConnectionPool):
     ``ca_cert_dir``, ``ssl_version``, ``key_password`` are only used if :mod:`ssl`
     is available and are fed into :meth:`urllib3.util.ssl_wrap_socket` to upgrade
     the connection socket into an SSL socket.
+
+    New connections resume the TLS session of earlier ones to the same host
+    where the server allows it; :attr:`tls_session_cache` counts full and
+    resumed handshakes.
     """
 
     scheme = "https"
@@ -1025,6 +1030,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         self.ssl_maximum_version = ssl_maximum_version
         self.assert_hostname = assert_hostname
         self.assert_fingerprint = assert_fingerprint
+        self.tls_session_cache = TLSSessionCache()
 
     def _prepare_proxy(self, conn: HTTPSConnection) -> None:  # type: ignore[override]
         """Establishes a tunnel connection through HTTP CONNECT."""
@@ -1064,6 +1070,12 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             actual_host = self.proxy.host
             actual_port = self.proxy.port
 
+        conn_kw = self.conn_kw
+        if "tls_session_cache" not in conn_kw and issubclass(
+            self.ConnectionCls, HTTPSConnection
+        ):
+            conn_kw = {**conn_kw, "tls_session_cache": self.tls_session_cache}
+
         return self.ConnectionCls(
             host=actual_host,
             port=actual_port,
@@ -1079,7 +1091,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             ssl_version=self.ssl_version,
             ssl_minimum_version=self.ssl_minimum_version,
             ssl_maximum_version=self.ssl_maximum_version,
-            **self.conn_kw,
+            **conn_kw,
         )
 
     def _validate_conn(self, conn: BaseHTTPConnection) -> None:
@@ -10,6 +10,7 @@ __all__ = [
 import typing
 
 orig_HTTPSConnection: typing.Any = None
+orig_HTTPSConnectionPool: typing.Any = None
 
 
 def inject_into_urllib3() -> None:
@@ -24,16 +25,21 @@ def inject_into_urllib3() -> None:
 
     # Import here to avoid circular dependencies.
     from .. import connection as urllib3_connection
+    from .. import poolmanager as urllib3_poolmanager
     from .. import util as urllib3_util
     from ..connectionpool import HTTPSConnectionPool
     from ..util import ssl_ as urllib3_util_ssl
     from .connection import HTTP2Connection
+    from .connectionpool import HTTP2ConnectionPool
 
-    global orig_HTTPSConnection
+    global orig_HTTPSConnection, orig_HTTPSConnectionPool
     orig_HTTPSConnection = urllib3_connection.HTTPSConnection
+    orig_HTTPSConnectionPool = urllib3_poolmanager.pool_classes_by_scheme["https"]
 
     HTTPSConnectionPool.ConnectionCls = HTTP2Connection
     urllib3_connection.HTTPSConnection = HTTP2Connection  # type: ignore[misc]
+    # Pool managers share this dict, so existing ones switch over as well.
+    urllib3_poolmanager.pool_classes_by_scheme["https"] = HTTP2ConnectionPool
 
     # TODO: Offer 'http/1.1' as well, but for testing purposes this is handy.
     urllib3_util.ALPN_PROTOCOLS = ["h2"]
@@ -42,12 +48,14 @@ def inject_into_urllib3() -> None:
 
 def extract_from_urllib3() -> None:
     from .. import connection as urllib3_connection
+    from .. import poolmanager as urllib3_poolmanager
     from .. import util as urllib3_util
     from ..connectionpool import HTTPSConnectionPool
     from ..util import ssl_ as urllib3_util_ssl
 
     HTTPSConnectionPool.ConnectionCls = orig_HTTPSConnection
     urllib3_connection.HTTPSConnection = orig_HTTPSConnection  # type: ignore[misc]
+    urllib3_poolmanager.pool_classes_by_scheme["https"] = orig_HTTPSConnectionPool
 
     urllib3_util.ALPN_PROTOCOLS = ["http/1.1"]
     urllib3_util_ssl.ALPN_PROTOCOLS = ["http/1.1"]
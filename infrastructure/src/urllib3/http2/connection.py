@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+import collections
 import logging
 import re
 import threading
+import time
 import types
 import typing
+from socket import timeout as SocketTimeout
 
 import h2.config  # type: ignore[import-untyped]
 import h2.connection  # type: ignore[import-untyped]
+import h2.errors  # type: ignore[import-untyped]
 import h2.events  # type: ignore[import-untyped]
+import h2.exceptions  # type: ignore[import-untyped]
+import h2.settings  # type: ignore[import-untyped]
 
 from .._base_connection import _TYPE_BODY
 from .._collections import HTTPHeaderDict
 from ..connection import HTTPSConnection, _get_default_user_agent
-from ..exceptions import ConnectionError
+from ..exceptions import ConnectionError, HTTPError, ProtocolError
 from ..response import BaseHTTPResponse
+from ..util.wait import wait_for_read
 
 orig_HTTPSConnection = HTTPSConnection
 
@@ -25,6 +32,14 @@ log = logging.getLogger(__name__)
 RE_IS_LEGAL_HEADER_NAME = re.compile(rb"^[!#$%&'*+\-.^_`|~0-9a-z]+$")
 RE_IS_ILLEGAL_HEADER_VALUE = re.compile(rb"[\0\x00\x0a\x0d\r\n]|^[ \r\n\t]|[ \r\n\t]$")
 
+# Receive windows we advertise. Every stream may buffer up to STREAM_WINDOW
+# bytes that its reader hasn't consumed yet; the connection window is larger so
+# that one slow reader doesn't stall the other streams on the connection.
+STREAM_WINDOW = 1 << 20
+CONNECTION_WINDOW = 1 << 24
+# h2's initial window for both before any settings are exchanged.
+DEFAULT_WINDOW = 65535
+
 
 def _is_legal_header_name(name: bytes) -> bool:
     """
@@ -82,13 +97,64 @@ class _LockedObject(typing.Generic[T]):
         self.lock.release()
 
 
+class _StreamState:
+    """Receive-side state of one HTTP/2 stream, filled in by the demultiplexing reader."""
+
+    __slots__ = (
+        "stream_id",
+        "status",
+        "headers",
+        "chunks",
+        "buffered",
+        "ended",
+        "error",
+        "released",
+    )
+
+    def __init__(self) -> None:
+        self.stream_id: int | None = None
+        self.status: int | None = None
+        self.headers: HTTPHeaderDict | None = None
+        self.chunks: collections.deque[bytes] = collections.deque()
+        self.buffered = 0
+        self.ended = False
+        self.error: Exception | None = None
+        self.released = False
+
+
 class HTTP2Connection(HTTPSConnection):
+    """
+    One TCP+TLS connection carrying many concurrent HTTP/2 streams.
+
+    Each request runs on an :class:`HTTP2Stream` from :meth:`open_stream`.
+    There is no background thread: whichever waiting stream gets there first
+    reads from the socket and hands every frame to the stream it belongs to,
+    while the other streams wait for it to do so. The connection-level
+    ``request()``/``getresponse()`` methods still work for callers that use
+    the connection for one request at a time.
+    """
+
+    #: Upper bound on concurrent streams, on top of the server's own limit.
+    max_concurrent_streams = 100
+
     def __init__(
         self, host: str, port: int | None = None, **kwargs: typing.Any
     ) -> None:
         self._h2_conn = self._new_h2_conn()
-        self._h2_stream: int | None = None
-        self._headers: list[tuple[bytes, bytes]] = []
+        self._streams: dict[int, _StreamState] = {}
+        self._cond = threading.Condition()
+        self._connect_lock = threading.Lock()
+        self._reading = False
+        self._reserved = 0
+        self._ready = False
+        # Bumped whenever the server may let us send more: window updates,
+        # new settings and finished streams.
+        self._send_generation = 0
+        self._goaway = False
+        self._error: Exception | None = None
+        self._current: HTTP2Stream | None = None
+        #: Called with the connection whenever one of its streams is released.
+        self.release_callback: typing.Callable[[HTTP2Connection], None] | None = None
 
         if "proxy" in kwargs or "proxy_config" in kwargs:  # Defensive:
             raise NotImplementedError("Proxies aren't supported with HTTP/2")
@@ -104,16 +170,508 @@ class HTTP2Connection(HTTPSConnection):
 
     def connect(self) -> None:
         super().connect()
+        with self._cond:
+            self._error = None
+            self._goaway = False
         with self._h2_conn as conn:
             conn.initiate_connection()
+            conn.update_settings(
+                {
+                    h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                    h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: STREAM_WINDOW,
+                }
+            )
+            conn.increment_flow_control_window(CONNECTION_WINDOW - DEFAULT_WINDOW)
+            if data_to_send := conn.data_to_send():
+                self.sock.sendall(data_to_send)
+        self._ready = True
+
+    @property
+    def is_closed(self) -> bool:
+        # The socket is set before the TLS handshake, so other streams must
+        # not take it as connected until the HTTP/2 preface has been sent.
+        return self.sock is None or not self._ready
+
+    def _ensure_connected(self, timeout: typing.Any) -> None:
+        """Connect once, however many streams ask for it at the same time."""
+        with self._connect_lock:
+            if self.is_closed:
+                self.timeout = timeout
+                self.connect()
+
+    # Stream bookkeeping
+
+    def open_stream(self) -> HTTP2Stream:
+        """Reserve a stream slot on this connection for one request."""
+        with self._cond:
+            self._reserved += 1
+        return HTTP2Stream(self)
+
+    @property
+    def stream_limit(self) -> int:
+        """Number of concurrent streams this connection may carry."""
+        with self._h2_conn as conn:
+            remote = conn.remote_settings.max_concurrent_streams
+        return min(remote, self.max_concurrent_streams)
+
+    @property
+    def active_streams(self) -> int:
+        """Number of stream slots currently handed out."""
+        return self._reserved
+
+    @property
+    def is_usable(self) -> bool:
+        """Whether new streams may still be opened on this connection."""
+        return self._error is None and not self._goaway
+
+    def has_capacity(self) -> bool:
+        return self.is_usable and self._reserved < self.stream_limit
+
+    def _release(self, state: _StreamState) -> None:
+        with self._cond:
+            if state.released:
+                return
+            state.released = True
+            self._reserved = max(0, self._reserved - 1)
+            if state.stream_id is not None:
+                self._streams.pop(state.stream_id, None)
+            self._cond.notify_all()
+        if self.release_callback is not None:
+            self.release_callback(self)
+
+    def _reset(self, state: _StreamState) -> None:
+        """Cancel a stream that's still open, e.g. when its response is abandoned."""
+        if state.stream_id is None or state.ended or self.sock is None:
+            return
+        try:
+            with self._h2_conn as conn:
+                conn.reset_stream(state.stream_id, h2.errors.ErrorCodes.CANCEL)
+                if data_to_send := conn.data_to_send():
+                    self.sock.sendall(data_to_send)
+        except (h2.exceptions.H2Error, OSError):
+            pass
+        with self._cond:
+            state.ended = True
+            self._send_generation += 1
+            self._cond.notify_all()
+
+    # Sending
+
+    def _start_stream(
+        self,
+        state: _StreamState,
+        headers: list[tuple[bytes, bytes]],
+        end_stream: bool,
+        timeout: float | None,
+    ) -> None:
+        while True:
+            # The stream id is allocated and used under one lock: opening a
+            # higher id first would implicitly close the lower one.
+            with self._h2_conn as conn:
+                with self._cond:
+                    if self._error is not None:
+                        raise ProtocolError("Connection broken", self._error)
+                    generation = self._send_generation
+                # Until the server's SETTINGS arrive we may have reserved more
+                # slots than it allows; those streams wait for others to end.
+                if (
+                    conn.open_outbound_streams
+                    < conn.remote_settings.max_concurrent_streams
+                ):
+                    stream_id = conn.get_next_available_stream_id()
+                    with self._cond:
+                        state.stream_id = stream_id
+                        self._streams[stream_id] = state
+                    conn.send_headers(
+                        stream_id=stream_id, headers=headers, end_stream=end_stream
+                    )
+                    if data_to_send := conn.data_to_send():
+                        self.sock.sendall(data_to_send)
+                    return
+            self._wait(state, lambda: self._send_generation != generation, timeout)
+
+    def _send_data(
+        self,
+        state: _StreamState,
+        data: bytes,
+        end_stream: bool,
+        timeout: float | None,
+    ) -> None:
+        """Send body data, waiting for WINDOW_UPDATEs when the peer's window is used up."""
+        assert state.stream_id is not None
+        view = memoryview(data)
+        while True:
+            with self._h2_conn as conn:
+                window = min(
+                    conn.local_flow_control_window(state.stream_id),
+                    conn.max_outbound_frame_size,
+                )
+                if window > 0 or not view:
+                    size = min(window, len(view))
+                    last = size == len(view)
+                    conn.send_data(
+                        state.stream_id,
+                        view[:size].tobytes(),
+                        end_stream=end_stream and last,
+                    )
+                    if data_to_send := conn.data_to_send():
+                        self.sock.sendall(data_to_send)
+                    view = view[size:]
+                    if last:
+                        return
+                    continue
+                generation = self._send_generation
+            self._wait(state, lambda: self._send_generation != generation, timeout)
+
+    def _end_stream(self, state: _StreamState) -> None:
+        assert state.stream_id is not None
+        with self._h2_conn as conn:
+            conn.end_stream(state.stream_id)
             if data_to_send := conn.data_to_send():
                 self.sock.sendall(data_to_send)
 
+    # Receiving
+
+    def _wait(
+        self,
+        state: _StreamState,
+        predicate: typing.Callable[[], bool],
+        timeout: float | None,
+    ) -> None:
+        """
+        Wait until ``predicate()`` holds for a stream, reading from the socket
+        whenever no other stream is doing so.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if state.error is not None:
+                        raise state.error
+                    if predicate():
+                        return
+                    if self._error is not None:
+                        raise ProtocolError("Connection broken", self._error)
+                    if not self._reading:
+                        self._reading = True
+                        break
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise SocketTimeout("Read timed out.")
+                    self._cond.wait(remaining)
+            try:
+                remaining = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                self._receive(remaining)
+            finally:
+                with self._cond:
+                    self._reading = False
+                    self._cond.notify_all()
+
+    def _receive(self, timeout: float | None) -> None:
+        """Read once from the socket and dispatch the frames to their streams."""
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("Connection is closed")
+        pending = getattr(sock, "pending", None)
+        if not (pending and pending()) and not wait_for_read(sock, timeout=timeout):
+            raise SocketTimeout("Read timed out.")
+
+        try:
+            with self._h2_conn as conn:
+                data = sock.recv(max(self.blocksize, 65535))
+                if not data:
+                    raise ConnectionError("Connection closed by the server")
+                events = conn.receive_data(data)
+                for event in events:
+                    # Padding and data for streams nobody reads count against
+                    # our windows too, so give them back straight away.
+                    if isinstance(event, h2.events.DataReceived):
+                        unread = event.flow_controlled_length
+                        if event.stream_id in self._streams:
+                            unread -= len(event.data)
+                        if unread:
+                            conn.acknowledge_received_data(unread, event.stream_id)
+                if data_to_send := conn.data_to_send():
+                    sock.sendall(data_to_send)
+        except SocketTimeout:
+            raise
+        except (OSError, h2.exceptions.H2Error, ConnectionError) as e:
+            self._fail(e)
+            raise ProtocolError("Connection broken", e) from e
+
+        with self._cond:
+            for event in events:
+                self._dispatch(event)
+            self._cond.notify_all()
+
+    def _dispatch(self, event: h2.events.Event) -> None:
+        if isinstance(
+            event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)
+        ):
+            self._send_generation += 1
+            return
+        if isinstance(event, h2.events.ConnectionTerminated):
+            # Streams above last_stream_id were never processed by the server
+            # and are safe to retry on another connection.
+            self._goaway = True
+            for stream_id, state in self._streams.items():
+                if event.last_stream_id is None or stream_id > event.last_stream_id:
+                    state.error = state.error or ProtocolError(
+                        f"Stream {stream_id} refused, server is going away "
+                        f"(error code {event.error_code!r})"
+                    )
+            return
+
+        state = self._streams.get(getattr(event, "stream_id", 0))
+        if state is None:
+            return
+        if isinstance(event, h2.events.ResponseReceived):
+            headers = HTTPHeaderDict()
+            for header, value in event.headers:
+                if header == b":status":
+                    state.status = int(value.decode())
+                else:
+                    headers.add(header.decode("latin-1"), value.decode("latin-1"))
+            state.headers = headers
+        elif isinstance(event, h2.events.DataReceived):
+            if event.data:
+                state.chunks.append(event.data)
+                state.buffered += len(event.data)
+        elif isinstance(event, h2.events.StreamEnded):
+            state.ended = True
+            self._send_generation += 1
+        elif isinstance(event, h2.events.StreamReset):
+            state.ended = True
+            self._send_generation += 1
+            state.error = state.error or ProtocolError(
+                f"Stream {event.stream_id} reset by the server "
+                f"(error code {event.error_code!r})"
+            )
+
+    def _fail(self, error: Exception) -> None:
+        """Fail every stream after the connection itself broke."""
+        with self._cond:
+            self._error = error
+            for state in self._streams.values():
+                state.error = state.error or ProtocolError("Connection broken", error)
+            self._cond.notify_all()
+        sock, self.sock = self.sock, None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def poll(self) -> bool:
+        """
+        Process whatever the server sent while no stream was reading, such as
+        a GOAWAY or the socket being closed. Returns whether the connection is
+        still usable.
+        """
+        with self._cond:
+            if self._reading or not self.is_usable or self.sock is None:
+                return self.is_usable and self.sock is not None
+            self._reading = True
+        try:
+            while self.sock is not None and wait_for_read(self.sock, timeout=0.0):
+                self._receive(0.0)
+        except (HTTPError, OSError):
+            pass
+        finally:
+            with self._cond:
+                self._reading = False
+                self._cond.notify_all()
+        return self.is_usable and self.sock is not None
+
+    def _wait_for_headers(self, state: _StreamState, timeout: float | None) -> None:
+        self._wait(state, lambda: state.headers is not None, timeout)
+
+    def _read_body(
+        self, state: _StreamState, amt: int | None, timeout: float | None
+    ) -> bytes:
+        """
+        Read up to ``amt`` bytes of a stream's body (all of it if ``amt`` is
+        None), opening the stream's window again by what was consumed.
+        """
+        if amt is not None:
+            return self._read_chunk(state, amt, timeout)
+        # Bodies larger than the stream window only arrive as we consume them.
+        parts = []
+        while chunk := self._read_chunk(state, None, timeout):
+            parts.append(chunk)
+        return b"".join(parts)
+
+    def _read_chunk(
+        self, state: _StreamState, amt: int | None, timeout: float | None
+    ) -> bytes:
+        self._wait(state, lambda: state.buffered > 0 or state.ended, timeout)
+
+        with self._cond:
+            parts = []
+            size = 0
+            while state.chunks and (amt is None or size < amt):
+                chunk = state.chunks.popleft()
+                if amt is not None and size + len(chunk) > amt:
+                    keep = size + len(chunk) - amt
+                    state.chunks.appendleft(chunk[-keep:])
+                    chunk = chunk[:-keep]
+                parts.append(chunk)
+                size += len(chunk)
+            state.buffered -= size
+            finished = state.ended and not state.chunks
+
+        if size and self.sock is not None:
+            assert state.stream_id is not None
+            with self._h2_conn as conn:
+                try:
+                    conn.acknowledge_received_data(size, state.stream_id)
+                    if data_to_send := conn.data_to_send():
+                        self.sock.sendall(data_to_send)
+                except (h2.exceptions.H2Error, OSError):
+                    pass
+        if finished:
+            self._release(state)
+        return b"".join(parts)
+
+    # Single-request interface, kept for callers that use the connection directly
+
     def putrequest(  # type: ignore[override]
         self,
         method: str,
         url: str,
         **kwargs: typing.Any,
+    ) -> None:
+        self._current = self.open_stream()
+        self._current.putrequest(method, url, **kwargs)
+
+    def _current_stream(self) -> HTTP2Stream:
+        if self._current is None:
+            raise ConnectionError("Must call `putrequest` first.")
+        return self._current
+
+    def putheader(self, header: str | bytes, *values: str | bytes) -> None:  # type: ignore[override]
+        self._current_stream().putheader(header, *values)
+
+    def endheaders(self, message_body: typing.Any = None) -> None:  # type: ignore[override]
+        stream = self._current_stream()
+        stream.timeout = self.timeout
+        stream.endheaders(message_body)
+
+    def send(self, data: typing.Any) -> None:
+        self._current_stream().send(data)
+
+    def set_tunnel(
+        self,
+        host: str,
+        port: int | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        scheme: str = "http",
+    ) -> None:
+        raise NotImplementedError(
+            "HTTP/2 does not support setting up a tunnel through a proxy"
+        )
+
+    def getresponse(  # type: ignore[override]
+        self,
+    ) -> HTTP2Response:
+        stream = self._current_stream()
+        self._current = None
+        stream.timeout = self.timeout
+        return stream.getresponse()
+
+    def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        body: _TYPE_BODY | None = None,
+        headers: typing.Mapping[str, str] | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Send an HTTP/2 request on a new stream of this connection"""
+        self._current = self.open_stream()
+        self._current.timeout = self.timeout
+        self._current.request(method, url, body=body, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            with self._h2_conn as conn:
+                try:
+                    conn.close_connection()
+                    if data := conn.data_to_send():
+                        self.sock.sendall(data)
+                except Exception:
+                    pass
+
+        with self._cond:
+            self._error = self._error or ConnectionError("Connection closed")
+            for state in self._streams.values():
+                state.error = state.error or ProtocolError("Connection closed")
+            self._cond.notify_all()
+
+        # Reset all our HTTP/2 connection state.
+        self._h2_conn = self._new_h2_conn()
+        self._streams = {}
+        self._reserved = 0
+        self._current = None
+        self._send_generation = 0
+        self._ready = False
+
+        super().close()
+
+
+class HTTP2Stream:
+    """
+    One request/response exchange on a shared :class:`HTTP2Connection`.
+
+    Streams are what :class:`~urllib3.http2.HTTP2ConnectionPool` hands out
+    instead of whole connections, so they mirror the parts of the connection
+    interface that the pool uses. Attributes they don't define are read from
+    the connection.
+    """
+
+    def __init__(self, connection: HTTP2Connection) -> None:
+        self._conn = connection
+        self._state = _StreamState()
+        self._headers: list[tuple[bytes, bytes]] = []
+        self._request_url = "/"
+        self._preload_content = True
+        self._decode_content = True
+        self.timeout: typing.Any = connection.timeout
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._conn, name)
+
+    @property
+    def connection(self) -> HTTP2Connection:
+        return self._conn
+
+    @property
+    def stream_id(self) -> int | None:
+        return self._state.stream_id
+
+    @property
+    def is_closed(self) -> bool:
+        return self._conn.is_closed
+
+    @property
+    def is_connected(self) -> bool:
+        return self._conn.sock is not None and self._conn.is_usable
+
+    def connect(self) -> None:
+        self._conn._ensure_connected(self.timeout)
+
+    def _read_timeout(self) -> float | None:
+        return self.timeout if isinstance(self.timeout, (int, float)) else None
+
+    def putrequest(
+        self,
+        method: str,
+        url: str,
+        **kwargs: typing.Any,
     ) -> None:
         """putrequest
         This deviates from the HTTPConnection method signature since we never need to override
@@ -125,22 +683,22 @@ class HTTP2Connection(HTTPSConnection):
             raise NotImplementedError("`skip_accept_encoding` isn't supported")
 
         self._request_url = url or "/"
-        self._validate_path(url)  # type: ignore[attr-defined]
+        self._conn._validate_path(url)  # type: ignore[attr-defined]
 
-        if ":" in self.host:
-            authority = f"[{self.host}]:{self.port or 443}"
+        host, port = self._conn.host, self._conn.port
+        if ":" in host:
+            authority = f"[{host}]:{port or 443}"
         else:
-            authority = f"{self.host}:{self.port or 443}"
+            authority = f"{host}:{port or 443}"
 
-        self._headers.append((b":scheme", b"https"))
-        self._headers.append((b":method", method.encode()))
-        self._headers.append((b":authority", authority.encode()))
-        self._headers.append((b":path", url.encode()))
-
-        with self._h2_conn as conn:
-            self._h2_stream = conn.get_next_available_stream_id()
+        self._headers = [
+            (b":scheme", b"https"),
+            (b":method", method.encode()),
+            (b":authority", authority.encode()),
+            (b":path", url.encode()),
+        ]
 
-    def putheader(self, header: str | bytes, *values: str | bytes) -> None:  # type: ignore[override]
+    def putheader(self, header: str | bytes, *values: str | bytes) -> None:
         # TODO SKIPPABLE_HEADERS from urllib3 are ignored.
         header = header.encode() if isinstance(header, str) else header
         header = header.lower()  # A lot of upstream code uses capitalized headers.
@@ -153,119 +711,58 @@ class HTTP2Connection(HTTPSConnection):
                 raise ValueError(f"Illegal header value {str(value)}")
             self._headers.append((header, value))
 
-    def endheaders(self, message_body: typing.Any = None) -> None:  # type: ignore[override]
-        if self._h2_stream is None:
+    def endheaders(self, message_body: typing.Any = None) -> None:
+        if not self._headers:
             raise ConnectionError("Must call `putrequest` first.")
-
-        with self._h2_conn as conn:
-            conn.send_headers(
-                stream_id=self._h2_stream,
-                headers=self._headers,
-                end_stream=(message_body is None),
-            )
-            if data_to_send := conn.data_to_send():
-                self.sock.sendall(data_to_send)
-        self._headers = []  # Reset headers for the next request.
+        if self.is_closed:
+            self.connect()
+        self._conn._start_stream(
+            self._state,
+            self._headers,
+            end_stream=(message_body is None),
+            timeout=self._read_timeout(),
+        )
+        self._headers = []
 
     def send(self, data: typing.Any) -> None:
         """Send data to the server.
         `data` can be: `str`, `bytes`, an iterable, or file-like objects
         that support a .read() method.
         """
-        if self._h2_stream is None:
+        if self._state.stream_id is None:
             raise ConnectionError("Must call `putrequest` first.")
 
-        with self._h2_conn as conn:
-            if data_to_send := conn.data_to_send():
-                self.sock.sendall(data_to_send)
-
-            if hasattr(data, "read"):  # file-like objects
-                while True:
-                    chunk = data.read(self.blocksize)
-                    if not chunk:
-                        break
-                    if isinstance(chunk, str):
-                        chunk = chunk.encode()  # pragma: no cover
-                    conn.send_data(self._h2_stream, chunk, end_stream=False)
-                    if data_to_send := conn.data_to_send():
-                        self.sock.sendall(data_to_send)
-                conn.end_stream(self._h2_stream)
-                return
-
-            if isinstance(data, str):  # str -> bytes
-                data = data.encode()
-
-            try:
-                if isinstance(data, bytes):
-                    conn.send_data(self._h2_stream, data, end_stream=True)
-                    if data_to_send := conn.data_to_send():
-                        self.sock.sendall(data_to_send)
-                else:
-                    for chunk in data:
-                        conn.send_data(self._h2_stream, chunk, end_stream=False)
-                        if data_to_send := conn.data_to_send():
-                            self.sock.sendall(data_to_send)
-                    conn.end_stream(self._h2_stream)
-            except TypeError:
-                raise TypeError(
-                    "`data` should be str, bytes, iterable, or file. got %r"
-                    % type(data)
-                )
-
-    def set_tunnel(
-        self,
-        host: str,
-        port: int | None = None,
-        headers: typing.Mapping[str, str] | None = None,
-        scheme: str = "http",
-    ) -> None:
-        raise NotImplementedError(
-            "HTTP/2 does not support setting up a tunnel through a proxy"
-        )
-
-    def getresponse(  # type: ignore[override]
-        self,
-    ) -> HTTP2Response:
-        status = None
-        data = bytearray()
-        with self._h2_conn as conn:
-            end_stream = False
-            while not end_stream:
-                # TODO: Arbitrary read value.
-                if received_data := self.sock.recv(65535):
-                    events = conn.receive_data(received_data)
-                    for event in events:
-                        if isinstance(event, h2.events.ResponseReceived):
-                            headers = HTTPHeaderDict()
-                            for header, value in event.headers:
-                                if header == b":status":
-                                    status = int(value.decode())
-                                else:
-                                    headers.add(
-                                        header.decode("ascii"), value.decode("ascii")
-                                    )
-
-                        elif isinstance(event, h2.events.DataReceived):
-                            data += event.data
-                            conn.acknowledge_received_data(
-                                event.flow_controlled_length, event.stream_id
-                            )
-
-                        elif isinstance(event, h2.events.StreamEnded):
-                            end_stream = True
-
-                if data_to_send := conn.data_to_send():
-                    self.sock.sendall(data_to_send)
-
-        assert status is not None
-        return HTTP2Response(
-            status=status,
-            headers=headers,
-            request_url=self._request_url,
-            data=bytes(data),
-        )
+        timeout = self._read_timeout()
+        if hasattr(data, "read"):  # file-like objects
+            while True:
+                chunk = data.read(self._conn.blocksize)
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()  # pragma: no cover
+                self._conn._send_data(self._state, chunk, False, timeout)
+            self._conn._end_stream(self._state)
+            return
+
+        if isinstance(data, str):  # str -> bytes
+            data = data.encode()
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self._conn._send_data(self._state, bytes(data), True, timeout)
+            return
+        try:
+            chunks = iter(data)
+        except TypeError:
+            raise TypeError(
+                "`data` should be str, bytes, iterable, or file. got %r" % type(data)
+            )
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            self._conn._send_data(self._state, chunk, False, timeout)
+        self._conn._end_stream(self._state)
 
-    def request(  # type: ignore[override]
+    def request(
         self,
         method: str,
         url: str,
@@ -283,9 +780,8 @@ class HTTP2Connection(HTTPSConnection):
             # raise NotImplementedError("`chunked` isn't supported with HTTP/2")
             pass
 
-        if self.sock is not None:
-            self.sock.settimeout(self.timeout)
-
+        self._preload_content = preload_content
+        self._decode_content = decode_content
         self.putrequest(method, url)
 
         headers = headers or {}
@@ -304,32 +800,48 @@ class HTTP2Connection(HTTPSConnection):
         else:
             self.endheaders()
 
-    def close(self) -> None:
-        with self._h2_conn as conn:
-            try:
-                conn.close_connection()
-                if data := conn.data_to_send():
-                    self.sock.sendall(data)
-            except Exception:
-                pass
+    def getresponse(self) -> HTTP2Response:
+        state = self._state
+        self._conn._wait_for_headers(state, self._read_timeout())
+        self._conn._save_tls_session()
+        assert state.status is not None and state.headers is not None
+        return HTTP2Response(
+            status=state.status,
+            headers=state.headers,
+            request_url=self._request_url,
+            stream=self,
+            decode_content=self._decode_content,
+            preload_content=self._preload_content,
+        )
 
-        # Reset all our HTTP/2 connection state.
-        self._h2_conn = self._new_h2_conn()
-        self._h2_stream = None
-        self._headers = []
+    def read(self, amt: int | None = None) -> bytes:
+        """Read raw body bytes of the response on this stream."""
+        return self._conn._read_body(self._state, amt, self._read_timeout())
 
-        super().close()
+    @property
+    def finished(self) -> bool:
+        return self._state.released or (self._state.ended and not self._state.chunks)
+
+    def release(self) -> None:
+        """Give the stream slot back, cancelling the stream if it's still running."""
+        if not self._state.ended:
+            self._conn._reset(self._state)
+        self._conn._release(self._state)
+
+    def close(self) -> None:
+        self.release()
 
 
 class HTTP2Response(BaseHTTPResponse):
-    # TODO: This is a woefully incomplete response object, but works for non-streaming.
     def __init__(
         self,
         status: int,
         headers: HTTPHeaderDict,
         request_url: str,
-        data: bytes,
-        decode_content: bool = False,  # TODO: support decoding
+        data: bytes | None = None,
+        decode_content: bool = True,
+        stream: HTTP2Stream | None = None,
+        preload_content: bool = True,
     ) -> None:
         super().__init__(
             status=status,
@@ -342,15 +854,120 @@ class HTTP2Response(BaseHTTPResponse):
             decode_content=decode_content,
             request_url=request_url,
         )
-        self._data = data
-        self.length_remaining = 0
+        self._stream = stream
+        self._body = data
+        self._connection: HTTP2Stream | None = None
+        self._pool: typing.Any = None
+        self._eof = stream is None
+        try:
+            self.length_remaining = int(headers["content-length"])
+        except (KeyError, ValueError):
+            self.length_remaining = None if stream is not None else 0
+
+        if preload_content and self._body is None and stream is not None:
+            self._body = self.read(decode_content=decode_content)
 
     @property
     def data(self) -> bytes:
-        return self._data
+        if self._body is None:
+            self._body = self.read()
+        return self._body
+
+    @property
+    def url(self) -> str | None:
+        return self._request_url
+
+    @url.setter
+    def url(self, url: str | None) -> None:
+        self._request_url = url
+
+    @property
+    def connection(self) -> HTTP2Stream | None:
+        return self._connection
+
+    def read(
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+        cache_content: bool = False,
+    ) -> bytes:
+        if decode_content is None:
+            decode_content = self.decode_content
+        if self._eof or self._stream is None:
+            return b""
+        self._init_decoder()
+
+        data = b""
+        # A compressed chunk can decode to nothing, so keep going until there's
+        # output or the body ends.
+        while not data and not self._eof:
+            raw = self._stream.read(amt)
+            if self.length_remaining is not None:
+                self.length_remaining = max(0, self.length_remaining - len(raw))
+            self._eof = not raw or (amt is None) or self._stream.finished
+            data = self._decode(raw, decode_content, flush_decoder=self._eof)
+
+        if self._eof:
+            self.release_conn()
+        if cache_content:
+            self._body = data
+        return data
+
+    def read1(
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+    ) -> bytes:
+        return self.read(amt if amt is not None else 2**16, decode_content)
+
+    def stream(
+        self, amt: int | None = 2**16, decode_content: bool | None = None
+    ) -> typing.Iterator[bytes]:
+        if self._body is not None and self._eof:
+            if self._body:
+                yield self._body
+            return
+        while not self._eof:
+            data = self.read(amt, decode_content)
+            if data:
+                yield data
+
+    def read_chunked(
+        self,
+        amt: int | None = None,
+        decode_content: bool | None = None,
+    ) -> typing.Iterator[bytes]:
+        # HTTP/2 frames the body itself; there's no chunked encoding to parse.
+        return self.stream(amt, decode_content)
+
+    def release_conn(self) -> None:
+        if self._stream is not None and not self._stream.finished:
+            self._stream.release()
+        if self._pool is not None and self._connection is not None:
+            self._pool._put_conn(self._connection)
+            self._connection = None
+
+    def drain_conn(self) -> None:
+        try:
+            self.read()
+        except (HTTPError, OSError):
+            pass
+        self.release_conn()
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def closed(self) -> bool:
+        return self._eof
+
+    def isclosed(self) -> bool:
+        return self._eof
 
-    def get_redirect_location(self) -> None:
-        return None
+    def shutdown(self) -> None:
+        if self._stream is not None:
+            self._stream.release()
 
     def close(self) -> None:
-        pass
+        self._eof = True
+        self.release_conn()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing
+
+from ..connectionpool import HTTPSConnectionPool
+from ..exceptions import ClosedPoolError, EmptyPoolError
+from .connection import HTTP2Connection, HTTP2Stream
+
+log = logging.getLogger(__name__)
+
+
+class HTTP2ConnectionPool(HTTPSConnectionPool):
+    """
+    HTTPS pool that multiplexes requests as streams over HTTP/2 connections.
+
+    Instead of one request per connection, every request gets an
+    :class:`~urllib3.http2.connection.HTTP2Stream` on the least busy
+    connection that still has room for one. ``maxsize`` limits the number of
+    connections kept open to the host; a new one is only opened when all of
+    them are carrying as many streams as the server allows. With
+    ``block=True`` requests then wait for a stream to finish instead.
+    """
+
+    ConnectionCls = HTTP2Connection
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._sessions: list[HTTP2Connection] = []
+        self._sessions_cond = threading.Condition()
+        self._maxsize = self.pool.maxsize if self.pool is not None else 1
+
+    def _new_conn(self) -> HTTP2Connection:  # type: ignore[override]
+        conn = typing.cast(HTTP2Connection, super()._new_conn())
+        conn.release_callback = self._on_release
+        return conn
+
+    def _on_release(self, conn: HTTP2Connection) -> None:
+        with self._sessions_cond:
+            self._sessions_cond.notify_all()
+
+    def _usable(self, conn: HTTP2Connection) -> bool:
+        """Whether a session can take more streams, dropping it if it's dead."""
+        if conn.sock is not None and conn.active_streams == 0 and not conn.poll():
+            log.debug("Resetting dropped connection: %s", self.host)
+            self._sessions.remove(conn)
+            conn.close()
+            return False
+        if not conn.is_usable:
+            if conn.active_streams == 0:
+                self._sessions.remove(conn)
+                conn.close()
+            return False
+        return True
+
+    def _get_conn(self, timeout: float | None = None) -> HTTP2Stream:  # type: ignore[override]
+        """
+        Get a stream on a pooled connection, opening a new connection if all
+        pooled ones are busy.
+
+        :param timeout:
+            Seconds to wait for a free stream before raising
+            :class:`urllib3.exceptions.EmptyPoolError` when the pool is full and
+            :prop:`.block` is ``True``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._sessions_cond:
+            while True:
+                if self.pool is None:
+                    raise ClosedPoolError(self, "Pool is closed.")
+
+                candidates = [
+                    conn
+                    for conn in list(self._sessions)
+                    if self._usable(conn) and conn.has_capacity()
+                ]
+                if candidates:
+                    conn = min(candidates, key=lambda c: c.active_streams)
+                    return conn.open_stream()
+
+                if len(self._sessions) < self._maxsize or not self.block:
+                    conn = self._new_conn()
+                    if len(self._sessions) < self._maxsize:
+                        self._sessions.append(conn)
+                    return conn.open_stream()
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise EmptyPoolError(
+                        self,
+                        "Pool is full and no HTTP/2 stream became available in time.",
+                    )
+                self._sessions_cond.wait(remaining)
+
+    def _put_conn(self, conn: HTTP2Stream | None) -> None:  # type: ignore[override]
+        """
+        Give a stream back. Its connection stays in the pool for later
+        requests; connections that aren't pooled are closed once idle.
+        """
+        if conn is None:
+            return
+        conn.release()
+        session = conn.connection
+        with self._sessions_cond:
+            pooled = self.pool is not None and session in self._sessions
+            if session.active_streams == 0 and (not pooled or not session.is_usable):
+                if pooled:
+                    self._sessions.remove(session)
+                session.close()
+            self._sessions_cond.notify_all()
+
+    def close(self) -> None:
+        """
+        Close all pooled connections and disable the pool.
+        """
+        if self.pool is None:
+            return
+        with self._sessions_cond:
+            self.pool = None
+            sessions, self._sessions = self._sessions, []
+            self._sessions_cond.notify_all()
+        for conn in sessions:
+            conn.close()
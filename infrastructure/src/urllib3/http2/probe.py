@@ -1,6 +1,150 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import logging
+import os
+import tempfile
 import threading
+import time
+import typing
+
+try:
+    import fcntl
+except ImportError:  # Platform-specific: Windows
+    fcntl = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+#: Default lifetime of a probe result stored on disk, in seconds.
+DEFAULT_PROBE_TTL = 24 * 60 * 60
+#: Default lifetime of a stored "doesn't support HTTP/2" result, in seconds.
+DEFAULT_NEGATIVE_PROBE_TTL = 60 * 60
+
+
+class _DiskProbeStore:
+    """
+    Probe results persisted to a JSON file that several processes can share.
+
+    Writes merge with what other processes wrote in the meantime and replace
+    the file atomically, under an advisory lock where the platform has one.
+    Readers only parse the file again once it has changed.
+    """
+
+    __slots__ = (
+        "path",
+        "ttl",
+        "negative_ttl",
+        "origin_ttls",
+        "_lock",
+        "_stat",
+        "_entries",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: float,
+        negative_ttl: float,
+        origin_ttls: typing.Mapping[tuple[str, int], float] | None,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.origin_ttls = dict(origin_ttls or {})
+        self._lock = threading.Lock()
+        self._stat: tuple[int, int] | None = None
+        self._entries: dict[str, tuple[bool, float]] = {}
+
+    @staticmethod
+    def _origin(key: tuple[str, int]) -> str:
+        return f"{key[0]}:{key[1]}"
+
+    def ttl_for(self, key: tuple[str, int], supports_http2: bool) -> float:
+        if key in self.origin_ttls:
+            return self.origin_ttls[key]
+        return self.ttl if supports_http2 else self.negative_ttl
+
+    def _read(self) -> dict[str, tuple[bool, float]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                origin: (bool(entry["h2"]), float(entry["expires"]))
+                for origin, entry in data["origins"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            log.debug("Ignoring unreadable HTTP/2 probe cache %s: %s", self.path, e)
+            return {}
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+            stat: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stat = None
+        if stat != self._stat:
+            self._entries = self._read() if stat is not None else {}
+            self._stat = stat
+
+    def get(self, key: tuple[str, int]) -> tuple[bool, float] | None:
+        """Returns ``(supports_http2, expires)`` if a live result is stored."""
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(self._origin(key))
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> typing.Iterator[None]:
+        if fcntl is None:  # Platform-specific: Windows
+            yield
+            return
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def put(self, key: tuple[str, int], supports_http2: bool) -> float:
+        """Stores a result and returns when it expires."""
+        now = time.time()
+        expires = now + self.ttl_for(key, supports_http2)
+        try:
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            with self._lock, self._file_lock():
+                entries = {
+                    origin: entry
+                    for origin, entry in self._read().items()
+                    if entry[1] > now
+                }
+                entries[self._origin(key)] = (supports_http2, expires)
+                data = {
+                    "version": 1,
+                    "origins": {
+                        origin: {"h2": h2, "expires": round(exp, 3)}
+                        for origin, (h2, exp) in entries.items()
+                    },
+                }
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".http2-probe-")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                self._entries = entries
+                st = os.stat(self.path)
+                self._stat = (st.st_mtime_ns, st.st_size)
+        except OSError as e:
+            log.debug("Couldn't write HTTP/2 probe cache %s: %s", self.path, e)
+        return expires
 
 
 class _HTTP2ProbeCache:
@@ -8,12 +152,17 @@ class _HTTP2ProbeCache:
         "_lock",
         "_cache_locks",
         "_cache_values",
+        "_cache_expires",
+        "_store",
     )
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._cache_locks: dict[tuple[str, int], threading.RLock] = {}
         self._cache_values: dict[tuple[str, int], bool | None] = {}
+        # Only results that also live on disk expire.
+        self._cache_expires: dict[tuple[str, int], float] = {}
+        self._store: _DiskProbeStore | None = None
 
     def acquire_and_get(self, host: str, port: int) -> bool | None:
         # By the end of this block we know that
@@ -25,10 +174,20 @@ class _HTTP2ProbeCache:
                 value = self._cache_values[key]
                 # If it's a known value we return right away.
                 if value is not None:
-                    return value
+                    if self._cache_expires.get(key, float("inf")) > time.time():
+                        return value
+                    # Expired, so it's unknown again.
+                    self._cache_values[key] = None
+                    self._cache_expires.pop(key, None)
+                    value = self._load(key)
+                    if value is not None:
+                        return value
             except KeyError:
                 self._cache_locks[key] = threading.RLock()
                 self._cache_values[key] = None
+                value = self._load(key)
+                if value is not None:
+                    return value
 
         # If the value is unknown, we acquire the lock to signal
         # to the requesting thread that the probe is in progress
@@ -48,6 +207,15 @@ class _HTTP2ProbeCache:
 
         return value
 
+    def _load(self, key: tuple[str, int]) -> bool | None:
+        # Another process may have probed the origin already.
+        # Must be called with self._lock held.
+        stored = self._store.get(key) if self._store is not None else None
+        if stored is None:
+            return None
+        self._cache_values[key], self._cache_expires[key] = stored
+        return stored[0]
+
     def set_and_release(
         self, host: str, port: int, supports_http2: bool | None
     ) -> None:
@@ -59,9 +227,41 @@ class _HTTP2ProbeCache:
                     "Cannot reset HTTP/2 support for origin after value has been set."
                 )  # Defensive: not expected in normal usage
 
+        store = self._store
+        if supports_http2 is not None and store is not None:
+            self._cache_expires[key] = store.put(key, supports_http2)
         self._cache_values[key] = supports_http2
         key_lock.release()
 
+    def enable_disk_cache(
+        self,
+        path: str | os.PathLike[str],
+        ttl: float = DEFAULT_PROBE_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_PROBE_TTL,
+        origin_ttls: typing.Mapping[tuple[str, int], float] | None = None,
+    ) -> None:
+        """
+        Keeps probe results in a file as well, so that other processes and later
+        runs know which origins support HTTP/2 without probing them again.
+
+        :param path: JSON file to store the results in. Processes pointing at
+            the same file share their results.
+        :param ttl: Seconds after which an origin that supports HTTP/2 is
+            probed again.
+        :param negative_ttl: Seconds after which an origin that doesn't support
+            HTTP/2 is probed again.
+        :param origin_ttls: Lifetimes for specific ``(host, port)`` origins,
+            overriding ``ttl`` and ``negative_ttl``.
+        """
+        with self._lock:
+            self._store = _DiskProbeStore(path, ttl, negative_ttl, origin_ttls)
+
+    def disable_disk_cache(self) -> None:
+        """Stops reading and writing probe results on disk."""
+        with self._lock:
+            self._store = None
+            self._cache_expires = {}
+
     def _values(self) -> dict[tuple[str, int], bool | None]:
         """This function is for testing purposes only. Gets the current state of the probe cache"""
         with self._lock:
@@ -72,16 +272,21 @@ class _HTTP2ProbeCache:
         with self._lock:
             self._cache_locks = {}
             self._cache_values = {}
+            self._cache_expires = {}
 
 
 _HTTP2_PROBE_CACHE = _HTTP2ProbeCache()
 
 set_and_release = _HTTP2_PROBE_CACHE.set_and_release
 acquire_and_get = _HTTP2_PROBE_CACHE.acquire_and_get
+enable_disk_cache = _HTTP2_PROBE_CACHE.enable_disk_cache
+disable_disk_cache = _HTTP2_PROBE_CACHE.disable_disk_cache
 _values = _HTTP2_PROBE_CACHE._values
 _reset = _HTTP2_PROBE_CACHE._reset
 
 __all__ = [
     "set_and_release",
     "acquire_and_get",
+    "enable_disk_cache",
+    "disable_disk_cache",
 ]
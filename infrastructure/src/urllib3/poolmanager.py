@@ -29,6 +29,8 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Self
 
+    from .util.resolver import BaseResolver
+
 __all__ = ["PoolManager", "ProxyManager", "proxy_from_url"]
 
 
@@ -85,6 +87,8 @@ class PoolKey(typing.NamedTuple):
     key__proxy_headers: frozenset[tuple[str, str]] | None
     key__proxy_config: ProxyConfig | None
     key_socket_options: _TYPE_SOCKET_OPTIONS | None
+    key_happy_eyeballs_delay: float | None
+    key_resolver: BaseResolver | None
     key__socks_options: frozenset[tuple[str, str]] | None
     key_assert_hostname: bool | str | None
     key_assert_fingerprint: str | None
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import collections
+import errno
 import io
 import json as _json
 import logging
+import os
 import re
 import socket
 import sys
+import time
 import typing
 import warnings
 import zlib
@@ -61,6 +64,7 @@ from .exceptions import (
 )
 from .util.response import is_fp_closed, is_response_to_head
 from .util.retry import Retry
+from .util.wait import wait_for_read
 
 if typing.TYPE_CHECKING:
     from .connectionpool import HTTPConnectionPool
@@ -261,6 +265,11 @@ class BytesQueueBuffer:
         elif n < 0:
             raise ValueError("n should be > 0")
 
+        if len(self.buffer[0]) == n:
+            # The common case of reading back what was just put: no copy.
+            self._size -= n
+            return self.buffer.popleft()
+
         fetched = 0
         ret = io.BytesIO()
         while fetched < n:
@@ -283,6 +292,20 @@ class BytesQueueBuffer:
 
         return ret.getvalue()
 
+    def get_into(self, b: memoryview) -> int:
+        """Moves up to ``len(b)`` bytes into ``b`` and returns how many."""
+        n = len(b)
+        fetched = 0
+        while fetched < n and self.buffer:
+            chunk = self.buffer.popleft()
+            take = min(len(chunk), n - fetched)
+            b[fetched : fetched + take] = memoryview(chunk)[:take]
+            if take < len(chunk):
+                self.buffer.appendleft(chunk[take:])
+            fetched += take
+        self._size -= fetched
+        return fetched
+
     def get_all(self) -> bytes:
         buffer = self.buffer
         if not buffer:
@@ -298,6 +321,30 @@ class BytesQueueBuffer:
         return result
 
 
+class SaveResult(typing.NamedTuple):
+    """What :meth:`HTTPResponse.save_to` wrote and how fast."""
+
+    #: Bytes written to the file.
+    bytes_written: int
+    #: Seconds spent receiving and writing the body.
+    elapsed: float
+    #: How the body got to the file: ``"splice"`` (kernel only),
+    #: ``"recv_into"`` (one reused buffer), ``"stream"`` (decoded) or
+    #: ``"preloaded"`` (from :attr:`HTTPResponse.data`).
+    method: str
+
+    @property
+    def throughput(self) -> float:
+        """Bytes written per second."""
+        return self.bytes_written / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 class BaseHTTPResponse(io.IOBase):
     CONTENT_DECODERS = ["gzip", "x-gzip", "deflate"]
     if brotli is not None:
@@ -360,6 +407,62 @@ class BaseHTTPResponse(io.IOBase):
             return self.headers.get("location")
         return False
 
+    def _init_length(self, request_method: str | None) -> int | None:
+        """
+        Set initial length value for Response content if available.
+        """
+        length: int | None
+        content_length: str | None = self.headers.get("content-length")
+
+        if content_length is not None:
+            if self.chunked:
+                # This Response will fail with an IncompleteRead if it can't be
+                # received as chunked. This method falls back to attempt reading
+                # the response before raising an exception.
+                log.warning(
+                    "Received response with both Content-Length and "
+                    "Transfer-Encoding set. This is expressly forbidden "
+                    "by RFC 7230 sec 3.3.2. Ignoring Content-Length and "
+                    "attempting to process response as Transfer-Encoding: "
+                    "chunked."
+                )
+                return None
+
+            try:
+                # RFC 7230 section 3.3.2 specifies multiple content lengths can
+                # be sent in a single Content-Length header
+                # (e.g. Content-Length: 42, 42). This line ensures the values
+                # are all valid ints and that as long as the `set` length is 1,
+                # all values are the same. Otherwise, the header is invalid.
+                lengths = {int(val) for val in content_length.split(",")}
+                if len(lengths) > 1:
+                    raise InvalidHeader(
+                        "Content-Length contained multiple "
+                        "unmatching values (%s)" % content_length
+                    )
+                length = lengths.pop()
+            except ValueError:
+                length = None
+            else:
+                if length < 0:
+                    length = None
+
+        else:  # if content_length is None
+            length = None
+
+        # Convert status to int for comparison
+        # In some cases, httplib returns a status of "_UNKNOWN"
+        try:
+            status = int(self.status)
+        except ValueError:
+            status = 0
+
+        # Check for responses that shouldn't include a body
+        if status in (204, 304) or 100 <= status < 200 or request_method == "HEAD":
+            length = 0
+
+        return length
+
     @property
     def data(self) -> bytes:
         raise NotImplementedError()
@@ -506,14 +609,60 @@ class BaseHTTPResponse(io.IOBase):
         return b""
 
     # Compatibility methods for `io` module
-    def readinto(self, b: bytearray) -> int:
-        temp = self.read(len(b))
+    def readinto(self, b: bytearray, decode_content: bool | None = None) -> int:
+        temp = self.read(len(b), decode_content=decode_content)
         if len(temp) == 0:
             return 0
         else:
             b[: len(temp)] = temp
             return len(temp)
 
+    def stream_into(
+        self,
+        target: typing.Any,
+        decode_content: bool | None = None,
+        buffer_size: int = 2**16,
+    ) -> int:
+        """
+        Writes the body into ``target`` with :meth:`readinto` and returns the
+        number of bytes written.
+
+        :param target:
+            Either a writable buffer such as a :class:`bytearray` or
+            :class:`memoryview`, which is filled from the start until it's
+            full or the body ends, or a binary file object, which gets the
+            rest of the body.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param buffer_size:
+            Size of the buffer reused for every write to a file object.
+        """
+        if hasattr(target, "write"):
+            view = memoryview(bytearray(buffer_size))
+            total = 0
+            while True:
+                n = self.readinto(view, decode_content=decode_content)
+                if not n:
+                    return total
+                written = 0
+                while written < n:
+                    # Raw files may write less than they were given.
+                    count = target.write(view[written:n])
+                    written += n - written if count is None else count
+                total += n
+
+        view = memoryview(target).cast("B")
+        filled = 0
+        while filled < len(view):
+            n = self.readinto(view[filled:], decode_content=decode_content)
+            if not n:
+                break
+            filled += n
+        return filled
+
     # Compatibility methods for http.client.HTTPResponse
     def getheaders(self) -> HTTPHeaderDict:
         warnings.warn(
@@ -682,62 +831,6 @@ class HTTPResponse(BaseHTTPResponse):
         """
         return self._fp_bytes_read
 
-    def _init_length(self, request_method: str | None) -> int | None:
-        """
-        Set initial length value for Response content if available.
-        """
-        length: int | None
-        content_length: str | None = self.headers.get("content-length")
-
-        if content_length is not None:
-            if self.chunked:
-                # This Response will fail with an IncompleteRead if it can't be
-                # received as chunked. This method falls back to attempt reading
-                # the response before raising an exception.
-                log.warning(
-                    "Received response with both Content-Length and "
-                    "Transfer-Encoding set. This is expressly forbidden "
-                    "by RFC 7230 sec 3.3.2. Ignoring Content-Length and "
-                    "attempting to process response as Transfer-Encoding: "
-                    "chunked."
-                )
-                return None
-
-            try:
-                # RFC 7230 section 3.3.2 specifies multiple content lengths can
-                # be sent in a single Content-Length header
-                # (e.g. Content-Length: 42, 42). This line ensures the values
-                # are all valid ints and that as long as the `set` length is 1,
-                # all values are the same. Otherwise, the header is invalid.
-                lengths = {int(val) for val in content_length.split(",")}
-                if len(lengths) > 1:
-                    raise InvalidHeader(
-                        "Content-Length contained multiple "
-                        "unmatching values (%s)" % content_length
-                    )
-                length = lengths.pop()
-            except ValueError:
-                length = None
-            else:
-                if length < 0:
-                    length = None
-
-        else:  # if content_length is None
-            length = None
-
-        # Convert status to int for comparison
-        # In some cases, httplib returns a status of "_UNKNOWN"
-        try:
-            status = int(self.status)
-        except ValueError:
-            status = 0
-
-        # Check for responses that shouldn't include a body
-        if status in (204, 304) or 100 <= status < 200 or request_method == "HEAD":
-            length = 0
-
-        return length
-
     @contextmanager
     def _error_catcher(self) -> typing.Generator[None]:
         """
@@ -987,6 +1080,95 @@ class HTTPResponse(BaseHTTPResponse):
 
         return data
 
+    def _raw_readinto(self, b: memoryview) -> int:
+        """
+        Reads up to ``len(b)`` bytes from the socket straight into ``b``.
+        """
+        if self._fp is None:
+            return 0
+
+        if not hasattr(self._fp, "readinto"):
+            data = self._raw_read(len(b))
+            b[: len(data)] = data
+            return len(data)
+
+        c_int_max = 2**31 - 1
+        if len(b) > c_int_max and (util.IS_PYOPENSSL or sys.version_info < (3, 10)):
+            # See _fp_read() for why larger reads aren't safe here.
+            b = b[:c_int_max]
+
+        fp_closed = getattr(self._fp, "closed", False)
+
+        with self._error_catcher():
+            n = self._fp.readinto(b) if not fp_closed else 0
+            if not n and len(b):
+                self._fp.close()
+                if (
+                    self.enforce_content_length
+                    and self.length_remaining is not None
+                    and self.length_remaining != 0
+                ):
+                    raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+        if n:
+            self._fp_bytes_read += n
+            if self.length_remaining is not None:
+                self.length_remaining -= n
+        return n
+
+    def readinto(  # type: ignore[override]
+        self, b: bytearray | memoryview, decode_content: bool | None = None
+    ) -> int:
+        """
+        Reads up to ``len(b)`` bytes of the body into the writable buffer
+        ``b`` and returns how many, or ``0`` once the body has been read.
+        Like :meth:`read` with ``amt`` it only returns less at the end of the
+        body.
+
+        If the body isn't decoded, because it has no known 'content-encoding'
+        or ``decode_content`` is False, it's received straight into ``b``
+        without passing through intermediate :class:`bytes` objects.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        if not decode_content and self._has_decoded_content:
+            raise RuntimeError(
+                "Calling readinto(decode_content=False) is not supported after "
+                "readinto(decode_content=True) was called."
+            )
+
+        view = memoryview(b).cast("B")
+        if not view:
+            return 0
+        if len(self._decoded_buffer) > 0:
+            return self._decoded_buffer.get_into(view)
+
+        if self._decoder is None or not decode_content:
+            filled = 0
+            while filled < len(view):
+                n = self._raw_readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            return filled
+
+        if self._fp is None:
+            return 0
+        while len(self._decoded_buffer) < len(view):
+            data = self._raw_read(len(view))
+            self._decoded_buffer.put(
+                self._decode(data, decode_content, flush_decoder=not data)
+            )
+            if not data:
+                break
+        return self._decoded_buffer.get_into(view)
+
     def read1(
         self,
         amt: int | None = None,
@@ -1068,6 +1250,240 @@ class HTTPResponse(BaseHTTPResponse):
                 if data:
                     yield data
 
+    def save_to(
+        self,
+        path_or_fd: str | os.PathLike[str] | int,
+        decode_content: bool | None = None,
+        fsync: bool = False,
+        preallocate: bool = True,
+        buffer_size: int = 2**20,
+    ) -> SaveResult:
+        """
+        Writes the rest of the body to a file.
+
+        Bodies that come over plain HTTP with a Content-Length and aren't
+        decoded are moved from the socket to the file by the kernel with
+        :func:`os.splice` where that's available, or else received with
+        :meth:`socket.socket.recv_into` into a single reused buffer. All other
+        bodies are decoded and written with :meth:`stream_into`. The fast
+        path needs the connection, so the response must have been requested
+        with ``preload_content=False``; a preloaded response writes its
+        :attr:`data`.
+
+        :param path_or_fd:
+            Path of the file to create or truncate, or a file descriptor
+            open for writing. A descriptor is written from its current
+            position and left open.
+
+        :param decode_content:
+            If True, will attempt to decode the body based on the
+            'content-encoding' header.
+
+        :param fsync:
+            If True, the file is flushed to disk with :func:`os.fsync`
+            before returning.
+
+        :param preallocate:
+            If True and the size of what's written is known up front, the
+            space is reserved with :func:`os.posix_fallocate` first. If the
+            download fails the file keeps that size.
+
+        :param buffer_size:
+            Size of the buffer, or the pipe for :func:`os.splice`, that the
+            body is moved through.
+
+        :returns: A :class:`SaveResult` with the number of bytes written,
+            the time it took and the method used.
+        """
+        self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
+
+        owns_fd = not isinstance(path_or_fd, int)
+        if owns_fd:
+            fd = os.open(path_or_fd, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        else:
+            fd = path_or_fd
+        try:
+            start = time.perf_counter()
+            identity = self._decoder is None or not decode_content
+            if self._body is not None:
+                # Preloaded, so the body has been read into .data already.
+                _write_all(fd, self._body)
+                written, method = len(self._body), "preloaded"
+            else:
+                if preallocate and identity and not self._decoded_buffer:
+                    self._preallocate(fd)
+
+                sock = self._passthrough_socket() if identity else None
+                if sock is not None:
+                    written, method = self._save_raw(sock, fd, buffer_size)
+                else:
+                    with io.FileIO(fd, "w", closefd=False) as f:
+                        written = self.stream_into(f, decode_content, buffer_size)
+                    method = "stream"
+
+            if fsync:
+                os.fsync(fd)
+            elapsed = time.perf_counter() - start
+        finally:
+            if owns_fd:
+                os.close(fd)
+
+        result = SaveResult(written, elapsed, method)
+        log.debug(
+            "Saved %d bytes from %s in %.3fs (%.1f MiB/s, %s)",
+            written,
+            self.url,
+            elapsed,
+            result.throughput / 2**20,
+            method,
+        )
+        return result
+
+    def _preallocate(self, fd: int) -> None:
+        if not self.length_remaining or not hasattr(os, "posix_fallocate"):
+            return
+        import fcntl
+
+        try:
+            if fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_APPEND:
+                # Appends would land after the reserved space.
+                return
+            offset = os.lseek(fd, 0, os.SEEK_CUR)
+            os.posix_fallocate(fd, offset, self.length_remaining)
+        except OSError:
+            # Not every file system supports it, and pipes can't seek.
+            pass
+
+    def _passthrough_socket(self) -> socket.socket | None:
+        """
+        The plain TCP socket the rest of the body can be read from directly,
+        or None if it has to go through :meth:`read`.
+        """
+        if (
+            not isinstance(self._fp, _HttplibHTTPResponse)
+            or self._fp.fp is None
+            or self.chunked
+            or not self.length_remaining
+            or self._decoded_buffer
+        ):
+            return None
+        sock = getattr(self._connection, "sock", None)
+        # TLS sockets decrypt in userspace anyway.
+        if type(sock) is not socket.socket:
+            return None
+        return sock
+
+    def _save_raw(
+        self, sock: socket.socket, fd: int, buffer_size: int
+    ) -> tuple[int, str]:
+        assert isinstance(self._fp, _HttplibHTTPResponse) and self._fp.fp is not None
+        assert self.length_remaining is not None
+        remaining = self.length_remaining
+        moved = 0
+        method = "recv_into"
+        try:
+            # Whatever arrived together with the headers is buffered already.
+            with self._error_catcher():
+                head = self._fp.fp.peek()[:remaining]
+                self._fp.fp.read(len(head))
+            _write_all(fd, head)
+            moved += len(head)
+
+            if moved < remaining and hasattr(os, "splice"):
+                spliced = self._splice_to(sock, fd, remaining - moved, buffer_size)
+                if spliced:
+                    method = "splice"
+                moved += spliced
+
+            if moved < remaining:
+                buf = memoryview(bytearray(min(buffer_size, remaining - moved)))
+                while moved < remaining:
+                    with self._error_catcher():
+                        n = sock.recv_into(buf, min(len(buf), remaining - moved))
+                        if not n:
+                            raise IncompleteRead(
+                                self._fp_bytes_read + moved, remaining - moved
+                            )
+                    _write_all(fd, buf[:n])
+                    moved += n
+        except BaseException:
+            # The rest of the body is still on the wire.
+            self.close()
+            raise
+        finally:
+            self._fp_bytes_read += moved
+            self.length_remaining -= moved
+
+        with self._error_catcher():
+            # Let http.client know the body is done so the connection can be
+            # reused.
+            self._fp.length = 0
+            self._fp.read()
+        return moved, method
+
+    def _splice_to(
+        self, sock: socket.socket, fd: int, count: int, pipe_size: int
+    ) -> int:
+        """
+        Moves up to ``count`` bytes from ``sock`` to ``fd`` through a pipe
+        with :func:`os.splice`. Stops early if the connection is closed or
+        ``fd`` can't be spliced to, leaving the rest to the caller.
+        """
+        import fcntl
+
+        moved = 0
+        timeout = sock.gettimeout()
+        r, w = os.pipe()
+        try:
+            try:
+                fcntl.fcntl(w, fcntl.F_SETPIPE_SZ, pipe_size)
+            except OSError:
+                pass
+            pipe_size = fcntl.fcntl(w, fcntl.F_GETPIPE_SZ)
+
+            while moved < count:
+                with self._error_catcher():
+                    try:
+                        n = os.splice(
+                            sock.fileno(),
+                            w,
+                            min(pipe_size, count - moved),
+                            flags=os.SPLICE_F_MOVE,
+                        )
+                    except BlockingIOError:
+                        # Sockets with a timeout are non-blocking underneath.
+                        if not wait_for_read(sock, timeout):
+                            raise SocketTimeout("timed out") from None
+                        continue
+                    except OSError as e:
+                        if e.errno in (errno.EINVAL, errno.ENOSYS):
+                            return moved
+                        raise
+                if not n:
+                    return moved
+
+                pending = n
+                try:
+                    while pending:
+                        pending -= os.splice(r, fd, pending, flags=os.SPLICE_F_MOVE)
+                except OSError as e:
+                    if e.errno != errno.EINVAL:
+                        raise
+                    # Files opened with O_APPEND, for example, can't be
+                    # spliced to. Copy what's in the pipe and stop.
+                    while pending:
+                        data = os.read(r, pending)
+                        _write_all(fd, data)
+                        pending -= len(data)
+                    return moved + n
+                moved += n
+        finally:
+            os.close(r)
+            os.close(w)
+        return moved
+
     # Overrides from io.IOBase
     def readable(self) -> bool:
         return True
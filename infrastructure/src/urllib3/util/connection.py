@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import errno
+import itertools
+import os
+import selectors
 import socket
+import time
 import typing
+from socket import timeout as SocketTimeout
 
 from ..exceptions import LocationParseError
 from .timeout import _DEFAULT_TIMEOUT, _TYPE_TIMEOUT
 
 _TYPE_SOCKET_OPTIONS = list[tuple[int, int, typing.Union[int, bytes]]]
 
+#: Seconds to wait for a connection attempt before racing the next address
+#: against it, the "Connection Attempt Delay" recommended by RFC 8305.
+DEFAULT_HAPPY_EYEBALLS_DELAY = 0.25
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+
 if typing.TYPE_CHECKING:
     from .._base_connection import BaseHTTPConnection
+    from .resolver import BaseResolver
 
 
 def is_connection_dropped(conn: BaseHTTPConnection) -> bool:  # Platform-specific
@@ -20,6 +33,24 @@ def is_connection_dropped(conn: BaseHTTPConnection) -> bool:  # Platform-specifi
     return not conn.is_connected
 
 
+class ConnectAttempt(typing.NamedTuple):
+    """
+    One attempt at connecting to an address returned by ``getaddrinfo``.
+
+    ``started`` is the number of seconds after the first attempt at which
+    this one was started and ``elapsed`` how long it ran. ``outcome`` is one
+    of ``"connected"``, ``"failed"`` or ``"cancelled"``, the latter for
+    attempts that were abandoned once another address had connected.
+    """
+
+    family: socket.AddressFamily
+    sockaddr: tuple[typing.Any, ...]
+    started: float
+    elapsed: float
+    outcome: str
+    error: OSError | None = None
+
+
 # This function is copied from socket.py in the Python 2.7 standard
 # library test suite. Added to its signature is only `socket_options`.
 # One additional modification is that we avoid binding to IPv6 servers
@@ -29,6 +60,9 @@ def create_connection(
     timeout: _TYPE_TIMEOUT = _DEFAULT_TIMEOUT,
     source_address: tuple[str, int] | None = None,
     socket_options: _TYPE_SOCKET_OPTIONS | None = None,
+    happy_eyeballs_delay: float | None = None,
+    attempts: list[ConnectAttempt] | None = None,
+    resolver: BaseResolver | None = None,
 ) -> socket.socket:
     """Connect to *address* and return the socket object.
 
@@ -40,6 +74,18 @@ def create_connection(
     is used.  If *source_address* is set it must be a tuple of (host, port)
     for the socket to bind as a source address before making the connection.
     An host of '' or port 0 tells the OS to use the default.
+
+    If *happy_eyeballs_delay* is set and the host resolves to more than one
+    address, the addresses are raced as described in RFC 8305: they're
+    reordered to alternate between IPv6 and IPv4, and every *delay* seconds
+    (or as soon as an attempt fails) another connection attempt is started
+    alongside the ones still pending. The first to connect wins and the
+    others are closed, so an unreachable address only costs the delay rather
+    than a full connect timeout. *timeout* then applies to each attempt.
+    Every attempt made is appended to *attempts* if given.
+
+    Names are looked up with *resolver* if given, otherwise with
+    :func:`socket.getaddrinfo`.
     """
 
     host, port = address
@@ -57,9 +103,23 @@ def create_connection(
     except UnicodeError:
         raise LocationParseError(f"'{host}', label empty or too long") from None
 
-    for res in socket.getaddrinfo(host, port, family, socket.SOCK_STREAM):
+    getaddrinfo = socket.getaddrinfo if resolver is None else resolver.getaddrinfo
+    addrinfos = getaddrinfo(host, port, family, socket.SOCK_STREAM)
+    if happy_eyeballs_delay is not None and len(addrinfos) > 1:
+        return _race_connections(
+            _interleave_families(addrinfos),
+            timeout,
+            source_address,
+            socket_options,
+            happy_eyeballs_delay,
+            attempts,
+        )
+
+    first_started = time.monotonic()
+    for res in addrinfos:
         af, socktype, proto, canonname, sa = res
         sock = None
+        started = time.monotonic()
         try:
             sock = socket.socket(af, socktype, proto)
 
@@ -71,12 +131,33 @@ def create_connection(
             if source_address:
                 sock.bind(source_address)
             sock.connect(sa)
+            if attempts is not None:
+                attempts.append(
+                    ConnectAttempt(
+                        af,
+                        sa,
+                        started - first_started,
+                        time.monotonic() - started,
+                        "connected",
+                    )
+                )
             # Break explicitly a reference cycle
             err = None
             return sock
 
         except OSError as _:
             err = _
+            if attempts is not None:
+                attempts.append(
+                    ConnectAttempt(
+                        af,
+                        sa,
+                        started - first_started,
+                        time.monotonic() - started,
+                        "failed",
+                        err,
+                    )
+                )
             if sock is not None:
                 sock.close()
 
@@ -90,6 +171,133 @@ def create_connection(
         raise OSError("getaddrinfo returns an empty list")
 
 
+def _interleave_families(
+    addrinfos: list[tuple[typing.Any, ...]],
+) -> list[tuple[typing.Any, ...]]:
+    """
+    Reorders ``getaddrinfo`` results so that address families alternate,
+    starting with the family of the first result (RFC 8305, section 4).
+    """
+    by_family: dict[int, list[tuple[typing.Any, ...]]] = {}
+    for res in addrinfos:
+        by_family.setdefault(res[0], []).append(res)
+    return [
+        res
+        for group in itertools.zip_longest(*by_family.values())
+        for res in group
+        if res is not None
+    ]
+
+
+def _race_connections(
+    addrinfos: list[tuple[typing.Any, ...]],
+    timeout: _TYPE_TIMEOUT,
+    source_address: tuple[str, int] | None,
+    socket_options: _TYPE_SOCKET_OPTIONS | None,
+    delay: float,
+    attempts: list[ConnectAttempt] | None,
+) -> socket.socket:
+    if timeout is _DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+    pending = list(reversed(addrinfos))
+    records: list[ConnectAttempt] = []
+    # socket -> (family, sockaddr, started, deadline)
+    in_flight: dict[
+        socket.socket, tuple[socket.AddressFamily, typing.Any, float, float | None]
+    ] = {}
+    errors: list[OSError] = []
+    winner = None
+    first_started = time.monotonic()
+    next_attempt = first_started
+
+    def finish(sock: socket.socket, outcome: str, error: OSError | None) -> None:
+        af, sa, started, _ = in_flight.pop(sock)
+        records.append(
+            ConnectAttempt(
+                af,
+                sa,
+                started - first_started,
+                time.monotonic() - started,
+                outcome,
+                error,
+            )
+        )
+        if outcome != "connected":
+            selector.unregister(sock)
+            sock.close()
+        if error is not None:
+            errors.append(error)
+
+    selector = selectors.DefaultSelector()
+    try:
+        while winner is None and (pending or in_flight):
+            now = time.monotonic()
+            if pending and (now >= next_attempt or not in_flight):
+                af, socktype, proto, canonname, sa = pending.pop()
+                next_attempt = now + delay
+                sock = None
+                try:
+                    sock = socket.socket(af, socktype, proto)
+                    _set_socket_options(sock, socket_options)
+                    if source_address:
+                        sock.bind(source_address)
+                    sock.setblocking(False)
+                    code = sock.connect_ex(sa)
+                except OSError as e:
+                    if sock is not None:
+                        sock.close()
+                    records.append(
+                        ConnectAttempt(af, sa, now - first_started, 0.0, "failed", e)
+                    )
+                    errors.append(e)
+                    # Move on to the next address right away.
+                    next_attempt = now
+                    continue
+                deadline = None if timeout is None else now + timeout
+                in_flight[sock] = (af, sa, now, deadline)
+                selector.register(sock, selectors.EVENT_WRITE)
+                if code == 0:
+                    winner = sock
+                elif code not in _CONNECT_IN_PROGRESS:
+                    finish(sock, "failed", OSError(code, os.strerror(code)))
+                    next_attempt = now
+                continue
+
+            wake_ups = [d for *_, d in in_flight.values() if d is not None]
+            if pending:
+                wake_ups.append(next_attempt)
+            wait = max(min(wake_ups) - now, 0.0) if wake_ups else None
+            for key, _ in selector.select(wait):
+                sock = typing.cast(socket.socket, key.fileobj)
+                code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if code == 0:
+                    winner = sock
+                    break
+                finish(sock, "failed", OSError(code, os.strerror(code)))
+                next_attempt = time.monotonic()
+
+            if winner is None:
+                now = time.monotonic()
+                for sock, (*_, deadline) in list(in_flight.items()):
+                    if deadline is not None and deadline <= now:
+                        finish(sock, "failed", SocketTimeout("timed out"))
+
+        if winner is not None:
+            selector.unregister(winner)
+            finish(winner, "connected", None)
+            winner.settimeout(timeout)
+            return winner
+        raise errors[-1]
+    finally:
+        for sock in list(in_flight):
+            finish(sock, "cancelled", None)
+        selector.close()
+        if attempts is not None:
+            attempts.extend(sorted(records, key=lambda a: a.started))
+        # Break explicitly a reference cycle
+        errors.clear()
+
+
 def _set_socket_options(
     sock: socket.socket, options: _TYPE_SOCKET_OPTIONS | None
 ) -> None:
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import collections
+import logging
+import socket
+import threading
+import time
+import typing
+
+log = logging.getLogger(__name__)
+
+_TYPE_ADDRINFO = tuple[
+    socket.AddressFamily,
+    socket.SocketKind,
+    int,
+    str,
+    typing.Union[tuple[str, int], tuple[str, int, int, int], tuple[int, bytes]],
+]
+_TYPE_KEY = tuple[
+    typing.Optional[str], typing.Union[str, int, None], int, int, int, int
+]
+
+#: Default lifetime of a successful lookup, in seconds.
+DEFAULT_DNS_TTL = 60.0
+#: Default lifetime of a failed lookup, in seconds.
+DEFAULT_NEGATIVE_DNS_TTL = 5.0
+#: Default time an expired lookup may still be used while it's refreshed.
+DEFAULT_STALE_DNS_TTL = 300.0
+
+
+class BaseResolver:
+    """
+    Turns host names into addresses for new connections.
+
+    Subclasses implement :meth:`getaddrinfo` with the same signature and
+    results as :func:`socket.getaddrinfo`, raising :class:`socket.gaierror`
+    when a name can't be resolved. Pass an instance as ``resolver`` to a
+    connection, pool or :class:`~urllib3.PoolManager` to use it.
+    """
+
+    def getaddrinfo(
+        self,
+        host: str | None,
+        port: str | int | None,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[_TYPE_ADDRINFO]:
+        raise NotImplementedError()
+
+
+class SystemResolver(BaseResolver):
+    """Resolves names with :func:`socket.getaddrinfo`, like urllib3 does by default."""
+
+    def getaddrinfo(
+        self,
+        host: str | None,
+        port: str | int | None,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[_TYPE_ADDRINFO]:
+        return socket.getaddrinfo(host, port, family, type, proto, flags)
+
+
+class StaticResolver(BaseResolver):
+    """
+    Resolves names from a fixed table, for tests or pinning hosts to
+    addresses.
+
+    :param hosts: Maps host names to the IP addresses they resolve to, in
+        order of preference.
+    :param fallback: Resolver for hosts missing from ``hosts``. Without one
+        those fail to resolve.
+    """
+
+    def __init__(
+        self,
+        hosts: typing.Mapping[str, typing.Sequence[str]],
+        fallback: BaseResolver | None = None,
+    ) -> None:
+        self.hosts = {host.lower(): list(addrs) for host, addrs in hosts.items()}
+        self.fallback = fallback
+
+    def getaddrinfo(
+        self,
+        host: str | None,
+        port: str | int | None,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[_TYPE_ADDRINFO]:
+        addrs = self.hosts.get(host.lower()) if host is not None else None
+        if addrs is None:
+            if self.fallback is not None:
+                return self.fallback.getaddrinfo(host, port, family, type, proto, flags)
+            raise socket.gaierror(socket.EAI_NONAME, f"{host!r} is not in the table")
+
+        results: list[_TYPE_ADDRINFO] = []
+        for addr in addrs:
+            try:
+                results.extend(
+                    socket.getaddrinfo(
+                        addr, port, family, type, proto, flags | socket.AI_NUMERICHOST
+                    )
+                )
+            except socket.gaierror:
+                # Not of the requested address family.
+                continue
+        if not results:
+            raise socket.gaierror(
+                socket.EAI_NONAME, f"{host!r} has no addresses of the requested family"
+            )
+        return results
+
+
+class _CacheEntry:
+    __slots__ = ("result", "error", "expires", "stale_until", "refreshing")
+
+    def __init__(
+        self,
+        result: list[_TYPE_ADDRINFO] | None,
+        error: socket.gaierror | None,
+        expires: float,
+        stale_until: float,
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.expires = expires
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class _PendingLookup:
+    """A lookup in progress, whose outcome is handed to the callers waiting on it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: list[_TYPE_ADDRINFO] | None = None
+        self.error: BaseException | None = None
+
+
+class CachingResolver(BaseResolver):
+    """
+    Remembers the results of another resolver so that new connections don't
+    wait for a lookup every time.
+
+    Successful lookups are kept for ``ttl`` seconds and failed ones for
+    ``negative_ttl`` seconds; temporary failures (``EAI_AGAIN``) aren't
+    cached. Once a successful lookup has expired it's still returned for up
+    to ``stale_ttl`` more seconds while it's refreshed in the background, so
+    only the first lookup of a host, or one that has gone unused for longer
+    than that, waits for the resolver. Concurrent lookups of the same name
+    share a single query.
+
+    :param resolver: Resolver to cache, the system resolver by default.
+    :param ttl: Seconds a successful lookup is used for.
+    :param negative_ttl: Seconds a failed lookup is remembered for.
+    :param stale_ttl: Seconds after ``ttl`` during which an expired lookup is
+        still used while it's refreshed. ``0`` disables this.
+    :param maxsize: Number of lookups, and of hosts with statistics, to keep;
+        the least recently used ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        resolver: BaseResolver | None = None,
+        ttl: float = DEFAULT_DNS_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_DNS_TTL,
+        stale_ttl: float = DEFAULT_STALE_DNS_TTL,
+        maxsize: int = 1024,
+    ) -> None:
+        self.resolver = resolver if resolver is not None else SystemResolver()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[_TYPE_KEY, _CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._pending: dict[_TYPE_KEY, _PendingLookup] = {}
+        self._stats: collections.OrderedDict[str | None, collections.Counter[str]] = (
+            collections.OrderedDict()
+        )
+
+    def getaddrinfo(
+        self,
+        host: str | None,
+        port: str | int | None,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[_TYPE_ADDRINFO]:
+        key = (host, port, family, type, proto, flags)
+        with self._lock:
+            entry = self._entries.get(key)
+            stats = self._host_stats(host)
+            now = time.monotonic()
+            if entry is not None and now < entry.expires:
+                self._entries.move_to_end(key)
+                if entry.error is not None:
+                    stats["negative_hits"] += 1
+                    raise socket.gaierror(*entry.error.args)
+                stats["hits"] += 1
+                return list(entry.result)  # type: ignore[arg-type]
+
+            if (
+                entry is not None
+                and entry.result is not None
+                and now < entry.stale_until
+            ):
+                self._entries.move_to_end(key)
+                stats["stale_hits"] += 1
+                if not entry.refreshing:
+                    entry.refreshing = True
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, entry),
+                        name="urllib3-dns-refresh",
+                        daemon=True,
+                    ).start()
+                return list(entry.result)
+
+            pending = self._pending.get(key)
+            if pending is None:
+                stats["misses"] += 1
+                leader = self._pending[key] = _PendingLookup()
+
+        if pending is not None:
+            # Somebody else is looking the name up already, share their
+            # outcome whether or not it was cached.
+            pending.done.wait()
+            if pending.result is None and pending.error is None:
+                # The lookup was interrupted, e.g. by KeyboardInterrupt.
+                return self.getaddrinfo(host, port, family, type, proto, flags)
+            with self._lock:
+                stats = self._host_stats(host)
+                if pending.error is not None:
+                    stats["negative_hits"] += 1
+                else:
+                    stats["hits"] += 1
+            if isinstance(pending.error, socket.gaierror):
+                raise socket.gaierror(*pending.error.args)
+            if pending.error is not None:
+                raise pending.error
+            return list(pending.result)  # type: ignore[arg-type]
+
+        try:
+            leader.result = self._lookup(key)
+            return list(leader.result)
+        except Exception as e:
+            leader.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+            leader.done.set()
+
+    def _lookup(self, key: _TYPE_KEY) -> list[_TYPE_ADDRINFO]:
+        try:
+            result = self.resolver.getaddrinfo(*key)
+        except socket.gaierror as e:
+            with self._lock:
+                self._host_stats(key[0])["errors"] += 1
+                if e.errno != socket.EAI_AGAIN and self.negative_ttl > 0:
+                    expires = time.monotonic() + self.negative_ttl
+                    self._store(key, _CacheEntry(None, e, expires, expires))
+            raise
+        self._store_result(key, result)
+        return result
+
+    def _refresh(self, key: _TYPE_KEY, entry: _CacheEntry) -> None:
+        try:
+            result = self.resolver.getaddrinfo(*key)
+        except Exception as e:
+            # Keep using the stale result until it runs out.
+            log.debug("Refreshing DNS entry for %s failed: %s", key[0], e)
+            with self._lock:
+                self._host_stats(key[0])["errors"] += 1
+                entry.refreshing = False
+            return
+        with self._lock:
+            self._host_stats(key[0])["refreshes"] += 1
+        self._store_result(key, result)
+
+    def _store_result(self, key: _TYPE_KEY, result: list[_TYPE_ADDRINFO]) -> None:
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            self._store(
+                key, _CacheEntry(result, None, expires, expires + self.stale_ttl)
+            )
+
+    def _store(self, key: _TYPE_KEY, entry: _CacheEntry) -> None:
+        # Must be called with self._lock held.
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _host_stats(self, host: str | None) -> collections.Counter[str]:
+        # Must be called with self._lock held.
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = collections.Counter()
+            while len(self._stats) > self.maxsize:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(host)
+        return stats
+
+    def stats(self, host: str | None = None) -> dict[str, typing.Any]:
+        """
+        Lookup counts per host: ``hits``, ``stale_hits``, ``negative_hits``,
+        ``misses``, background ``refreshes`` and resolver ``errors``. With
+        ``host`` only that host's counts are returned. Only the ``maxsize``
+        most recently looked up hosts are counted.
+        """
+        names = ("hits", "stale_hits", "negative_hits", "misses", "refreshes", "errors")
+        with self._lock:
+            if host is not None:
+                counts = self._stats.get(host, collections.Counter())
+                return {name: counts[name] for name in names}
+            return {
+                name: {stat: counts[stat] for stat in names}
+                for name, counts in self._stats.items()
+            }
+
+    def invalidate(self, host: str) -> None:
+        """Forgets all lookups of ``host``."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == host]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forgets all lookups and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
@@ -5,8 +5,10 @@ import hmac
 import os
 import socket
 import sys
+import threading
 import typing
 import warnings
+import weakref
 from binascii import unhexlify
 
 from ..exceptions import ProxySchemeUnsupported, SSLError
@@ -371,6 +373,146 @@ def create_urllib3_context(
     return context
 
 
+# Fully loaded contexts by TLS configuration, see cached_ssl_context().
+_ssl_context_cache: weakref.WeakValueDictionary[typing.Hashable, ssl.SSLContext] = (
+    weakref.WeakValueDictionary()
+)
+_ssl_context_cache_lock = threading.Lock()
+# The arguments each cached context was made with.
+_ssl_context_settings: weakref.WeakKeyDictionary[
+    ssl.SSLContext, dict[str, typing.Any]
+] = weakref.WeakKeyDictionary()
+
+
+def _file_identity(path: str | None) -> tuple[str, int, int] | str | None:
+    # Include the modification time so that an updated CA bundle is loaded again.
+    if not path:
+        return path
+    try:
+        st = os.stat(path)
+    except OSError:
+        return path
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def cached_ssl_context(
+    *,
+    ssl_version: int | str | None = None,
+    cert_reqs: int | str | None = None,
+    ciphers: str | None = None,
+    ssl_minimum_version: int | None = None,
+    ssl_maximum_version: int | None = None,
+    ca_certs: str | None = None,
+    ca_cert_dir: str | None = None,
+    ca_cert_data: None | str | bytes = None,
+    cert_file: str | None = None,
+    key_file: str | None = None,
+    key_password: str | None = None,
+    check_hostname: bool = True,
+) -> ssl.SSLContext:
+    """
+    Returns a context created with :func:`create_urllib3_context` with its CA
+    certificates (the OS defaults if none are given) and client certificate
+    already loaded.
+
+    Contexts are shared process-wide by everyone asking for the same
+    configuration, so that parsing a CA bundle happens once rather than for
+    every pool. The cache only holds weak references: a context is dropped
+    once nothing uses it any more. Callers must not modify the context;
+    connections given a cached context as their ``ssl_context`` use the
+    cached context with their own settings instead.
+
+    :param check_hostname:
+        Set to ``False`` when the caller verifies hostnames itself.
+    """
+    key = (
+        resolve_ssl_version(ssl_version),
+        resolve_cert_reqs(cert_reqs),
+        ciphers,
+        ssl_minimum_version,
+        ssl_maximum_version,
+        _file_identity(ca_certs),
+        _file_identity(ca_cert_dir),
+        ca_cert_data,
+        _file_identity(cert_file),
+        _file_identity(key_file),
+        key_password,
+        check_hostname,
+    )
+    with _ssl_context_cache_lock:
+        context = _ssl_context_cache.get(key)
+        if context is not None:
+            return context
+
+        context = create_urllib3_context(
+            ssl_version=resolve_ssl_version(ssl_version),
+            cert_reqs=resolve_cert_reqs(cert_reqs),
+            ciphers=ciphers,
+            ssl_minimum_version=ssl_minimum_version,
+            ssl_maximum_version=ssl_maximum_version,
+        )
+        if not check_hostname:
+            context.check_hostname = False
+        if ca_certs or ca_cert_dir or ca_cert_data:
+            _load_certs(
+                context,
+                ca_certs=ca_certs,
+                ca_cert_dir=ca_cert_dir,
+                ca_cert_data=ca_cert_data,
+            )
+        elif hasattr(context, "load_default_certs"):
+            context.load_default_certs()
+        _load_certs(
+            context, certfile=cert_file, keyfile=key_file, key_password=key_password
+        )
+        _ssl_context_cache[key] = context
+        _ssl_context_settings[context] = {
+            "ssl_version": ssl_version,
+            "cert_reqs": cert_reqs,
+            "ciphers": ciphers,
+            "ssl_minimum_version": ssl_minimum_version,
+            "ssl_maximum_version": ssl_maximum_version,
+            "ca_certs": ca_certs,
+            "ca_cert_dir": ca_cert_dir,
+            "ca_cert_data": ca_cert_data,
+            "cert_file": cert_file,
+            "key_file": key_file,
+            "key_password": key_password,
+            "check_hostname": check_hostname,
+        }
+        return context
+
+
+def _reconfigure_cached_ssl_context(
+    context: ssl.SSLContext,
+    cert_reqs: int,
+    check_hostname: bool,
+    **certs: typing.Any,
+) -> ssl.SSLContext | None:
+    """
+    Returns the context made by :func:`cached_ssl_context` with the settings of
+    ``context``, changed to ``cert_reqs``, without OpenSSL checking hostnames
+    unless ``check_hostname`` is set, and with the CA and client certificates
+    in ``certs`` that aren't ``None``. This is ``context`` itself if nothing
+    changes.
+
+    Cached contexts are shared, so connections given one never modify it.
+
+    :returns: ``None`` if ``context`` didn't come from :func:`cached_ssl_context`.
+    """
+    settings = _ssl_context_settings.get(context)
+    if settings is None:
+        return None
+    return cached_ssl_context(
+        **{
+            **settings,
+            **{name: value for name, value in certs.items() if value is not None},
+            "cert_reqs": cert_reqs,
+            "check_hostname": settings["check_hostname"] and check_hostname,
+        }
+    )
+
+
 @typing.overload
 def ssl_wrap_socket(
     sock: socket.socket,
@@ -386,6 +528,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: typing.Literal[False] = ...,
+    session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket: ...
 
 
@@ -404,6 +547,7 @@ def ssl_wrap_socket(
     key_password: str | None = ...,
     ca_cert_data: None | str | bytes = ...,
     tls_in_tls: bool = ...,
+    session: ssl.SSLSession | None = ...,
 ) -> ssl.SSLSocket | SSLTransportType: ...
 
 
@@ -421,6 +565,7 @@ def ssl_wrap_socket(
     key_password: str | None = None,
     ca_cert_data: None | str | bytes = None,
     tls_in_tls: bool = False,
+    session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     """
     All arguments except for server_hostname, ssl_context, tls_in_tls, ca_cert_data and
@@ -446,6 +591,9 @@ def ssl_wrap_socket(
         passing as the cadata parameter to SSLContext.load_verify_locations()
     :param tls_in_tls:
         Use SSLTransport to wrap the existing socket.
+    :param session:
+        A TLS session from an earlier connection made with the same
+        ``ssl_context`` to resume. Not supported with ``tls_in_tls``.
     """
     context = ssl_context
     if context is None:
@@ -454,15 +602,44 @@ def ssl_wrap_socket(
         context = create_urllib3_context(ssl_version, cert_reqs, ciphers=ciphers)
 
     if ca_certs or ca_cert_dir or ca_cert_data:
-        try:
-            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
-        except OSError as e:
-            raise SSLError(e) from e
+        _load_certs(
+            context,
+            ca_certs=ca_certs,
+            ca_cert_dir=ca_cert_dir,
+            ca_cert_data=ca_cert_data,
+        )
 
     elif ssl_context is None and hasattr(context, "load_default_certs"):
         # try to load OS default certs; works well on Windows.
         context.load_default_certs()
 
+    _load_certs(context, certfile=certfile, keyfile=keyfile, key_password=key_password)
+
+    context.set_alpn_protocols(ALPN_PROTOCOLS)
+
+    ssl_sock = _ssl_wrap_socket_impl(
+        sock, context, tls_in_tls, server_hostname, session=session
+    )
+    return ssl_sock
+
+
+def _load_certs(
+    context: ssl.SSLContext,
+    *,
+    ca_certs: str | None = None,
+    ca_cert_dir: str | None = None,
+    ca_cert_data: None | str | bytes = None,
+    certfile: str | None = None,
+    keyfile: str | None = None,
+    key_password: str | None = None,
+) -> None:
+    """Loads CA certificates and the client certificate into a context."""
+    if ca_certs or ca_cert_dir or ca_cert_data:
+        try:
+            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
+        except OSError as e:
+            raise SSLError(e) from e
+
     # Attempt to detect if we get the goofy behavior of the
     # keyfile being encrypted and OpenSSL asking for the
     # passphrase via the terminal and instead error out.
@@ -475,11 +652,6 @@ def ssl_wrap_socket(
         else:
             context.load_cert_chain(certfile, keyfile, key_password)
 
-    context.set_alpn_protocols(ALPN_PROTOCOLS)
-
-    ssl_sock = _ssl_wrap_socket_impl(sock, context, tls_in_tls, server_hostname)
-    return ssl_sock
-
 
 def is_ipaddress(hostname: str | bytes) -> bool:
     """Detects whether the hostname given is an IPv4 or IPv6 address.
@@ -510,6 +682,7 @@ def _ssl_wrap_socket_impl(
     ssl_context: ssl.SSLContext,
     tls_in_tls: bool,
     server_hostname: str | None = None,
+    session: ssl.SSLSession | None = None,
 ) -> ssl.SSLSocket | SSLTransportType:
     if tls_in_tls:
         if not SSLTransport:
@@ -521,4 +694,8 @@ def _ssl_wrap_socket_impl(
         SSLTransport._validate_ssl_context_for_tls_in_tls(ssl_context)
         return SSLTransport(sock, ssl_context, server_hostname)
 
+    if session is not None:
+        return ssl_context.wrap_socket(
+            sock, server_hostname=server_hostname, session=session
+        )
     return ssl_context.wrap_socket(sock, server_hostname=server_hostname)
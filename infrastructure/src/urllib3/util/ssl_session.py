@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import collections
+import threading
+import typing
+import weakref
+
+if typing.TYPE_CHECKING:
+    import ssl
+
+    from .ssltransport import SSLTransport
+
+_TYPE_ORIGIN = tuple[str, typing.Optional[int]]
+
+
+class TLSSessionCache:
+    """
+    Remembers TLS sessions so that new connections to an origin can resume
+    them instead of doing a full handshake, which saves a round trip and the
+    key exchange.
+
+    A session can only be resumed with the :class:`ssl.SSLContext` that
+    created it, so sessions are kept per ``(host, port, context)``. For
+    connections without a user-supplied context the cache also holds on to
+    the shared context for their TLS settings, so that it outlives the
+    connections.
+
+    :param maxsize: Number of sessions to keep; the least recently used ones
+        are dropped first.
+    """
+
+    def __init__(self, maxsize: int = 100) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._sessions: collections.OrderedDict[
+            tuple[str, int | None, int],
+            tuple[weakref.ReferenceType[ssl.SSLContext], ssl.SSLSession],
+        ] = collections.OrderedDict()
+        self._contexts: dict[typing.Hashable, ssl.SSLContext] = {}
+        self._full_handshakes = 0
+        self._resumed_handshakes = 0
+
+    def default_context(
+        self,
+        settings: typing.Hashable,
+        factory: typing.Callable[[], ssl.SSLContext],
+    ) -> ssl.SSLContext:
+        """
+        Returns the context for connections with these TLS settings, getting
+        it from ``factory`` the first time. The factory must return a fully
+        configured context since it's used as-is afterwards.
+        """
+        with self._lock:
+            context = self._contexts.get(settings)
+            if context is None:
+                context = self._contexts[settings] = factory()
+            return context
+
+    def get(
+        self, origin: _TYPE_ORIGIN, context: ssl.SSLContext
+    ) -> ssl.SSLSession | None:
+        """Returns a session to resume for ``origin`` with ``context``, if any."""
+        key = (*origin, id(context))
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return None
+            # The id may have been reused by a newer context.
+            if entry[0]() is not context:
+                del self._sessions[key]
+                return None
+            self._sessions.move_to_end(key)
+            return entry[1]
+
+    def put(
+        self,
+        origin: _TYPE_ORIGIN,
+        context: ssl.SSLContext,
+        sock: ssl.SSLSocket | SSLTransport,
+    ) -> bool:
+        """
+        Stores the session of an established connection if it can be resumed.
+        Returns whether it was stored.
+        """
+        session = getattr(sock, "session", None)
+        if session is None:
+            return False
+        # TLS 1.3 sessions are only resumable once the server's ticket has
+        # arrived, which happens after the handshake.
+        if not session.has_ticket and (sock.version() == "TLSv1.3" or not session.id):
+            return False
+        key = (*origin, id(context))
+        with self._lock:
+            self._sessions[key] = (weakref.ref(context), session)
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+        return True
+
+    def record_handshake(self, sock: ssl.SSLSocket | SSLTransport) -> bool:
+        """Counts a completed handshake and returns whether it resumed a session."""
+        resumed = bool(getattr(sock, "session_reused", False))
+        with self._lock:
+            if resumed:
+                self._resumed_handshakes += 1
+            else:
+                self._full_handshakes += 1
+        return resumed
+
+    def stats(self) -> dict[str, int]:
+        """Numbers of full and resumed handshakes and of sessions kept."""
+        with self._lock:
+            return {
+                "full_handshakes": self._full_handshakes,
+                "resumed_handshakes": self._resumed_handshakes,
+                "sessions": len(self._sessions),
+            }
+
+    def clear(self) -> None:
+        """Forgets all sessions and shared contexts."""
+        with self._lock:
+            self._sessions.clear()
+            self._contexts.clear()
@@ -0,0 +1,23 @@
+import shutil
+import subprocess
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def certs(tmp_path_factory):
+    """A throwaway self-signed certificate for localhost, as (certfile, keyfile)."""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is needed to create the test certificate")
+    directory = tmp_path_factory.mktemp("certs")
+    certfile, keyfile = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", str(keyfile), "-out", str(certfile),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return str(certfile), str(keyfile)
@@ -0,0 +1,53 @@
+from jarvis.core.memory.activity import LOG_MAGIC, ActivityStore
+
+
+def _log_path(store):
+    return store.root / "activity-0.log"
+
+
+def test_append_after_torn_record(tmp_path):
+    store = ActivityStore(tmp_path, compact_bytes=0)
+    store.append("jarvis", "before torn", date="2025-01-01")
+    with open(_log_path(store), "ab") as f:
+        # A length prefix without its body, as a crash mid-write leaves it
+        f.write(b"\x10\x00\x00")
+
+    store.append("jarvis", "after torn", date="2025-01-02")
+
+    descriptions = [activity["description"] for activity in store.query("jarvis", newest_first=False)]
+    assert descriptions == ["before torn", "after torn"]
+
+
+def test_append_after_torn_record_from_another_process(tmp_path):
+    store = ActivityStore(tmp_path, compact_bytes=0)
+    store.append("jarvis", "first", date="2025-01-01")
+    # Another writer appends and then crashes mid-record
+    ActivityStore(tmp_path, compact_bytes=0).append("jarvis", "second", date="2025-01-02")
+    with open(_log_path(store), "ab") as f:
+        f.write(b"\x30\x00\x00\x00\xde\xad")
+
+    store.append("jarvis", "third", date="2025-01-03")
+
+    descriptions = [activity["description"] for activity in store.query("jarvis", newest_first=False)]
+    assert descriptions == ["first", "second", "third"]
+
+
+def test_compact_keeps_records_after_torn_record(tmp_path):
+    store = ActivityStore(tmp_path, compact_bytes=0)
+    store.append("jarvis", "before torn", date="2025-01-01")
+    with open(_log_path(store), "ab") as f:
+        f.write(b"\x10\x00\x00")
+    store.append("jarvis", "after torn", date="2025-01-02")
+
+    assert store.compact() == {"records": 2, "merged": 2}
+    assert len(store.query("jarvis")) == 2
+
+
+def test_torn_log_magic_is_rewritten(tmp_path):
+    store = ActivityStore(tmp_path, compact_bytes=0)
+    _log_path(store).write_bytes(LOG_MAGIC[:3])
+
+    store.append("jarvis", "after torn magic", date="2025-01-01")
+
+    assert _log_path(store).read_bytes().startswith(LOG_MAGIC)
+    assert [activity["description"] for activity in store.query()] == ["after torn magic"]
@@ -0,0 +1,91 @@
+import asyncio
+import io
+
+import pytest
+
+from urllib3.aio import AsyncHTTPConnectionPool
+from urllib3.exceptions import ReadTimeoutError
+
+
+BODY = bytes(range(256)) * 1000
+
+
+async def _handle(reader, writer):
+    """Answers /ok and /body in full; everything else stalls halfway through the body."""
+    while True:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            break
+        if not request.startswith((b"GET /ok ", b"GET /body ")):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n" + b"x" * 10)
+            await writer.drain()
+            await asyncio.sleep(5)
+            break
+        body = b"ok" if request.startswith(b"GET /ok ") else BODY
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        await writer.drain()
+    writer.close()
+
+
+def _run(test):
+    async def main():
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        async with server:
+            await test(server.sockets[0].getsockname()[1])
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("preload_content", [True, False])
+def test_read_timeout_names_the_pool(preload_content):
+    async def test(port):
+        pool = AsyncHTTPConnectionPool("127.0.0.1", port, maxsize=2, timeout=0.2, retries=False)
+        with pytest.raises(ReadTimeoutError) as info:
+            response = await pool.request("GET", "/stall", preload_content=preload_content)
+            await response.read()
+
+        assert info.value.pool is pool
+        assert f"127.0.0.1', port={port}" in str(info.value)
+        # The broken connection was replaced exactly once
+        assert pool.pool.qsize() == 2
+        assert (await pool.request("GET", "/ok")).data == b"ok"
+        assert pool.pool.qsize() == 2
+        pool.close()
+
+    _run(test)
+
+
+def test_readinto():
+    async def test(port):
+        pool = AsyncHTTPConnectionPool("127.0.0.1", port)
+        response = await pool.request("GET", "/body", preload_content=False)
+        buf = bytearray(100_000)
+
+        received = bytearray()
+        while n := await response.readinto(buf):
+            received += buf[:n]
+
+        assert received == BODY
+        pool.close()
+
+    _run(test)
+
+
+def test_stream_into():
+    async def test(port):
+        pool = AsyncHTTPConnectionPool("127.0.0.1", port)
+
+        response = await pool.request("GET", "/body", preload_content=False)
+        f = io.BytesIO()
+        assert await response.stream_into(f, buffer_size=4096) == len(BODY)
+        assert f.getvalue() == BODY
+
+        response = await pool.request("GET", "/body", preload_content=False)
+        buf = bytearray(1000)
+        assert await response.stream_into(buf) == 1000
+        assert buf == BODY[:1000]
+        response.close()
+        pool.close()
+
+    _run(test)
@@ -0,0 +1,146 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from jarvis.core.coalescing import SingleFlight
+
+
+class Call:
+    """Counts calls, each of which takes a while and may raise."""
+
+    def __init__(self, error=None, delay=0.2):
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"value": value}
+
+
+def _do_concurrently(flights, call, keys):
+    barrier = threading.Barrier(len(keys))
+
+    def do(key):
+        barrier.wait()
+        try:
+            return flights.do(key, call, key)
+        except Exception as e:
+            return e
+
+    with concurrent.futures.ThreadPoolExecutor(len(keys)) as executor:
+        return list(executor.map(do, keys))
+
+
+def _do_async_concurrently(flights, call, keys):
+    async def main():
+        async def do(key):
+            try:
+                return await flights.do_async(key, call, key)
+            except Exception as e:
+                return e
+
+        return await asyncio.gather(*(do(key) for key in keys))
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("run", [_do_concurrently, _do_async_concurrently])
+def test_identical_calls_share_one_call(run):
+    flights = SingleFlight()
+    call = Call()
+
+    results = run(flights, call, ["a"] * 10)
+
+    assert call.calls == 1
+    assert results == [{"value": "a"}] * 10
+    # Every caller gets its own dict
+    assert len({id(result) for result in results}) == 10
+    assert flights.stats() == {"calls": 10, "shared": 9, "in_flight": 0}
+
+
+@pytest.mark.parametrize("run", [_do_concurrently, _do_async_concurrently])
+def test_errors_reach_every_caller(run):
+    flights = SingleFlight()
+    error = RuntimeError("quota exceeded")
+    call = Call(error=error)
+
+    results = run(flights, call, ["a"] * 10)
+
+    assert call.calls == 1
+    assert all(result is error for result in results)
+    # The key is free again, so the next call is made
+    with pytest.raises(RuntimeError):
+        flights.do("a", call, "a")
+    assert call.calls == 2
+
+
+@pytest.mark.parametrize("run", [_do_concurrently, _do_async_concurrently])
+def test_different_keys_do_not_share(run):
+    flights = SingleFlight()
+    call = Call()
+
+    results = run(flights, call, ["a", "b", "c"] * 3)
+
+    assert call.calls == 3
+    assert results == [{"value": key} for key in ["a", "b", "c"] * 3]
+
+
+def test_threads_and_tasks_share_one_call():
+    flights = SingleFlight()
+    call = Call(delay=0.3)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        in_thread = executor.submit(flights.do, "a", call, "a")
+        time.sleep(0.1)
+        in_task = _do_async_concurrently(flights, call, ["a"] * 3)
+
+    assert call.calls == 1
+    assert in_thread.result() == {"value": "a"}
+    assert in_task == [{"value": "a"}] * 3
+
+
+def test_voice_callers_saving_elsewhere_share_one_call(tmp_path, monkeypatch):
+    pytest.importorskip("openai")
+    pytest.importorskip("dotenv")
+    from jarvis.core.voice_generation import generator
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    calls = []
+
+    def synthesize(text, voice, model, api_key, response_format, speed):
+        calls.append(api_key)
+        time.sleep(0.2)
+        return {"success": True, "audio": b"ID3 audio", "voice": voice, "model": model,
+                "format": response_format, "speed": speed}
+
+    monkeypatch.setattr(generator, "_synthesize", synthesize)
+    targets = [(tmp_path / "a", "jarvis_response"), (tmp_path / "b", "jarvis"), (None, "")]
+    barrier = threading.Barrier(len(targets))
+
+    def speak(target):
+        barrier.wait()
+        return generator.generate_voice("Hello  there", voice="echo", output_dir=target[0], filename_prefix=target[1])
+
+    with concurrent.futures.ThreadPoolExecutor(len(targets)) as executor:
+        results = list(executor.map(speak, targets))
+
+    assert calls == [None]
+    assert results[2]["saved_path"] is None
+    for (output_dir, prefix), result in zip(targets[:2], results):
+        saved = tmp_path / result["saved_path"]
+        assert saved.parent == output_dir and saved.name.startswith(prefix + "_")
+        assert saved.read_bytes() == b"ID3 audio"
+
+    # A different voice or account is a different call
+    generator.generate_voice("Hello there", voice="nova")
+    generator.generate_voice("Hello there", voice="echo", api_key="sk-other")
+    assert calls == [None, None, "sk-other"]
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from jarvis.core.memory import paths, recall
+from jarvis.core.memory.context import ContextLoader
+
+
+SECTIONS = [
+    {"name": "identity", "title": "Identity", "files": ["identity.md"]},
+    {"name": "relevant_memories", "title": "Relevant Memories", "recall": 2, "max_chars": 2000},
+]
+
+
+@pytest.fixture
+def knowledge(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+    root = tmp_path / "knowledge"
+    (root / "episodic_memory" / "sessions").mkdir(parents=True)
+    (root / "identity.md").write_text("I am Jarvis.")
+    (root / "episodic_memory" / "sessions" / "20250101_voice.md").write_text(
+        "# Voice\n\nWe switched the voice pipeline to streaming playback."
+    )
+    return root
+
+
+def _loader(knowledge, tmp_path):
+    return ContextLoader(knowledge, tmp_path / "context.json", sections=SECTIONS)
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_touched_file_saves_its_fingerprint_without_rebuilding(knowledge, tmp_path, monkeypatch):
+    _loader(knowledge, tmp_path).build()
+    identity = knowledge / "identity.md"
+    _touch(identity)
+
+    result = _loader(knowledge, tmp_path).build()
+    assert result["rebuilt"] == []
+    assert result["cached"]
+
+    # The refreshed fingerprint was saved, so the next session doesn't read the file
+    reads = []
+    read_text = type(identity).read_text
+    monkeypatch.setattr(type(identity), "read_text", lambda self, *a, **kw: reads.append(self) or read_text(self, *a, **kw))
+    result = _loader(knowledge, tmp_path).build()
+    assert reads == []
+    assert result["rebuilt"] == []
+    assert "I am Jarvis." in result["text"]
+
+
+def test_changed_file_rebuilds_its_section(knowledge, tmp_path):
+    _loader(knowledge, tmp_path).build()
+    (knowledge / "identity.md").write_text("I am Jarvis, and I speak.")
+
+    result = _loader(knowledge, tmp_path).build()
+    assert result["rebuilt"] == ["identity"]
+    assert not result["cached"]
+    assert "I am Jarvis, and I speak." in result["text"]
+
+
+def test_recall_section_is_cached_by_query_and_index(knowledge, tmp_path, monkeypatch):
+    result = _loader(knowledge, tmp_path).build(query="voice streaming")
+    assert result["rebuilt"] == ["identity", "relevant_memories"]
+    assert "streaming playback" in result["text"]
+
+    calls = []
+    for name in ("update", "search"):
+        method = getattr(recall.MemoryRecall, name)
+        monkeypatch.setattr(
+            recall.MemoryRecall, name, lambda self, *a, _name=name, _method=method, **kw: calls.append(_name) or _method(self, *a, **kw)
+        )
+
+    result = _loader(knowledge, tmp_path).build(query="voice streaming")
+    assert calls == []
+    assert result["rebuilt"] == []
+    assert result["cached"]
+
+    # A new query searches the existing index without walking the tree
+    _loader(knowledge, tmp_path).build(query="voice")
+    assert calls == ["search"]
+
+    # So does the same query once the index was updated
+    (knowledge / "episodic_memory" / "sessions" / "20250102_voice.md").write_text("# Voice\n\nThe voice got louder.")
+    recall.MemoryRecall(knowledge).update()
+    calls.clear()
+    result = _loader(knowledge, tmp_path).build(query="voice")
+    assert calls == ["search"]
+    assert result["rebuilt"] == ["relevant_memories"]
+    assert "louder" in result["text"]
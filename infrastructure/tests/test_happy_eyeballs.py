@@ -0,0 +1,142 @@
+import errno
+import socket
+import time
+
+import pytest
+
+import urllib3
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util import connection
+from urllib3.util.resolver import StaticResolver
+
+LIVE = "127.0.0.1"
+# Listens with a full accept queue, so connecting never completes
+DEAD = "127.0.0.2"
+DEAD_TOO = "127.0.0.3"
+# Nothing listens there, so connecting is refused at once
+REFUSED = "127.0.0.4"
+REFUSED_TOO = "127.0.0.5"
+
+
+@pytest.fixture(scope="module")
+def port():
+    live = socket.socket()
+    live.bind((LIVE, 0))
+    live.listen(8)
+    port = live.getsockname()[1]
+
+    sockets = [live]
+    for address in (DEAD, DEAD_TOO):
+        dead = socket.socket()
+        dead.bind((address, port))
+        dead.listen(0)
+        sockets.append(dead)
+        for _ in range(3):
+            filler = socket.socket()
+            filler.setblocking(False)
+            filler.connect_ex((address, port))
+            sockets.append(filler)
+    time.sleep(0.1)
+    yield port
+    for sock in sockets:
+        sock.close()
+
+
+def _connect(port, addresses, timeout=5.0, delay=0.1):
+    attempts = []
+    resolver = StaticResolver({"example.test": addresses})
+    start = time.monotonic()
+    try:
+        sock = connection.create_connection(
+            ("example.test", port),
+            timeout=timeout,
+            happy_eyeballs_delay=delay,
+            attempts=attempts,
+            resolver=resolver,
+        )
+    except OSError as e:
+        return e, attempts, time.monotonic() - start
+    return sock, attempts, time.monotonic() - start
+
+
+class RecordingSocket(socket.socket):
+    created = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created.append(self)
+
+
+def test_live_address_wins_over_a_dead_one(port, monkeypatch):
+    RecordingSocket.created = []
+    monkeypatch.setattr(connection.socket, "socket", RecordingSocket)
+
+    sock, attempts, elapsed = _connect(port, [DEAD, LIVE])
+    monkeypatch.undo()
+
+    assert sock.getpeername() == (LIVE, port)
+    assert sock.gettimeout() == 5.0
+    assert elapsed < 1.0
+    assert [(a.sockaddr[0], a.outcome) for a in attempts] == [
+        (DEAD, "cancelled"),
+        (LIVE, "connected"),
+    ]
+    assert attempts[0].started < 0.05
+    assert attempts[0].elapsed >= 0.1
+    assert 0.1 <= attempts[1].started < 0.5
+
+    # The losing attempt was closed
+    assert RecordingSocket.created[1] is sock
+    assert RecordingSocket.created[0].fileno() == -1
+    sock.close()
+
+
+def test_refused_address_moves_on_at_once(port):
+    sock, attempts, elapsed = _connect(port, [REFUSED, LIVE], delay=5.0)
+
+    assert sock.getpeername() == (LIVE, port)
+    assert elapsed < 1.0
+    assert [(a.sockaddr[0], a.outcome) for a in attempts] == [
+        (REFUSED, "failed"),
+        (LIVE, "connected"),
+    ]
+    assert attempts[0].error.errno == errno.ECONNREFUSED
+    assert attempts[1].started < 0.5
+    sock.close()
+
+
+def test_all_addresses_failing_raises_the_last_error(port):
+    error, attempts, _ = _connect(port, [REFUSED, REFUSED_TOO])
+    assert isinstance(error, ConnectionRefusedError)
+    assert [a.outcome for a in attempts] == ["failed", "failed"]
+
+    # The dead address times out after the refusal
+    error, attempts, elapsed = _connect(port, [DEAD, REFUSED], timeout=0.3)
+    assert isinstance(error, socket.timeout)
+    assert [(a.sockaddr[0], a.outcome) for a in attempts] == [
+        (DEAD, "failed"),
+        (REFUSED, "failed"),
+    ]
+    assert 0.3 <= elapsed < 1.0
+
+
+def test_pool_raises_connect_timeout(port):
+    pool = urllib3.HTTPConnectionPool(
+        "example.test",
+        port,
+        timeout=urllib3.Timeout(connect=0.3),
+        retries=False,
+        happy_eyeballs_delay=0.05,
+        resolver=StaticResolver({"example.test": [DEAD, DEAD_TOO]}),
+    )
+    conn = pool._new_conn()
+
+    with pytest.raises(ConnectTimeoutError):
+        conn.connect()
+
+    assert [(a.sockaddr[0], a.outcome) for a in conn.connect_attempts] == [
+        (DEAD, "failed"),
+        (DEAD_TOO, "failed"),
+    ]
+    assert all(isinstance(a.error, socket.timeout) for a in conn.connect_attempts)
+    pool.close()
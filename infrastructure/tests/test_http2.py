@@ -0,0 +1,298 @@
+import concurrent.futures
+import hashlib
+import socket
+import ssl
+import threading
+import time
+
+import pytest
+
+h2 = pytest.importorskip("h2")
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.errors  # noqa: E402
+import h2.events  # noqa: E402
+import h2.exceptions  # noqa: E402
+import h2.settings  # noqa: E402
+
+import urllib3  # noqa: E402
+import urllib3.http2  # noqa: E402
+from urllib3.exceptions import ProtocolError  # noqa: E402
+
+BIG = bytes(range(256)) * (4 * 1024 * 4)  # 4 MiB
+
+
+class H2Server:
+    """
+    A small HTTP/2 server on a background thread, enough to exercise the
+    multiplexing client.
+
+    Routes:
+        /sleep/<seconds>/<tag>  responds with the path after sleeping
+        /big                    responds with BIG
+        /upload                 (POST) responds with the sha256 of the body
+        /reset                  resets the stream
+        /goaway/<tag>           the first time, refuses the stream with GOAWAY and
+                                closes the connection; responds with the path after that
+        anything else           responds with the path
+    """
+
+    def __init__(self, certfile, keyfile):
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.context.load_cert_chain(certfile, keyfile)
+        self.context.set_alpn_protocols(["h2"])
+        self.listener = socket.socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(16)
+        self.port = self.listener.getsockname()[1]
+        self.connections = 0
+        self.refused = set()
+        self.closed = False
+
+    def start(self):
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def stop(self):
+        self.closed = True
+        self.listener.close()
+
+    def _accept(self):
+        while not self.closed:
+            try:
+                sock, _ = self.listener.accept()
+                sock = self.context.wrap_socket(sock, server_side=True)
+            except OSError:
+                continue
+            self.connections += 1
+            threading.Thread(target=_H2Handler(self, sock).run, daemon=True).start()
+
+
+class _H2Handler:
+    """Serves one connection, answering each request on its own thread."""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.lock = threading.Lock()
+        config = h2.config.H2Configuration(client_side=False)
+        self.conn = h2.connection.H2Connection(config=config)
+        self.conn.local_settings = h2.settings.Settings(
+            client=False, initial_values={h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 50}
+        )
+        self.requests = {}
+        self.pending = {}
+
+    def run(self):
+        with self.lock:
+            self.conn.initiate_connection()
+            self.sock.sendall(self.conn.data_to_send())
+        try:
+            while True:
+                try:
+                    data = self.sock.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with self.lock:
+                    try:
+                        events = self.conn.receive_data(data)
+                    except h2.exceptions.ProtocolError:
+                        return
+                    for event in events:
+                        self._dispatch(event)
+                    self._flush()
+        finally:
+            self.sock.close()
+
+    def _dispatch(self, event):
+        if isinstance(event, h2.events.RequestReceived):
+            self.requests[event.stream_id] = (dict(event.headers), bytearray())
+        elif isinstance(event, h2.events.DataReceived):
+            self.requests[event.stream_id][1].extend(event.data)
+            self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+        elif isinstance(event, h2.events.StreamEnded):
+            self._start(event.stream_id)
+        elif isinstance(event, h2.events.StreamReset):
+            self.pending.pop(event.stream_id, None)
+
+    def _start(self, stream_id):
+        headers, body = self.requests.pop(stream_id)
+        path = headers[b":path"].decode()
+        threading.Thread(target=self._respond, args=(stream_id, path, bytes(body)), daemon=True).start()
+
+    def _respond(self, stream_id, path, body):
+        if path.startswith("/sleep/"):
+            time.sleep(float(path.split("/")[2]))
+        if path == "/reset":
+            with self.lock:
+                self.conn.reset_stream(stream_id, h2.errors.ErrorCodes.INTERNAL_ERROR)
+                self.sock.sendall(self.conn.data_to_send())
+            return
+        if path.startswith("/goaway/") and path not in self.server.refused:
+            self.server.refused.add(path)
+            with self.lock:
+                self.conn.close_connection(last_stream_id=stream_id - 2)
+                self.sock.sendall(self.conn.data_to_send())
+                # Only the reading thread closes the socket, so its descriptor
+                # can't be reused while recv() still blocks on it
+                self.sock.shutdown(socket.SHUT_RDWR)
+            return
+
+        if path == "/big":
+            data = BIG
+        elif path == "/upload":
+            data = hashlib.sha256(body).hexdigest().encode()
+        else:
+            data = path.encode()
+        with self.lock:
+            self.conn.send_headers(stream_id, [(":status", "200"), ("content-length", str(len(data)))])
+            self.pending[stream_id] = memoryview(data)
+            self._flush()
+
+    def _flush(self):
+        # Send as much of every pending body as flow control allows
+        for stream_id, view in list(self.pending.items()):
+            try:
+                while view:
+                    size = min(
+                        self.conn.local_flow_control_window(stream_id),
+                        self.conn.max_outbound_frame_size,
+                        len(view),
+                    )
+                    if size <= 0:
+                        break
+                    self.conn.send_data(stream_id, view[:size].tobytes())
+                    view = view[size:]
+                if view:
+                    self.pending[stream_id] = view
+                else:
+                    self.conn.end_stream(stream_id)
+                    del self.pending[stream_id]
+            except h2.exceptions.StreamClosedError:
+                self.pending.pop(stream_id, None)
+        try:
+            self.sock.sendall(self.conn.data_to_send())
+        except OSError:
+            pass
+
+
+@pytest.fixture(scope="module")
+def server(certs):
+    server = H2Server(*certs)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def http(server, certs):
+    """A PoolManager that speaks HTTP/2, with at most one connection per host."""
+    urllib3.http2.inject_into_urllib3()
+    manager = urllib3.PoolManager(ca_certs=certs[0], maxsize=1)
+    try:
+        yield manager
+    finally:
+        manager.clear()
+        urllib3.http2.extract_from_urllib3()
+
+
+def _url(server, path):
+    return f"https://localhost:{server.port}{path}"
+
+
+def _pool(http, server):
+    return http.connection_from_url(_url(server, "/"))
+
+
+def test_negotiates_http2(http, server):
+    response = http.request("GET", _url(server, "/hello"))
+
+    assert response.status == 200
+    assert response.version == 20
+    assert response.data == b"/hello"
+
+
+def test_concurrent_requests_share_one_connection(http, server):
+    http.request("GET", _url(server, "/warmup"))
+    connections = server.connections
+
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(10) as executor:
+        bodies = list(
+            executor.map(lambda i: http.request("GET", _url(server, f"/sleep/0.5/{i}")).data, range(10))
+        )
+    elapsed = time.monotonic() - start
+
+    assert bodies == [f"/sleep/0.5/{i}".encode() for i in range(10)]
+    # Serialized, the requests would take 5 seconds
+    assert elapsed < 2.5
+    assert server.connections == connections
+    assert _pool(http, server).num_connections == 1
+
+
+def test_large_upload(http, server):
+    body = BIG * 2
+
+    response = http.request("POST", _url(server, "/upload"), body=body)
+
+    assert response.data == hashlib.sha256(body).hexdigest().encode()
+
+
+def test_streamed_download(http, server):
+    response = http.request("GET", _url(server, "/big"), preload_content=False)
+
+    received = bytearray()
+    for chunk in response.stream(64 * 1024):
+        assert len(chunk) <= 64 * 1024
+        received.extend(chunk)
+    response.release_conn()
+
+    assert received == BIG
+
+
+def test_partial_read_then_release(http, server):
+    http.request("GET", _url(server, "/warmup"))
+    connections = server.connections
+    pool = _pool(http, server)
+
+    response = http.request("GET", _url(server, "/big"), preload_content=False)
+    assert response.read(10) == BIG[:10]
+    response.release_conn()
+
+    assert pool._sessions[0].active_streams == 0
+    # The abandoned stream is cancelled; the connection keeps serving requests
+    assert http.request("GET", _url(server, "/after")).data == b"/after"
+    assert server.connections == connections
+
+
+def test_stream_reset(http, server):
+    http.request("GET", _url(server, "/warmup"))
+    connections = server.connections
+
+    with pytest.raises(ProtocolError, match="reset by the server"):
+        http.request("GET", _url(server, "/reset"), retries=False)
+
+    # A reset only ends that stream
+    assert http.request("GET", _url(server, "/after")).data == b"/after"
+    assert server.connections == connections
+
+
+def test_goaway_retries_on_new_connection(http, server):
+    http.request("GET", _url(server, "/warmup"))
+    connections = server.connections
+
+    # The refused stream was never processed, so it is retried on a new connection
+    response = http.request("GET", _url(server, "/goaway/retried"), retries=1)
+    assert response.status == 200
+    assert response.data == b"/goaway/retried"
+    assert server.connections == connections + 1
+
+
+def test_goaway_without_retries(http, server):
+    http.request("GET", _url(server, "/warmup"))
+
+    with pytest.raises(ProtocolError, match="going away"):
+        http.request("GET", _url(server, "/goaway/unretried"), retries=False)
+
+    assert http.request("GET", _url(server, "/after")).data == b"/after"
@@ -0,0 +1,121 @@
+import json
+import multiprocessing
+
+import pytest
+
+from urllib3.http2 import probe
+from urllib3.http2.probe import _DiskProbeStore, _HTTP2ProbeCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(probe, "time", clock)
+    return clock
+
+
+def _cache(path, **kwargs):
+    cache = _HTTP2ProbeCache()
+    cache.enable_disk_cache(path, **kwargs)
+    return cache
+
+
+def _probe(cache, host, port, supports_http2):
+    """Returns the known result, or records supports_http2 as the outcome of a probe."""
+    known = cache.acquire_and_get(host, port)
+    if known is None:
+        cache.set_and_release(host, port, supports_http2)
+    return known
+
+
+def test_results_are_shared_through_the_file(tmp_path):
+    path = tmp_path / "probe.json"
+    first = _cache(path)
+    assert _probe(first, "h2.example", 443, True) is None
+    assert _probe(first, "h1.example", 443, False) is None
+
+    second = _cache(path)
+    assert second.acquire_and_get("h2.example", 443) is True
+    assert second.acquire_and_get("h1.example", 443) is False
+    assert second.acquire_and_get("new.example", 443) is None
+    second.set_and_release("new.example", 443, True)
+
+    # The first cache sees what the second one probed
+    assert first.acquire_and_get("new.example", 443) is True
+
+
+def test_results_expire(tmp_path, clock):
+    path = tmp_path / "probe.json"
+    ttls = {
+        "ttl": 100,
+        "negative_ttl": 10,
+        "origin_ttls": {("pinned.example", 443): 1000},
+    }
+    cache = _cache(path, **ttls)
+    _probe(cache, "h2.example", 443, True)
+    _probe(cache, "h1.example", 443, False)
+    _probe(cache, "pinned.example", 443, False)
+
+    clock.now += 50
+    later = _cache(path, **ttls)
+    assert later.acquire_and_get("h2.example", 443) is True
+    assert _probe(later, "h1.example", 443, True) is None
+    # The negative result expired in the cache that stored it as well
+    assert cache.acquire_and_get("h1.example", 443) is True
+
+    clock.now += 100
+    assert _probe(_cache(path, **ttls), "h2.example", 443, True) is None
+    assert _cache(path, **ttls).acquire_and_get("pinned.example", 443) is False
+
+    clock.now += 1000
+    assert _probe(cache, "pinned.example", 443, True) is None
+    # Expired results are dropped from the file by the next write
+    assert list(json.loads(path.read_text())["origins"]) == ["pinned.example:443"]
+
+
+def _write_origins(path, worker, count):
+    store = _DiskProbeStore(path, 3600, 3600, None)
+    for i in range(count):
+        store.put((f"host{worker}-{i}.example", 443), i % 2 == 0)
+
+
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    path = str(tmp_path / "probe.json")
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_write_origins, args=(path, worker, 25))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+        assert process.exitcode == 0
+
+    origins = json.loads(open(path).read())["origins"]
+    assert len(origins) == 100
+    assert origins["host3-24.example:443"]["h2"] is True
+    assert origins["host3-23.example:443"]["h2"] is False
+
+
+@pytest.mark.parametrize(
+    "content", ["{not json", '{"origins": []}', '{"origins": {"a:1": {}}}', "[1]"]
+)
+def test_unreadable_file_is_ignored(tmp_path, content):
+    path = tmp_path / "probe.json"
+    path.write_text(content)
+
+    cache = _cache(path)
+    assert _probe(cache, "h2.example", 443, True) is None
+
+    # The next write replaces it
+    assert _cache(path).acquire_and_get("h2.example", 443) is True
+    assert list(json.loads(path.read_text())["origins"]) == ["h2.example:443"]
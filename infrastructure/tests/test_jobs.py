@@ -0,0 +1,144 @@
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from jarvis.core.jobs import worker as jobs_worker
+from jarvis.core.jobs.queue import JobQueue
+from jarvis.core.jobs.worker import Worker, run_job
+
+
+CALLS = []
+
+
+def echo(text, delay=0.0):
+    CALLS.append(text)
+    time.sleep(delay)
+    return {"success": True, "text": text}
+
+
+def explode(text):
+    CALLS.append(text)
+    raise RuntimeError(f"cannot say {text}")
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    CALLS.clear()
+    monkeypatch.setitem(jobs_worker.HANDLERS, "echo", f"{__name__}:echo")
+    monkeypatch.setitem(jobs_worker.HANDLERS, "explode", f"{__name__}:explode")
+    queue = JobQueue(tmp_path / "jobs.sqlite", lease=0.2, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_expired_lease_hands_the_job_out_again(queue):
+    job_id = queue.submit("echo", {"text": "hi"})
+    assert queue.claim("host:1")["id"] == job_id
+    assert queue.claim("host:2") is None
+
+    time.sleep(0.3)
+    job = queue.claim("host:2")
+    assert job["id"] == job_id
+    assert job["attempts"] == 2
+    # The first worker lost the job
+    assert not queue.heartbeat(job_id, "host:1")
+    assert not queue.complete(job_id, {"success": True}, "host:1")
+
+    # Out of attempts, an expired lease fails the job
+    time.sleep(0.3)
+    assert queue.claim("host:3") is None
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Worker stopped responding"
+
+
+def test_heartbeat_keeps_the_lease(queue):
+    job_id = queue.submit("echo", {"text": "hi"})
+    queue.claim("host:1")
+    for _ in range(3):
+        time.sleep(0.1)
+        assert queue.heartbeat(job_id, "host:1")
+    assert queue.claim("host:2") is None
+
+
+def test_recover_requeues_jobs_of_exited_workers(queue):
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    host = socket.gethostname()
+
+    dead_id = queue.submit("echo", {"text": "dead"})
+    queue.claim(f"{host}:{exited.pid}")
+    live_id = queue.submit("echo", {"text": "live"})
+    queue.claim()
+
+    assert queue.recover() == 1
+    assert queue.get(dead_id)["status"] == "queued"
+    assert queue.get(live_id)["status"] == "running"
+
+
+def test_claims_follow_priority_then_source_then_age(queue):
+    batch = queue.submit("echo", {"text": "batch"}, priority="batch")
+    normal = queue.submit("echo", {"text": "normal"})
+    first = queue.submit("echo", {"text": "first"}, priority="interactive", source="watcher")
+    second = queue.submit("echo", {"text": "second"}, priority="interactive", source="watcher")
+    other = queue.submit("echo", {"text": "other"}, priority="interactive", source="app")
+
+    claimed = [queue.claim("host:1")["id"] for _ in range(5)]
+
+    # The app's job goes before the watcher's second one, which already has one running
+    assert claimed == [first, other, second, normal, batch]
+    assert queue.claim("host:1") is None
+
+
+def test_identical_jobs_in_flight_are_merged(queue):
+    job_id = queue.submit("echo", {"text": "hi"}, priority="batch")
+    assert queue.submit("echo", {"text": "hi"}, priority="interactive") == job_id
+    assert queue.get(job_id)["priority"] == 20
+    assert queue.submit("echo", {"text": "hi"}, priority="batch") == job_id
+    assert queue.get(job_id)["priority"] == 20
+
+    assert queue.submit("echo", {"text": "bye"}) != job_id
+    assert queue.submit("echo", {"text": "hi"}, dedupe=False) != job_id
+
+    # Running jobs are still merged, finished ones are not
+    job = queue.claim("host:1", job_id=job_id)
+    assert queue.submit("echo", {"text": "hi"}) == job_id
+    queue.complete(job["id"], {"success": True}, "host:1")
+    assert queue.submit("echo", {"text": "hi"}) != job_id
+
+
+def test_wait_polls_until_a_worker_finishes(queue):
+    job_id = queue.submit("echo", {"text": "hi", "delay": 0.2})
+    job = queue.wait(job_id, timeout=0.1, poll_interval=0.02)
+    assert job["status"] == "queued"
+
+    stop = threading.Event()
+    thread = threading.Thread(target=Worker(queue, worker_id="host:1").run, args=(stop,))
+    thread.start()
+    try:
+        job = queue.wait(job_id, timeout=5, poll_interval=0.02)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert job["status"] == "done"
+    assert job["result"] == {"success": True, "text": "hi"}
+    assert job["worker"] == "host:1"
+    assert CALLS == ["hi"]
+    with pytest.raises(ValueError):
+        queue.wait(job_id + 1)
+
+
+def test_run_job_runs_inline_without_workers(queue):
+    assert run_job("echo", {"text": "hi"}, queue=queue) == {"success": True, "text": "hi", "job_id": 1}
+
+    result = run_job("explode", {"text": "hi"}, queue=queue)
+    assert not result["success"]
+    assert result["error"].startswith("cannot say hi")
+    # Retried until it ran out of attempts
+    assert CALLS == ["hi", "hi", "hi"]
+    assert queue.stats()["status"] == {"queued": 0, "running": 0, "done": 1, "failed": 1}
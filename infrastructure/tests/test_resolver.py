@@ -0,0 +1,88 @@
+import concurrent.futures
+import socket
+import threading
+import time
+
+import pytest
+
+from urllib3.util.resolver import BaseResolver, CachingResolver, StaticResolver
+
+
+class SlowResolver(BaseResolver):
+    """Counts lookups, each of which takes a while and may fail."""
+
+    def __init__(self, error=None, delay=0.3):
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.addresses = StaticResolver({"example.com": ["127.0.0.1"]})
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.addresses.getaddrinfo(host, port, family, type, proto, flags)
+
+
+def _lookup_concurrently(resolver, count=10):
+    barrier = threading.Barrier(count)
+
+    def lookup(_):
+        barrier.wait()
+        try:
+            return resolver.getaddrinfo("example.com", 80)
+        except Exception as e:
+            return e
+
+    with concurrent.futures.ThreadPoolExecutor(count) as executor:
+        return list(executor.map(lookup, range(count)))
+
+
+def test_concurrent_lookups_share_a_query():
+    upstream = SlowResolver()
+    resolver = CachingResolver(upstream)
+
+    results = _lookup_concurrently(resolver)
+
+    assert upstream.calls == 1
+    assert all(result == results[0] for result in results)
+    assert resolver.stats("example.com")["misses"] == 1
+
+
+@pytest.mark.parametrize(
+    "error, negative_ttl",
+    [
+        (socket.gaierror(socket.EAI_AGAIN, "Temporary failure"), 5.0),
+        (socket.gaierror(socket.EAI_NONAME, "Name not known"), 0),
+        (OSError("resolver crashed"), 5.0),
+    ],
+)
+def test_concurrent_lookups_share_an_uncached_failure(error, negative_ttl):
+    upstream = SlowResolver(error=error)
+    resolver = CachingResolver(upstream, negative_ttl=negative_ttl)
+
+    start = time.monotonic()
+    results = _lookup_concurrently(resolver)
+    elapsed = time.monotonic() - start
+
+    assert upstream.calls == 1
+    assert elapsed < 1.0
+    assert all(type(result) is type(error) and result.args == error.args for result in results)
+
+    # The failure isn't cached, so the next lookup asks again
+    with pytest.raises(type(error)):
+        resolver.getaddrinfo("example.com", 80)
+    assert upstream.calls == 2
+
+
+def test_stats_are_bounded_by_maxsize():
+    resolver = CachingResolver(StaticResolver({}), maxsize=4)
+
+    for i in range(10):
+        with pytest.raises(socket.gaierror):
+            resolver.getaddrinfo(f"host{i}.example", 80)
+
+    assert list(resolver.stats()) == [f"host{i}.example" for i in range(6, 10)]
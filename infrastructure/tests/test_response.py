@@ -0,0 +1,226 @@
+import gzip
+import http.server
+import io
+import os
+import threading
+
+import pytest
+
+import urllib3
+from urllib3.response import HTTPResponse
+
+BODY = bytes(range(256)) * 1000
+GZIPPED = gzip.compress(BODY, mtime=0)
+
+
+class ReadintoOnly(io.BytesIO):
+    """A body that fails if it's read into intermediate bytes objects."""
+
+    def read(self, *args):
+        raise AssertionError("read() was called")
+
+    def read1(self, *args):
+        raise AssertionError("read1() was called")
+
+
+def _response(body=BODY, encoding=None, fp_class=io.BytesIO, **kwargs):
+    headers = {"content-length": str(len(body))}
+    if encoding:
+        headers["content-encoding"] = encoding
+    return HTTPResponse(
+        fp_class(body), headers=headers, status=200, preload_content=False, **kwargs
+    )
+
+
+def test_readinto_passes_the_body_through():
+    response = _response(fp_class=ReadintoOnly)
+    buf = bytearray(10_000)
+
+    received = bytearray()
+    while n := response.readinto(buf):
+        assert n == len(buf) or len(received) + n == len(BODY)
+        received += buf[:n]
+
+    assert received == BODY
+    assert response.readinto(buf) == 0
+
+
+def test_readinto_decodes_the_body():
+    response = _response(gzip.compress(BODY), encoding="gzip")
+    buf = memoryview(bytearray(10_000))
+
+    received = bytearray()
+    while n := response.readinto(buf):
+        received += buf[:n]
+
+    assert received == BODY
+
+
+def test_readinto_without_decoding_after_a_decoded_read():
+    response = _response(gzip.compress(BODY), encoding="gzip")
+    assert response.readinto(bytearray(100)) == 100
+
+    with pytest.raises(RuntimeError, match="decode_content=False"):
+        response.readinto(bytearray(100), decode_content=False)
+
+
+@pytest.mark.parametrize("encoding", [None, "gzip"])
+def test_stream_into_file(encoding):
+    body = gzip.compress(BODY) if encoding else BODY
+    response = _response(body, encoding=encoding)
+    f = io.BytesIO()
+
+    assert response.stream_into(f, buffer_size=4096) == len(BODY)
+    assert f.getvalue() == BODY
+
+
+def test_stream_into_file_with_short_writes():
+    class RawFile(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data += bytes(b[:1000])
+            return min(len(b), 1000)
+
+    f = RawFile()
+    assert _response().stream_into(f) == len(BODY)
+    assert f.data == BODY
+
+
+def test_stream_into_buffer():
+    buf = bytearray(1000)
+    assert _response(fp_class=ReadintoOnly).stream_into(buf) == 1000
+    assert buf == BODY[:1000]
+
+    buf = bytearray(len(BODY) + 10)
+    assert _response().stream_into(buf) == len(BODY)
+    assert buf[: len(BODY)] == BODY
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies = {
+        "/body": (BODY, None),
+        "/gzip": (GZIPPED, "gzip"),
+        "/short": (b"short", None),
+        "/empty": (b"", None),
+    }
+
+    def do_GET(self):
+        body, encoding = self.bodies[self.path]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def pool(server):
+    pool = urllib3.HTTPConnectionPool(*server.server_address, retries=False)
+    yield pool
+    pool.close()
+
+
+def _get(pool, path, **kwargs):
+    return pool.request("GET", path, preload_content=False, **kwargs)
+
+
+@pytest.mark.skipif(not hasattr(os, "splice"), reason="needs os.splice")
+def test_save_to_splices_the_body(pool, tmp_path):
+    path = tmp_path / "body"
+    result = _get(pool, "/body").save_to(path, buffer_size=4096)
+
+    assert result.method == "splice"
+    assert result.bytes_written == len(BODY)
+    assert path.read_bytes() == BODY
+
+
+def test_save_to_receives_into_a_buffer_without_splice(pool, tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "splice", raising=False)
+    path = tmp_path / "body"
+    result = _get(pool, "/body").save_to(path, buffer_size=4096)
+
+    assert result.method == "recv_into"
+    assert result.bytes_written == len(BODY)
+    assert path.read_bytes() == BODY
+
+
+def test_save_to_decodes_the_body(pool, tmp_path):
+    path = tmp_path / "body"
+    result = _get(pool, "/gzip").save_to(path, buffer_size=4096)
+
+    assert result.method == "stream"
+    assert result.bytes_written == len(BODY)
+    assert path.read_bytes() == BODY
+
+    result = _get(pool, "/gzip").save_to(path, decode_content=False)
+    assert result.method in ("splice", "recv_into")
+    assert path.read_bytes() == GZIPPED
+
+
+def test_save_to_appends_to_an_o_append_descriptor(pool, tmp_path):
+    path = tmp_path / "body"
+    path.write_bytes(b"existing")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+    try:
+        result = _get(pool, "/body").save_to(fd, buffer_size=4096)
+        # The descriptor is left open
+        os.write(fd, b"end")
+    finally:
+        os.close(fd)
+
+    assert result.bytes_written == len(BODY)
+    assert path.read_bytes() == b"existing" + BODY + b"end"
+
+
+@pytest.mark.parametrize("route, body", [("/short", b"short"), ("/empty", b"")])
+def test_save_to_short_bodies(pool, tmp_path, route, body):
+    path = tmp_path / "body"
+    path.write_bytes(b"truncated")
+    result = _get(pool, route).save_to(path)
+
+    assert result.bytes_written == len(body)
+    assert path.read_bytes() == body
+
+
+@pytest.mark.parametrize("route", ["/body", "/gzip", "/short"])
+def test_save_to_returns_the_connection_to_the_pool(pool, tmp_path, route):
+    for i in range(3):
+        response = _get(pool, route)
+        response.save_to(tmp_path / str(i))
+        response.release_conn()
+        assert (tmp_path / str(i)).read_bytes() == (
+            b"short" if route == "/short" else BODY
+        )
+
+    assert pool.num_connections == 1
+    assert pool.request("GET", "/short").data == b"short"
+    assert pool.num_connections == 1
+
+
+def test_save_to_writes_a_preloaded_body(pool, tmp_path):
+    path = tmp_path / "body"
+    response = pool.request("GET", "/gzip")
+    result = response.save_to(path)
+
+    assert result.method == "preloaded"
+    assert result.bytes_written == len(BODY)
+    assert path.read_bytes() == BODY
@@ -0,0 +1,135 @@
+import gc
+import http.server
+import os
+import shutil
+import ssl
+import threading
+import weakref
+
+import pytest
+
+import urllib3
+from urllib3.util.ssl_ import _ssl_context_cache, cached_ssl_context
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server(certs):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*certs)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def ca_file(certs, tmp_path):
+    path = tmp_path / "ca.pem"
+    shutil.copy(certs[0], path)
+    return str(path)
+
+
+def test_identical_settings_share_a_context(ca_file):
+    context = cached_ssl_context(ca_certs=ca_file)
+
+    assert cached_ssl_context(ca_certs=ca_file) is context
+    assert cached_ssl_context(ca_certs=ca_file, cert_reqs="CERT_REQUIRED") is context
+    assert cached_ssl_context(ca_certs=ca_file, check_hostname=False) is not context
+    assert (
+        cached_ssl_context(ca_certs=ca_file, ssl_minimum_version=ssl.TLSVersion.TLSv1_3)
+        is not context
+    )
+    assert context.check_hostname
+    assert context.verify_mode == ssl.CERT_REQUIRED
+
+
+def test_changed_ca_file_gives_a_new_context(ca_file):
+    context = cached_ssl_context(ca_certs=ca_file)
+
+    st = os.stat(ca_file)
+    os.utime(ca_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    touched = cached_ssl_context(ca_certs=ca_file)
+    assert touched is not context
+
+    with open(ca_file, "a") as f:
+        f.write("\n")
+    os.utime(ca_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    grown = cached_ssl_context(ca_certs=ca_file)
+    assert grown is not touched
+
+    assert cached_ssl_context(ca_certs=ca_file) is grown
+
+
+def test_unreferenced_contexts_are_dropped(ca_file):
+    context = weakref.ref(cached_ssl_context(ca_certs=ca_file, ciphers="ECDHE+AESGCM"))
+    gc.collect()
+
+    assert context() is None
+    assert all(key[2] != "ECDHE+AESGCM" for key in _ssl_context_cache.keys())
+
+
+def test_pools_use_the_cached_context(server, ca_file):
+    context = cached_ssl_context(ca_certs=ca_file)
+    pool = urllib3.HTTPSConnectionPool(
+        "localhost", server.server_address[1], ca_certs=ca_file
+    )
+
+    conn = pool._get_conn()
+    conn.connect()
+    assert conn.sock.context is context
+    conn.close()
+    pool.close()
+
+
+@pytest.mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning")
+@pytest.mark.parametrize(
+    "pool_kw, check_hostname, verify_mode",
+    [
+        ({}, True, ssl.CERT_REQUIRED),
+        ({"assert_hostname": "localhost"}, False, ssl.CERT_REQUIRED),
+        ({"cert_reqs": "CERT_NONE"}, False, ssl.CERT_NONE),
+    ],
+)
+def test_shared_context_given_to_a_pool_is_not_changed(
+    server, ca_file, pool_kw, check_hostname, verify_mode
+):
+    shared = cached_ssl_context(ca_certs=ca_file)
+    pool = urllib3.HTTPSConnectionPool(
+        "localhost", server.server_address[1], ssl_context=shared, **pool_kw
+    )
+
+    assert pool.request("GET", "/").data == b"ok"
+
+    conn = pool._get_conn()
+    assert conn.sock.context.check_hostname is check_hostname
+    assert conn.sock.context.verify_mode == verify_mode
+    assert (conn.sock.context is shared) == (not pool_kw)
+    assert shared.check_hostname
+    assert shared.verify_mode == ssl.CERT_REQUIRED
+    pool.close()
+
+
+def test_requests_preloads_the_cached_certifi_context():
+    certifi = pytest.importorskip("certifi")
+    if not os.path.exists(certifi.where()):
+        pytest.skip("certifi's CA bundle isn't installed")
+    from requests import adapters
+
+    assert adapters._preloaded_ssl_context is cached_ssl_context(
+        ca_certs=adapters.extract_zipped_paths(adapters.DEFAULT_CA_BUNDLE_PATH)
+    )
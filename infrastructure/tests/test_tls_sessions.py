@@ -0,0 +1,48 @@
+import http.server
+import ssl
+import threading
+
+import pytest
+
+import urllib3
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server(certs):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*certs)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+def test_session_saved_from_connection_close_response(server, certs):
+    pool = urllib3.HTTPSConnectionPool("localhost", server.server_address[1], ca_certs=certs[0])
+
+    for _ in range(4):
+        # The server closes the connection after every response
+        assert pool.request("GET", "/close").data == b"ok"
+
+    assert pool.tls_session_cache.stats() == {
+        "full_handshakes": 1,
+        "resumed_handshakes": 3,
+        "sessions": 1,
+    }
@@ -1,8 +0,0 @@
-"""
-Expose version
-"""
-
-from __future__ import annotations
-
-__version__ = "3.4.1"
-VERSION = __version__.split(".")
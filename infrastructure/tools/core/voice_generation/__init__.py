@@ -1,7 +0,0 @@
-"""
-Voice generation module for converting text to speech.
-"""
-
-from .generator import generate_voice, VoiceType, AudioFormat
-
-__all__ = ["generate_voice", "VoiceType", "AudioFormat"] 
\ No newline at end of file
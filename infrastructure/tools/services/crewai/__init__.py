@@ -1,3 +0,0 @@
-"""
-CrewAI newsletter generation service.
-""" 
\ No newline at end of file
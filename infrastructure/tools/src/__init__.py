@@ -1,3 +0,0 @@
-"""
-Core source modules for Jarvis tools.
-"""
@@ -1,3 +0,0 @@
-"""
-Core functionality modules for Jarvis.
-"""
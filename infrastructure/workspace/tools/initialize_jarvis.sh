@@ -53,7 +53,11 @@ echo ""
 
 # Verify environment
 echo "🔍 Verifying Jarvis environment..."
-python3 "$PROJECT_ROOT/tools/src/cli/verify_environment.py"
+if ! command -v jarvis-verify &> /dev/null; then
+  echo "❌ jarvis-verify not found. Install the tools with: pip install -e \"$PROJECT_ROOT/infrastructure\""
+  exit 1
+fi
+jarvis-verify
 VERIFY_RESULT=$?
 
 if [ $VERIFY_RESULT -ne 0 ]; then
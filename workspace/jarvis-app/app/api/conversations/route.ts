@@ -0,0 +1,114 @@
+import { NextRequest, NextResponse } from 'next/server';
+import fs from 'fs/promises';
+import path from 'path';
+
+// Conversation messages are appended to one NDJSON file per day in workspace/logs/conversations
+// (the app runs from workspace/jarvis-app)
+const logDir = path.resolve(process.cwd(), '../logs/conversations');
+
+// The logging client resends a batch when it did not see the response, so messages are
+// deduplicated by id against the files of the last two days (a resend can cross midnight)
+const DEDUPE_DAYS = 2;
+const seenIds = new Map<string, Set<string>>();
+
+// Appends run one at a time, so that two requests can't both pass the id check
+let appending: Promise<unknown> = Promise.resolve();
+
+interface ConversationMessage {
+  id?: string;
+  message: string;
+  source: string;
+  timestamp: string;
+}
+
+function isMessage(value: unknown): value is ConversationMessage {
+  const record = value as ConversationMessage;
+  return !!record && typeof record.message === 'string' && typeof record.source === 'string';
+}
+
+function logDay(offset = 0): string {
+  return new Date(Date.now() - offset * 86400000).toISOString().slice(0, 10);
+}
+
+async function idsOfDay(day: string): Promise<Set<string>> {
+  let ids = seenIds.get(day);
+  if (ids) return ids;
+
+  ids = new Set();
+  try {
+    const content = await fs.readFile(path.join(logDir, `${day}.ndjson`), 'utf8');
+    for (const line of content.split('\n')) {
+      if (!line.trim()) continue;
+      try {
+        const record = JSON.parse(line);
+        if (typeof record.id === 'string') ids.add(record.id);
+      } catch {
+        // A torn line from a crashed write
+      }
+    }
+  } catch {
+    // No messages that day
+  }
+  seenIds.set(day, ids);
+  return ids;
+}
+
+async function appendNew(messages: ConversationMessage[]): Promise<number> {
+  const days = Array.from({ length: DEDUPE_DAYS }, (_, offset) => logDay(offset));
+  for (const day of Array.from(seenIds.keys())) {
+    if (!days.includes(day)) seenIds.delete(day);
+  }
+  const recent = await Promise.all(days.map(idsOfDay));
+
+  const fresh = messages.filter((message) => {
+    if (!message.id) return true;
+    if (recent.some((ids) => ids.has(message.id!))) return false;
+    recent[0].add(message.id);
+    return true;
+  });
+  if (fresh.length > 0) {
+    await fs.mkdir(logDir, { recursive: true });
+    await fs.appendFile(
+      path.join(logDir, `${days[0]}.ndjson`),
+      fresh.map((message) => JSON.stringify(message)).join('\n') + '\n'
+    );
+  }
+  return fresh.length;
+}
+
+export async function POST(request: NextRequest) {
+  try {
+    // Accept a single JSON message or a batch of newline-delimited JSON messages
+    const body = await request.text();
+    const contentType = request.headers.get('content-type') || '';
+    const lines = contentType.includes('ndjson') ? body.split('\n') : [body];
+
+    const messages: ConversationMessage[] = [];
+    let rejected = 0;
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      try {
+        const record = JSON.parse(line);
+        if (isMessage(record)) {
+          messages.push({ ...record, timestamp: record.timestamp || new Date().toISOString() });
+        } else {
+          rejected++;
+        }
+      } catch {
+        rejected++;
+      }
+    }
+
+    let duplicates = 0;
+    if (messages.length > 0) {
+      const append = appending.then(() => appendNew(messages));
+      appending = append.catch(() => undefined);
+      duplicates = messages.length - (await append);
+    }
+
+    return NextResponse.json({ received: messages.length, rejected, duplicates });
+  } catch (error) {
+    console.error('Error in conversations API:', error);
+    return NextResponse.json({ error: 'Failed to log conversation messages' }, { status: 500 });
+  }
+}
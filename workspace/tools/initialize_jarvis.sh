@@ -22,6 +22,10 @@ while [[ $# -gt 0 ]]; do
       LAUNCH_APP=false
       shift
       ;;
+    --topic)
+      TOPIC="$2"
+      shift 2
+      ;;
     --help)
       echo "Usage: ./initialize_jarvis.sh [options]"
       echo ""
@@ -29,6 +33,7 @@ while [[ $# -gt 0 ]]; do
       echo "  --voice VALUE    Set voice (alloy, echo, fable, onyx, nova, shimmer). Default: echo"
       echo "  --verify-only    Only verify the environment without initializing"
       echo "  --no-app         Don't launch the Jarvis web app"
+      echo "  --topic VALUE    Topic of the session, used to recall related memories"
       echo "  --help           Show this help message"
       exit 0
       ;;
@@ -43,6 +48,7 @@ done
 # Get project root directory
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" &> /dev/null && pwd)"
 PROJECT_ROOT="$(dirname "$(dirname "$SCRIPT_DIR")")"
+export PYTHONPATH="$PROJECT_ROOT/infrastructure/src${PYTHONPATH:+:$PYTHONPATH}"
 
 # Print banner
 echo ""
@@ -53,7 +59,7 @@ echo ""
 
 # Verify environment
 echo "🔍 Verifying Jarvis environment..."
-python3 "$PROJECT_ROOT/tools/src/cli/verify_environment.py"
+python3 -m jarvis.cli.verify_environment --fast
 VERIFY_RESULT=$?
 
 if [ $VERIFY_RESULT -ne 0 ]; then
@@ -66,6 +72,16 @@ if [ "$VERIFY_ONLY" = true ]; then
   exit 0
 fi
 
+# Build the session context bundle (only changed sections are re-read)
+CONTEXT_FILE="$PROJECT_ROOT/workspace/.cache/jarvis_context.md"
+echo ""
+echo "🧠 Loading Jarvis context..."
+CONTEXT_ARGS=(--output "$CONTEXT_FILE")
+if [ -n "$TOPIC" ]; then
+  CONTEXT_ARGS+=(--query "$TOPIC")
+fi
+python3 -m jarvis.cli.load_context "${CONTEXT_ARGS[@]}"
+
 # Launch web app if enabled
 if [ "$LAUNCH_APP" = true ]; then
   echo ""
@@ -85,6 +101,7 @@ echo "   - Voice: $VOICE"
 if [ "$LAUNCH_APP" = true ]; then
   echo "   - Web app: http://localhost:3000"
 fi
+echo "   - Context: $CONTEXT_FILE"
 echo "   - All systems operational"
 echo ""
 echo "You can now interact with Jarvis through normal queries or"
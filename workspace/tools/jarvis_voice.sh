@@ -88,7 +88,7 @@ if [ $# -eq 0 ]; then
 fi
 
 # Build the command
-CMD="python3 $(dirname $(dirname $(dirname "$0")))/infrastructure/src/cli/auto_jarvis_voice.py"
+CMD="PYTHONPATH=$(dirname $(dirname $(dirname "$0")))/infrastructure/src python3 -m jarvis.cli.auto_jarvis_voice"
 
 # Add text (joining all remaining arguments with spaces)
 TEXT="$*"
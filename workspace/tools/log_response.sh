@@ -1,13 +1,12 @@
 #!/bin/bash
 # log_response.sh
+#
+# Usage: log_response.sh "message" [user|jarvis]
+# Messages are spooled locally and sent to the web app in batches, so logging
+# works (and returns quickly) even when the app is not running.
 
-# Get the message from arguments
-MESSAGE="$1"
-SOURCE="$2"  # Either "user" or "jarvis"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" &> /dev/null && pwd)"
+PROJECT_ROOT="$(dirname "$(dirname "$SCRIPT_DIR")")"
 
-# Send the message to the API
-curl -X POST http://localhost:3000/api/conversations \
-  -H "Content-Type: application/json" \
-  -d "{\"message\":\"$MESSAGE\",\"source\":\"$SOURCE\",\"timestamp\":\"$(date -u +"%Y-%m-%dT%H:%M:%SZ")\"}"
-
-echo "Response logged successfully" 
\ No newline at end of file
+export PYTHONPATH="$PROJECT_ROOT/infrastructure/src${PYTHONPATH:+:$PYTHONPATH}"
+exec python3 -m jarvis.cli.log_response "$@"
@@ -3,13 +3,9 @@
 Test script to verify environment variables are being loaded correctly.
 """
 import os
-import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
-# Add the project root to sys.path to enable imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-CONFIG_PATH = PROJECT_ROOT / "tools" / "config" / ".env"
+from jarvis.cli.verify_environment import ENV_FILE as CONFIG_PATH
 
 print(f"Looking for .env file at: {CONFIG_PATH}")
 print(f"File exists: {CONFIG_PATH.exists()}")